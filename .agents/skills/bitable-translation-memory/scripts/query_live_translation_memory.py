@@ -23,6 +23,7 @@ from tools.translation_memory import (  # noqa: E402
     render_translation_prompt_context,
     split_translation_units,
 )
+from tools.translation_memory_index import TranslationMemoryIndex  # noqa: E402
 
 # The A/wiki mirror is a READ-ONLY ARCHIVE since the 2026-07-02 base
 # convergence (Milestone G PR G4): the canonical live base is whatever
@@ -167,12 +168,14 @@ def main(argv: list[str] | None = None) -> int:
         rows, language_fields=language_fields, entry_type=entry_type, table_label=table_label
     )
     query_units = split_translation_units(args.query_text) if args.split_units else [" ".join(args.query_text.split())]
+    # One index for every unit query instead of rescanning the table per unit.
+    index = TranslationMemoryIndex(entries)
     unit_matches = []
     seen_entry_keys: set[tuple[str, str, str]] = set()
     unique_entries: list[TranslationMemoryEntry] = []
     for source_unit in query_units:
         matched = query_translation_memory_entries(
-            entries,
+            index,
             query_text=source_unit,
             preferred_lang=target_lang,
             source_lang=source_lang,
@@ -22,11 +22,14 @@ Design rules:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 from intake_contract import (
@@ -116,10 +119,55 @@ def merged_env() -> dict[str, str]:
     return env
 
 
+def build_daemon_socket_path() -> str:
+    """Same per-repo socket as tools/build_daemon.py ``default_socket_path``."""
+    override = os.environ.get("AUTO_MANUAL_BUILD_DAEMON_SOCKET", "").strip()
+    if override:
+        return override
+    key = hashlib.sha256(str(Path(REPO_ROOT).resolve()).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"auto-manual-build-{key}.sock")
+
+
+def run_via_build_daemon(argv: list[str], cwd: str) -> subprocess.CompletedProcess | None:
+    """Run ``python build.py ...`` in the resident build daemon; None when none is serving."""
+    if len(argv) < 2 or argv[1] != "build.py" or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = build_daemon_socket_path()
+    if not os.path.exists(path):
+        return None
+    request = {"argv": argv[2:], "cwd": cwd, "env": merged_env(), "repo_root": str(Path(REPO_ROOT).resolve())}
+    out: dict[str, list[str]] = {"stdout": [], "stderr": []}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(SUBPROC_TIMEOUT_SECONDS)
+        try:
+            conn.connect(path)
+            conn.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            for line in conn.makefile("r", encoding="utf-8"):
+                message = json.loads(line)
+                if "error" in message:
+                    return None
+                if "exit" in message:
+                    return subprocess.CompletedProcess(
+                        argv, int(message["exit"]), "".join(out["stdout"]), "".join(out["stderr"])
+                    )
+                out.get(message.get("stream"), out["stderr"]).append(str(message.get("data", "")))
+            if out["stdout"] or out["stderr"]:
+                log("build daemon closed the connection mid-command")
+                return subprocess.CompletedProcess(argv, 1, "".join(out["stdout"]), "".join(out["stderr"]))
+        except socket.timeout:
+            raise subprocess.TimeoutExpired(argv, SUBPROC_TIMEOUT_SECONDS) from None
+        except (OSError, ValueError) as exc:
+            if out["stdout"] or out["stderr"]:
+                log(f"build daemon connection failed mid-command: {exc}")
+                return subprocess.CompletedProcess(argv, 1, "".join(out["stdout"]), "".join(out["stderr"]))
+            return None
+    return None
+
+
 def run_subprocess(argv: list[str], cwd: str | None = None) -> dict:
     """Run a workspace command; return parsed JSON stdout or a structured error."""
     try:
-        proc = subprocess.run(
+        proc = run_via_build_daemon(argv, cwd or REPO_ROOT) or subprocess.run(
             argv, cwd=cwd or REPO_ROOT, env=merged_env(),
             capture_output=True, text=True, timeout=SUBPROC_TIMEOUT_SECONDS,
         )
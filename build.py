@@ -23,82 +23,75 @@ from tools.build_paths import (
     staging_version_tracking_root as _staging_version_tracking_root,
     version_tracking_root as _version_tracking_root,
 )
-from tools.build_entry_commands import (
-    append_data_root_arg as _append_data_root_arg_impl,
-    append_target_args as _append_target_args_impl,
-    build_docs_command as _build_docs_command_impl,
-    check_docs_command as _check_docs_command_impl,
-    effective_source as _effective_source_impl,
-    listen_build_queue_command as _listen_build_queue_command_impl,
-    listen_message_control_command as _listen_message_control_command_impl,
-    message_control_dry_run_command as _message_control_dry_run_command_impl,
-    normalize_cli_build_queue_action as _normalize_cli_build_queue_action_impl,
-    process_build_queue_command as _process_build_queue_command_impl,
-    process_review_start_queue_command as _process_review_start_queue_command_impl,
-    release_manifest_command as _release_manifest_command_impl,
-    release_rebuild_command as _release_rebuild_command_impl,
-    review_bundle_command as _review_bundle_command_impl,
-    spec_master_rebuild_command as _spec_master_rebuild_command_impl,
-    sync_data_command as _sync_data_command_impl,
-    sync_review_command as _sync_review_command_impl,
-)
-from tools.asset_commands import run_asset_command as _run_asset_command_impl
-from tools.new_line_scaffold import run_new_line as _run_new_line_impl
-from tools.build_doctor import (
-    check_word_com_available as _check_word_com_available_impl,
-    collect_doctor_findings as _collect_doctor_findings_impl,
-    doctor_import as _doctor_import_impl,
-    find_xelatex as _find_xelatex_impl,
-    is_windows_platform as _is_windows_platform_impl,
-    render_config_tokenized_value as _render_config_tokenized_value_impl,
-    render_finding as _doctor_render_finding_impl,
-    resolve_doctor_pdf_mode as _resolve_doctor_pdf_mode_impl,
-    resolve_doctor_target as _resolve_doctor_target_impl,
-    resolve_reference_doc_status as _resolve_reference_doc_status_impl,
-    run_doctor as _run_doctor_impl,
-    slug_token as _slug_token_impl,
-)
 from tools.build_cli import parse_args as _parse_args_impl
 from tools.build_dispatch import dispatch_action as _dispatch_action_impl
 from tools.build_main import run_main as _run_main_impl
-from tools.message_control_runtime import resolve_message_control as _resolve_message_control_impl
-from tools.manual_index_query import run_manual_index_query as _run_manual_index_query_impl
-from tools.queue_execute import run_queue_execute as _run_queue_execute_impl
-from tools.queue_query import run_queue_query as _run_queue_query_impl
-from tools.queue_resolve_action import run_queue_resolve_action as _run_queue_resolve_action_impl
-from tools.translation_memory import (
-    build_translation_memory_payload as _build_translation_memory_payload_impl,
-    payload_to_json as _payload_to_json_impl,
-    render_translation_memory_payload as _render_translation_memory_payload_impl,
-)
-from tools.build_reports import (
-    default_report_dir_for_tracked_root as _default_report_dir_for_tracked_root_impl,
-    diff_report_command as _diff_report_command,
-    publish_target_components as _publish_target_components_impl,
-    report_dir_for_target as _report_dir_for_target_impl,
-    require_explicit_target as _require_explicit_target_impl,
-    resolve_diff_report_targets as _resolve_diff_report_targets_impl,
-    tracked_root_for_target as _tracked_root_for_target_impl,
-)
-from tools.build_publish import (
-    run_diff_report as _run_diff_report_impl,
-    run_diff_report_with_paths as _run_diff_report_with_paths_impl,
-    run_publish as _run_publish_impl,
-)
-from tools.release_asset_lineage import publish_asset_gate_for_target as _asset_gate_impl
-from tools.build_runtime import (
-    clean_build_artifacts as _clean_build_artifacts_impl,
-    collect_legacy_docs_output_dirs as _collect_legacy_docs_output_dirs_impl,
-    format_command as _format_command_impl,
-    is_legacy_bundle_dir as _is_legacy_bundle_dir_impl,
-    maybe_sync_review_before_build as _maybe_sync_review_before_build_impl,
-    path_component as _path_component_impl,
-    preview_output_root as _preview_output_root_impl,
-    review_sync_target_args as _review_sync_target_args_impl,
-    run_check as _run_check_impl,
-    run_checked as _run_checked_impl,
-    run_validate as _run_validate_impl,
-)
+from tools.lazy_import import lazy_attr
+
+# Command implementations import on first call (tools/lazy_import.py), so a
+# cold `build.py <cmd>` only loads the modules that command dispatches to.
+_append_data_root_arg_impl = lazy_attr("tools.build_entry_commands", "append_data_root_arg")
+_append_target_args_impl = lazy_attr("tools.build_entry_commands", "append_target_args")
+_build_docs_command_impl = lazy_attr("tools.build_entry_commands", "build_docs_command")
+_check_docs_command_impl = lazy_attr("tools.build_entry_commands", "check_docs_command")
+_effective_source_impl = lazy_attr("tools.build_entry_commands", "effective_source")
+_listen_build_queue_command_impl = lazy_attr("tools.build_entry_commands", "listen_build_queue_command")
+_listen_message_control_command_impl = lazy_attr("tools.build_entry_commands", "listen_message_control_command")
+_message_control_dry_run_command_impl = lazy_attr("tools.build_entry_commands", "message_control_dry_run_command")
+_normalize_cli_build_queue_action_impl = lazy_attr("tools.build_entry_commands", "normalize_cli_build_queue_action")
+_process_build_queue_command_impl = lazy_attr("tools.build_entry_commands", "process_build_queue_command")
+_process_review_start_queue_command_impl = lazy_attr("tools.build_entry_commands", "process_review_start_queue_command")
+_release_manifest_command_impl = lazy_attr("tools.build_entry_commands", "release_manifest_command")
+_release_rebuild_command_impl = lazy_attr("tools.build_entry_commands", "release_rebuild_command")
+_review_bundle_command_impl = lazy_attr("tools.build_entry_commands", "review_bundle_command")
+_spec_master_rebuild_command_impl = lazy_attr("tools.build_entry_commands", "spec_master_rebuild_command")
+_sync_data_command_impl = lazy_attr("tools.build_entry_commands", "sync_data_command")
+_sync_review_command_impl = lazy_attr("tools.build_entry_commands", "sync_review_command")
+_run_asset_command_impl = lazy_attr("tools.asset_commands", "run_asset_command")
+_run_new_line_impl = lazy_attr("tools.new_line_scaffold", "run_new_line")
+_check_word_com_available_impl = lazy_attr("tools.build_doctor", "check_word_com_available")
+_collect_doctor_findings_impl = lazy_attr("tools.build_doctor", "collect_doctor_findings")
+_doctor_import_impl = lazy_attr("tools.build_doctor", "doctor_import")
+_find_xelatex_impl = lazy_attr("tools.build_doctor", "find_xelatex")
+_is_windows_platform_impl = lazy_attr("tools.build_doctor", "is_windows_platform")
+_render_config_tokenized_value_impl = lazy_attr("tools.build_doctor", "render_config_tokenized_value")
+_doctor_render_finding_impl = lazy_attr("tools.build_doctor", "render_finding")
+_resolve_doctor_pdf_mode_impl = lazy_attr("tools.build_doctor", "resolve_doctor_pdf_mode")
+_resolve_doctor_target_impl = lazy_attr("tools.build_doctor", "resolve_doctor_target")
+_resolve_reference_doc_status_impl = lazy_attr("tools.build_doctor", "resolve_reference_doc_status")
+_run_doctor_impl = lazy_attr("tools.build_doctor", "run_doctor")
+_slug_token_impl = lazy_attr("tools.build_doctor", "slug_token")
+_resolve_message_control_impl = lazy_attr("tools.message_control_runtime", "resolve_message_control")
+_run_manual_index_query_impl = lazy_attr("tools.manual_index_query", "run_manual_index_query")
+_run_queue_execute_impl = lazy_attr("tools.queue_execute", "run_queue_execute")
+_run_queue_query_impl = lazy_attr("tools.queue_query", "run_queue_query")
+_run_queue_resolve_action_impl = lazy_attr("tools.queue_resolve_action", "run_queue_resolve_action")
+_build_translation_memory_payload_impl = lazy_attr("tools.translation_memory", "build_translation_memory_payload")
+_payload_to_json_impl = lazy_attr("tools.translation_memory", "payload_to_json")
+_render_translation_memory_payload_impl = lazy_attr("tools.translation_memory", "render_translation_memory_payload")
+_build_fuzzy_translation_memory_payload_impl = lazy_attr("tools.translation_memory_fuzzy", "build_fuzzy_translation_memory_payload")
+_default_report_dir_for_tracked_root_impl = lazy_attr("tools.build_reports", "default_report_dir_for_tracked_root")
+_diff_report_command = lazy_attr("tools.build_reports", "diff_report_command")
+_publish_target_components_impl = lazy_attr("tools.build_reports", "publish_target_components")
+_report_dir_for_target_impl = lazy_attr("tools.build_reports", "report_dir_for_target")
+_require_explicit_target_impl = lazy_attr("tools.build_reports", "require_explicit_target")
+_resolve_diff_report_targets_impl = lazy_attr("tools.build_reports", "resolve_diff_report_targets")
+_tracked_root_for_target_impl = lazy_attr("tools.build_reports", "tracked_root_for_target")
+_run_diff_report_impl = lazy_attr("tools.build_publish", "run_diff_report")
+_run_diff_report_with_paths_impl = lazy_attr("tools.build_publish", "run_diff_report_with_paths")
+_run_publish_impl = lazy_attr("tools.build_publish", "run_publish")
+_asset_gate_impl = lazy_attr("tools.release_asset_lineage", "publish_asset_gate_for_target")
+_clean_build_artifacts_impl = lazy_attr("tools.build_runtime", "clean_build_artifacts")
+_collect_legacy_docs_output_dirs_impl = lazy_attr("tools.build_runtime", "collect_legacy_docs_output_dirs")
+_format_command_impl = lazy_attr("tools.build_runtime", "format_command")
+_is_legacy_bundle_dir_impl = lazy_attr("tools.build_runtime", "is_legacy_bundle_dir")
+_maybe_sync_review_before_build_impl = lazy_attr("tools.build_runtime", "maybe_sync_review_before_build")
+_path_component_impl = lazy_attr("tools.build_runtime", "path_component")
+_preview_output_root_impl = lazy_attr("tools.build_runtime", "preview_output_root")
+_review_sync_target_args_impl = lazy_attr("tools.build_runtime", "review_sync_target_args")
+_run_check_impl = lazy_attr("tools.build_runtime", "run_check")
+_run_checked_impl = lazy_attr("tools.build_runtime", "run_checked")
+_run_validate_impl = lazy_attr("tools.build_runtime", "run_validate")
 
 ROOT = Path(__file__).resolve().parent
 DEFAULT_CONFIG = "configs/config.us.yaml"
@@ -323,7 +316,12 @@ def _emit_text(text: str) -> None:
 
 
 def run_translation_memory(args: argparse.Namespace) -> None:
-    payload = _build_translation_memory_payload_impl(
+    build_payload = _build_translation_memory_payload_impl
+    if args.fuzzy_min_similarity is not None:
+        build_payload = partial(
+            _build_fuzzy_translation_memory_payload_impl, source_lang=args.source_lang, min_similarity=args.fuzzy_min_similarity
+        )
+    payload = build_payload(
         config_path=resolve_path_from_root(args.config),
         repo_root=ROOT,
         data_root=args.data_root,
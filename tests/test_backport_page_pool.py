@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.backport_page_pool import (
+    CRASH_RETURNCODE,
+    TIMEOUT_RETURNCODE,
+    _Worker,
+    run_page_in_process,
+    run_page_subprocess,
+    run_pages,
+)
+from tools.utils.path_utils import get_paths
+
+ROOT = get_paths().root
+FETCHED = ROOT / "tests/fixtures/cloud_doc_backport/fetched.md"
+PAGES = (
+    "docs/_review/JE-1000F/US/page/00_preface.rst",
+    "docs/_review/JE-1000F/US/page/01_fcc.rst",
+    "docs/_review/JE-1000F/US/page/02_whats_in_the_box.rst",
+)
+
+
+def _review_argv(source_rel: str, out: Path) -> list[str]:
+    return [
+        "run-review",
+        "--doc-url", str(FETCHED), "--source-path", str(ROOT / source_rel),
+        "--run-id", f"pool-{Path(source_rel).stem}", "--out", str(out / Path(source_rel).stem),
+        "--allow-rst-baseline",
+    ]
+
+
+def _summary(out: Path, source_rel: str) -> dict:
+    report = json.loads((out / Path(source_rel).stem / "cloud_doc_backport_report.json").read_text(encoding="utf-8"))
+    return {"result": report["result"], "summary": report["summary"], "selection": report["section_selection"]}
+
+
+class BackportPagePoolTests(unittest.TestCase):
+    def test_pool_matches_serial_runs_in_page_order(self) -> None:
+        with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as pool_dir:
+            serial_out, pool_out = Path(serial_dir), Path(pool_dir)
+            serial = [run_page_subprocess(_review_argv(rel, serial_out), cwd=ROOT) for rel in PAGES]
+            pooled = list(run_pages([_review_argv(rel, pool_out) for rel in PAGES], workers=2, cwd=ROOT))
+
+            self.assertEqual([run.returncode for run in serial], [run.returncode for run in pooled])
+            self.assertEqual([0, 0, 0], [run.returncode for run in pooled])
+            for rel, run in zip(PAGES, pooled):
+                self.assertIn(str(pool_out / Path(rel).stem), run.stdout)
+                self.assertEqual(_summary(serial_out, rel), _summary(pool_out, rel))
+
+    def test_failing_page_does_not_take_down_its_neighbours(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out = Path(td)
+            argvs = [_review_argv(PAGES[0], out), _review_argv("README.md", out), _review_argv(PAGES[1], out)]
+
+            runs = list(run_pages(argvs, workers=2, cwd=ROOT))
+
+        self.assertEqual([0, 2, 0], [run.returncode for run in runs])
+        self.assertIn("review source must be an .rst file", runs[1].stderr)
+
+    def test_timed_out_page_is_killed_and_worker_restarts(self) -> None:
+        worker = _Worker(ROOT)
+        try:
+            with tempfile.TemporaryDirectory() as td:
+                timed_out = worker.run(_review_argv(PAGES[0], Path(td)), 0.001)
+                finished = worker.run(_review_argv(PAGES[0], Path(td)), None)
+        finally:
+            worker.close()
+
+        self.assertTrue(timed_out.timed_out)
+        self.assertEqual(TIMEOUT_RETURNCODE, timed_out.returncode)
+        self.assertEqual(0, finished.returncode)
+
+
+    def test_crashed_page_exits_like_a_fresh_interpreter(self) -> None:
+        def crash(argv: list[str]) -> int:
+            raise ValueError(f"boom {argv[0]}")
+
+        run = run_page_in_process(crash, ["run-review"])
+        fresh = subprocess.run([sys.executable, "-c", "raise ValueError('boom')"], capture_output=True, text=True)
+
+        self.assertEqual(fresh.returncode, run.returncode)
+        self.assertEqual(CRASH_RETURNCODE, run.returncode)
+        self.assertIn("ValueError: boom run-review", run.stderr)
+
+    def test_output_written_to_raw_fds_is_returned_with_the_page(self) -> None:
+        def noisy(argv: list[str]) -> int:
+            print("python stdout")
+            os.write(1, b"fd stdout\n")
+            os.write(2, b"fd stderr\n")
+            subprocess.run([sys.executable, "-c", "import sys; sys.stderr.write('child stderr\\n')"], check=True)
+            return 0
+
+        run = run_page_in_process(noisy, [])
+
+        self.assertEqual(0, run.returncode)
+        self.assertEqual("python stdout\nfd stdout\n", run.stdout)
+        self.assertEqual("fd stderr\nchild stderr\n", run.stderr)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+import unittest
+from unittest import mock
+
+from tools.utils import block_diff
+from tools.utils.block_diff import clear_block_diff_cache, diff_opcodes
+
+
+def _edited(rng: random.Random, keys: list[str]) -> list[str]:
+    edited = list(keys)
+    for _ in range(rng.randint(0, 4)):
+        at = rng.randint(0, len(edited))
+        roll = rng.random()
+        if roll < 0.3 and edited:
+            edited[min(at, len(edited) - 1)] = rng.choice("xyzab")
+        elif roll < 0.6:
+            edited.insert(at, rng.choice("xyzabc"))
+        elif edited:
+            del edited[min(at, len(edited) - 1)]
+    return edited
+
+
+class BlockDiffTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_block_diff_cache()
+
+    def test_opcodes_cover_both_sequences_and_equal_runs_match(self) -> None:
+        rng = random.Random(11)
+        for _ in range(2000):
+            a = [rng.choice("abcdefghij") for _ in range(rng.randint(0, 15))]
+            b = _edited(rng, a)
+            opcodes = diff_opcodes(a, b)
+            with self.subTest(a=a, b=b):
+                i, j = 0, 0
+                for tag, i1, i2, j1, j2 in opcodes:
+                    self.assertEqual((i, j), (i1, j1))
+                    if tag == "equal":
+                        self.assertEqual(a[i1:i2], b[j1:j2])
+                    else:
+                        expected = "replace" if i1 < i2 and j1 < j2 else ("delete" if i1 < i2 else "insert")
+                        self.assertEqual(expected, tag)
+                    i, j = i2, j2
+                self.assertEqual((len(a), len(b)), (i, j))
+                tags = [opcode[0] == "equal" for opcode in opcodes]
+                self.assertFalse(any(x == y for x, y in zip(tags, tags[1:])))
+
+    def test_unique_blocks_anchor_around_a_moved_paragraph(self) -> None:
+        baseline = ["title", "intro", "step 1", "step 2", "note", "outro"]
+        fetched = ["title", "note", "intro", "step 1", "step 2 edited", "outro"]
+
+        self.assertEqual(
+            [
+                ("equal", 0, 1, 0, 1),
+                ("insert", 1, 1, 1, 2),
+                ("equal", 1, 3, 2, 4),
+                ("replace", 3, 5, 4, 5),
+                ("equal", 5, 6, 5, 6),
+            ],
+            diff_opcodes(baseline, fetched),
+        )
+
+    def test_unmatched_regions_are_memoized_by_span_hash(self) -> None:
+        baseline = ["head", "a", "b", "mid", "c", "c", "tail"]
+        first = ["head", "a2", "b", "mid", "c", "tail"]
+        second = ["head", "a2", "b", "mid", "c", "c", "tail"]
+
+        with mock.patch.object(block_diff.difflib, "SequenceMatcher", wraps=block_diff.difflib.SequenceMatcher) as matcher:
+            diff_opcodes(baseline, first)
+            calls = matcher.call_count
+            second_opcodes = diff_opcodes(baseline, second)
+
+        self.assertEqual(calls, matcher.call_count)
+        self.assertEqual([("equal", 0, 1, 0, 1), ("replace", 1, 2, 1, 2), ("equal", 2, 7, 2, 7)], second_opcodes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.build_daemon import (
+    SOCKET_ENV,
+    build_daemon_supported,
+    build_py_invocation,
+    capture_via_build_daemon,
+    control_build_daemon,
+    serve,
+)
+from tools.queue_runtime import run_command
+
+
+def _fake_build(argv: list[str]) -> int:
+    print(f"cwd={os.getcwd()} argv={argv} flag={os.environ.get('DAEMON_TEST_FLAG', '')}")
+    print("warning line", file=sys.stderr)
+    if argv[:1] == ["fail"]:
+        raise RuntimeError("boom")
+    return 3 if argv[:1] == ["three"] else 0
+
+
+def _serve(socket_path: str, repo_root: str, watched: str) -> None:
+    serve(Path(socket_path), repo_root=Path(repo_root), run=_fake_build, watched_files=[Path(watched)], log=lambda _: None)
+
+
+@unittest.skipUnless(build_daemon_supported(), "needs Unix sockets and fork()")
+class BuildDaemonTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory(dir="/tmp")
+        self.root = Path(self._tmp.name)
+        self.socket_path = self.root / "d.sock"
+        self.watched = self.root / "build.py"
+        self.watched.write_text("# build\n", encoding="utf-8")
+        context = multiprocessing.get_context("fork")
+        self.daemon = context.Process(target=_serve, args=(str(self.socket_path), str(self.root), str(self.watched)))
+        self.daemon.start()
+        deadline = time.monotonic() + 10
+        while control_build_daemon(self.socket_path, "ping") is None:
+            self.assertLess(time.monotonic(), deadline, "daemon did not start")
+            time.sleep(0.02)
+
+    def tearDown(self) -> None:
+        control_build_daemon(self.socket_path, "stop")
+        self.daemon.join(10)
+        if self.daemon.is_alive():
+            self.daemon.terminate()
+        self._tmp.cleanup()
+
+    def _capture(self, argv: list[str], **kwargs: object):
+        return capture_via_build_daemon(argv, repo_root=self.root, socket_path=self.socket_path, **kwargs)  # type: ignore[arg-type]
+
+    def test_commands_run_in_forked_children_with_caller_cwd_env_and_exit_code(self) -> None:
+        workdir = self.root / "work"
+        workdir.mkdir()
+        result = self._capture(["three", "--x"], cwd=workdir, env={"DAEMON_TEST_FLAG": "on"})
+        failed = self._capture(["fail"])
+
+        self.assertIsNotNone(result)
+        self.assertEqual(3, result.returncode)
+        self.assertEqual(f"cwd={workdir} argv=['three', '--x'] flag=on\n", result.stdout)
+        self.assertEqual("warning line\n", result.stderr)
+        self.assertEqual(1, failed.returncode)
+        self.assertIn("RuntimeError: boom", failed.stderr)
+        self.assertTrue(self.daemon.is_alive())
+
+    def test_other_checkouts_and_changed_sources_fall_back_to_local_execution(self) -> None:
+        self.assertIsNone(capture_via_build_daemon(["x"], repo_root=self.root / "other", socket_path=self.socket_path))
+        self.assertIsNone(capture_via_build_daemon(["x"], repo_root=self.root, socket_path=self.root / "missing.sock"))
+
+        stat = self.watched.stat()
+        os.utime(self.watched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(self._capture(["x"]))
+        self.daemon.join(10)
+        self.assertFalse(self.daemon.is_alive())
+
+    def test_queue_run_command_routes_build_py_through_the_daemon(self) -> None:
+        cmd = [sys.executable, str(self.root / "build.py"), "check", "--model", "JE-1000F"]
+        self.assertEqual((self.root.resolve(), ["check", "--model", "JE-1000F"]), build_py_invocation(cmd, cwd=Path("/")))
+        self.assertIsNone(build_py_invocation(["git", "status"], cwd=self.root))
+
+        with patch.dict(os.environ, {SOCKET_ENV: str(self.socket_path)}), patch(
+            "tools.queue_runtime.subprocess.run"
+        ) as subprocess_run, patch("builtins.print"):
+            run_command(cmd, cwd=self.root, prefix="[test]")
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                run_command([sys.executable, "build.py", "fail"], cwd=self.root, prefix="[test]")
+
+        subprocess_run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
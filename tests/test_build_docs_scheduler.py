@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from tests.test_helpers import temp_test_root
+from tools import build_docs
+from tools.build_docs_entry import run_build
+from tools.build_docs_scheduler import (
+    TargetBuildJob,
+    TargetBuildResult,
+    build_targets_in_parallel,
+    run_parallel_target_builds,
+    run_target_build_job,
+    target_build_pool_context,
+    target_log_path,
+)
+from tools.build_docs_shared import BuildTarget
+
+
+def _fake_run_job(job: TargetBuildJob) -> TargetBuildResult:
+    # Later targets finish first so ordering must come from the scheduler.
+    time.sleep(0.05 * (3 - job.position))
+    error = "RuntimeError: boom" if job.target.lang == "fail" else None
+    return TargetBuildResult(
+        position=job.position,
+        target=job.target,
+        log_path=job.log_path,
+        elapsed_seconds=0.0,
+        error=error,
+        html_switcher_refreshes=((job.target.model, "/tmp/_build"),),
+    )
+
+
+def _fake_build_target(cfg: dict, **kwargs: Any) -> None:
+    print(f"built {kwargs['target_lang']} with {kwargs['pdf_mode']}")
+    kwargs["refresh_html_switchers"](model=kwargs["target_model"], docs_build_dir=Path("/tmp/_build"))
+
+
+def _build_args(**overrides: Any) -> argparse.Namespace:
+    values = {
+        "config": "configs/config.us.yaml",
+        "output_root": None,
+        "output_base_root": None,
+        "model": None,
+        "region": None,
+        "lang": None,
+        "all_targets": True,
+        "clean": False,
+        "formats": None,
+        "pdf_mode": None,
+        "prepare_only": True,
+        "no_open": True,
+        "source": "runtime",
+        "data_root": None,
+        "page_selector": None,
+        "skip_root_index": False,
+        "jobs": 4,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+class BuildDocsSchedulerTests(unittest.TestCase):
+    def _run_build(self, args: argparse.Namespace, targets: list[BuildTarget]) -> dict[str, Any]:
+        calls: dict[str, Any] = {"sequential": [], "parallel": None, "index": None}
+
+        def fake_parallel(cfg: dict, parallel_targets: list[Any], **kwargs: Any) -> None:
+            calls["parallel"] = (parallel_targets, kwargs)
+
+        run_build(
+            args,
+            paths=SimpleNamespace(root=Path("/repo")),
+            load_config=lambda _path: {"paths": {"layout_params_csv": "layout.csv"}},
+            validate_loaded_config=lambda _cfg: None,
+            validate_layout_csv=lambda _path: None,
+            resolve_build_targets=lambda *_args, **_kwargs: targets,
+            config_uses_model_token=lambda _cfg: False,
+            config_uses_region_token=lambda _cfg: False,
+            clean_build_targets=lambda *_args, **_kwargs: None,
+            resolve_requested_formats=lambda _cfg, _formats: {"html"},
+            resolve_pdf_mode=lambda _cfg, _mode: "latex",
+            build_target=lambda _cfg, **kwargs: calls["sequential"].append(kwargs),
+            write_docs_root_index_for_targets=lambda index_targets: calls.__setitem__("index", index_targets),
+            run_parallel_target_builds=fake_parallel,
+        )
+        return calls
+
+    def test_jobs_dispatches_multi_target_builds_to_the_pool_without_wrapper_index_writes(self) -> None:
+        targets = [BuildTarget("JE-1000F", "US", "en"), BuildTarget("JE-1000F", "JP", "ja")]
+        calls = self._run_build(_build_args(), targets)
+
+        self.assertEqual([], calls["sequential"])
+        parallel_targets, kwargs = calls["parallel"]
+        self.assertEqual(targets, parallel_targets)
+        self.assertEqual(4, kwargs["jobs"])
+        self.assertFalse(kwargs["build_kwargs"]["write_wrapper_index"])
+        self.assertEqual(targets, calls["index"])
+
+    def test_single_target_or_single_job_stays_sequential(self) -> None:
+        targets = [BuildTarget("JE-1000F", "US", "en")]
+        calls = self._run_build(_build_args(), targets)
+        self.assertIsNone(calls["parallel"])
+        self.assertTrue(calls["sequential"][0]["write_wrapper_index"])
+
+        two_targets = [BuildTarget("JE-1000F", "US", "en"), BuildTarget("JE-1000F", "JP", "ja")]
+        calls = self._run_build(_build_args(jobs=1), two_targets)
+        self.assertIsNone(calls["parallel"])
+        self.assertEqual(2, len(calls["sequential"]))
+
+    def test_jobs_rejects_a_shared_output_root(self) -> None:
+        targets = [BuildTarget("JE-1000F", "US", "en"), BuildTarget("JE-1000F", "JP", "ja")]
+        with self.assertRaisesRegex(RuntimeError, "per-target output roots"):
+            self._run_build(_build_args(output_root="docs/_build/preview"), targets)
+
+    def test_target_job_captures_output_and_defers_html_switcher_refresh(self) -> None:
+        with temp_test_root() as root:
+            target = BuildTarget("JE-1000F", "US", "en")
+            job = TargetBuildJob(
+                position=0,
+                target=target,
+                cfg={},
+                build_kwargs={"pdf_mode": "latex"},
+                log_path=target_log_path(root / "_target_logs", target),
+            )
+
+            def fake_build_target(cfg: dict, **kwargs: Any) -> None:
+                print("sphinx says hi")
+                kwargs["refresh_html_switchers"](model="JE-1000F", docs_build_dir=root)
+
+            result = run_target_build_job(job, build_target=fake_build_target)
+
+            self.assertTrue(result.ok)
+            self.assertEqual((("JE-1000F", str(root)),), result.html_switcher_refreshes)
+            self.assertEqual(root / "_target_logs" / "JE-1000F_US_en.log", result.log_path)
+            self.assertIn("sphinx says hi", result.log_path.read_text(encoding="utf-8"))
+
+    def test_parallel_builds_report_in_target_order_and_refresh_switchers_once(self) -> None:
+        targets = [
+            BuildTarget("JE-1000F", "US", "en"),
+            BuildTarget("JE-1000F", "JP", "fail"),
+            BuildTarget("JE-2000E", "EU", "de"),
+        ]
+        refreshed: list[tuple[str, Path]] = []
+        prepared: list[bool] = []
+        messages: list[str] = []
+        with temp_test_root() as root:
+            with self.assertRaises(RuntimeError) as ctx:
+                run_parallel_target_builds(
+                    {},
+                    targets,
+                    jobs=3,
+                    build_kwargs={},
+                    log_dir=root,
+                    prepare_shared_inputs=lambda: prepared.append(True),
+                    run_job=_fake_run_job,
+                    refresh_model_html_switchers=lambda *, model, docs_build_dir: refreshed.append(
+                        (model, docs_build_dir)
+                    ),
+                    printer=messages.append,
+                )
+
+        self.assertEqual([True], prepared)
+        self.assertIn("1 of 3 target build(s) failed", str(ctx.exception))
+        self.assertIn("lang='fail'", str(ctx.exception))
+        self.assertEqual(
+            [("JE-1000F", Path("/tmp/_build")), ("JE-2000E", Path("/tmp/_build"))],
+            refreshed,
+        )
+
+    def test_build_docs_entry_runs_target_builder_in_workers_with_per_target_logs(self) -> None:
+        targets = [BuildTarget("JE-1000F", "US", "en"), BuildTarget("JE-1000F", "JP", "ja")]
+        refreshed: list[tuple[str, Path]] = []
+        with temp_test_root() as root:
+            results = build_targets_in_parallel(
+                {},
+                targets,
+                jobs=2,
+                build_kwargs={"source_mode": "review-asis", "pdf_mode": "latex"},
+                output_base_root=root,
+                default_docs_build_dir=root / "unused",
+                build_target=_fake_build_target,
+                resolve_spec_master_csv_path=lambda *_args, **_kwargs: self.fail("review-asis reads no snapshot"),
+                refresh_model_html_switchers=lambda *, model, docs_build_dir: refreshed.append(
+                    (model, docs_build_dir)
+                ),
+            )
+
+            self.assertEqual(targets, [result.target for result in results])
+            self.assertEqual(
+                "built ja with latex",
+                (root / "_target_logs" / "JE-1000F_JP_ja.log").read_text(encoding="utf-8").splitlines()[-1],
+            )
+        self.assertEqual([("JE-1000F", Path("/tmp/_build"))], refreshed)
+
+
+    def test_build_docs_main_parses_jobs_through_its_own_cli(self) -> None:
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), self.assertRaises(SystemExit) as ctx:
+            build_docs.main(["--help"])
+
+        self.assertEqual(0, ctx.exception.code)
+        self.assertIn("--jobs", stdout.getvalue())
+
+    def test_pool_asks_for_fork_only_where_the_platform_offers_it(self) -> None:
+        with mock.patch("multiprocessing.get_all_start_methods", return_value=["fork", "spawn", "forkserver"]):
+            self.assertEqual("fork", target_build_pool_context().get_start_method())
+        with mock.patch("multiprocessing.get_all_start_methods", return_value=["spawn"]):
+            self.assertIsNone(target_build_pool_context())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from collections.abc import Mapping
+from typing import Any
+
+from tools.build_docs_stages import (
+    BuildStage,
+    format_stage_timings,
+    resolve_format_jobs,
+    run_build_stages,
+)
+
+
+class BuildDocsStagesTests(unittest.TestCase):
+    def test_sequential_run_keeps_declared_order_and_passes_results(self) -> None:
+        calls: list[str] = []
+
+        def stage(name: str, value: str) -> BuildStage:
+            def run(_finished: Mapping[str, Any]) -> str:
+                calls.append(name)
+                return value
+
+            return BuildStage(name, run)
+
+        stages = [
+            stage("html", "index.html"),
+            stage("latex", "manual.tex"),
+            BuildStage("pdf", lambda finished: f"{finished['latex']}.pdf", depends_on=("latex",)),
+        ]
+        report = run_build_stages(stages)
+
+        self.assertEqual(["html", "latex"], calls)
+        self.assertEqual("manual.tex.pdf", report.results["pdf"])
+        self.assertEqual(["html", "latex", "pdf"], list(report.timings))
+
+    def test_concurrent_run_overlaps_independent_stages_and_respects_dependencies(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        order: list[str] = []
+        lock = threading.Lock()
+
+        def meet(name: str) -> Any:
+            def run(_finished: Mapping[str, Any]) -> str:
+                barrier.wait()
+                with lock:
+                    order.append(name)
+                return name
+
+            return run
+
+        def after_latex(finished: Mapping[str, Any]) -> str:
+            with lock:
+                order.append("pdf")
+            return f"{finished['latex']}->pdf"
+
+        report = run_build_stages(
+            [
+                BuildStage("html", meet("html")),
+                BuildStage("latex", meet("latex")),
+                BuildStage("pdf", after_latex, depends_on=("latex",)),
+            ],
+            max_workers=3,
+        )
+
+        self.assertEqual("latex->pdf", report.results["pdf"])
+        self.assertLess(order.index("latex"), order.index("pdf"))
+        self.assertEqual(["html", "latex", "pdf"], list(report.timings))
+
+    def test_concurrent_failure_reraises_earliest_declared_stage_and_skips_dependents(self) -> None:
+        ran: list[str] = []
+
+        def fail(message: str) -> Any:
+            def run(_finished: Mapping[str, Any]) -> None:
+                raise RuntimeError(message)
+
+            return run
+
+        with self.assertRaisesRegex(RuntimeError, "latex failed"):
+            run_build_stages(
+                [
+                    BuildStage("latex", fail("latex failed")),
+                    BuildStage("md", fail("md failed")),
+                    BuildStage("pdf", lambda _finished: ran.append("pdf"), depends_on=("latex",)),
+                ],
+                max_workers=2,
+            )
+        self.assertEqual([], ran)
+
+    def test_stage_order_and_format_jobs_are_validated(self) -> None:
+        with self.assertRaisesRegex(RuntimeError, "depends on undeclared"):
+            run_build_stages([BuildStage("pdf", lambda _finished: None, depends_on=("latex",))])
+        with self.assertRaisesRegex(RuntimeError, "duplicate build stage"):
+            run_build_stages([BuildStage("md", lambda _f: None), BuildStage("md", lambda _f: None)])
+
+        self.assertEqual(1, resolve_format_jobs({}))
+        self.assertEqual(3, resolve_format_jobs({"format_jobs": 3}))
+        with self.assertRaisesRegex(RuntimeError, "build.format_jobs"):
+            resolve_format_jobs({"format_jobs": "many"})
+
+        self.assertEqual("html 1.0s, pdf 12.3s", format_stage_timings({"html": 1.04, "pdf": 12.34}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import build
+from tools import check_import_budget as import_budget
+from tools.lazy_import import LazyAttr, lazy_attr, resolve_lazy_attrs
+
+SAMPLE_IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       400 |       1500 | site
+import time:       200 |        200 |     tools.utils
+import time:       300 |        500 |   tools.build_paths
+import time:      2000 |       2500 | tools.build_main
+not an importtime line
+"""
+
+
+class ImportBudgetTests(unittest.TestCase):
+    def test_parse_importtime_sums_top_level_cumulative_times(self) -> None:
+        profile = import_budget.parse_importtime(SAMPLE_IMPORTTIME)
+
+        self.assertEqual(("_io", "site", "tools.utils", "tools.build_paths", "tools.build_main"), profile.modules)
+        self.assertEqual((("site", 1.5), ("tools.build_main", 2.5)), profile.top_level)
+        self.assertAlmostEqual(4.0, profile.total_ms)
+
+    def test_check_budget_fails_on_module_count_and_heavy_modules_only(self) -> None:
+        profile = import_budget.ImportProfile(
+            total_ms=300.0,
+            modules=("site", "bs4", "bs4.element", "tools.build_docs_io"),
+            top_level=(("site", 300.0),),
+        )
+        budget = import_budget.ImportBudget(argv=("--help",), max_modules=3, max_time_ratio=2.0)
+
+        problems = import_budget.check_budget(budget, profile)
+
+        self.assertEqual(2, len(problems))
+        self.assertIn("4 modules (budget 3)", problems[0])
+        self.assertIn("heavy modules bs4, bs4.element", problems[1])
+
+    def test_import_time_is_an_advisory_ratio_to_a_bare_interpreter_start(self) -> None:
+        budget = import_budget.ImportBudget(argv=("--help",), max_modules=250, max_time_ratio=10.0)
+        slow_runner = import_budget.ImportProfile(total_ms=40.0, modules=("site",), top_level=(("site", 40.0),))
+        fast_runner = import_budget.ImportProfile(total_ms=8.0, modules=("site",), top_level=(("site", 8.0),))
+        profile = import_budget.ImportProfile(total_ms=300.0, modules=("site",), top_level=(("site", 300.0),))
+
+        self.assertIsNone(import_budget.check_time(budget, profile, slow_runner))
+        warning = import_budget.check_time(budget, profile, fast_runner)
+        self.assertIn("37.5x a bare interpreter start", warning or "")
+        self.assertEqual([], import_budget.check_budget(budget, profile))
+
+    def test_build_help_cold_start_stays_off_heavy_modules(self) -> None:
+        budget = import_budget.LIGHT_COMMAND_BUDGETS[0]
+        profile = import_budget.profile_command(budget.argv)
+
+        self.assertIn("tools.build_main", profile.modules)
+        self.assertEqual([], import_budget.heavy_imports(profile))
+        self.assertLessEqual(len(profile.modules), budget.max_modules)
+
+
+class LazyAttrTests(unittest.TestCase):
+    def test_build_binds_command_implementations_lazily(self) -> None:
+        self.assertIsInstance(build._run_queue_query_impl, LazyAttr)
+        self.assertEqual("tools.queue_query", build._run_queue_query_impl.module)
+
+    def test_lazy_attr_imports_on_first_call_and_can_be_patched(self) -> None:
+        join = lazy_attr("posixpath", "join")
+        self.assertEqual("a/b", join("a", "b"))
+
+        with patch.object(build, "_format_command_impl", lambda cmd: "patched"):
+            self.assertEqual("patched", build.format_command(["x"]))
+        self.assertIn("tools.build_runtime.format_command", resolve_lazy_attrs(build))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,23 +13,26 @@ from types import SimpleNamespace
 from unittest.mock import patch
 
 _LEDGER_ENV = "AUTO_MANUAL_REVISION_LEDGER_PATH"
-_ledger_env_before: str | None = None
+_FETCH_CACHE_ENV = "AUTO_MANUAL_CLOUD_DOC_CACHE"
+_env_before: dict[str, str | None] = {}
 
 
 def setUpModule() -> None:
     # The review-branch flow feeds the revision ledger best-effort; tests must
     # never append to the real repo ledger. Individual tests that exercise the
-    # hook point the env at a tmp path themselves.
-    global _ledger_env_before
-    _ledger_env_before = os.environ.get(_LEDGER_ENV)
-    os.environ[_LEDGER_ENV] = "off"
+    # hook point the env at a tmp path themselves. The fetch cache is off too,
+    # so stubbed fetches neither probe revisions nor write under .tmp.
+    for name in (_LEDGER_ENV, _FETCH_CACHE_ENV):
+        _env_before[name] = os.environ.get(name)
+        os.environ[name] = "off"
 
 
 def tearDownModule() -> None:
-    if _ledger_env_before is None:
-        os.environ.pop(_LEDGER_ENV, None)
-    else:
-        os.environ[_LEDGER_ENV] = _ledger_env_before
+    for name, value in _env_before.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
 
 from tools.cloud_doc_backport import (
     _auto_sibling_rels,
@@ -1364,7 +1367,7 @@ class RunReviewBranchPageGateTests(unittest.TestCase):
              patch("tools.cloud_doc_backport_orchestration.ensure_review_worktree", return_value=tmp), \
              patch("tools.cloud_doc_backport_orchestration.doc_token", return_value="tok"), \
              patch("tools.cloud_doc_backport_orchestration.fetch_doc_text", return_value="doc text"), \
-             patch("tools.cloud_doc_backport_orchestration.subprocess.run", return_value=worker), \
+             patch("tools.backport_page_pool.subprocess.run", return_value=worker), \
              contextlib.redirect_stdout(buf), contextlib.redirect_stderr(err):
             rc = _run_review_branch(args)
         payload = json.loads(buf.getvalue().strip().splitlines()[-1])
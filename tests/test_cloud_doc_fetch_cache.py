@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tools.cloud_doc_backport_model import fetch_doc_text
+from tools.cloud_doc_fetch_cache import CLOUD_DOC_CACHE_ENV, CloudDocFetchCache, doc_ref
+
+DOC_URL = "https://example.feishu.cn/wiki/Doc123"
+
+# A lark-cli stand-in: logs every argv, answers ``drive metas batch_query``
+# from the revision file, and only knows the ``docs +fetch --doc <url>`` shape.
+_STUB = textwrap.dedent(
+    """\
+    import json, sys
+    from pathlib import Path
+    state = Path(__file__).parent
+    argv = sys.argv[1:]
+    with (state / "calls.log").open("a", encoding="utf-8") as log:
+        log.write(json.dumps(argv) + "\\n")
+    if argv[:3] == ["drive", "metas", "batch_query"]:
+        revision = (state / "revision").read_text(encoding="utf-8").strip()
+        print(json.dumps({"code": 0, "data": {"metas": [{"latest_modify_time": revision}]}}))
+    elif argv[:3] == ["docs", "+fetch", "--doc"] and len(argv) == 4:
+        print(json.dumps({"ok": True, "data": {"markdown": (state / "doc.md").read_text(encoding="utf-8")}}))
+    else:
+        print("unknown flag", file=sys.stderr)
+        sys.exit(1)
+    """
+)
+
+
+class CloudDocFetchCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.state = Path(self._tmp.name)
+        (self.state / "lark_stub.py").write_text(_STUB, encoding="utf-8")
+        self.lark_cli = self.state / "lark-cli"
+        self.lark_cli.write_text(f"#!{sys.executable}\nexec(open({str(self.state / 'lark_stub.py')!r}).read())\n")
+        self.lark_cli.chmod(0o755)
+        self.cache_dir = self.state / "cache"
+        self._publish("# Safety\n\nRead all instructions.\n", revision="1700000000")
+
+    def _publish(self, text: str, *, revision: str) -> None:
+        (self.state / "doc.md").write_text(text, encoding="utf-8")
+        (self.state / "revision").write_text(revision, encoding="utf-8")
+
+    def _fetch(self) -> tuple[str, list[list[str]]]:
+        log = self.state / "calls.log"
+        log.unlink(missing_ok=True)
+        text = fetch_doc_text(DOC_URL, lark_cli=str(self.lark_cli), cache_dir=self.cache_dir)
+        return text, [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+    def test_unchanged_revision_skips_fetch_and_variant_probing(self) -> None:
+        text, calls = self._fetch()
+        self.assertEqual("# Safety\n\nRead all instructions.\n", text)
+        self.assertEqual(4, len(calls))  # revision lookup, two rejected variants, the working one
+
+        again, calls = self._fetch()
+        self.assertEqual(text, again)
+        self.assertEqual([["drive", "metas", "batch_query"]], [call[:3] for call in calls])
+
+    def test_new_revision_refetches_with_the_learned_variant_only(self) -> None:
+        self._fetch()
+        self._publish("# Safety\n\nRead every instruction.\n", revision="1700000500")
+
+        text, calls = self._fetch()
+
+        self.assertEqual("# Safety\n\nRead every instruction.\n", text)
+        self.assertEqual([["drive", "metas", "batch_query"], ["docs", "+fetch", "--doc", DOC_URL]], [calls[0][:3], calls[1]])
+        self.assertEqual(2, len(calls))
+        entry = json.loads((self.cache_dir / "Doc123.json").read_text(encoding="utf-8"))
+        self.assertEqual(("1700000500", 2), (entry["revision"], entry["variant"]))
+
+    def test_failed_revision_lookup_still_fetches_and_learns_the_variant(self) -> None:
+        (self.state / "revision").unlink()
+
+        text, calls = self._fetch()
+        self.assertEqual("# Safety\n\nRead all instructions.\n", text)
+        self.assertFalse((self.cache_dir / "Doc123.json").exists())
+        self.assertEqual(2, CloudDocFetchCache(self.cache_dir).learned_variant(str(self.lark_cli)))
+
+        _, calls = self._fetch()
+        self.assertEqual(["docs", "+fetch", "--doc", DOC_URL], calls[1])
+
+    def test_env_off_disables_the_cache(self) -> None:
+        with patch.dict(os.environ, {CLOUD_DOC_CACHE_ENV: "off"}):
+            log = self.state / "calls.log"
+            fetch_doc_text(DOC_URL, lark_cli=str(self.lark_cli))
+            fetch_doc_text(DOC_URL, lark_cli=str(self.lark_cli))
+        calls = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(6, len(calls))
+        self.assertNotIn(["drive", "metas", "batch_query"], [call[:3] for call in calls])
+
+    def test_doc_ref_maps_url_kind_to_drive_doc_type(self) -> None:
+        self.assertEqual(("Doc123", "wiki"), doc_ref(DOC_URL))
+        self.assertEqual(("Abc9", "docx"), doc_ref("https://x.feishu.cn/docx/Abc9?from=share"))
+        self.assertIsNone(doc_ref("https://example.com/page"))
+
+
+if __name__ == "__main__":
+    unittest.main()
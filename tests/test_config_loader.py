@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
 
-from tools.config_loader import load_config_mapping
+from tools.config_loader import ConfigCache, load_config_mapping
 
 
 class TestConfigLoader(unittest.TestCase):
@@ -84,6 +85,32 @@ class TestConfigLoader(unittest.TestCase):
             with self.assertRaisesRegex(RuntimeError, "Config extends cycle detected"):
                 load_config_mapping(a_path)
 
+    def test_config_cache_shares_the_extends_chain_and_tracks_base_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            base_path = root / "base.yaml"
+            base_path.write_text("build:\n  languages: [en]\n  jobs: 1\n", encoding="utf-8")
+            (root / "us.yaml").write_text("extends: base.yaml\nbuild:\n  jobs: 2\n", encoding="utf-8")
+            (root / "eu.yaml").write_text("extends: base.yaml\nbuild:\n  jobs: 3\n", encoding="utf-8")
+            cache = ConfigCache()
+
+            for _ in range(100):
+                us_cfg = cache.load(root / "us.yaml")
+                eu_cfg = cache.load(root / "eu.yaml")
+            us_cfg["build"]["languages"].append("fr")
+            stats = cache.stats()
+
+            self.assertEqual((3, 3), (stats.misses, stats.configs))
+            self.assertEqual({"languages": ["en"], "jobs": 2}, cache.load(root / "us.yaml")["build"])
+            self.assertEqual(3, eu_cfg["build"]["jobs"])
+
+            # Same size, same mtime tick: the racy-window digest check still sees the edit.
+            stat = base_path.stat()
+            base_path.write_text("build:\n  languages: [de]\n  jobs: 1\n", encoding="utf-8")
+            os.utime(base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            self.assertEqual(["de"], cache.load(root / "eu.yaml")["build"]["languages"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.csv_pages import BuildPaths, BuildSelector, CsvPageBuilder, CsvPageCache
+from tools.csv_pages.page_cache import load_csv_page_cache_manifest, unverified_cached_outputs
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_PHASE2 = ROOT / "tests" / "fixtures" / "phase2"
+
+
+def _paths(data_dir: Path, output_dir: Path) -> BuildPaths:
+    return BuildPaths(
+        root=ROOT,
+        page_registry=data_dir / "page_registry.csv",
+        page_blocks_dir=data_dir,
+        template_dir=ROOT / "docs" / "templates",
+        output_dir=output_dir,
+        spec_master_csv=data_dir / "Spec_Master.csv",
+        spec_footnotes_csv=data_dir / "Spec_Footnotes.csv",
+        spec_notes_csv=data_dir / "Spec_Notes.csv",
+        spec_titles_csv=data_dir / "spec_titles.csv",
+        localized_copy_csv=data_dir / "Localized_Copy.csv",
+    )
+
+
+class CsvPageCacheTests(unittest.TestCase):
+    def test_unchanged_inputs_reuse_outputs_and_changed_blocks_rerender_their_page(self) -> None:
+        selector = BuildSelector.from_args(models="JE-1000F", regions="US", langs="en,fr")
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            data_dir = root / "phase2"
+            shutil.copytree(FIXTURE_PHASE2, data_dir)
+            uncached = CsvPageBuilder(_paths(data_dir, root / "uncached")).build(selector)
+            cache = root / "cache"
+
+            first = CsvPageBuilder(_paths(data_dir, root / "out"), cache=CsvPageCache(cache)).build(selector)
+            second = CsvPageBuilder(_paths(data_dir, root / "out"), cache=CsvPageCache(cache)).build(selector)
+            blocks = data_dir / "troubleshooting_blocks.csv"
+            blocks.write_text(blocks.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+            third = CsvPageBuilder(_paths(data_dir, root / "out"), cache=CsvPageCache(cache)).build(selector)
+
+            self.assertEqual([], first.cached_files)
+            self.assertEqual(second.written_files, second.cached_files)
+            self.assertEqual(
+                [path.read_text(encoding="utf-8") for path in uncached.written_files],
+                [path.read_text(encoding="utf-8") for path in second.written_files],
+            )
+            self.assertEqual(
+                sorted(path.name for path in third.written_files if path not in third.cached_files),
+                ["troubleshooting_en.rst", "troubleshooting_fr.rst"],
+            )
+            manifest = load_csv_page_cache_manifest(root / "out")
+            self.assertTrue(manifest["JE-1000F/spec_en.rst"]["cached"])
+            self.assertFalse(manifest["JE-1000F/troubleshooting_en.rst"]["cached"])
+            self.assertEqual([], unverified_cached_outputs(root / "out"))
+
+            edited = root / "out" / "JE-1000F" / "spec_en.rst"
+            edited.write_text(edited.read_text(encoding="utf-8") + "hand edit\n", encoding="utf-8")
+            self.assertEqual([edited], unverified_cached_outputs(root / "out"))
+
+    def test_render_vars_and_templates_are_part_of_the_key(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = Path(td) / "blocks.csv"
+            csv_path.write_text("a\n1\n", encoding="utf-8")
+            cache = CsvPageCache(Path(td) / "cache")
+
+            def key(template: str = "T", **render_vars: str) -> str:
+                return cache.page_key(
+                    renderer=unverified_cached_outputs,
+                    page_id="spec",
+                    lang="en",
+                    sku="",
+                    template_text=template,
+                    input_csvs=[csv_path],
+                    render_vars={"lang": "en", **render_vars},
+                )
+
+            self.assertEqual(key(), key())
+            self.assertNotEqual(key(), key("T2"))
+            self.assertNotEqual(key(), key(model="JE-1000F"))
+
+
+if __name__ == "__main__":
+    unittest.main()
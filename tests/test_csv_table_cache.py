@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import unittest
+
+from tests.test_helpers import temp_test_root, write_text
+from tools.utils.csv_table_cache import CsvTableCache
+
+
+class CsvTableCacheTests(unittest.TestCase):
+    def test_repeat_reads_parse_once_and_return_independent_rows(self) -> None:
+        cache = CsvTableCache()
+        with temp_test_root() as root:
+            path = root / "Spec_Master.csv"
+            write_text(path, "\ufeffRow_key,Value_source\nproduct_name,Jackery\n")
+
+            first = cache.read_rows(path)
+            assert first is not None
+            first[0]["Value_source"] = "mutated"
+            second = cache.read_rows(path, line_numbers=True)
+
+            self.assertEqual([{"Row_key": "product_name", "Value_source": "Jackery", "__line__": "2"}], second)
+            stats = cache.stats()
+            self.assertEqual((1, 1, 1), (stats.hits, stats.misses, stats.tables))
+
+    def test_rewritten_file_is_reparsed_even_within_the_same_mtime(self) -> None:
+        cache = CsvTableCache()
+        with temp_test_root() as root:
+            path = root / "table.csv"
+            write_text(path, "key\naaa\n")
+            before = path.stat()
+            self.assertEqual([{"key": "aaa"}], cache.read_rows(path))
+
+            write_text(path, "key\nbbb\n")
+            os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+            self.assertEqual([{"key": "bbb"}], cache.read_rows(path))
+            self.assertEqual(2, cache.stats().misses)
+
+    def test_missing_file_reads_as_none_and_lru_evicts_oldest_table(self) -> None:
+        cache = CsvTableCache(max_tables=1)
+        with temp_test_root() as root:
+            self.assertIsNone(cache.read_rows(root / "missing.csv"))
+            write_text(root / "a.csv", "key\na\n")
+            write_text(root / "b.csv", "key\nb\n")
+            cache.read_rows(root / "a.csv")
+            cache.read_rows(root / "b.csv")
+            cache.read_rows(root / "a.csv")
+
+            stats = cache.stats()
+            self.assertEqual((0, 3, 2, 1), (stats.hits, stats.misses, stats.evictions, stats.tables))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,13 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from tools.draft_engine import render_generated_page
+from unittest import mock
+
+from tools import draft_engine
+from tools.draft_engine import RenderContext, render_generated_page
+from tools.word_bundle_common import fill_product_name_from_spec_master, resolve_spec_master_substitutions
+
+FIXTURE_SPEC_MASTER = Path(__file__).resolve().parent / "fixtures" / "phase2" / "Spec_Master.csv"
 
 
 class TestDraftEngine(unittest.TestCase):
@@ -352,5 +358,38 @@ class TestDraftEngine(unittest.TestCase):
         self.assertIn("==MISSING:MAIN_POWER_BUTTON_LABEL==", result.text)
 
 
+class RenderContextTests(unittest.TestCase):
+    def test_context_matches_per_page_resolution_and_reads_spec_master_once(self) -> None:
+        base_vars = {"model": "JE-1000F", "region": "US", "localized_copy_csv": "copy.csv"}
+        base_substitutions = {"MANUAL_LANGUAGE_SCOPE": "EN/FR", "PRODUCT_NAME": "overridden"}
+        with mock.patch.object(
+            draft_engine, "read_spec_master_rows", wraps=draft_engine.read_spec_master_rows
+        ) as read_rows:
+            context = RenderContext(
+                spec_master_csv=FIXTURE_SPEC_MASTER,
+                model="JE-1000F",
+                region="US",
+                base_vars_map=base_vars,
+                base_substitutions=base_substitutions,
+            )
+            for lang in ("en", "fr", "en"):
+                with self.subTest(lang=lang):
+                    expected_vars = fill_product_name_from_spec_master(
+                        base_vars, spec_master_csv=FIXTURE_SPEC_MASTER, model="JE-1000F", region="US", lang=lang
+                    )
+                    expected_substitutions = {
+                        **base_substitutions,
+                        **resolve_spec_master_substitutions(
+                            spec_master_csv=FIXTURE_SPEC_MASTER, model="JE-1000F", region="US", lang=lang
+                        ),
+                    }
+                    self.assertEqual(expected_vars, context.page_vars(lang))
+                    self.assertEqual(expected_substitutions, context.page_substitutions(lang))
+
+            context.page_vars("en")["lang"] = "en"
+            self.assertNotIn("lang", context.page_vars("en"))
+            self.assertEqual(1, read_rows.call_count)
+
+
 if __name__ == "__main__":
     unittest.main()
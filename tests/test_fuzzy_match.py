@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from tools.utils.fuzzy_match import (
+    NGramIndex,
+    anchored_partial_ratio,
+    bounded_levenshtein,
+    normalize_fuzzy_text,
+    partial_ratio,
+    similarity_percent,
+)
+
+
+def _levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for row, char_a in enumerate(a, start=1):
+        current = [row]
+        for column, char_b in enumerate(b, start=1):
+            current.append(min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _random_text(rng: random.Random) -> str:
+    return "".join(rng.choice("abc d-") for _ in range(rng.randint(0, 14)))
+
+
+class FuzzyMatchTests(unittest.TestCase):
+    def test_bounded_levenshtein_agrees_with_full_distance(self) -> None:
+        rng = random.Random(3)
+        for _ in range(2000):
+            a, b = _random_text(rng), _random_text(rng)
+            bound = rng.randint(0, 8)
+            exact = _levenshtein(a, b)
+            with self.subTest(a=a, b=b, bound=bound):
+                self.assertEqual(exact if exact <= bound else None, bounded_levenshtein(a, b, bound))
+
+    def test_index_search_matches_brute_force(self) -> None:
+        rng = random.Random(5)
+        words = ["usb-c", "port", "100w", "60w", "charging", "power", "output", "ac", "dc"]
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(300)]
+        index = NGramIndex(enumerate(texts))
+        for _ in range(60):
+            query = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+            threshold = rng.choice([60, 70, 75, 85, 95, 100])
+            expected = set()
+            for key, raw in enumerate(texts):
+                text, normalized_query = normalize_fuzzy_text(raw), normalize_fuzzy_text(query)
+                distance = _levenshtein(normalized_query, text)
+                if similarity_percent(len(normalized_query), len(text), distance) >= threshold:
+                    expected.add((key, distance))
+            with self.subTest(query=query, threshold=threshold):
+                found = index.search(query, min_similarity=threshold)
+                self.assertEqual(expected, {(candidate.key, candidate.distance) for candidate in found})
+                self.assertEqual(sorted(found, key=lambda c: -c.similarity), found)
+
+    def test_similarity_is_cat_style_percentage(self) -> None:
+        index = NGramIndex([("a", "USB-C 100W Port"), ("b", "Keep the port dry")])
+
+        found = index.search("usb-c  60w port", min_similarity=75)
+
+        self.assertEqual(["a"], [candidate.key for candidate in found])
+        self.assertEqual((2, 86), (found[0].distance, found[0].similarity))
+        self.assertEqual(100, index.search("Usb-C 100w PORT", min_similarity=100)[0].similarity)
+
+    def test_partial_ratio_keeps_every_anchored_score_that_reaches_the_threshold(self) -> None:
+        rng = random.Random(7)
+        for _ in range(800):
+            needle = "".join(rng.choice("abcd e") for _ in range(rng.randint(0, 24)))
+            hay = "".join(rng.choice("abcd e") for _ in range(rng.randint(0, 60)))
+            if needle and rng.random() < 0.5:
+                cut = rng.randint(0, len(hay))
+                hay = hay[:cut] + needle[1:] + hay[cut:]
+            min_ratio = rng.choice([0.6, 0.8, 0.9])
+            expected = anchored_partial_ratio(needle, hay)
+            with self.subTest(needle=needle, hay=hay, min_ratio=min_ratio):
+                self.assertEqual(expected if expected >= min_ratio else 0.0, partial_ratio(needle, hay, min_ratio=min_ratio))
+
+if __name__ == "__main__":
+    unittest.main()
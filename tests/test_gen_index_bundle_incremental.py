@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+import build as build_cli
+from tests.test_helpers import temp_test_root, write_text
+from tools import build_docs
+from tools.gen_index_bundle_incremental import (
+    bundle_file_state_path,
+    preserve_unchanged_bundle_files,
+    retire_bundle_tree,
+)
+
+_OLD_MTIME_NS = 1_600_000_000_000_000_000
+
+
+def _materialize(bundle_dir: Path, files: dict[str, str]) -> None:
+    retire_bundle_tree(bundle_dir, remove_tree=shutil.rmtree)
+    for relative, text in files.items():
+        write_text(bundle_dir / relative, text)
+
+
+class IncrementalBundleTests(unittest.TestCase):
+    def test_rematerialized_bundle_keeps_mtimes_of_identical_files_only(self) -> None:
+        with temp_test_root() as root:
+            bundle_dir = root / "JE-1000F" / "US" / "rst"
+            _materialize(
+                bundle_dir,
+                {"index.rst": "index\n", "page/a.rst": "A\n", "page/b.rst": "B\n", "page/stale.rst": "S\n"},
+            )
+            for path in bundle_dir.rglob("*.rst"):
+                os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+            first = preserve_unchanged_bundle_files(bundle_dir)
+            self.assertEqual((0, 0, 4, 0), (first.unchanged, first.changed, first.added, first.removed))
+
+            _materialize(bundle_dir, {"index.rst": "index\n", "page/a.rst": "A\n", "page/b.rst": "B2\n", "page/c.rst": "C\n"})
+            report = preserve_unchanged_bundle_files(bundle_dir)
+
+            self.assertEqual((2, 1, 1, 1), (report.unchanged, report.changed, report.added, report.removed))
+            self.assertEqual(_OLD_MTIME_NS, (bundle_dir / "page" / "a.rst").stat().st_mtime_ns)
+            self.assertNotEqual(_OLD_MTIME_NS, (bundle_dir / "page" / "b.rst").stat().st_mtime_ns)
+            self.assertFalse((bundle_dir / "page" / "stale.rst").exists())
+            self.assertTrue(bundle_file_state_path(bundle_dir).is_file())
+
+    def test_files_edited_after_the_last_record_are_rehashed_before_retirement(self) -> None:
+        with temp_test_root() as root:
+            bundle_dir = root / "rst"
+            _materialize(bundle_dir, {"page/a.rst": "A\n"})
+            os.utime(bundle_dir / "page" / "a.rst", ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+            preserve_unchanged_bundle_files(bundle_dir)
+
+            # A hand edit between builds means Sphinx already saw newer content,
+            # so restoring the recorded mtime must not hide the next change.
+            write_text(bundle_dir / "page" / "a.rst", "edited\n")
+            edited_mtime = (bundle_dir / "page" / "a.rst").stat().st_mtime_ns
+            _materialize(bundle_dir, {"page/a.rst": "A\n"})
+            report = preserve_unchanged_bundle_files(bundle_dir)
+
+            self.assertEqual(1, report.changed)
+            self.assertGreaterEqual((bundle_dir / "page" / "a.rst").stat().st_mtime_ns, edited_mtime)
+
+    def test_default_clean_keeps_bundle_state_and_sphinx_doctrees(self) -> None:
+        # Every action but fast passes --clean, so the clean path is the normal
+        # path and must leave the next build incremental.
+        self.assertIn("--clean", build_cli.build_docs_command(build_cli.parse_args(["html"])))
+        with temp_test_root() as root:
+            docs_dir = root / "docs"
+            target = SimpleNamespace(model="JE-1000F", region="US", lang=None)
+            target_root = build_docs.build_root_for_target(
+                target.model, target.region, target.lang, docs_build_dir=docs_dir / "_build"
+            )
+            bundle_dir = target_root / "rst"
+            _materialize(bundle_dir, {"index.rst": "index\n", "page/a.rst": "A\n"})
+            os.utime(bundle_dir / "page" / "a.rst", ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+            preserve_unchanged_bundle_files(bundle_dir)
+            write_text(target_root / "html" / "index.html", "<html></html>\n")
+            write_text(target_root / "html" / ".doctrees" / "environment.pickle", "env\n")
+            write_text(target_root / "latex" / ".doctrees" / "index.doctree", "doctree\n")
+            write_text(target_root / "latex" / "manual.tex", "tex\n")
+            write_text(target_root / "pdf" / "manual.pdf", "pdf\n")
+
+            build_docs.clean_build_targets([target], docs_dir=docs_dir)
+
+            self.assertFalse((target_root / "html" / "index.html").exists())
+            self.assertFalse((target_root / "latex" / "manual.tex").exists())
+            self.assertFalse((target_root / "pdf").exists())
+            self.assertTrue((target_root / "html" / ".doctrees" / "environment.pickle").is_file())
+            self.assertTrue((target_root / "latex" / ".doctrees" / "index.doctree").is_file())
+            self.assertTrue(bundle_file_state_path(bundle_dir).is_file())
+
+            _materialize(bundle_dir, {"index.rst": "index\n", "page/a.rst": "A\n"})
+            report = preserve_unchanged_bundle_files(bundle_dir)
+
+            self.assertEqual((2, 0, 0), (report.unchanged, report.changed, report.added))
+            self.assertEqual(_OLD_MTIME_NS, (bundle_dir / "page" / "a.rst").stat().st_mtime_ns)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from tools.gen_index_bundle_runtime import (
+    BundleMaterializationContext,
+    materialize_bundle_pages,
+    resolve_bundle_jobs,
+)
+
+
+@dataclass(frozen=True)
+class _Planned:
+    file_name: str
+
+
+@dataclass(frozen=True)
+class _Render:
+    recipe_path: Path
+    used_snippet_ids: tuple[str, ...]
+
+
+def _fake_materialize(planned: _Planned, *, target_path: Path, render_context: object, **_kwargs: object):
+    print(f"render {planned.file_name}")
+    if planned.file_name == "broken.rst":
+        raise RuntimeError("broken page")
+    stem = Path(planned.file_name).stem
+    render = None if stem.startswith("plain") else _Render(Path(f"recipes/{stem}.yaml"), (f"{stem}.a", f"{stem}.b"))
+    return f"{stem} via {render_context} in {os.getpid()}", render
+
+
+def _context(root: Path, names: list[str]) -> BundleMaterializationContext:
+    bundle_dir = root / "rst"
+    return BundleMaterializationContext(
+        docs_dir=root,
+        repo_root=root,
+        target_model="JE-1000F",
+        target_region="US",
+        build_langs=("en",),
+        primary_lang="en",
+        output_lang=None,
+        page_manifest_path=None,
+        planned_pages=tuple(_Planned(name) for name in names),
+        spec_master_csv=root / "Spec_Master.csv",
+        base_vars_map={},
+        base_substitutions={},
+        reference_doc=None,
+        title="Manual",
+        bundle_dir=bundle_dir,
+        generated_dir=bundle_dir / "generated",
+        page_dir=bundle_dir / "page",
+        index_path=bundle_dir / "index.rst",
+        wrapper_index_path=root / "index.rst",
+        bundle_manifest_path=bundle_dir / "bundle_manifest.json",
+    )
+
+
+class MaterializeBundlePagesTests(unittest.TestCase):
+    def test_parallel_pages_match_sequential_order_and_ids(self) -> None:
+        names = [f"p{index:02d}_page.rst" for index in range(6)] + ["plain.rst", "sub/p07_page.rst"]
+        results = {}
+        for workers in (1, 3):
+            with tempfile.TemporaryDirectory() as td:
+                context = _context(Path(td), names)
+                page_paths, recipe_ids, snippet_ids = materialize_bundle_pages(
+                    context,
+                    cfg={},
+                    materialize_planned_page=_fake_materialize,
+                    render_context="ctx",
+                    max_workers=workers,
+                )
+                texts = [path.read_text(encoding="utf-8").split(" in ")[0] for path in page_paths]
+                results[workers] = ([path.relative_to(td).as_posix() for path in page_paths], recipe_ids, snippet_ids, texts)
+
+        self.assertEqual(results[1], results[3])
+        self.assertEqual([f"rst/page/{name}" for name in names], results[3][0])
+        self.assertEqual(["p00_page", "p01_page"], results[3][1][:2])
+        self.assertEqual(["p00_page.a", "p00_page.b", "p01_page.a"], results[3][2][:3])
+        self.assertEqual("p00_page via ctx", results[3][3][0])
+
+    def test_parallel_page_errors_propagate(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            context = _context(Path(td), ["p01_page.rst", "broken.rst", "p03_page.rst"])
+            with self.assertRaisesRegex(RuntimeError, "broken page"):
+                materialize_bundle_pages(
+                    context, cfg={}, materialize_planned_page=_fake_materialize, max_workers=2
+                )
+            self.assertTrue((Path(td) / "rst" / "page" / "p01_page.rst").exists())
+            self.assertFalse((Path(td) / "rst" / "page" / "p03_page.rst").exists())
+
+    def test_bundle_jobs_config(self) -> None:
+        self.assertEqual(1, resolve_bundle_jobs({}))
+        self.assertEqual(4, resolve_bundle_jobs({"bundle_jobs": "4"}))
+        self.assertEqual(1, resolve_bundle_jobs({"bundle_jobs": 0}))
+        with self.assertRaisesRegex(RuntimeError, "build.bundle_jobs must be a positive integer"):
+            resolve_bundle_jobs({"bundle_jobs": "many"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools.git_object_reader import GitObjectReader, last_commits_for_paths
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Rev Reviewer", "-c", "user.email=rev@example.invalid", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    ).stdout.strip()
+
+
+def _commit(root: Path, files: dict[str, str], message: str) -> None:
+    for rel_path, text in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        _git(root, "add", rel_path)
+    _git(root, "commit", "-q", "-m", message)
+
+
+class GitObjectReaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        _git(self.root, "init", "-q")
+        _commit(self.root, {"docs/a page.rst": "old a\n", "docs/b.rst": "b\n"}, "first")
+        _commit(self.root, {"docs/a page.rst": "new a\n"}, "land edits (#42)")
+
+    def test_reads_blobs_at_refs_and_caches_them(self) -> None:
+        with GitObjectReader(self.root) as reader:
+            self.assertEqual("old a\n", reader.read_text("HEAD~1", "docs/a page.rst"))
+            self.assertEqual("new a\n", reader.read_text("HEAD", "docs/a page.rst"))
+            self.assertEqual("new a\n", reader.read_text("HEAD", "docs/a page.rst"))
+            self.assertIsNone(reader.read_text("HEAD", "docs/missing.rst"))
+            self.assertIsNone(reader.read_text("HEAD", "docs"))
+            self.assertIsNone(reader.read_text("no-such-ref", "docs/b.rst"))
+            stats = reader.stats()
+
+        self.assertEqual(6, stats.reads)
+        self.assertEqual(1, stats.cache_hits)
+
+    def test_refs_stay_pinned_for_the_reader_lifetime(self) -> None:
+        with GitObjectReader(self.root) as reader:
+            self.assertEqual("b\n", reader.read_text("HEAD", "docs/b.rst"))
+            _commit(self.root, {"docs/b.rst": "b2\n"}, "third")
+            self.assertEqual("b\n", reader.read_text("HEAD", "docs/b.rst"))
+        with GitObjectReader(self.root) as reader:
+            self.assertEqual("b2\n", reader.read_text("HEAD", "docs/b.rst"))
+
+    def test_cache_stays_within_its_byte_budget(self) -> None:
+        with GitObjectReader(self.root, max_cache_bytes=8) as reader:
+            reader.read_text("HEAD", "docs/a page.rst")
+            reader.read_text("HEAD", "docs/b.rst")
+            reader.read_text("HEAD~1", "docs/a page.rst")
+
+            self.assertLessEqual(reader.stats().cached_bytes, 8)
+
+    def test_non_repository_reads_as_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as td, GitObjectReader(Path(td)) as reader:
+            self.assertIsNone(reader.read_text("HEAD", "docs/b.rst"))
+            self.assertIsNone(reader.read_text("HEAD", "docs/b.rst"))
+
+    def test_last_commits_for_paths_resolves_every_path_in_one_pass(self) -> None:
+        commits = last_commits_for_paths(self.root, ["docs/a page.rst", "./docs/b.rst", "docs/none.rst"])
+
+        self.assertEqual({"docs/a page.rst", "./docs/b.rst"}, set(commits))
+        self.assertEqual("land edits (#42)", commits["docs/a page.rst"].subject)
+        self.assertEqual("first", commits["./docs/b.rst"].subject)
+        self.assertEqual("Rev Reviewer", commits["./docs/b.rst"].author)
+        self.assertEqual(_git(self.root, "rev-parse", "HEAD"), commits["docs/a page.rst"].sha)
+
+
+if __name__ == "__main__":
+    unittest.main()
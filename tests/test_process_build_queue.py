@@ -902,7 +902,7 @@ class TestProcessBuildQueue(unittest.TestCase):
                 side_effect=[main_worktree, review_worktree],
             ) as prepare_mock, mock.patch.object(
                 process_build_queue,
-                "_remove_worktree",
+                "_release_worktree",
             ) as remove_mock, mock.patch.object(
                 process_build_queue,
                 "_run_command",
@@ -1040,7 +1040,7 @@ class TestProcessBuildQueue(unittest.TestCase):
                 side_effect=[main_worktree, review_worktree],
             ), mock.patch.object(
                 process_build_queue,
-                "_remove_worktree",
+                "_release_worktree",
             ), mock.patch.object(
                 process_build_queue,
                 "_run_command",
@@ -1120,7 +1120,7 @@ class TestProcessBuildQueue(unittest.TestCase):
                 side_effect=[main_worktree, review_worktree],
             ), mock.patch.object(
                 process_build_queue,
-                "_remove_worktree",
+                "_release_worktree",
             ), mock.patch.object(
                 process_build_queue,
                 "_run_command",
@@ -22,6 +22,7 @@ class QueueBoundRuntimeTests(unittest.TestCase):
                 run_git,
                 worktree_dir_for_git_ref,
                 remove_worktree,
+                worktree_pool,
             ) -> Path:
                 self.assertEqual(repo_root, root)
                 self.assertEqual(git_ref, "feature/test")
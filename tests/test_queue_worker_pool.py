@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from tools import queue_runtime
+from tools.queue_worker_pool import (
+    MAIN_CHECKOUT_LOCK,
+    QueueWorkerPool,
+    current_queue_worker_slot,
+    queue_group_lock_keys,
+    resolve_queue_workers,
+    run_queue_groups,
+)
+
+
+@dataclass(frozen=True)
+class _Record:
+    record_id: str
+    document: str
+    git_ref: str = ""
+    immediate: bool = False
+
+
+def _lock_keys(group):
+    return queue_group_lock_keys(group, queue_record_key=lambda record: record.document)
+
+
+class _Tracker:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active: list[str] = []
+        self.max_active = 0
+        self.overlaps: list[tuple[str, ...]] = []
+        self.order: list[str] = []
+
+    def run(self, group):
+        name = group[0].record_id
+        with self.lock:
+            self.active.append(name)
+            self.order.append(name)
+            self.max_active = max(self.max_active, len(self.active))
+            self.overlaps.append(tuple(sorted(self.active)))
+        time.sleep(self.delay)
+        with self.lock:
+            self.active.remove(name)
+        return name
+
+
+def _run(groups, tracker, *, workers=4, exclusive=lambda group: False, pool=None, since=None):
+    return run_queue_groups(
+        groups,
+        pool=pool or QueueWorkerPool(workers),
+        run_group=tracker.run,
+        lock_keys=_lock_keys,
+        is_immediate=lambda group: any(record.immediate for record in group),
+        is_exclusive=exclusive,
+        since=since,
+    )
+
+
+class QueueWorkerPoolTests(unittest.TestCase):
+    def test_resolve_queue_workers(self) -> None:
+        self.assertEqual(1, resolve_queue_workers({}))
+        self.assertEqual(4, resolve_queue_workers({"queue_workers": "4"}))
+        self.assertEqual(1, resolve_queue_workers({"queue_workers": 0}))
+        with self.assertRaisesRegex(RuntimeError, "queue_workers"):
+            resolve_queue_workers({"queue_workers": "many"})
+
+    def test_lock_keys_cover_documents_and_git_refs(self) -> None:
+        keys = _lock_keys([_Record("r1", "DocA", git_ref="review/a"), _Record("r2", "DocB")])
+
+        self.assertEqual(
+            frozenset({"document:DocA", "document:DocB", "git_ref:review/a", MAIN_CHECKOUT_LOCK}),
+            keys,
+        )
+
+    def test_independent_groups_run_concurrently_and_keep_input_order(self) -> None:
+        groups = [[_Record(f"r{index}", f"Doc{index}", git_ref=f"review/{index}")] for index in range(4)]
+        tracker = _Tracker()
+
+        results = _run(groups, tracker)
+
+        self.assertEqual(["r0", "r1", "r2", "r3"], results)
+        self.assertGreater(tracker.max_active, 1)
+
+    def test_groups_sharing_a_document_or_git_ref_never_overlap(self) -> None:
+        groups = [
+            [_Record("a1", "DocA", git_ref="review/a")],
+            [_Record("a2", "DocA", git_ref="review/b")],
+            [_Record("b1", "DocB", git_ref="review/c")],
+            [_Record("c1", "DocC", git_ref="review/c")],
+            [_Record("d1", "DocD")],
+            [_Record("e1", "DocE")],
+        ]
+        tracker = _Tracker()
+
+        _run(groups, tracker)
+
+        for active in tracker.overlaps:
+            self.assertFalse({"a1", "a2"} <= set(active), active)
+            self.assertFalse({"b1", "c1"} <= set(active), active)
+            self.assertFalse({"d1", "e1"} <= set(active), active)
+
+    def test_exclusive_group_runs_alone(self) -> None:
+        groups = [[_Record(f"r{index}", f"Doc{index}", git_ref=f"review/{index}")] for index in range(4)]
+        tracker = _Tracker()
+
+        _run(groups, tracker, exclusive=lambda group: group[0].record_id == "r1")
+
+        for active in tracker.overlaps:
+            if "r1" in active:
+                self.assertEqual(("r1",), active)
+
+    def test_immediate_and_backlog_lanes_alternate(self) -> None:
+        groups = [[_Record(f"b{index}", f"Doc{index}")] for index in range(3)]
+        groups += [[_Record(f"i{index}", f"Imm{index}", immediate=True)] for index in range(2)]
+        tracker = _Tracker(delay=0)
+
+        # Every group locks the checkout, so they run one at a time in lane order.
+        _run(groups, tracker)
+
+        self.assertEqual(["i0", "b0", "i1", "b1", "b2"], tracker.order)
+
+    def test_groups_finished_by_another_pass_are_skipped_as_stale(self) -> None:
+        pool = QueueWorkerPool(2)
+        since = pool.mark()
+        tracker = _Tracker(delay=0)
+        _run([[_Record("r1", "DocA")]], tracker, pool=pool)
+
+        results = _run([[_Record("r1", "DocA")], [_Record("r2", "DocB")]], tracker, pool=pool, since=since)
+
+        self.assertEqual([None, "r2"], results)
+        self.assertEqual(["r1", "r2"], tracker.order)
+        self.assertEqual(0, pool.queued)
+
+    def test_first_error_is_reraised_after_running_groups_finish(self) -> None:
+        def run_group(group):
+            raise RuntimeError(f"failed {group[0].record_id}")
+
+        with self.assertRaisesRegex(RuntimeError, "failed r0"):
+            run_queue_groups(
+                [[_Record("r0", "DocA")], [_Record("r1", "DocB")]],
+                pool=QueueWorkerPool(2),
+                run_group=run_group,
+                lock_keys=_lock_keys,
+                is_immediate=lambda group: False,
+                is_exclusive=lambda group: False,
+            )
+
+    def test_worker_slot_suffixes_queue_worktrees(self) -> None:
+        repo_root = Path("/repo")
+        seen: dict[str, tuple[int, Path]] = {}
+
+        def run_group(group):
+            seen[group[0].record_id] = (
+                current_queue_worker_slot(),
+                queue_runtime.worktree_dir_for_git_ref(repo_root=repo_root, git_ref="main"),
+            )
+            time.sleep(0.05)
+
+        run_queue_groups(
+            [[_Record("r0", "DocA", git_ref="a")], [_Record("r1", "DocB", git_ref="b")]],
+            pool=QueueWorkerPool(2),
+            run_group=run_group,
+            lock_keys=_lock_keys,
+            is_immediate=lambda group: False,
+            is_exclusive=lambda group: False,
+        )
+
+        self.assertEqual({0, 1}, {slot for slot, _ in seen.values()})
+        self.assertEqual(2, len({path for _, path in seen.values()}))
+        self.assertEqual(0, current_queue_worker_slot())
+        self.assertEqual(
+            {repo_root / ".tmp" / "process-build-queue-worktrees" / name for name in ("main", "main@1")},
+            {path for _, path in seen.values()},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from tools import queue_runtime
+from tools.queue_worktree_pool import (
+    DEFAULT_WORKTREE_POOL_SIZE,
+    QueueWorktreePool,
+    resolve_worktree_pool_size,
+)
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    ).stdout.strip()
+
+
+def _commit(root: Path, text: str) -> None:
+    (root / "page.rst").write_text(text, encoding="utf-8")
+    _git(root, "add", "page.rst")
+    _git(root, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", text)
+
+
+class QueueWorktreePoolTests(unittest.TestCase):
+    def test_resolve_worktree_pool_size(self) -> None:
+        self.assertEqual(DEFAULT_WORKTREE_POOL_SIZE, resolve_worktree_pool_size({}))
+        self.assertEqual(0, resolve_worktree_pool_size({"worktree_pool_size": 0}))
+        with self.assertRaisesRegex(RuntimeError, "worktree_pool_size"):
+            resolve_worktree_pool_size({"worktree_pool_size": "lots"})
+
+    def test_reused_worktree_fast_forwards_and_keeps_docs_build(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo = Path(td) / "repo"
+            repo.mkdir()
+            _git(repo, "init", "-q", "-b", "main")
+            _commit(repo, "v1\n")
+            pool = QueueWorktreePool(
+                pool_root=queue_runtime.worktree_pool_root(repo),
+                max_worktrees=2,
+                run_git=lambda args: _git(repo, *args),
+                remove_worktree=lambda path: queue_runtime.remove_worktree(repo_root=repo, path=path),
+            )
+            worktree = queue_runtime.worktree_dir_for_git_ref(repo_root=repo, git_ref="main")
+
+            with redirect_stderr(io.StringIO()):
+                pool.checkout(worktree=worktree, source_ref="main")
+                self.assertFalse(pool.is_warm(worktree))
+                (worktree / "docs" / "_build").mkdir(parents=True)
+                (worktree / "docs" / "_build" / "environment.pickle").write_text("state", encoding="utf-8")
+                (worktree / "stray.txt").write_text("leftover", encoding="utf-8")
+                (worktree / "page.rst").write_text("edited\n", encoding="utf-8")
+                pool.release(worktree)
+                _commit(repo, "v2\n")
+
+                pool.checkout(worktree=worktree, source_ref="main")
+
+            self.assertTrue(pool.is_warm(worktree))
+            self.assertEqual("v2\n", (worktree / "page.rst").read_text(encoding="utf-8"))
+            self.assertFalse((worktree / "stray.txt").exists())
+            self.assertEqual("state", (worktree / "docs" / "_build" / "environment.pickle").read_text(encoding="utf-8"))
+
+    def test_release_evicts_least_recently_used_idle_worktrees(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            pool_root = Path(td) / "worktrees"
+            removed: list[str] = []
+            ticks = iter(range(100))
+
+            def add_worktree(args: list[str]) -> None:
+                if args[:2] != ["worktree", "add"]:
+                    return
+                path = Path(args[-2])
+                path.mkdir(parents=True)
+                (path / ".git").write_text("gitdir: elsewhere\n", encoding="utf-8")
+
+            def remove(path: Path) -> None:
+                if path.exists():
+                    removed.append(path.name)
+                    (path / ".git").unlink()
+                    path.rmdir()
+
+            pool = QueueWorktreePool(
+                pool_root=pool_root,
+                max_worktrees=2,
+                run_git=add_worktree,
+                remove_worktree=remove,
+                clock=lambda: float(next(ticks)),
+            )
+            a, b, c = (pool_root / name for name in ("a", "b", "c"))
+
+            with redirect_stderr(io.StringIO()):
+                for worktree in (a, b):
+                    pool.checkout(worktree=worktree, source_ref="main")
+                    pool.release(worktree)
+                pool.checkout(worktree=a, source_ref="main")
+                pool.release(a)
+                pool.checkout(worktree=c, source_ref="main")
+                self.assertEqual([], removed)
+                pool.release(c)
+
+            self.assertEqual(["b"], removed)
+            self.assertEqual(["a", "c"], sorted(path.name for path in pool_root.iterdir() if path.is_dir()))
+
+    def test_disabled_pool_removes_released_worktrees(self) -> None:
+        removed: list[Path] = []
+        pool = QueueWorktreePool(
+            pool_root=Path("/unused"),
+            max_worktrees=0,
+            run_git=lambda args: None,
+            remove_worktree=removed.append,
+        )
+
+        pool.release(Path("/unused/main"))
+
+        self.assertEqual([Path("/unused/main")], removed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import difflib
 import json
+import random
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from tools import revision_ledger
 
@@ -608,6 +611,112 @@ class TestRevisionLedgerSimilarityVerdict(unittest.TestCase):
         )
 
 
+# Golden corpus for the fuzzy verdict layer: (reviewer_text, machine_text,
+# verdict) rows against one manual-sized haystack. The verdicts are the ones
+# the original sliding-window SequenceMatcher produced; the n-gram prefiltered
+# matcher must reach the same decision for every row.
+_GOLDEN_HAYSTACK = " ".join(
+    [
+        "Safety Instructions Read all instructions before using the power station.",
+        "Never cover the vents while charging, and keep the unit away from water.",
+        "Do not disassemble the product; refer servicing to qualified personnel.",
+        "Getting Started Charge the battery fully before first use.",
+        "Press and hold the power button for two seconds to turn on the display.",
+        "The LCD shows the remaining battery level, input power and output power.",
+        "Charging Connect the AC charging cable to a wall outlet.",
+        "The device begins charging automatically and the indicator turns green.",
+        "Solar charging is supported through the DC8020 input port.",
+        "Storage Store the unit in a cool, dry place and recharge it every three months.",
+    ]
+    * 4
+)
+_GOLDEN_ROWS = [
+    ("Charge the battery fully before first use.", "Charge the battery.", "accepted_as_proposed"),
+    ("Charge the battery fully, before first use.", "Charge the battery.", "accepted_as_proposed"),
+    ("Press and hold the power button for 2 seconds.", "Press the power button.", "accepted_as_proposed"),
+    ("Press and hold the power button for two second to turn on the display.", "Press the power button.", "accepted_as_proposed"),
+    ("The device starts charging automatically.", "The device begins charging automatically.", "rejected"),
+    ("The device starts charging on its own.", "The device begins charging automaticaly.", "rejected"),
+    ("Keep the vents clear at all times.", "Never cover the vents while charging,", "rejected"),
+    ("Recharge the unit every six months.", "Recharge it every three months.", "rejected"),
+    ("Store the unit in a cool dry place and recharge it every three months.", "Store the unit somewhere.", "accepted_as_proposed"),
+    ("Solar panels connect to the XT60 input port.", "Solar charging uses the input port.", "edited_further"),
+    ("", "Do not disassemble the product; refer servicing to qualified personnel.", "rejected"),
+    ("", "Do not disassemble the product, refer service to qualified personnel.", "rejected"),
+    ("", "Do not open the enclosure under any circumstances.", "accepted_as_proposed"),
+    ("The LCD displays the remaining battery level.", "The LCD shows the battery level.", "edited_further"),
+    ("The LCD shows the remaining battery level, input power and output power.", "", "accepted_as_proposed"),
+    ("Connect the AC cable to a grounded wall outlet.", "Connect the AC charging cable to a wall outlet.", "rejected"),
+]
+
+
+def _baseline_partial_ratio(needle: str, hay: str) -> float:
+    """``revision_ledger._partial_ratio`` before the n-gram matcher, verbatim."""
+    if not needle or not hay:
+        return 0.0
+    if len(needle) > len(hay):
+        needle, hay = hay, needle
+    anchor = difflib.SequenceMatcher(None, needle, hay, autojunk=False)
+    best = 0.0
+    for block in anchor.get_matching_blocks():
+        start = max(block.b - block.a, 0)
+        window = hay[start : start + len(needle)]
+        if not window:
+            continue
+        ratio = difflib.SequenceMatcher(None, needle, window, autojunk=False).ratio()
+        if ratio > best:
+            best = ratio
+        if best >= 0.995:
+            break
+    return best
+
+
+def _baseline_verdict(row: dict, haystack: str) -> str:
+    with mock.patch.object(
+        revision_ledger, "partial_ratio", lambda needle, hay, *, min_ratio: _baseline_partial_ratio(needle, hay)
+    ):
+        return revision_ledger.classify_verdict(row, haystack)
+
+
+def _mutate(rng: random.Random, text: str, edits: int) -> str:
+    chars = list(text)
+    for _ in range(edits):
+        position = rng.randrange(len(chars) + 1)
+        operation = rng.choice("ids") if chars and position < len(chars) else "i"
+        if operation == "i":
+            chars.insert(position, rng.choice("abcdefghijklmnopqrstuvwxyz ,."))
+        elif operation == "d":
+            del chars[position]
+        else:
+            chars[position] = rng.choice("abcdefghijklmnopqrstuvwxyz ,.")
+    return "".join(chars)
+
+
+class TestRevisionLedgerSimilarityGoldenCorpus(unittest.TestCase):
+    def test_verdicts_match_golden_corpus(self) -> None:
+        haystack = _GOLDEN_HAYSTACK.lower()
+        for reviewer, machine, verdict in _GOLDEN_ROWS:
+            row = {"reviewer_text": reviewer.lower(), "machine_text": machine.lower()}
+            with self.subTest(reviewer=reviewer, machine=machine):
+                self.assertEqual(_baseline_verdict(row, haystack), verdict)
+                self.assertEqual(revision_ledger.classify_verdict(row, haystack), verdict)
+
+    def test_verdicts_match_the_baseline_matcher_on_mutated_rows(self) -> None:
+        # Rows are near-copies of haystack sentences at every edit level around
+        # the 0.90 threshold; the golden verdict is the pre-n-gram matcher's.
+        haystack = _GOLDEN_HAYSTACK[: len(_GOLDEN_HAYSTACK) // 4].lower()
+        sentences = sorted({sentence.strip() + "." for sentence in haystack.split(".") if len(sentence) > 20})
+        rng = random.Random(22)
+        for _ in range(1500):
+            sentence = rng.choice(sentences)
+            reviewer = "" if rng.random() < 0.15 else _mutate(rng, sentence, rng.choice([1, 2, 3, 4, 5, 6, 8, 12]))
+            machine_source = sentence if rng.random() < 0.7 else rng.choice(sentences)
+            machine = "" if rng.random() < 0.1 else _mutate(rng, machine_source, rng.choice([0, 1, 2, 3, 4, 6, 10]))
+            row = {"reviewer_text": reviewer, "machine_text": machine}
+            with self.subTest(reviewer=reviewer, machine=machine):
+                self.assertEqual(_baseline_verdict(row, haystack), revision_ledger.classify_verdict(row, haystack))
+
+
 def _git(root: Path, *args: str, env: dict | None = None) -> None:
     import subprocess
 
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from tools import revision_ledger
+from tools.revision_ledger_store import RevisionLedgerStore, store_path_for
+
+
+def _report(run_id: str, *hashes: str, git_ref: str = "review/je-1000f") -> dict:
+    return {
+        "run_id": run_id,
+        "source_target": {"path": "docs/_review/JE-1000F/US/en/page/01_overview.rst"},
+        "metadata": {"git_ref": git_ref},
+        "deltas": [
+            {
+                "index": index,
+                "delta_hash": delta_hash,
+                "route_class": "repo_review_text",
+                "old_text": "Charge the battery.",
+                "new_text": f"Charge the battery ({delta_hash}).",
+            }
+            for index, delta_hash in enumerate(hashes)
+        ],
+    }
+
+
+class RevisionLedgerStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.ledger = Path(self._tmp.name) / "ledger.jsonl"
+
+    def test_ingest_appends_through_the_index_without_reimporting(self) -> None:
+        revision_ledger.ingest_report(_report("run-1", "hash-a", "hash-b"), ledger_path=self.ledger)
+        summary = revision_ledger.ingest_report(_report("run-1", "hash-b", "hash-c"), ledger_path=self.ledger)
+
+        self.assertEqual((1, 1), (summary["rows_written"], summary["rows_skipped"]))
+        self.assertTrue(store_path_for(self.ledger).exists())
+        with RevisionLedgerStore(self.ledger) as store:
+            self.assertFalse(store.reimported)
+            self.assertEqual(3, store.count())
+            self.assertEqual({"run-1:hash-a"}, store.existing_row_keys(["run-1:hash-a", "run-9:hash-a"]))
+        self.assertEqual(
+            ["run-1:hash-a", "run-1:hash-b", "run-1:hash-c"],
+            [row["row_key"] for row in revision_ledger.load_ledger(self.ledger)],
+        )
+
+    def test_point_queries_by_page_block_and_git_ref(self) -> None:
+        revision_ledger.ingest_report(_report("run-1", "hash-a"), ledger_path=self.ledger)
+        revision_ledger.ingest_report(_report("run-2", "hash-a", git_ref="review/other"), ledger_path=self.ledger)
+
+        with RevisionLedgerStore(self.ledger) as store:
+            self.assertEqual(2, len(store.rows_for_page("docs/_review/JE-1000F/US/en/page/01_overview.rst")))
+            self.assertEqual(["run-1", "run-2"], [row["run_id"] for row in store.rows_for_block("hash-a")])
+            self.assertEqual(["run-2"], [row["run_id"] for row in store.rows_for_git_ref("review/other")])
+            self.assertEqual("hash-a", store.get("run-1:hash-a")["delta_hash"])
+            self.assertIsNone(store.get("run-3:hash-a"))
+
+    def test_external_jsonl_edits_are_reimported(self) -> None:
+        revision_ledger.ingest_report(_report("run-1", "hash-a"), ledger_path=self.ledger)
+        row = revision_ledger.load_ledger(self.ledger)[0]
+        with self.ledger.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({**row, "row_key": "run-0:hand", "delta_hash": "hand"}) + "\n")
+
+        summary = revision_ledger.ingest_report(_report("run-0", "hand", "hash-z"), ledger_path=self.ledger)
+
+        self.assertEqual((1, 1), (summary["rows_written"], summary["rows_skipped"]))
+        self.assertEqual(3, len(revision_ledger.load_ledger(self.ledger)))
+
+    def test_reconcile_updates_store_and_jsonl_export_together(self) -> None:
+        root = Path(self._tmp.name)
+        review = root / "docs/_review/JE-1000F/US/en/page/01_overview.rst"
+        review.parent.mkdir(parents=True)
+        review.write_text("Charge the battery (hash-a).\n", encoding="utf-8")
+        revision_ledger.ingest_report(_report("run-1", "hash-a", "hash-b"), ledger_path=self.ledger)
+
+        summary = revision_ledger.reconcile(self.ledger, root=root)
+
+        self.assertEqual(2, summary["rows_reconciled"])
+        exported = {row["delta_hash"]: row["final_status"] for row in revision_ledger.load_ledger(self.ledger)}
+        self.assertEqual(revision_ledger.ACCEPTED_STATUS, exported["hash-a"])
+        with RevisionLedgerStore(self.ledger) as store:
+            self.assertFalse(store.reimported)
+            self.assertEqual([], store.entries(final_status=revision_ledger.PENDING_STATUS))
+            self.assertEqual(exported["hash-b"], store.get("run-1:hash-b")["final_status"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.test_helpers import write_lines
+from tools.csv_pages.renderers_common import apply_vars
+from tools.localized_copy import COPY_TOKEN_RE, apply_localized_copy_tokens
+from tools.rst_template import compile_rst_template, render_rst_template
+from tools.utils.korean_josa import with_josa_substitutions
+from tools.utils.spec_master import resolve_template_substitutions_from_spec_master
+
+ROOT = Path(__file__).resolve().parents[1]
+SPEC_MASTER = ROOT / "tests" / "fixtures" / "phase2" / "Spec_Master.csv"
+
+
+def _legacy_render(text: str, substitutions: dict[str, str], vars_map: dict[str, str]) -> str:
+    """The per-key replace renderer the compiled templates must reproduce."""
+    out = apply_vars(text, vars_map)
+    lang = (vars_map.get("lang") or vars_map.get("language") or "").strip().lower()
+    effective = with_josa_substitutions(substitutions) if lang in {"ko", "ko-kr"} else substitutions
+    for key, value in effective.items():
+        out = out.replace(f"|{key}|", value)
+    if COPY_TOKEN_RE.search(out):
+        out = apply_localized_copy_tokens(
+            out,
+            localized_copy_csv=vars_map["localized_copy_csv"],
+            lang=vars_map["lang"],
+            model=vars_map.get("model") or None,
+            region=vars_map.get("region") or None,
+        )
+    return out
+
+
+def _render(text: str, substitutions: dict[str, str], vars_map: dict[str, str]) -> str:
+    return render_rst_template(
+        text,
+        substitutions,
+        vars_map,
+        model=vars_map.get("model") or None,
+        region=vars_map.get("region") or None,
+    ).text
+
+
+class RstTemplateTests(unittest.TestCase):
+    def test_repo_templates_render_like_per_key_replacement(self) -> None:
+        for lang, region in (("en", "US"), ("fr", "US"), ("de", "EU"), ("ko", "KR")):
+            substitutions = resolve_template_substitutions_from_spec_master(
+                SPEC_MASTER, model="JE-1000F", region=region, lang=lang
+            )
+            vars_map = {"lang": lang, "model": "JE-1000F", "region": region, "product_name": "Explorer 1000"}
+            for path in sorted((ROOT / "docs" / "templates").rglob("*.rst")):
+                text = path.read_text(encoding="utf-8")
+                if COPY_TOKEN_RE.search(text):
+                    continue
+                with self.subTest(lang=lang, path=path.relative_to(ROOT).as_posix()):
+                    self.assertEqual(_legacy_render(text, substitutions, vars_map), _render(text, substitutions, vars_map))
+
+    def test_order_sensitive_inputs_match_per_key_replacement(self) -> None:
+        rng = random.Random(11)
+        pieces = ["|A|", "|B|", "|A B|", "|C|", "|", " ", "x", "\n", "{{ lang }}", "{{ v }}", "{{ missing }}", "{", "}"]
+        for _ in range(3000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+            keys = rng.sample(["A", "B", "A B", "C", " A", "x|y"], rng.randint(0, 4))
+            values = ["1", "|B|", "v|", "{{ v }}", "|C|", "2 "]
+            substitutions = {key: rng.choice(values) for key in keys}
+            vars_map = {"lang": rng.choice(["en", "A"]), "v": rng.choice(["w", "|A|", "|", "{{ lang }}"])}
+            with self.subTest(text=text, substitutions=substitutions, vars_map=vars_map):
+                self.assertEqual(_legacy_render(text, substitutions, vars_map), _render(text, substitutions, vars_map))
+
+    def test_korean_josa_companions_resolve_inline_and_unknown_names_are_reported(self) -> None:
+        rendered = render_rst_template(
+            "|PRODUCT_NAME_JOSA_EUN| |BATTERY_JOSA_I| |BRAND_JOSA_EUL| |MISSING|",
+            {"PRODUCT_NAME": "리튬이차전지시스템", "BATTERY": "배터리", "BRAND": "Zorbly"},
+            {"lang": "ko"},
+        )
+
+        self.assertEqual("리튬이차전지시스템은 배터리가 |BRAND_JOSA_EUL| |MISSING|", rendered.text)
+        self.assertEqual(("BRAND_JOSA_EUL", "MISSING"), rendered.unresolved)
+
+    def test_copy_tokens_resolve_in_the_same_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = Path(td) / "Localized_Copy.csv"
+            write_lines(
+                csv_path,
+                [
+                    "copy_key,Region,Model,Is_Latest,text_en,text_fr",
+                    "overview.title,all,all,TRUE,Product Overview,Aperçu du produit",
+                ],
+            )
+            text = "{{ copy:overview.title }} |PRODUCT_NAME|\n{{ lang }}"
+            vars_map = {"lang": "fr", "localized_copy_csv": str(csv_path)}
+
+            self.assertEqual(
+                _legacy_render(text, {"PRODUCT_NAME": "Explorer"}, vars_map),
+                _render(text, {"PRODUCT_NAME": "Explorer"}, vars_map),
+            )
+            with self.assertRaisesRegex(RuntimeError, "localized_copy_csv is not configured"):
+                _render(text, {}, {"lang": "fr"})
+
+    def test_placeholders_inside_copy_tokens_resolve_like_per_key_replacement(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = Path(td) / "Localized_Copy.csv"
+            write_lines(
+                csv_path,
+                [
+                    "copy_key,Region,Model,Is_Latest,text_en,text_fr",
+                    "overview.title,all,all,TRUE,Product Overview,Aperçu du produit",
+                ],
+            )
+            vars_map = {"lang": "fr", "localized_copy_csv": str(csv_path)}
+            for text, substitutions in (
+                ("x {{ copy:|K| }} y", {"K": "overview.title"}),
+                ("x {{ |C|:overview.title }} y", {"C": "copy"}),
+                ("x {{ copy:overview.|K| }} |K| y", {"K": "title"}),
+                ("x {{ copy:|K| }} y", {}),
+            ):
+                with self.subTest(text=text, substitutions=substitutions):
+                    self.assertEqual(_legacy_render(text, substitutions, vars_map), _render(text, substitutions, vars_map))
+            with self.assertRaises(RuntimeError):
+                _render("x {{ copy:|K| }} y", {"K": "abc"}, vars_map)
+
+    def test_templates_are_compiled_once_per_text(self) -> None:
+        text = "|PRODUCT_NAME| uses {{ lang }}\n"
+        self.assertIs(compile_rst_template(text), compile_rst_template(str(text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from tools.utils.spec_master import (
+    SpecMasterIndex,
+    collect_matching_spec_rows,
+    read_spec_master_rows,
+    resolve_spec_value_from_rows,
+    resolve_template_substitutions_from_rows,
+)
+from tools.utils.spec_master_row_helpers import _iter_ranked_rows
+from tools.utils.spec_master_shared import _LEGACY_PAGE_VALUE_BINDINGS
+
+
+ROOT = Path(__file__).resolve().parents[1]
+PHASE2_FIXTURE = ROOT / "tests" / "fixtures" / "phase2"
+
+
+class TestSpecMasterIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.rows = read_spec_master_rows(PHASE2_FIXTURE / "Spec_Master.csv")
+        cls.index = SpecMasterIndex(cls.rows)
+
+    def test_index_behaves_like_the_row_sequence(self) -> None:
+        self.assertEqual(len(self.rows), len(self.index))
+        self.assertIs(self.rows[0], self.index[0])
+        self.assertEqual(self.rows, list(self.index))
+
+    def test_ranked_rows_match_linear_scan_for_every_fixture_row_key(self) -> None:
+        row_keys = sorted({(row.get("Row_key") or "").strip().lower() for row in self.rows} - {""})
+        row_keys.extend(sorted(_LEGACY_PAGE_VALUE_BINDINGS)[:10])
+        targets = [("JE-1000F", "US"), ("JE-1000F", "JP"), ("JE-2000E", "EU"), ("JE-1000F_US", "US"), (None, None)]
+        page_filters = [None, ("spec", "specifications"), "operation_guide", ["product_overview", "safety"]]
+        for row_key in row_keys:
+            for model, region in targets:
+                for lang in ("en", "ja", "fr"):
+                    for pages in page_filters:
+                        with self.subTest(row_key=row_key, model=model, region=region, lang=lang, pages=pages):
+                            expected = _iter_ranked_rows(
+                                self.rows,
+                                model=model,
+                                region=region,
+                                lang=lang,
+                                row_key=row_key,
+                                pages=pages,
+                            )
+                            actual = self.index.ranked_rows(
+                                model=model,
+                                region=region,
+                                lang=lang,
+                                row_key=row_key,
+                                pages=pages,
+                            )
+                            self.assertEqual([id(row) for row in expected], [id(row) for row in actual])
+
+    def test_selector_filters_match_linear_scan(self) -> None:
+        selectors = [
+            {"line_order": "2"},
+            {"line_order": 1},
+            {"usage_type": "page_value"},
+            {"value_role": "label"},
+            {"placement_key": "front", "value_role": "spec"},
+        ]
+        for selector in selectors:
+            with self.subTest(selector=selector):
+                expected = _iter_ranked_rows(
+                    self.rows, model="JE-1000F", region="US", lang="en", pages=None, **selector
+                )
+                actual = self.index.ranked_rows(model="JE-1000F", region="US", lang="en", pages=None, **selector)
+                self.assertEqual([id(row) for row in expected], [id(row) for row in actual])
+
+    def test_lookup_functions_accept_index_transparently(self) -> None:
+        for lang in ("en", "ja"):
+            with self.subTest(lang=lang):
+                self.assertEqual(
+                    resolve_spec_value_from_rows(
+                        self.rows, model="JE-1000F", region="US", lang=lang, row_key="product_name", pages=None
+                    ),
+                    resolve_spec_value_from_rows(
+                        self.index, model="JE-1000F", region="US", lang=lang, row_key="product_name", pages=None
+                    ),
+                )
+                self.assertEqual(
+                    collect_matching_spec_rows(
+                        self.rows, model="JE-1000F", region="JP", lang=lang, row_key="storage_temperature", pages=None
+                    ),
+                    collect_matching_spec_rows(
+                        self.index, model="JE-1000F", region="JP", lang=lang, row_key="storage_temperature", pages=None
+                    ),
+                )
+                self.assertEqual(
+                    resolve_template_substitutions_from_rows(
+                        self.rows, model="JE-1000F", region="US", lang=lang
+                    ),
+                    resolve_template_substitutions_from_rows(
+                        self.index, model="JE-1000F", region="US", lang=lang
+                    ),
+                )
+
+    def test_disabled_and_superseded_rows_are_not_indexed(self) -> None:
+        rows = [
+            {"Row_key": "product_name", "Value_source": "Old", "Is_Latest": "FALSE", "Model": "M1", "__line__": "2"},
+            {"Row_key": "product_name", "Value_source": "Off", "Enabled": "no", "Model": "M1", "__line__": "3"},
+            {"Row_key": "product_name", "Value_source": "New", "Is_Latest": "TRUE", "Model": "M1", "__line__": "4"},
+        ]
+        match = resolve_spec_value_from_rows(
+            SpecMasterIndex(rows), model="M1", region=None, lang="en", row_key="product_name", pages=None
+        )
+        self.assertIsNotNone(match)
+        assert match is not None
+        self.assertEqual("New", match.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from tools import sync_data
+from tools.sync_data_attachments import (
+    STATUS_DOWNLOADED,
+    STATUS_FAILED,
+    STATUS_PRESENT,
+    STATUS_REUSED,
+    STATUS_UNAVAILABLE,
+    AttachmentJob,
+    AttachmentStats,
+    AttachmentStore,
+    download_attachments,
+)
+
+
+class _Downloader:
+    def __init__(self, *, fail_tokens: set[str] | None = None, barrier: threading.Barrier | None = None) -> None:
+        self.fail_tokens = fail_tokens or set()
+        self.barrier = barrier
+        self.calls: list[tuple[str, Path]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, file_token: str, output_path: Path) -> None:
+        with self._lock:
+            self.calls.append((file_token, output_path))
+        if self.barrier is not None:
+            self.barrier.wait()
+        if file_token in self.fail_tokens:
+            raise RuntimeError("boom")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(f"image:{file_token}".encode("utf-8"))
+
+
+class SyncDataAttachmentTests(unittest.TestCase):
+    def test_shared_token_downloads_once_and_is_copied_to_other_targets(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            store = AttachmentStore(root / "store")
+            downloader = _Downloader()
+            stats = AttachmentStats()
+            jobs = [
+                AttachmentJob("tok_a", root / "us" / "1_wifi_tok_a.png"),
+                AttachmentJob("tok_a", root / "eu" / "1_wifi_tok_a.png"),
+                AttachmentJob("tok_b", root / "us" / "2_bt_tok_b.png"),
+            ]
+
+            outcomes = download_attachments(jobs, store=store, download=downloader, max_workers=4, stats=stats)
+
+            self.assertEqual([STATUS_DOWNLOADED, STATUS_REUSED, STATUS_DOWNLOADED], [o.status for o in outcomes])
+            self.assertCountEqual(["tok_a", "tok_b"], [token for token, _ in downloader.calls])
+            self.assertEqual(b"image:tok_a", (root / "eu" / "1_wifi_tok_a.png").read_bytes())
+            self.assertEqual((2, 1, len(b"image:tok_a")), (stats.downloaded, stats.reused, stats.bytes_reused))
+            self.assertEqual(len(b"image:tok_a") + len(b"image:tok_b"), stats.bytes_downloaded)
+
+    def test_store_serves_new_data_roots_without_a_downloader(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            store = AttachmentStore(root / "store")
+            download_attachments(
+                [AttachmentJob("tok_a", root / "first" / "a.png")],
+                store=store,
+                download=_Downloader(),
+                max_workers=1,
+                stats=AttachmentStats(),
+            )
+            stats = AttachmentStats()
+
+            outcomes = download_attachments(
+                [AttachmentJob("tok_a", root / "first" / "a.png"), AttachmentJob("tok_a", root / "second" / "a.png")],
+                store=store,
+                download=None,
+                max_workers=2,
+                stats=stats,
+            )
+
+            self.assertEqual([STATUS_PRESENT, STATUS_REUSED], [o.status for o in outcomes])
+            self.assertEqual(b"image:tok_a", (root / "second" / "a.png").read_bytes())
+            self.assertEqual(0, stats.downloaded)
+
+    def test_failed_token_is_not_retried_for_each_row(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            downloader = _Downloader(fail_tokens={"tok_bad"})
+            stats = AttachmentStats()
+
+            outcomes = download_attachments(
+                [AttachmentJob("tok_bad", root / "a.png"), AttachmentJob("tok_bad", root / "b.png")],
+                store=AttachmentStore(root / "store"),
+                download=downloader,
+                max_workers=2,
+                stats=stats,
+            )
+
+            self.assertEqual([STATUS_FAILED, STATUS_FAILED], [o.status for o in outcomes])
+            self.assertEqual("boom", outcomes[1].error)
+            self.assertEqual(1, len(downloader.calls))
+            self.assertEqual(2, stats.failed)
+
+    def test_missing_downloader_reports_unavailable(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            outcomes = download_attachments(
+                [AttachmentJob("tok_a", Path(td) / "a.png")],
+                store=AttachmentStore(Path(td) / "store"),
+                download=None,
+                max_workers=1,
+                stats=AttachmentStats(),
+            )
+
+            self.assertEqual(STATUS_UNAVAILABLE, outcomes[0].status)
+
+    def test_distinct_tokens_download_concurrently(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            downloader = _Downloader(barrier=threading.Barrier(2, timeout=5))
+
+            outcomes = download_attachments(
+                [AttachmentJob("tok_a", root / "a.png"), AttachmentJob("tok_b", root / "b.png")],
+                store=AttachmentStore(root / "store"),
+                download=downloader,
+                max_workers=2,
+                stats=AttachmentStats(),
+            )
+
+            self.assertEqual([STATUS_DOWNLOADED, STATUS_DOWNLOADED], [o.status for o in outcomes])
+
+    def test_sync_reuses_store_across_data_roots_and_records_stats(self) -> None:
+        class _Source:
+            def __init__(self) -> None:
+                self.downloads: list[str] = []
+
+            def fetch_records(self, *, base_token: str, table_id: str, view_id: str | None) -> list[dict[str, object]]:
+                return [
+                    {
+                        "fields": {
+                            "No.": str(number),
+                            "Model": "JE-1000F",
+                            "Is_latest": True,
+                            "Version": "V1.0",
+                            "icon_en": "Wi-Fi",
+                            "icon_desc_en": "On: Wi-Fi connected.",
+                            "figure": [{"file_token": "file_token_wifi", "name": "wifi.png"}],
+                        }
+                    }
+                    for number in (1, 2)
+                ]
+
+            def download_drive_file(self, *, file_token: str, output_path: Path, overwrite: bool = False) -> None:
+                self.downloads.append(file_token)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_bytes(b"fake image")
+
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            cfg = {
+                "paths": {"page_registry_csv": "fixtures/page_registry.csv"},
+                "sync": {
+                    "phase2": {
+                        "provider": "lark_cli",
+                        "base_token_env": "BASE_TOKEN",
+                        "tables": {"lcd_icons": {"table_id": "tbl_lcd"}},
+                    }
+                },
+            }
+            config_path = root / "config.yaml"
+            config_path.write_text("sync: {}\n", encoding="utf-8")
+            registry = root / "fixtures" / "page_registry.csv"
+            registry.parent.mkdir(parents=True)
+            registry.write_text(
+                "page_id,order,page_type,sku_scope,langs,template,content_query,asset_ref,enabled\n",
+                encoding="utf-8",
+            )
+            source = _Source()
+            with mock.patch.dict("os.environ", {"BASE_TOKEN": "app_token"}, clear=True), mock.patch.object(
+                sync_data, "ROOT", root
+            ):
+                for data_root in ("data/phase2", ".tmp/review-start/phase2"):
+                    sync_data.sync_phase2_snapshot(
+                        cfg=cfg,
+                        config_path=config_path,
+                        data_root=data_root,
+                        table_names=["lcd_icons"],
+                        source=source,
+                        built_at=datetime(2026, 3, 31, 9, 0, tzinfo=timezone.utc),
+                    )
+
+            self.assertEqual(["file_token_wifi"], source.downloads)
+            self.assertTrue(
+                (root / ".tmp" / "review-start" / "phase2" / "_attachments" / "lcd_icons" / "2_Wi-Fi_file_token_wifi.png").exists()
+            )
+            first = json.loads((root / "data" / "phase2" / "snapshot_manifest.json").read_text(encoding="utf-8"))
+            second = json.loads(
+                (root / ".tmp" / "review-start" / "phase2" / "snapshot_manifest.json").read_text(encoding="utf-8")
+            )
+            self.assertEqual((1, 1), (first["attachments"]["downloaded"], first["attachments"]["reused"]))
+            self.assertEqual((0, 2), (second["attachments"]["downloaded"], second["attachments"]["reused"]))
+            self.assertEqual(20, second["attachments"]["bytes_reused"])
+
+
+if __name__ == "__main__":
+    unittest.main()
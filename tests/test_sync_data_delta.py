@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from tools import sync_data
+from tools.sync_data_delta import (
+    OUTCOME_CACHED,
+    OUTCOME_FULL,
+    DeltaFetchReport,
+    DeltaRecordStore,
+    delta_state_dir,
+    fetch_records_delta,
+    request_key,
+)
+from tools.sync_data_fetch import RecordFetchRequest
+
+
+class _VersionedSource:
+    """Fake delta-capable source: records carry ids and a last-modified time."""
+
+    def __init__(self, tables: dict[str, list[tuple[str, int, dict[str, Any]]]]) -> None:
+        self.tables = tables
+        self.full_fetches: list[str] = []
+        self.plain_fetches: list[str] = []
+
+    def _record(self, record_id: str, fields: dict[str, Any]) -> dict[str, Any]:
+        return {"record_id": record_id, "fields": dict(fields)}
+
+    def list_record_versions(self, *, base_token: str, table_id: str, view_id: str | None) -> dict[str, int]:
+        return {record_id: modified for record_id, modified, _ in self.tables[table_id]}
+
+    def fetch_records(self, *, base_token: str, table_id: str, view_id: str | None) -> list[dict[str, Any]]:
+        self.plain_fetches.append(table_id)
+        return [{"fields": dict(fields)} for _, _, fields in self.tables[table_id]]
+
+    def fetch_records_with_ids(self, *, base_token: str, table_id: str, view_id: str | None) -> list[dict[str, Any]]:
+        self.full_fetches.append(table_id)
+        return [self._record(record_id, fields) for record_id, _, fields in self.tables[table_id]]
+
+
+class _FieldNamesSource(_VersionedSource):
+    def __init__(self, tables: dict[str, list[tuple[str, int, dict[str, Any]]]], field_names: set[str]) -> None:
+        super().__init__(tables)
+        self.names = field_names
+
+    def field_names(self, *, base_token: str, table_id: str) -> frozenset[str]:
+        return frozenset(self.names)
+
+
+REQUEST = RecordFetchRequest(base_token="app", table_id="tbl_rows", view_id="view")
+
+
+def _fetch(source: Any, store: DeltaRecordStore, *, full_refresh: bool = False) -> tuple[list[dict[str, Any]], DeltaFetchReport]:
+    report = DeltaFetchReport()
+    records = fetch_records_delta(source, REQUEST, store=store, full_refresh=full_refresh, report=report)
+    return records, report
+
+
+class SyncDataDeltaTests(unittest.TestCase):
+    def test_unchanged_table_is_served_from_the_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = DeltaRecordStore(Path(td))
+            source = _VersionedSource({"tbl_rows": [("rec_a", 10, {"n": 1}), ("rec_b", 20, {"n": 2})]})
+
+            first, first_report = _fetch(source, store)
+            second, second_report = _fetch(source, store)
+
+            self.assertEqual([{"fields": {"n": 1}}, {"fields": {"n": 2}}], first)
+            self.assertEqual(first, second)
+            self.assertEqual(["tbl_rows"], source.full_fetches)
+            self.assertEqual(OUTCOME_FULL, first_report.outcomes[request_key(REQUEST)])
+            self.assertEqual(OUTCOME_CACHED, second_report.outcomes["tbl_rows@view"])
+
+    def test_deleted_records_are_dropped_without_refetching(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = DeltaRecordStore(Path(td))
+            source = _VersionedSource({"tbl_rows": [("rec_a", 10, {"n": 1}), ("rec_b", 20, {"n": 2})]})
+            _fetch(source, store)
+            source.tables["tbl_rows"] = source.tables["tbl_rows"][1:]
+
+            records, report = _fetch(source, store)
+
+            self.assertEqual([{"fields": {"n": 2}}], records)
+            self.assertEqual(["tbl_rows"], source.full_fetches)
+            self.assertEqual(1, report.deleted_records["tbl_rows@view"])
+            self.assertEqual(OUTCOME_CACHED, report.outcomes["tbl_rows@view"])
+
+    def test_changed_table_is_fetched_in_full(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = DeltaRecordStore(Path(td))
+            source = _VersionedSource({"tbl_rows": [("rec_a", 10, {"n": 1}), ("rec_b", 20, {"n": 2})]})
+            _fetch(source, store)
+            source.tables["tbl_rows"] = [
+                ("rec_a", 30, {"n": 10}),
+                ("rec_b", 20, {"n": 2}),
+                ("rec_c", 40, {"n": 3}),
+            ]
+
+            records, report = _fetch(source, store)
+
+            self.assertEqual(source.fetch_records(base_token="app", table_id="tbl_rows", view_id="view"), records)
+            self.assertEqual(["tbl_rows", "tbl_rows"], source.full_fetches)
+            self.assertEqual(OUTCOME_FULL, report.outcomes["tbl_rows@view"])
+            self.assertEqual(2, report.changed_records["tbl_rows@view"])
+
+    def test_field_drift_and_forced_refresh_ignore_the_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            store = DeltaRecordStore(Path(td))
+            source = _FieldNamesSource({"tbl_rows": [("rec_a", 10, {"n": 1})]}, {"n"})
+            _fetch(source, store)
+            _fetch(source, store, full_refresh=True)
+            source.names = {"n", "added"}
+            _, report = _fetch(source, store)
+
+            self.assertEqual(["tbl_rows"] * 3, source.full_fetches)
+            self.assertEqual(OUTCOME_FULL, report.outcomes["tbl_rows@view"])
+
+    def test_read_only_store_does_not_write_state(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            state_dir = Path(td) / "state"
+            source = _VersionedSource({"tbl_rows": [("rec_a", 10, {"n": 1})]})
+
+            _fetch(source, DeltaRecordStore(state_dir, writable=False))
+
+            self.assertFalse(state_dir.exists())
+
+    def test_delta_sync_writes_byte_identical_csvs_and_skips_unchanged_tables(self) -> None:
+        tables = {
+            "tbl_master": [
+                (
+                    f"rec_{row}",
+                    100 + row,
+                    {
+                        "document_key": "JE-1000F_US_en",
+                        "Region": "US",
+                        "Is_Latest": True,
+                        "Page": "specifications",
+                        "Section": "GENERAL INFO",
+                        "Section_order": 1,
+                        "Row_order": row,
+                        "Row_key": f"row_{row}",
+                        "Row_label_source": f"Row {row}",
+                        "Line_order": 1,
+                        "Value_source": f"value {row}",
+                        "Model": "JE-1000F",
+                        "Source_lang": "en",
+                    },
+                )
+                for row in (2, 1, 3)
+            ],
+        }
+
+        def run_sync(root: Path, source: Any, *, delta: bool) -> bytes:
+            cfg = {
+                "paths": {"page_registry_csv": "data/phase2/page_registry.csv"},
+                "sync": {
+                    "phase2": {
+                        "provider": "lark_cli",
+                        "base_token_env": "BASE_TOKEN",
+                        "delta_sync": delta,
+                        "tables": {"spec_master": {"table_id": "tbl_master"}},
+                    }
+                },
+            }
+            config_path = root / "config.yaml"
+            config_path.write_text("sync: {}\n", encoding="utf-8")
+            registry = root / "data" / "phase2" / "page_registry.csv"
+            registry.parent.mkdir(parents=True, exist_ok=True)
+            registry.write_text(
+                "page_id,order,page_type,sku_scope,langs,template,content_query,asset_ref,enabled\n"
+                "spec,20,csv_page,ALL,en,spec_template.rst,page_id=spec,,1\n",
+                encoding="utf-8",
+            )
+            with mock.patch.dict("os.environ", {"BASE_TOKEN": "app_token"}, clear=True), mock.patch.object(
+                sync_data, "ROOT", root
+            ), mock.patch.object(sync_data, "inspect_phase2_schema", return_value=[]):
+                sync_data.sync_phase2_snapshot(
+                    cfg=cfg,
+                    config_path=config_path,
+                    data_root="data/phase2",
+                    table_names=["spec_master"],
+                    source=source,
+                    built_at=datetime(2026, 3, 31, 9, 0, tzinfo=timezone.utc),
+                )
+            return (root / "data" / "phase2" / "Spec_Master.csv").read_bytes()
+
+        with tempfile.TemporaryDirectory() as full_td, tempfile.TemporaryDirectory() as delta_td:
+            full_csv = run_sync(Path(full_td), _VersionedSource(tables), delta=False)
+            delta_source = _VersionedSource({name: list(rows) for name, rows in tables.items()})
+            first_delta_csv = run_sync(Path(delta_td), delta_source, delta=True)
+            second_delta_csv = run_sync(Path(delta_td), delta_source, delta=True)
+            manifest_path = Path(delta_td) / "data" / "phase2" / "snapshot_manifest.json"
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+            self.assertEqual(full_csv, first_delta_csv)
+            self.assertEqual(full_csv, second_delta_csv)
+            self.assertEqual(["tbl_master"], delta_source.full_fetches)
+            self.assertEqual([], delta_source.plain_fetches)
+            self.assertEqual(OUTCOME_CACHED, manifest["delta_sync"]["tables"]["tbl_master"]["outcome"])
+            self.assertTrue(any(delta_state_dir(manifest_path).glob("tbl_master-*.json")))
+
+            delta_source.tables["tbl_master"][0] = (
+                "rec_2",
+                500,
+                {**tables["tbl_master"][0][2], "Value_source": "edited"},
+            )
+            edited_full_csv = run_sync(Path(full_td), _VersionedSource(delta_source.tables), delta=False)
+            edited_delta_csv = run_sync(Path(delta_td), delta_source, delta=True)
+
+            self.assertEqual(edited_full_csv, edited_delta_csv)
+            self.assertIn(b"edited", edited_delta_csv)
+            self.assertEqual(["tbl_master", "tbl_master"], delta_source.full_fetches)
+
+    def test_full_sync_forces_a_full_refresh_and_is_recorded(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            cfg = {
+                "paths": {"page_registry_csv": "data/phase2/page_registry.csv"},
+                "sync": {
+                    "phase2": {
+                        "provider": "lark_cli",
+                        "base_token_env": "BASE_TOKEN",
+                        "delta_sync": True,
+                        "tables": {"spec_master": {"table_id": "tbl_master"}},
+                    }
+                },
+            }
+            config_path = root / "config.yaml"
+            config_path.write_text("sync: {}\n", encoding="utf-8")
+            registry = root / "data" / "phase2" / "page_registry.csv"
+            registry.parent.mkdir(parents=True, exist_ok=True)
+            registry.write_text(
+                "page_id,order,page_type,sku_scope,langs,template,content_query,asset_ref,enabled\n",
+                encoding="utf-8",
+            )
+            source = _VersionedSource({"tbl_master": []})
+            with mock.patch.dict("os.environ", {"BASE_TOKEN": "app_token"}, clear=True), mock.patch.object(sync_data, "ROOT", root):
+                sync_data.sync_phase2_snapshot(
+                    cfg=cfg,
+                    config_path=config_path,
+                    data_root="data/phase2",
+                    table_names=["spec_master"],
+                    source=source,
+                    full_sync=True,
+                )
+            manifest = json.loads((root / "data" / "phase2" / "snapshot_manifest.json").read_text(encoding="utf-8"))
+
+            self.assertEqual("full sync requested", manifest["delta_sync"]["full_refresh_reason"])
+            self.assertEqual(["tbl_master"], source.full_fetches)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+from tools import sync_data
+from tools.sync_data_fetch import (
+    LarkRateLimitError,
+    RecordFetchRequest,
+    RecordPage,
+    call_with_rate_limit_backoff,
+    collect_record_pages,
+    fetch_record_requests,
+    plan_table_fetches,
+    resolve_fetch_jobs,
+)
+
+
+class _BarrierSource:
+    """Fake record source whose fetches only complete once two run at once."""
+
+    def __init__(self) -> None:
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.calls: list[tuple[str, bool]] = []
+        self._lock = threading.Lock()
+
+    def _fetch(self, table_id: str, *, with_ids: bool) -> list[dict[str, Any]]:
+        with self._lock:
+            self.calls.append((table_id, with_ids))
+        self.barrier.wait()
+        return [{"fields": {"table": table_id}, **({"record_id": f"rec_{table_id}"} if with_ids else {})}]
+
+    def fetch_records(self, *, base_token: str, table_id: str, view_id: str | None) -> list[dict[str, Any]]:
+        return self._fetch(table_id, with_ids=False)
+
+    def fetch_records_with_ids(self, *, base_token: str, table_id: str, view_id: str | None) -> list[dict[str, Any]]:
+        return self._fetch(table_id, with_ids=True)
+
+
+def _page(start: int, count: int, *, has_more: bool, total: int | None = None) -> RecordPage:
+    return RecordPage(
+        records=[{"fields": {"n": index}} for index in range(start, start + count)],
+        has_more=has_more,
+        total=total,
+    )
+
+
+class SyncDataFetchTests(unittest.TestCase):
+    def test_independent_table_requests_are_fetched_concurrently_and_deduplicated(self) -> None:
+        source = _BarrierSource()
+        rows = RecordFetchRequest(base_token="app", table_id="tbl_rows", view_id=None, with_ids=True)
+        notes = RecordFetchRequest(base_token="app", table_id="tbl_notes", view_id="view")
+
+        fetched = fetch_record_requests(source, [rows, notes, rows], max_workers=4)
+
+        self.assertEqual([rows, notes], list(fetched))
+        self.assertEqual("rec_tbl_rows", fetched[rows][0]["record_id"])
+        self.assertEqual({"table": "tbl_notes"}, fetched[notes][0]["fields"])
+        self.assertCountEqual([("tbl_rows", True), ("tbl_notes", False)], source.calls)
+
+    def test_plan_groups_spec_master_sources_and_appends_translation_memory(self) -> None:
+        def binding(_cfg: dict[str, Any], logical_name: str) -> SimpleNamespace:
+            return SimpleNamespace(
+                logical_name=logical_name, schema=None, base_token="app", table_id=f"tbl_{logical_name}", view_id=None
+            )
+
+        with mock.patch(
+            "tools.sync_data_fetch.source_table_bindings_from_cfg",
+            return_value=("tbl_rows", "view_rows", "tbl_placeholders", None),
+        ):
+            plan = plan_table_fetches(
+                {},
+                ["spec_master", "spec_footnotes", "manual_copy_source"],
+                table_schemas={"spec_master": None},
+                phase2_base_token=lambda _cfg: "app",
+                resolve_table_binding=binding,
+                source_supports_ids=True,
+                with_ids_tables=frozenset({"spec_footnotes"}),
+            )
+
+        self.assertEqual(("tbl_rows", "tbl_placeholders"), plan.spec_master_source_table_ids)
+        self.assertEqual(
+            [
+                ("tbl_rows", True),
+                ("tbl_placeholders", True),
+                ("tbl_spec_footnotes", True),
+                ("tbl_manual_copy_source", False),
+                ("tbl_translation_memory", False),
+            ],
+            [(request.table_id, request.with_ids) for request in plan.requests],
+        )
+        fetched = {request: [{"fields": {"table": request.table_id}}] for request in plan.requests}
+        self.assertEqual(
+            ["tbl_rows", "tbl_placeholders"],
+            [record["fields"]["table"] for record in plan.table_records("spec_master", fetched)],
+        )
+
+    def test_offset_pages_are_fetched_in_parallel_but_assembled_in_offset_order(self) -> None:
+        requested: list[int] = []
+        lock = threading.Lock()
+
+        def fetch_page(offset: int) -> RecordPage:
+            with lock:
+                requested.append(offset)
+            count = min(2, 5 - offset)
+            return _page(offset, count, has_more=offset + count < 5, total=5)
+
+        records = collect_record_pages(
+            fetch_page,
+            first_page=_page(0, 2, has_more=True, total=5),
+            limit=2,
+            max_workers=3,
+        )
+
+        self.assertEqual(list(range(5)), [record["fields"]["n"] for record in records])
+        self.assertCountEqual([2, 4], requested)
+
+    def test_short_middle_page_falls_back_to_sequential_paging(self) -> None:
+        def fetch_page(offset: int) -> RecordPage:
+            if offset == 2:
+                return _page(2, 1, has_more=True, total=5)
+            if offset == 3:
+                return _page(3, 1, has_more=False, total=4)
+            return _page(offset, 1, has_more=False, total=4)
+
+        records = collect_record_pages(
+            fetch_page,
+            first_page=_page(0, 2, has_more=True, total=5),
+            limit=2,
+            max_workers=3,
+        )
+
+        self.assertEqual([0, 1, 2, 3], [record["fields"]["n"] for record in records])
+
+    def test_rate_limited_calls_back_off_and_retry(self) -> None:
+        attempts: list[int] = []
+        delays: list[float] = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise LarkRateLimitError("request trigger frequency limit")
+            return "ok"
+
+        self.assertEqual("ok", call_with_rate_limit_backoff(flaky, sleep=delays.append, jitter=lambda: 0.0))
+        self.assertEqual([1.0, 2.0], delays)
+
+        with self.assertRaises(LarkRateLimitError):
+            call_with_rate_limit_backoff(
+                lambda: (_ for _ in ()).throw(LarkRateLimitError("429")),
+                max_attempts=2,
+                sleep=lambda _delay: None,
+            )
+
+    def test_lark_cli_source_retries_rate_limited_api_responses(self) -> None:
+        source = sync_data.LarkCliSource(cli_bin="lark-cli")
+        source._sleep = lambda _delay: None
+        payloads = [
+            json.dumps({"code": 99991400, "msg": "request trigger frequency limit"}),
+            json.dumps({"code": 0, "data": {"items": []}}),
+        ]
+
+        with mock.patch("tools.sync_data.shutil.which", return_value="/usr/local/bin/lark-cli"), mock.patch(
+            "tools.sync_data.subprocess.run",
+            side_effect=lambda *_args, **_kwargs: mock.Mock(stdout=payloads.pop(0)),
+        ):
+            payload = source._run_base_command(args=["+field-list"])
+
+        self.assertEqual({"items": []}, payload["data"])
+        self.assertEqual([], payloads)
+
+    def test_fetch_jobs_must_be_a_positive_integer(self) -> None:
+        self.assertEqual(4, resolve_fetch_jobs(None))
+        self.assertEqual(2, resolve_fetch_jobs("2"))
+        for raw in (0, True, "many"):
+            with self.assertRaisesRegex(RuntimeError, "sync.phase2.fetch_jobs"):
+                resolve_fetch_jobs(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1006,26 +1006,29 @@ class TestTargetResolution(unittest.TestCase):
     def test_clean_build_targets_should_only_remove_requested_target_output(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             docs_dir = Path(td) / "docs"
-            keep_dir = docs_dir / "_build" / "M2" / "JP" / "rst"
-            drop_dir = docs_dir / "_build" / "M1" / "US" / "rst"
+            keep_dir = docs_dir / "_build" / "M2" / "JP" / "html"
+            drop_dir = docs_dir / "_build" / "M1" / "US" / "html"
             drop_dir.mkdir(parents=True)
             keep_dir.mkdir(parents=True)
-            (drop_dir / "index.rst").write_text("", encoding="utf-8")
-            (keep_dir / "index.rst").write_text("", encoding="utf-8")
+            (drop_dir / "index.html").write_text("", encoding="utf-8")
+            (keep_dir / "index.html").write_text("", encoding="utf-8")
+            (docs_dir / "_build" / "M1" / "US" / "rst").mkdir()
+            (docs_dir / "_build" / "M1" / "US" / "rst" / "index.rst").write_text("", encoding="utf-8")
 
             build_docs.clean_build_targets(
                 [build_docs.BuildTarget(model="M1", region="US")],
                 docs_dir=docs_dir,
             )
 
-            self.assertFalse((docs_dir / "_build" / "M1" / "US").exists())
-            self.assertTrue((docs_dir / "_build" / "M2" / "JP" / "rst" / "index.rst").exists())
+            self.assertFalse(drop_dir.exists())
+            self.assertTrue((docs_dir / "_build" / "M1" / "US" / "rst" / "index.rst").exists())  # bundle is build state
+            self.assertTrue((docs_dir / "_build" / "M2" / "JP" / "html" / "index.html").exists())
 
     def test_clean_build_targets_should_retry_when_windows_handle_is_transient(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             docs_dir = Path(td) / "docs"
             target_root = docs_dir / "_build" / "M1" / "US"
-            (target_root / "rst").mkdir(parents=True)
+            (target_root / "html").mkdir(parents=True)
 
             with mock.patch.object(
                 build_docs.shutil,
@@ -1046,7 +1049,7 @@ class TestTargetResolution(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             docs_dir = Path(td) / "docs"
             target_root = docs_dir / "_build" / "M1" / "US"
-            (target_root / "rst").mkdir(parents=True)
+            (target_root / "html").mkdir(parents=True)
 
             with mock.patch.object(
                 build_docs.shutil,
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.test_translation_memory import _write_phase2_fixture
+from tools.translation_memory import TranslationMemoryEntry, render_translation_memory_payload
+from tools.translation_memory_fuzzy import FuzzyTranslationMemory, build_fuzzy_translation_memory_payload
+
+
+def _entry(source_text: str, **translations: str) -> TranslationMemoryEntry:
+    return TranslationMemoryEntry(
+        table="spec-master",
+        entry_type="row-label",
+        source_lang="en",
+        source_text=source_text,
+        translations={"en": source_text, **translations},
+    )
+
+
+class TranslationMemoryFuzzyTests(unittest.TestCase):
+    def test_match_scores_near_misses_per_language_pair(self) -> None:
+        memory = FuzzyTranslationMemory(
+            [
+                _entry("USB-C 100W Port", fr="Port USB-C 100 W"),
+                _entry("USB-C 100W Port", es="Puerto USB-C de 100 W"),
+                _entry("Keep the port dry", fr="Gardez le port au sec"),
+            ]
+        )
+
+        matches = memory.match("USB-C 60W Port", source_lang="en", target_lang="fr", min_similarity=75)
+        from_french = memory.match("Port USB-C 60 W", source_lang="fr", min_similarity=75)
+
+        self.assertEqual([("Port USB-C 100 W", 86)], [(m.entry.translations["fr"], m.similarity) for m in matches])
+        self.assertEqual(["USB-C 100W Port"], [m.entry.source_text for m in from_french])
+        self.assertEqual([], memory.match("USB-C 60W Port", target_lang="fr", min_similarity=95))
+
+    def test_match_batch_reuses_scores_for_repeated_segments(self) -> None:
+        memory = FuzzyTranslationMemory([_entry("Keep the port dry", fr="Gardez le port au sec")])
+
+        results = memory.match_batch(["Keep the port dry.", "keep the  port dry.", "Unrelated"], target_lang="fr")
+
+        self.assertIs(results[0], results[1])
+        self.assertEqual([94], [match.similarity for match in results[0]])
+        self.assertEqual([], results[2])
+
+    def test_fuzzy_payload_reports_match_percent_per_unit(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            config_path = _write_phase2_fixture(root)
+
+            payload = build_fuzzy_translation_memory_payload(
+                config_path=config_path,
+                repo_root=root,
+                model="JE-1000F",
+                region="US",
+                query_text="USB-C 60W Port\nKeep the ports dry",
+                preferred_lang="fr",
+                source_lang="en",
+                min_similarity=80,
+            )
+            rendered = render_translation_memory_payload(payload)
+
+            self.assertEqual("fuzzy", payload["mode"])
+            self.assertEqual(["USB-C 60W Port", "Keep the ports dry"], payload["query_units"])
+            self.assertEqual([1, 1], [unit["match_count"] for unit in payload["unit_matches"]])
+            self.assertEqual([94, 86], [entry["match_percent"] for entry in payload["entries"]])
+            self.assertIn("- fuzzy match: `86%` on `USB-C 100W Port`", rendered)
+
+    def test_fuzzy_payload_keeps_the_best_matches_across_units_when_truncating(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            config_path = _write_phase2_fixture(root)
+
+            payload = build_fuzzy_translation_memory_payload(
+                config_path=config_path,
+                repo_root=root,
+                model="JE-1000F",
+                region="US",
+                query_text="USB-C 60W Port\nKeep the ports dry",
+                preferred_lang="fr",
+                source_lang="en",
+                limit=1,
+                min_similarity=80,
+            )
+
+            self.assertEqual(2, payload["unique_entry_count"])
+            self.assertEqual([(94, "Keep the port dry")], [(e["match_percent"], e["matched_text"]) for e in payload["entries"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.test_helpers import write_lines, write_text
+from tools.translation_memory import (
+    TranslationMemoryEntry,
+    _entry_searchable_values,
+    _normalize_text,
+    _tokenize,
+    collect_translation_memory_entries,
+    normalize_language,
+    normalize_tables,
+    query_translation_memory_entries,
+)
+from tools.translation_memory_index import (
+    TranslationMemoryIndex,
+    load_translation_memory_index,
+    translation_memory_index_path,
+)
+
+
+def _linear_query(entries: list[TranslationMemoryEntry], **kwargs: object) -> list[TranslationMemoryEntry]:
+    """The pre-index linear scan, kept as the ranking reference."""
+    query_text = kwargs.get("query_text")
+    normalized_query = _normalize_text(query_text)
+    preferred = normalize_language(kwargs.get("preferred_lang"))  # type: ignore[arg-type]
+    source = normalize_language(kwargs.get("source_lang"))  # type: ignore[arg-type]
+    target = normalize_language(kwargs.get("target_lang"))  # type: ignore[arg-type]
+    table_filters = normalize_tables(kwargs.get("tables", ()))  # type: ignore[arg-type]
+    query_tokens = _tokenize(query_text)  # type: ignore[arg-type]
+    ranked = []
+    for index, entry in enumerate(entries):
+        if table_filters and entry.table not in table_filters:
+            continue
+        if source and not entry.translations.get(source):
+            continue
+        if target and not entry.translations.get(target):
+            continue
+        score = 0
+        search_blob = " ".join(_entry_searchable_values(entry))
+        source_blob = _normalize_text(entry.translations.get(source)) if source else ""
+        target_blob = _normalize_text(entry.translations.get(target)) if target else ""
+        source_token_hits = 0
+        if normalized_query:
+            if source_blob and normalized_query == source_blob:
+                score += 180
+            elif normalized_query == _normalize_text(entry.source_text):
+                score += 120
+            if normalized_query == _normalize_text(entry.row_key):
+                score += 110
+            if any(normalized_query == _normalize_text(value) for value in entry.translations.values()):
+                score += 110
+            if source_blob and normalized_query in source_blob:
+                score += 60
+            if normalized_query in search_blob:
+                score += 40
+            if source_blob:
+                source_token_hits = sum(1 for token in query_tokens if token in source_blob)
+                score += source_token_hits * 12
+            token_hits = sum(1 for token in query_tokens if token in search_blob)
+            if token_hits == 0:
+                continue
+            score += token_hits * 8
+            if query_tokens and token_hits == len(query_tokens):
+                score += 24
+        if preferred and entry.translations.get(preferred):
+            score += 12
+        if target and target_blob:
+            score += 12
+        if source and source_token_hits:
+            score += 10
+        ranked.append((score, index, entry))
+    ranked.sort(key=lambda item: (-item[0], item[1]))
+    return [entry for _, _, entry in ranked[: max(int(kwargs.get("limit", 10)), 1)]]  # type: ignore[call-overload]
+
+
+_WORDS = ["usb-c", "port", "100w", "charging", "power", "câble", "输出端口", "出力ポート", "ac", "output", "dry", "v1.0"]
+
+
+def _random_entries(rng: random.Random, count: int) -> list[TranslationMemoryEntry]:
+    entries = []
+    for position in range(count):
+        translations = {}
+        for lang in rng.sample(["en", "fr", "es", "zh", "ja"], rng.randint(1, 4)):
+            text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 4)))
+            translations[lang] = text.upper() if rng.random() < 0.3 else text
+        entries.append(
+            TranslationMemoryEntry(
+                table=rng.choice(["spec-master", "spec-notes", "symbols-blocks"]),
+                entry_type="row-label",
+                source_lang="en",
+                source_text=translations.get("en") or next(iter(translations.values())),
+                translations=translations,
+                row_key=rng.choice([None, "usb_c_port", f"row_{position}"]),
+                aliases=rng.sample(_WORDS, rng.randint(0, 2)),
+            )
+        )
+    return entries
+
+
+def _write_snapshot(root: Path) -> Path:
+    config_path = root / "config.test.yaml"
+    write_text(config_path, "paths:\n  structured_data_dir: data/phase2\n")
+    phase2_dir = root / "data" / "phase2"
+    write_lines(
+        phase2_dir / "spec_titles.csv",
+        [
+            "title_en,section_order,title_zh,title_jp,title_fr,title_es",
+            "OUTPUT PORTS,3,输出端口,出力ポート,PORTS DE SORTIE,PUERTOS DE SALIDA",
+        ],
+    )
+    write_lines(
+        phase2_dir / "Spec_Notes.csv",
+        [
+            "Note_id,Region,Model,Source_lang,Is_Latest,Page,Note_order,Text_en,Text_fr,Text_es,Text_ja,Enabled",
+            "note_usb,US,JE-1000F,en,TRUE,operation_guide,1,Keep the port dry,Gardez le port au sec,Mantenga seco el puerto,,TRUE",
+        ],
+    )
+    return config_path
+
+
+class TranslationMemoryIndexTests(unittest.TestCase):
+    def test_index_ranking_matches_the_linear_scan(self) -> None:
+        rng = random.Random(7)
+        entries = _random_entries(rng, 120)
+        index = TranslationMemoryIndex(entries)
+        queries = [
+            {"query_text": "USB-C port", "limit": 20},
+            {"query_text": "port", "preferred_lang": "fr", "limit": 50},
+            {"query_text": "ch", "source_lang": "en", "target_lang": "fr", "limit": 50},
+            {"query_text": "输出", "limit": 50},
+            {"query_text": "usb_c_port", "tables": ["spec-master"], "limit": 50},
+            {"query_text": "", "preferred_lang": "es", "limit": 200},
+            {"query_text": "!!!", "limit": 5},
+            {"query_text": "100w charging power", "source_lang": "en", "limit": 200},
+        ]
+        for words in range(20):
+            queries.append({"query_text": " ".join(rng.sample(_WORDS, 1 + words % 3)), "source_lang": "en", "limit": 30})
+
+        for query in queries:
+            with self.subTest(query=query):
+                expected = _linear_query(entries, **query)
+                self.assertEqual(expected, index.query(**query))  # type: ignore[arg-type]
+                self.assertEqual(expected, query_translation_memory_entries(entries, **query))  # type: ignore[arg-type]
+
+    def test_persisted_index_is_reused_and_rebuilt_per_changed_table(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            config_path = _write_snapshot(root)
+
+            first, snapshot_root = load_translation_memory_index(config_path=config_path, repo_root=root)
+            second, _ = load_translation_memory_index(config_path=config_path, repo_root=root)
+            titles = snapshot_root / "spec_titles.csv"
+            write_lines(
+                titles,
+                [
+                    "title_en,section_order,title_zh,title_jp,title_fr,title_es",
+                    "INPUT PORTS,4,输入端口,入力ポート,PORTS D'ENTRÉE,PUERTOS DE ENTRADA",
+                ],
+            )
+            stat = titles.stat()
+            os.utime(titles, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third, _ = load_translation_memory_index(config_path=config_path, repo_root=root)
+            entries, _ = collect_translation_memory_entries(config_path=config_path, repo_root=root)
+
+            self.assertTrue(translation_memory_index_path(repo_root=root, phase2_root=snapshot_root, model=None, region=None).exists())
+            self.assertIn("spec-titles", first.rebuilt_segments)
+            self.assertEqual((), second.rebuilt_segments)
+            self.assertEqual(first.entries, second.entries)
+            self.assertEqual(("spec-titles",), third.rebuilt_segments)
+            self.assertEqual(entries, third.entries)
+            self.assertEqual(
+                query_translation_memory_entries(entries, query_text="ports", limit=5),
+                third.query(query_text="ports", limit=5),
+            )
+            self.assertEqual([], third.query(query_text="OUTPUT", tables=["spec-titles"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
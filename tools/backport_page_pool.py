@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Warm worker pool for run-review-branch's per-page ``run-review`` calls.
+
+A whole-doc ``run-review-branch`` diffs the fetched cloud-doc against every
+page of the review bundle. Spawning ``cloud_doc_backport.py run-review`` per
+page pays interpreter startup and the backport imports on every page and
+keeps one core busy. :func:`run_pages` instead keeps up to ``workers``
+resident processes (this file, run as a script) that import the backport CLI
+once and then run ``main(argv)`` for one page per request.
+
+Pages stay isolated: an exception or ``SystemExit`` inside a page becomes its
+returncode (an uncaught exception exits 1, as it would in a fresh
+interpreter), and a worker that dies or overruns ``timeout`` is killed and
+replaced before its next page. Output written straight to fds 1 and 2 (tools
+the page shells out to) is captured per page like ``capture_output``. Results
+come back in submission order no matter which page finishes first.
+
+Protocol: one JSON line ``{"argv": [...]}`` on the worker's stdin, answered
+by one JSON line ``{"returncode", "stdout", "stderr"}`` on its stdout.
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Callable, Iterator, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# Exit status reported for a page that overran its timeout (as timeout(1)).
+TIMEOUT_RETURNCODE = 124
+# Exit status of a page that raised, matching a fresh interpreter's uncaught
+# exception so single-page and pooled runs classify the crash the same way.
+CRASH_RETURNCODE = 1
+_BACKPORT_CLI = Path(__file__).resolve().with_name("cloud_doc_backport.py")
+
+
+@dataclass(frozen=True)
+class PageRun:
+    returncode: int
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+
+
+def _exit_status(exc: SystemExit, stderr: io.StringIO) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    stderr.write(f"{exc.code}\n")
+    return 1
+
+
+@contextlib.contextmanager
+def _captured_fds() -> Iterator[tuple[IO[bytes], IO[bytes]]]:
+    """Point fds 1 and 2 at temp files for the duration of one page."""
+    saved = (os.dup(1), os.dup(2))
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            yield out, err
+        finally:
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            for fd in saved:
+                os.close(fd)
+
+
+def _read_captured(stream: IO[bytes]) -> str:
+    stream.seek(0)
+    return stream.read().decode("utf-8", errors="replace")
+
+
+def run_page_in_process(main: Callable[[list[str]], int | None], argv: Sequence[str]) -> PageRun:
+    """Run one CLI ``main(argv)`` in this process, captured like a subprocess."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with _captured_fds() as (fd_out, fd_err):
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                returncode = main(list(argv)) or 0
+        except SystemExit as exc:
+            returncode = _exit_status(exc, stderr)
+        except Exception:
+            stderr.write(traceback.format_exc())
+            returncode = CRASH_RETURNCODE
+        stdout.write(_read_captured(fd_out))
+        stderr.write(_read_captured(fd_err))
+    return PageRun(returncode, stdout.getvalue(), stderr.getvalue())
+
+
+def serve() -> int:
+    """Worker loop: run one backport CLI ``argv`` per stdin line."""
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    # Stray writes to fd 1 between pages must not corrupt the protocol stream.
+    os.dup2(2, 1)
+    from tools.cloud_doc_backport_cli import main
+
+    for line in sys.stdin:
+        run = run_page_in_process(main, json.loads(line)["argv"])
+        protocol.write(json.dumps({"returncode": run.returncode, "stdout": run.stdout, "stderr": run.stderr}) + "\n")
+        protocol.flush()
+    return 0
+
+
+class _Worker:
+    """One resident worker process, restarted after a crash or timeout."""
+
+    def __init__(self, cwd: Path) -> None:
+        self._cwd = cwd
+        self._proc: subprocess.Popen[str] | None = None
+        # Worker output outside a page (startup errors, a dying interpreter);
+        # returned as the stderr of the page the worker was running.
+        self._stderr: IO[bytes] | None = None
+        self._timed_out = False
+
+    def _ensure_started(self) -> subprocess.Popen[str]:
+        if self._proc is None or self._proc.poll() is not None:
+            if self._stderr is not None:
+                self._stderr.close()
+            self._stderr = tempfile.TemporaryFile()
+            self._proc = subprocess.Popen(
+                [sys.executable, str(Path(__file__).resolve())],
+                cwd=str(self._cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                text=True,
+                encoding="utf-8",
+            )
+        return self._proc
+
+    def _kill(self) -> None:
+        self._timed_out = True
+        if self._proc is not None:
+            self._proc.kill()
+
+    def run(self, argv: Sequence[str], timeout: float | None) -> PageRun:
+        proc = self._ensure_started()
+        assert proc.stdin is not None and proc.stdout is not None
+        self._timed_out = False
+        timer = threading.Timer(timeout, self._kill) if timeout else None
+        if timer is not None:
+            timer.start()
+        try:
+            proc.stdin.write(json.dumps({"argv": list(argv)}) + "\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+        except (BrokenPipeError, OSError):
+            line = ""
+        finally:
+            if timer is not None:
+                timer.cancel()
+        if not line:
+            returncode = proc.wait()
+            if self._timed_out:
+                return PageRun(TIMEOUT_RETURNCODE, "", f"page timed out after {timeout}s\n", timed_out=True)
+            assert self._stderr is not None
+            return PageRun(returncode or 2, "", _read_captured(self._stderr) + f"page worker exited (rc {returncode})\n")
+        try:
+            payload = json.loads(line)
+            return PageRun(int(payload["returncode"]), str(payload["stdout"]), str(payload["stderr"]))
+        except (KeyError, TypeError, ValueError):
+            self._kill()
+            return PageRun(2, "", "malformed page worker response\n")
+
+    def close(self) -> None:
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+        if self._proc is None or self._proc.poll() is not None:
+            return
+        assert self._proc.stdin is not None
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            self._proc.wait()
+
+
+def run_page_subprocess(argv: Sequence[str], *, cwd: Path, timeout: float | None = None) -> PageRun:
+    """Run one backport CLI ``argv`` in a fresh interpreter (single-page runs)."""
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(_BACKPORT_CLI), *argv], cwd=str(cwd), capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return PageRun(TIMEOUT_RETURNCODE, "", f"page timed out after {timeout}s\n", timed_out=True)
+    return PageRun(proc.returncode, proc.stdout or "", proc.stderr or "")
+
+
+def run_pages(
+    argvs: Sequence[Sequence[str]],
+    *,
+    workers: int,
+    cwd: Path,
+    timeout: float | None = None,
+) -> Iterator[PageRun]:
+    """Run each backport CLI ``argv`` on a warm worker; results in ``argvs`` order."""
+    slots = [_Worker(cwd) for _ in range(max(1, min(workers, len(argvs))))]
+    idle: queue.Queue[_Worker] = queue.Queue()
+    for slot in slots:
+        idle.put(slot)
+
+    def run_one(argv: Sequence[str]) -> PageRun:
+        worker = idle.get()
+        try:
+            return worker.run(argv, timeout)
+        finally:
+            idle.put(worker)
+
+    executor = ThreadPoolExecutor(max_workers=len(slots), thread_name_prefix="backport-page")
+    try:
+        futures = [executor.submit(run_one, argv) for argv in argvs]
+        for future in futures:
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        for slot in slots:
+            slot.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(serve())
@@ -9,7 +9,7 @@ sentinel does — a daily, read-only check that reports and never acts:
 For every InReview row of the build table that carries a review cloud doc, the
 live doc text is compared against the committed render baseline on the row's
 review branch (``docs/_review/<model>/<region>/.backport/<token>.baseline.md``,
-read via ``git show`` — no worktree needed). A difference means reviewer edits
+read from the object store — no worktree needed). A difference means reviewer edits
 exist that no backport has collected; a missing baseline means the review has
 never been backported at all. Timestamps are deliberately not used: pending
 content is the signal, and the alert clears exactly when a backport advances
@@ -21,6 +21,7 @@ import argparse
 import json
 import subprocess
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable
 
@@ -28,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from tools.backport_baseline import baseline_rel_path  # noqa: E402
 from tools.cloud_doc_backport_model import fetch_doc_text, parse_blocks  # noqa: E402
 from tools.document_link_queue import field_value, scalar_text  # noqa: E402
+from tools.git_object_reader import GitObjectReader  # noqa: E402
 from tools.review_branch_resolver import (  # noqa: E402
     CLOUD_DOC_FIELDS,
     DOCUMENT_ID_FIELDS,
@@ -77,10 +79,17 @@ def in_review_docs(raw_records: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 def baseline_from_git(
-    git_ref: str, rel_path: str, *, remote: str = "origin", repo_root: Path | None = None
+    git_ref: str,
+    rel_path: str,
+    *,
+    remote: str = "origin",
+    repo_root: Path | None = None,
+    reader: GitObjectReader | None = None,
 ) -> str | None:
     """Read the committed baseline file from the remote-tracking review branch."""
     ref = f"{remote}/{git_ref}" if remote else git_ref
+    if reader is not None:
+        return reader.read_text(ref, rel_path)
     try:
         proc = subprocess.run(
             ["git", "show", f"{ref}:{rel_path}"],
@@ -111,9 +120,20 @@ def check_docs(
     remote: str = "origin",
     repo_root: Path | None = None,
     fetch: Callable[..., str] = fetch_doc_text,
-    baseline_reader: Callable[..., str | None] = baseline_from_git,
+    baseline_reader: Callable[..., str | None] | None = None,
 ) -> dict[str, Any]:
     """Classify every in-review doc; report-only, no writes anywhere."""
+    if baseline_reader is None:
+        # Every baseline comes from one `git cat-file --batch` process.
+        with GitObjectReader(repo_root or Path.cwd()) as reader:
+            return check_docs(
+                docs,
+                lark_cli=lark_cli,
+                remote=remote,
+                repo_root=repo_root,
+                fetch=fetch,
+                baseline_reader=partial(baseline_from_git, reader=reader),
+            )
     results: list[dict[str, Any]] = []
     for doc in docs:
         rel_path = baseline_rel_path(doc["review_dir"], doc_token(doc["cloud_doc"]))
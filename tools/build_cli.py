@@ -99,6 +99,18 @@ def parse_args(
     )
     ap.add_argument("--open", action="store_true", help="Allow opening generated artifacts after build")
     ap.add_argument("--no-clean", action="store_true", help="Skip cleaning current target outputs before build")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="For build actions: build up to N targets concurrently (multi-target builds only)",
+    )
+    ap.add_argument(
+        "--bundle-jobs",
+        type=int,
+        default=None,
+        help="For build actions: render bundle pages with N worker processes",
+    )
     ap.add_argument(
         "--skip-root-index",
         action="store_true",
@@ -197,6 +209,13 @@ def parse_args(
     )
     ap.add_argument("--section", default=None, help="For translation-memory: exact section/title filter")
     ap.add_argument("--row-key", default=None, help="For translation-memory: exact Row_key filter")
+    ap.add_argument(
+        "--fuzzy-min-similarity",
+        type=int,
+        default=None,
+        help="For translation-memory: return edit-distance matches scoring at least this percent (CAT-style fuzzy lookup)",
+    )
+    ap.add_argument("--source-lang", default=None, help="For translation-memory fuzzy lookup: language the query is written in")
     ap.add_argument("--message", default=None, help="For message-control-dry-run: raw incoming user message")
     ap.add_argument(
         "--document-id",
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Resident build daemon: ``build.py`` commands without per-task startup.
+
+The daemon imports ``build`` (and through it every ``tools`` module, YAML,
+BeautifulSoup and Sphinx when installed) once, keeps the snapshot CSV
+parses warm, and listens on a Unix socket. Each request forks a child from
+that pre-imported parent, so commands start in milliseconds, never share
+state with each other, and a crash only takes down its own child.
+
+Protocol: the client sends one JSON line ``{"argv", "cwd", "env",
+"repo_root"}``; the daemon answers with ``{"stream": "stdout"|"stderr",
+"data"}`` lines and a final ``{"exit": code}``, or a single ``{"error"}``
+line when it cannot take the request (wrong repo, code changed since it
+started). Clients treat an unreachable or refusing daemon as absent and run
+the command themselves.
+"""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import hashlib
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+SOCKET_ENV = "AUTO_MANUAL_BUILD_DAEMON_SOCKET"
+DISABLE_ENV = "AUTO_MANUAL_BUILD_DAEMON"
+_REQUEST_TIMEOUT_SECONDS = 5.0
+_READ_CHUNK = 65536
+_PRELOAD_MODULES = ("yaml", "bs4", "docutils.core", "sphinx.application")
+
+
+def build_daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork")
+
+
+def default_socket_path(repo_root: Path) -> Path:
+    override = (os.environ.get(SOCKET_ENV) or "").strip()
+    if override:
+        return Path(override)
+    key = hashlib.sha256(str(repo_root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"auto-manual-build-{key}.sock"
+
+
+def _send(conn: socket.socket, payload: Mapping[str, Any]) -> None:
+    conn.sendall((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+def _read_line(conn: socket.socket) -> dict[str, Any] | None:
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(_READ_CHUNK)
+        if not chunk:
+            break
+        data += chunk
+    try:
+        payload = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+# --------------------------------------------------------------------- client
+
+
+@dataclass(frozen=True)
+class DaemonResult:
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def run_via_build_daemon(
+    argv: list[str],
+    *,
+    repo_root: Path,
+    cwd: Path | None = None,
+    env: Mapping[str, str] | None = None,
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+    socket_path: Path | None = None,
+) -> int | None:
+    """Run ``build.py argv`` in the daemon; ``None`` when no daemon took it."""
+    if not build_daemon_supported() or os.environ.get(DISABLE_ENV, "").strip() == "0":
+        return None
+    path = socket_path or default_socket_path(repo_root)
+    if not path.exists():
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            conn.connect(str(path))
+            _send(
+                conn,
+                {
+                    "argv": [str(arg) for arg in argv],
+                    "cwd": str(cwd or Path.cwd()),
+                    "env": dict(os.environ if env is None else env),
+                    "repo_root": str(repo_root.resolve()),
+                },
+            )
+        except OSError:
+            return None
+        reader = conn.makefile("r", encoding="utf-8")
+        started = False
+        for line in reader:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if "error" in message and not started:
+                return None
+            if "exit" in message:
+                return int(message["exit"])
+            started = True
+            (on_stderr if message.get("stream") == "stderr" else on_stdout)(str(message.get("data", "")))
+        if not started:
+            return None
+        on_stderr("[build-daemon] connection closed before the command finished\n")
+        return 1
+    finally:
+        conn.close()
+
+
+def capture_via_build_daemon(
+    argv: list[str],
+    *,
+    repo_root: Path,
+    cwd: Path | None = None,
+    env: Mapping[str, str] | None = None,
+    socket_path: Path | None = None,
+) -> DaemonResult | None:
+    stdout: list[str] = []
+    stderr: list[str] = []
+    returncode = run_via_build_daemon(
+        argv,
+        repo_root=repo_root,
+        cwd=cwd,
+        env=env,
+        on_stdout=stdout.append,
+        on_stderr=stderr.append,
+        socket_path=socket_path,
+    )
+    if returncode is None:
+        return None
+    return DaemonResult(returncode=returncode, stdout="".join(stdout), stderr="".join(stderr))
+
+
+def build_py_invocation(cmd: list[str], *, cwd: Path) -> tuple[Path, list[str]] | None:
+    """``(repo_root, argv)`` when ``cmd`` is ``<python> <repo>/build.py argv...``."""
+    if len(cmd) < 2 or not Path(str(cmd[0])).name.startswith("python"):
+        return None
+    script = Path(str(cmd[1]))
+    if script.name != "build.py":
+        return None
+    script = script if script.is_absolute() else cwd / script
+    return script.resolve().parent, [str(arg) for arg in cmd[2:]]
+
+
+# --------------------------------------------------------------------- server
+
+
+def _source_fingerprint(paths: Iterable[Path]) -> dict[str, int]:
+    fingerprint: dict[str, int] = {}
+    for path in paths:
+        try:
+            fingerprint[str(path)] = path.stat().st_mtime_ns
+        except OSError:
+            fingerprint[str(path)] = -1
+    return fingerprint
+
+
+def loaded_source_files(repo_root: Path) -> list[Path]:
+    root = repo_root.resolve()
+    files: set[Path] = set()
+    for module in list(sys.modules.values()):
+        source = getattr(module, "__file__", None)
+        if not source:
+            continue
+        path = Path(source).resolve()
+        if path.is_relative_to(root) and "site-packages" not in path.parts:
+            files.add(path)
+    return sorted(files)
+
+
+def _exit_code(value: object) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    print(value, file=sys.stderr)
+    return 1
+
+
+def _run_request(request: Mapping[str, Any], run: Callable[[list[str]], int | None], out_fd: int, err_fd: int) -> int:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.close(out_fd)
+    os.close(err_fd)
+    # The daemon's own sys.stdout may not write to fd 1 (e.g. under a test runner).
+    # Line-buffered, so prints interleave with output of subprocesses the command runs.
+    sys.stdout = open(1, "w", buffering=1, encoding="utf-8", errors="replace", closefd=False)
+    sys.stderr = open(2, "w", buffering=1, encoding="utf-8", errors="replace", closefd=False)
+    try:
+        os.chdir(str(request.get("cwd") or os.getcwd()))
+        env = request.get("env")
+        if isinstance(env, dict):
+            os.environ.clear()
+            os.environ.update({str(key): str(value) for key, value in env.items()})
+        argv = [str(arg) for arg in request.get("argv") or []]
+        sys.argv = [str(Path(str(request.get("repo_root") or ".")) / "build.py"), *argv]
+        try:
+            code = _exit_code(run(argv))
+        except SystemExit as exc:
+            code = _exit_code(exc.code)
+    except BaseException:  # noqa: BLE001 - the child reports, the daemon keeps serving
+        traceback.print_exc()
+        code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return code
+
+
+def _relay(conn: socket.socket, pid: int, out_r: int, err_r: int) -> None:
+    streams = {out_r: "stdout", err_r: "stderr"}
+    decoders = {fd: codecs.getincrementaldecoder("utf-8")(errors="replace") for fd in streams}
+    selector = selectors.DefaultSelector()
+    for fd in streams:
+        selector.register(fd, selectors.EVENT_READ)
+    client_gone = False
+    while selector.get_map():
+        for key, _ in selector.select():
+            fd = int(key.fd)  # type: ignore[arg-type]
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                selector.unregister(fd)
+                os.close(fd)
+            text = decoders[fd].decode(chunk, final=not chunk)
+            if text and not client_gone:
+                try:
+                    _send(conn, {"stream": streams[fd], "data": text})
+                except OSError:
+                    # The caller gave up (e.g. timed out); stop the command too.
+                    client_gone = True
+                    os.kill(pid, signal.SIGTERM)
+    _, status = os.waitpid(pid, 0)
+    if not client_gone:
+        try:
+            _send(conn, {"exit": os.waitstatus_to_exitcode(status)})
+        except OSError:
+            pass
+
+
+def _handle_connection(conn: socket.socket, request: Mapping[str, Any], run: Callable[[list[str]], int | None]) -> None:
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        conn.close()
+        os.close(out_r)
+        os.close(err_r)
+        os._exit(_run_request(request, run, out_w, err_w))
+    os.close(out_w)
+    os.close(err_w)
+    _relay(conn, pid, out_r, err_r)
+
+
+def _reap_children() -> None:
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve(
+    socket_path: Path,
+    *,
+    repo_root: Path,
+    run: Callable[[list[str]], int | None],
+    watched_files: Iterable[Path] = (),
+    warm: Callable[[], None] | None = None,
+    log: Callable[[str], None] = lambda message: print(message, file=sys.stderr, flush=True),
+) -> int:
+    """Serve requests until stopped, or until a watched source file changes."""
+    repo_key = str(repo_root.resolve())
+    watched = list(watched_files)
+    fingerprint = _source_fingerprint(watched)
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+        else:
+            probe.close()
+            raise RuntimeError(f"a build daemon is already listening on {socket_path}")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    listener.listen(16)
+    listener.settimeout(1.0)
+    log(f"[build-daemon] listening on {socket_path} (pid {os.getpid()}, {len(watched)} source files)")
+    try:
+        while True:
+            _reap_children()
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            with conn:
+                conn.settimeout(_REQUEST_TIMEOUT_SECONDS)
+                try:
+                    request = _read_line(conn)
+                except OSError:
+                    continue
+                conn.settimeout(None)
+                if request is None:
+                    continue
+                control = request.get("control")
+                if control in {"ping", "stop"}:
+                    _send(conn, {"ok": True, "pid": os.getpid(), "repo_root": repo_key})
+                    if control == "stop":
+                        log("[build-daemon] stop requested")
+                        return 0
+                    continue
+                if request.get("repo_root") != repo_key:
+                    _send(conn, {"error": f"daemon serves {repo_key}"})
+                    continue
+                if _source_fingerprint(watched) != fingerprint:
+                    _send(conn, {"error": "stale"})
+                    log("[build-daemon] sources changed since startup; exiting")
+                    return 0
+                if warm is not None:
+                    warm()
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:
+                    listener.close()
+                    code = 0
+                    try:
+                        _handle_connection(conn, request, run)
+                    except BaseException:  # noqa: BLE001
+                        code = 1
+                    os._exit(code)
+    finally:
+        listener.close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
+
+
+def control_build_daemon(socket_path: Path, command: str) -> dict[str, Any] | None:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(socket_path))
+        _send(conn, {"control": command})
+        return _read_line(conn)
+    except OSError:
+        return None
+    finally:
+        conn.close()
+
+
+def _warm_snapshot_tables(data_dir: Path) -> None:
+    from tools.utils.csv_table_cache import shared_csv_table_cache
+
+    cache = shared_csv_table_cache()
+    for path in sorted(data_dir.glob("*.csv")):
+        cache.table(path)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser("Resident build.py daemon")
+    ap.add_argument("command", choices=("serve", "status", "stop"), nargs="?", default="serve")
+    ap.add_argument("--socket", default=None, help=f"Socket path (default: per-repo path in the temp dir, or ${SOCKET_ENV})")
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    try:
+        from tools.script_bootstrap import bootstrap_repo_root
+    except ImportError:  # pragma: no cover - direct script execution fallback
+        from script_bootstrap import bootstrap_repo_root
+
+    root = bootstrap_repo_root(__file__, parent_count=1)
+    args = parse_args(argv)
+    if not build_daemon_supported():
+        print("[build-daemon] ERROR: needs Unix sockets and fork()", file=sys.stderr)
+        return 1
+    socket_path = Path(args.socket) if args.socket else default_socket_path(root)
+    if args.command != "serve":
+        reply = control_build_daemon(socket_path, "ping" if args.command == "status" else "stop")
+        if reply is None:
+            print(f"[build-daemon] not running ({socket_path})")
+            return 1
+        print(json.dumps(reply, ensure_ascii=False))
+        return 0
+
+    started = time.perf_counter()
+    import importlib
+
+    for name in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    import build
+    from tools.data_snapshot import STRUCTURED_DATA_DEFAULT_DIR
+    from tools.lazy_import import resolve_lazy_attrs
+
+    # build.py binds command implementations lazily; a resident daemon wants
+    # them all imported up front so forked commands start warm.
+    resolve_lazy_attrs(build)
+
+    data_dir = root / STRUCTURED_DATA_DEFAULT_DIR
+    _warm_snapshot_tables(data_dir)
+    print(f"[build-daemon] preloaded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    try:
+        return serve(
+            socket_path,
+            repo_root=root,
+            run=build.main,
+            watched_files=loaded_source_files(root),
+            warm=lambda: _warm_snapshot_tables(data_dir),
+        )
+    except (RuntimeError, OSError) as exc:
+        print(f"[build-daemon] ERROR: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -11,6 +11,7 @@ import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Any, Callable
 
 try:
     from tools.script_bootstrap import bootstrap_repo_root
@@ -63,6 +64,7 @@ from tools.build_docs_targets import (
     resolve_build_targets as _resolve_build_targets_impl,
 )
 from tools.bundle_asset_finalize import finalize_materialized_bundle
+from tools.gen_index_bundle_incremental import preserve_unchanged_bundle_files
 from tools.build_docs_theme import (
     body_tag_with_class as _body_tag_with_class_impl,
     effective_variants_for_current as _effective_variants_for_current_impl,
@@ -92,6 +94,10 @@ from tools.build_docs_sphinx import (
     with_product_name_epilog as _with_product_name_epilog_impl,
     with_rst_epilog as _with_rst_epilog_impl,
 )
+from tools.build_docs_scheduler import (
+    TargetBuildResult,
+    build_targets_in_parallel as _build_targets_in_parallel_impl,
+)
 from tools.build_docs_shared import (
     BODY_SWITCHER_CLASS,
     MANUAL_META_FILE_NAME,
@@ -738,6 +744,7 @@ def prepare_manual_bundle(
         docs_dir=paths.docs_dir,
         repo_root=getattr(paths, "root", ROOT),
         trim_bundle_language_blocks=trim_bundle_language_blocks,
+        preserve_unchanged_bundle_files=preserve_unchanged_bundle_files,
     )
 
 
@@ -768,6 +775,7 @@ def build_target(
     output_base_root: Path | None = None,
     write_wrapper_index: bool = True,
     draft_placeholders: bool = False,
+    refresh_html_switchers: Callable[..., None] | None = None,
 ) -> None:
     return _build_target_impl(
         cfg,
@@ -805,7 +813,19 @@ def build_target(
         open_file=open_file,
         strip_html_cover_section=strip_html_cover_section,
         write_html_manual_meta=write_html_manual_meta,
+        refresh_model_html_switchers=refresh_html_switchers or refresh_model_html_switchers,
+    )
+
+
+def run_parallel_target_builds(cfg: dict, targets: list[BuildTarget], **kwargs: Any) -> list[TargetBuildResult]:
+    return _build_targets_in_parallel_impl(
+        cfg,
+        targets,
+        default_docs_build_dir=paths.docs_build_dir,
+        build_target=build_target,
+        resolve_spec_master_csv_path=_resolve_spec_master_csv_path,
         refresh_model_html_switchers=refresh_model_html_switchers,
+        **kwargs,
     )
 
 
@@ -829,6 +849,7 @@ def main(argv: list[str] | None = None) -> None:
         resolve_pdf_mode=resolve_pdf_mode,
         build_target=build_target,
         write_docs_root_index_for_targets=write_docs_root_index_for_targets,
+        run_parallel_target_builds=run_parallel_target_builds,
     )
 
 
@@ -66,6 +66,7 @@ def prepare_manual_bundle(
     repo_root: Path,
     printer: Callable[[str], None] = print,
     trim_bundle_language_blocks: Callable[..., list[tuple[str, tuple[str, ...]]]] | None = None,
+    preserve_unchanged_bundle_files: Callable[[Path], Any] | None = None,
 ) -> Any:
     doc_type = cfg.get("doc_type", "manual_bundle")
     if doc_type != "manual_bundle":
@@ -209,6 +210,12 @@ def prepare_manual_bundle(
             else None
         ),
     )
+    if preserve_unchanged_bundle_files is not None:
+        report = preserve_unchanged_bundle_files(Path(bundle.bundle_dir))
+        printer(
+            f"[build] Bundle files: {report.unchanged} unchanged, {report.changed} changed, "
+            f"{report.added} added, {report.removed} removed"
+        )
     printer(f"[build] Prepared bundle: {bundle.bundle_dir}")
     printer("[build] Bundle source: review" if review_applied else "[build] Bundle source: runtime")
     return bundle
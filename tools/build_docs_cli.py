@@ -20,6 +20,18 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     ap.add_argument("--output-root", default=None, help="Override target output root for this build")
     ap.add_argument("--output-base-root", default=None, help="Override docs/_build base root for this build")
     ap.add_argument("--skip-root-index", action="store_true", help="Do not rewrite docs/index.rst")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Build up to N targets concurrently in worker processes (per-target logs under _target_logs/)",
+    )
+    ap.add_argument(
+        "--bundle-jobs",
+        type=int,
+        default=None,
+        help="Render bundle pages with N worker processes (overrides build.bundle_jobs)",
+    )
     ap.add_argument(
         "--source",
         choices=("auto", "review", "review-asis", "runtime"),
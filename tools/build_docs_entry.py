@@ -29,6 +29,7 @@ def run_build(
     resolve_pdf_mode: Callable[[dict, str | None], str],
     build_target: Callable[..., None],
     write_docs_root_index_for_targets: Callable[[list[Any]], None],
+    run_parallel_target_builds: Callable[..., Any] | None = None,
 ) -> None:
     cfg_path = Path(args.config)
     if not cfg_path.is_absolute():
@@ -37,12 +38,17 @@ def run_build(
     cfg = load_config(cfg_path)
     build_cfg_raw = cfg.get("build", {})
     build_cfg = build_cfg_raw if isinstance(build_cfg_raw, dict) else {}
+    bundle_jobs = getattr(args, "bundle_jobs", None)
+    if bundle_jobs is not None:
+        build_cfg = {**build_cfg, "bundle_jobs": bundle_jobs}
+        cfg = {**cfg, "build": build_cfg}
     tools_cfg_raw = cfg.get("tools", {})
     tools_cfg = tools_cfg_raw if isinstance(tools_cfg_raw, dict) else {}
     output_root = _resolve_optional_root(args.output_root, repo_root=paths.root)
     output_base_root = _resolve_optional_root(args.output_base_root, repo_root=paths.root)
     if output_root is not None and output_base_root is not None:
         raise RuntimeError("Use either --output-root or --output-base-root, not both")
+    jobs = max(1, int(getattr(args, "jobs", 1) or 1))
 
     print("[build] validating config...")
     validate_loaded_config(cfg)
@@ -77,29 +83,45 @@ def run_build(
 
     requested_formats = resolve_requested_formats(cfg, args.formats)
     pdf_mode = resolve_pdf_mode(cfg, args.pdf_mode) if "pdf" in requested_formats else "latex"
-    for target in targets:
-        print(
-            "[build] target: "
-            f"model='{target.model or ''}', region='{target.region or ''}', lang='{target.lang or ''}'"
-        )
-        build_target(
+    build_kwargs: dict[str, Any] = {
+        "requested_formats": requested_formats if not args.prepare_only else [],
+        "pdf_mode": pdf_mode,
+        "build_cfg": build_cfg,
+        "tools_cfg": tools_cfg,
+        "no_open": args.no_open,
+        "source_mode": args.source,
+        "data_root": args.data_root,
+        "page_selector": args.page_selector,
+        "output_root": output_root,
+        "output_base_root": output_base_root,
+        "write_wrapper_index": not args.skip_root_index,
+        "draft_placeholders": getattr(args, "draft_placeholders", False),
+    }
+    if jobs > 1 and len(targets) > 1 and run_parallel_target_builds is not None:
+        if output_root is not None:
+            raise RuntimeError("--jobs > 1 needs per-target output roots; drop --output-root or use --jobs 1")
+        # docs/index.rst is shared by every target, so the root index written
+        # below is its only writer in parallel mode.
+        run_parallel_target_builds(
             cfg,
-            target_model=target.model,
-            target_region=target.region,
-            target_lang=target.lang,
-            requested_formats=requested_formats if not args.prepare_only else [],
-            pdf_mode=pdf_mode,
-            build_cfg=build_cfg,
-            tools_cfg=tools_cfg,
-            no_open=args.no_open,
-            source_mode=args.source,
-            data_root=args.data_root,
-            page_selector=args.page_selector,
-            output_root=output_root,
+            targets,
+            jobs=jobs,
+            build_kwargs={**build_kwargs, "write_wrapper_index": False},
             output_base_root=output_base_root,
-            write_wrapper_index=not args.skip_root_index,
-            draft_placeholders=getattr(args, "draft_placeholders", False),
         )
+    else:
+        for target in targets:
+            print(
+                "[build] target: "
+                f"model='{target.model or ''}', region='{target.region or ''}', lang='{target.lang or ''}'"
+            )
+            build_target(
+                cfg,
+                target_model=target.model,
+                target_region=target.region,
+                target_lang=target.lang,
+                **build_kwargs,
+            )
 
     if not args.skip_root_index:
         write_docs_root_index_for_targets(targets)
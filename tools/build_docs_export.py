@@ -13,6 +13,12 @@ from tools.build_docs_artifacts import (
     resolve_build_artifact_plan,
 )
 from tools.asset_usage import ASSET_USAGE_MANIFEST_FILENAME
+from tools.build_docs_stages import (
+    BuildStage,
+    format_stage_timings,
+    resolve_format_jobs,
+    run_build_stages,
+)
 from tools.gen_index_bundle_assets import raw_html_asset_values
 from tools.safe_copy import copy_regular_file_no_symlinks
 from tools.utils.path_utils import PathSegments, latex_renderer_of
@@ -305,57 +311,93 @@ def build_target(
         compile_xelatex(artifact_plan.main_tex, artifact_plan.xelatex_runs, cwd=artifact_plan.latex_out_dir)
         latex_built = True
 
-    if "html" in requested_formats or artifact_plan.word_source == "html":
-        ensure_html(minimal_theme=("html" not in requested_formats and artifact_plan.word_source == "html"))
-
-    docx_path = build_word_artifact(
-        cfg=cfg,
-        target_model=target_model,
-        target_region=target_region,
-        requested_formats=requested_formats,
-        pdf_mode=pdf_mode,
-        plan=artifact_plan,
-        bundle=bundle,
-        resolve_output_path=resolve_output_path,
-        ensure_html=ensure_html,
-        ensure_latex=ensure_latex,
-        export_word_from_bundle=export_word_from_bundle,
-        export_word_from_html=export_word_from_html,
-        export_word_from_latex=export_word_from_latex,
-        open_file=open_file,
-        printer=printer,
-    )
-
-    build_pdf_artifact(
-        cfg=cfg,
-        target_model=target_model,
-        target_region=target_region,
-        requested_formats=requested_formats,
-        pdf_mode=pdf_mode,
-        plan=artifact_plan,
-        bundle=bundle,
-        docx_path=docx_path,
-        resolve_output_path=resolve_output_path,
-        ensure_latex=ensure_latex,
-        export_word_from_bundle=export_word_from_bundle,
-        export_pdf_from_docx_via_word=export_pdf_from_docx_via_word,
-        copy_file=copy_file,
-        open_file=open_file,
-        printer=printer,
-    )
+    # Format stages only share the read-only prepared bundle, so with
+    # build.format_jobs > 1 they run concurrently once their inputs exist
+    # (Word-from-HTML/LaTeX waits on that Sphinx build, PDF on LaTeX or DOCX).
+    # The default of 1 keeps the historical order and Word COM on this thread.
+    word_source = artifact_plan.word_source
+    html_minimal_theme = "html" not in requested_formats and word_source == "html"
+    needs_word = "word" in requested_formats or ("pdf" in requested_formats and pdf_mode == "word")
+    needs_html = "html" in requested_formats or word_source == "html"
+    word_needs_latex = needs_word and word_source == "latex"
+    pdf_needs_latex = "pdf" in requested_formats and pdf_mode == "latex"
+    stages: list[BuildStage] = []
+    if needs_html:
+        stages.append(BuildStage("html", lambda _finished: ensure_html(minimal_theme=html_minimal_theme)))
+    if word_needs_latex:
+        stages.append(BuildStage("latex", lambda _finished: ensure_latex()))
+    if needs_word:
+        stages.append(
+            BuildStage(
+                "word",
+                lambda _finished: build_word_artifact(
+                    cfg=cfg,
+                    target_model=target_model,
+                    target_region=target_region,
+                    requested_formats=requested_formats,
+                    pdf_mode=pdf_mode,
+                    plan=artifact_plan,
+                    bundle=bundle,
+                    resolve_output_path=resolve_output_path,
+                    ensure_html=ensure_html,
+                    ensure_latex=ensure_latex,
+                    export_word_from_bundle=export_word_from_bundle,
+                    export_word_from_html=export_word_from_html,
+                    export_word_from_latex=export_word_from_latex,
+                    open_file=open_file,
+                    printer=printer,
+                ),
+                depends_on=(("html",) if word_source == "html" else ("latex",) if word_needs_latex else ()),
+            )
+        )
+    if pdf_needs_latex and not word_needs_latex:
+        stages.append(BuildStage("latex", lambda _finished: ensure_latex()))
+    if "pdf" in requested_formats:
+        stages.append(
+            BuildStage(
+                "pdf",
+                lambda finished: build_pdf_artifact(
+                    cfg=cfg,
+                    target_model=target_model,
+                    target_region=target_region,
+                    requested_formats=requested_formats,
+                    pdf_mode=pdf_mode,
+                    plan=artifact_plan,
+                    bundle=bundle,
+                    docx_path=finished.get("word"),
+                    resolve_output_path=resolve_output_path,
+                    ensure_latex=ensure_latex,
+                    export_word_from_bundle=export_word_from_bundle,
+                    export_pdf_from_docx_via_word=export_pdf_from_docx_via_word,
+                    copy_file=copy_file,
+                    open_file=open_file,
+                    printer=printer,
+                ),
+                depends_on=("latex",) if pdf_needs_latex else (("word",) if needs_word else ()),
+            )
+        )
+    if "md" in requested_formats:
+        stages.append(
+            BuildStage(
+                "md",
+                lambda _finished: build_markdown_artifact(
+                    cfg=cfg,
+                    target_model=target_model,
+                    target_region=target_region,
+                    requested_formats=requested_formats,
+                    plan=artifact_plan,
+                    bundle=bundle,
+                    resolve_output_path=resolve_output_path,
+                    export_markdown_from_bundle=export_markdown_from_bundle,
+                    open_file=open_file,
+                    printer=printer,
+                ),
+            )
+        )
 
-    build_markdown_artifact(
-        cfg=cfg,
-        target_model=target_model,
-        target_region=target_region,
-        requested_formats=requested_formats,
-        plan=artifact_plan,
-        bundle=bundle,
-        resolve_output_path=resolve_output_path,
-        export_markdown_from_bundle=export_markdown_from_bundle,
-        open_file=open_file,
-        printer=printer,
-    )
+    stage_report = run_build_stages(stages, max_workers=resolve_format_jobs(build_cfg))
+    if stage_report.timings:
+        printer(f"[build] stage timings: {format_stage_timings(stage_report.timings)}")
 
     finalize_html_artifact(
         requested_formats=requested_formats,
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
+from tools.gen_index_bundle_incremental import bundle_file_state_path
 from tools.utils.path_utils import docs_build_dir_of
 
 
@@ -89,8 +90,8 @@ def clean_build_targets(
             preview_name=preview_name,
         )
         if target_build_root.exists():
-            printer(f"[build] Cleaning target output: {target_build_root}")
-            remove_tree_with_retries(target_build_root)
+            printer(f"[build] Cleaning target output (keeping incremental build state): {target_build_root}")
+            _clean_target_build_root(target_build_root, remove_tree_with_retries=remove_tree_with_retries)
 
         if preview_name is None:
             cleanup_legacy_rst_artifacts(
@@ -100,6 +101,36 @@ def clean_build_targets(
             )
 
 
+# --clean is the default for every action except fast, so it must not throw
+# away what makes the next build incremental: the rst bundle and its recorded
+# file states (tools/gen_index_bundle_incremental.py) and each Sphinx builder's
+# .doctrees (pickled environment). The bundle is re-materialized on every build
+# anyway; final outputs (html pages, latex/pdf/word/md) are what gets removed.
+_SPHINX_DOCTREES_DIRNAME = ".doctrees"
+
+
+def _remove_build_path(path: Path, remove_tree_with_retries: Callable[[Path], None]) -> None:
+    if path.is_dir() and not path.is_symlink():
+        remove_tree_with_retries(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _clean_target_build_root(target_build_root: Path, *, remove_tree_with_retries: Callable[[Path], None]) -> None:
+    bundle_dir = target_build_root / "rst"
+    kept = {bundle_dir.name, bundle_file_state_path(bundle_dir).name}
+    for child in sorted(target_build_root.iterdir()):
+        if child.name in kept:
+            continue
+        doctrees_dir = child / _SPHINX_DOCTREES_DIRNAME
+        if child.is_dir() and not child.is_symlink() and doctrees_dir.is_dir():
+            for output in sorted(child.iterdir()):
+                if output.name != _SPHINX_DOCTREES_DIRNAME:
+                    _remove_build_path(output, remove_tree_with_retries)
+            continue
+        _remove_build_path(child, remove_tree_with_retries)
+
+
 def sphinx_build(
     builder: str,
     *,
@@ -21,6 +21,7 @@ def run_main(
     resolve_pdf_mode: Callable[[dict, str | None], str],
     build_target: Callable[..., None],
     write_docs_root_index_for_targets: Callable[[list[Any]], None],
+    run_parallel_target_builds: Callable[..., Any] | None = None,
 ) -> None:
     args = parse_args(argv)
     run_build(
@@ -37,4 +38,5 @@ def run_main(
         resolve_pdf_mode=resolve_pdf_mode,
         build_target=build_target,
         write_docs_root_index_for_targets=write_docs_root_index_for_targets,
+        run_parallel_target_builds=run_parallel_target_builds,
     )
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+from tools.utils.csv_table_cache import read_cached_csv_rows
+
+TARGET_LOG_DIRNAME = "_target_logs"
+
+
+@dataclass(frozen=True)
+class TargetBuildJob:
+    position: int
+    target: Any
+    cfg: dict
+    build_kwargs: dict[str, Any]
+    log_path: Path
+
+
+@dataclass(frozen=True)
+class TargetBuildResult:
+    position: int
+    target: Any
+    log_path: Path
+    elapsed_seconds: float
+    error: str | None = None
+    # (model, docs_build_dir) pairs whose HTML switchers the parent refreshes
+    # once every target is built; workers must not rewrite sibling HTML.
+    html_switcher_refreshes: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def describe_target(target: Any) -> str:
+    return (
+        f"model='{getattr(target, 'model', None) or ''}', "
+        f"region='{getattr(target, 'region', None) or ''}', "
+        f"lang='{getattr(target, 'lang', None) or ''}'"
+    )
+
+
+def target_log_path(log_dir: Path, target: Any) -> Path:
+    parts = [
+        str(getattr(target, name, None) or "").strip() or "default"
+        for name in ("model", "region", "lang")
+    ]
+    return log_dir / f"{'_'.join(parts)}.log"
+
+
+def resolve_target_log_dir(*, output_base_root: Path | None, default_docs_build_dir: Path) -> Path:
+    return (output_base_root or default_docs_build_dir) / TARGET_LOG_DIRNAME
+
+
+@contextmanager
+def _redirect_process_output(log: TextIO) -> Iterator[None]:
+    """Send Python output and fd 1/2 (Sphinx/XeLaTeX subprocesses) to ``log``."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout = os.dup(1)
+    saved_stderr = os.dup(2)
+    try:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        with redirect_stdout(log), redirect_stderr(log):
+            yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+
+def run_target_build_job(
+    job: TargetBuildJob,
+    *,
+    build_target: Callable[..., None],
+) -> TargetBuildResult:
+    refreshes: list[tuple[str, str]] = []
+
+    def record_html_switcher_refresh(*, model: str | None, docs_build_dir: Path) -> None:
+        if model:
+            refreshes.append((model, str(docs_build_dir)))
+
+    job.log_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    error: str | None = None
+    with job.log_path.open("w", encoding="utf-8", buffering=1) as log, _redirect_process_output(log):
+        print(f"[build] target: {describe_target(job.target)}")
+        try:
+            build_target(
+                job.cfg,
+                target_model=job.target.model,
+                target_region=job.target.region,
+                target_lang=job.target.lang,
+                refresh_html_switchers=record_html_switcher_refresh,
+                **job.build_kwargs,
+            )
+        except (Exception, SystemExit) as exc:
+            traceback.print_exc()
+            error = f"{type(exc).__name__}: {exc}"
+    return TargetBuildResult(
+        position=job.position,
+        target=job.target,
+        log_path=job.log_path,
+        elapsed_seconds=time.monotonic() - started,
+        error=error,
+        html_switcher_refreshes=tuple(refreshes),
+    )
+
+
+def target_build_pool_context() -> BaseContext | None:
+    """Fork where the platform offers it so workers inherit warmed inputs.
+
+    Fork is not the default everywhere (macOS, Windows, Linux from Python
+    3.14), so ask for it explicitly; without it workers fall back to the
+    platform default and read the snapshot tables themselves.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def run_target_build_jobs(
+    build_jobs: list[TargetBuildJob],
+    *,
+    max_workers: int,
+    run_job: Callable[[TargetBuildJob], TargetBuildResult],
+    printer: Callable[[str], None] = print,
+) -> list[TargetBuildResult]:
+    """Run independent target builds in a process pool; results keep target order."""
+    results: dict[int, TargetBuildResult] = {}
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(max_workers, len(build_jobs))),
+        mp_context=target_build_pool_context(),
+    ) as pool:
+        futures = {pool.submit(run_job, job): job for job in build_jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                result = TargetBuildResult(
+                    position=job.position,
+                    target=job.target,
+                    log_path=job.log_path,
+                    elapsed_seconds=0.0,
+                    error=f"worker crashed: {type(exc).__name__}: {exc}",
+                )
+            results[job.position] = result
+            status = "done" if result.ok else "FAILED"
+            printer(
+                f"[build] {status}: {describe_target(job.target)} "
+                f"({result.elapsed_seconds:.1f}s, log: {job.log_path})"
+            )
+    return [results[job.position] for job in build_jobs]
+
+
+def run_parallel_target_builds(
+    cfg: dict,
+    targets: list[Any],
+    *,
+    jobs: int,
+    build_kwargs: dict[str, Any],
+    log_dir: Path,
+    prepare_shared_inputs: Callable[[], None],
+    run_job: Callable[[TargetBuildJob], TargetBuildResult],
+    refresh_model_html_switchers: Callable[..., None],
+    printer: Callable[[str], None] = print,
+) -> list[TargetBuildResult]:
+    # Warm shared, read-only inputs (snapshot tables) once in the parent so
+    # forked workers (see target_build_pool_context) inherit them instead of
+    # each re-parsing the snapshot.
+    prepare_shared_inputs()
+    build_jobs = [
+        TargetBuildJob(
+            position=position,
+            target=target,
+            cfg=cfg,
+            build_kwargs=dict(build_kwargs),
+            log_path=target_log_path(log_dir, target),
+        )
+        for position, target in enumerate(targets)
+    ]
+    printer(f"[build] building {len(build_jobs)} target(s) with {jobs} job(s); logs: {log_dir}")
+    results = run_target_build_jobs(build_jobs, max_workers=jobs, run_job=run_job, printer=printer)
+
+    refreshed: set[tuple[str, str]] = set()
+    for result in results:
+        for model, docs_build_dir in result.html_switcher_refreshes:
+            if (model, docs_build_dir) in refreshed:
+                continue
+            refreshed.add((model, docs_build_dir))
+            refresh_model_html_switchers(model=model, docs_build_dir=Path(docs_build_dir))
+
+    failed = [result for result in results if not result.ok]
+    if failed:
+        details = "\n".join(
+            f"  - {describe_target(result.target)}: {result.error} (log: {result.log_path})"
+            for result in failed
+        )
+        raise RuntimeError(f"{len(failed)} of {len(results)} target build(s) failed:\n{details}")
+    return results
+
+
+def build_targets_in_parallel(
+    cfg: dict,
+    targets: list[Any],
+    *,
+    jobs: int,
+    build_kwargs: dict[str, Any],
+    output_base_root: Path | None,
+    default_docs_build_dir: Path,
+    build_target: Callable[..., None],
+    resolve_spec_master_csv_path: Callable[..., Path],
+    refresh_model_html_switchers: Callable[..., None],
+) -> list[TargetBuildResult]:
+    """``build_docs --jobs`` entry: wire build_docs' target builder into the pool."""
+
+    def prepare_shared_inputs() -> None:
+        if build_kwargs.get("source_mode") == "review-asis":
+            return
+        read_cached_csv_rows(
+            resolve_spec_master_csv_path(cfg, data_root=build_kwargs.get("data_root")),
+            line_numbers=True,
+        )
+
+    return run_parallel_target_builds(
+        cfg,
+        targets,
+        jobs=jobs,
+        build_kwargs=build_kwargs,
+        log_dir=resolve_target_log_dir(
+            output_base_root=output_base_root,
+            default_docs_build_dir=default_docs_build_dir,
+        ),
+        prepare_shared_inputs=prepare_shared_inputs,
+        run_job=partial(run_target_build_job, build_target=build_target),
+        refresh_model_html_switchers=refresh_model_html_switchers,
+    )
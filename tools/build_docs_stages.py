@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class BuildStage:
+    name: str
+    # Called with the results of every stage finished so far (always
+    # including ``depends_on``).
+    run: Callable[[Mapping[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class BuildStageReport:
+    results: dict[str, Any]
+    timings: dict[str, float]
+
+
+def resolve_format_jobs(build_cfg: dict) -> int:
+    raw = build_cfg.get("format_jobs", 1)
+    try:
+        return max(1, int(raw))
+    except (TypeError, ValueError):
+        raise RuntimeError(f"build.format_jobs must be a positive integer, got {raw!r}") from None
+
+
+def format_stage_timings(timings: dict[str, float]) -> str:
+    return ", ".join(f"{name} {seconds:.1f}s" for name, seconds in timings.items())
+
+
+def _validate_stages(stages: list[BuildStage]) -> None:
+    seen: set[str] = set()
+    for stage in stages:
+        if stage.name in seen:
+            raise RuntimeError(f"duplicate build stage: {stage.name}")
+        missing = [name for name in stage.depends_on if name not in seen]
+        if missing:
+            raise RuntimeError(f"build stage {stage.name} depends on undeclared/later stage(s): {missing}")
+        seen.add(stage.name)
+
+
+def _timed(stage: BuildStage, finished: Mapping[str, Any]) -> tuple[Any, float]:
+    started = time.monotonic()
+    result = stage.run(finished)
+    return result, time.monotonic() - started
+
+
+def run_build_stages(stages: list[BuildStage], *, max_workers: int = 1) -> BuildStageReport:
+    """Run format stages after their dependencies, concurrently when ``max_workers`` > 1.
+
+    ``stages`` must be listed in a valid sequential order; that order is used
+    as-is for ``max_workers`` == 1 and decides which failure is re-raised when
+    several concurrent stages fail.
+    """
+    _validate_stages(stages)
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    if max_workers <= 1 or len(stages) <= 1:
+        for stage in stages:
+            results[stage.name], timings[stage.name] = _timed(stage, dict(results))
+        return BuildStageReport(results=results, timings=timings)
+
+    order = {stage.name: position for position, stage in enumerate(stages)}
+    pending = list(stages)
+    running: dict[Future[tuple[Any, float]], BuildStage] = {}
+    errors: dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="build-stage") as pool:
+        while pending or running:
+            if not errors:
+                for stage in [item for item in pending if all(dep in results for dep in item.depends_on)]:
+                    pending.remove(stage)
+                    running[pool.submit(_timed, stage, dict(results))] = stage
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    results[stage.name], timings[stage.name] = future.result()
+                except BaseException as exc:
+                    errors[stage.name] = exc
+    if errors:
+        first_failed = min(errors, key=order.__getitem__)
+        raise errors[first_failed]
+    return BuildStageReport(
+        results=results,
+        timings={name: timings[name] for name in sorted(timings, key=order.__getitem__)},
+    )
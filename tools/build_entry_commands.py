@@ -122,6 +122,12 @@ def build_docs_command(
         cmd.append("--no-open")
     if getattr(args, "draft_placeholders", False):
         cmd.append("--draft-placeholders")
+    jobs = getattr(args, "jobs", 1) or 1
+    if action != "preview" and jobs > 1:
+        cmd += ["--jobs", str(jobs)]
+    bundle_jobs = getattr(args, "bundle_jobs", None)
+    if bundle_jobs is not None:
+        cmd += ["--bundle-jobs", str(bundle_jobs)]
     return cmd
 
 
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 from typing import Callable
 
+from tools.build_daemon import run_via_build_daemon
 from tools.local_env import load_local_env_file
 
 
@@ -44,6 +45,18 @@ def run_main(
     run_asset_command: Callable[[argparse.Namespace], None] | None = None,
     run_new_line: Callable[[argparse.Namespace], None] | None = None,
 ) -> int:
+    if argv is None:
+        # A real command line: let a running build daemon (tools/build_daemon.py)
+        # take it; explicit argv lists (tests, the daemon itself) always run here.
+        forwarded = run_via_build_daemon(
+            sys.argv[1:],
+            repo_root=resolve_path_from_root(".").resolve(),
+            on_stdout=lambda text: (sys.stdout.write(text), sys.stdout.flush()),
+            on_stderr=lambda text: (sys.stderr.write(text), sys.stderr.flush()),
+        )
+        if forwarded is not None:
+            return forwarded
+
     # Make phase2/Feishu secrets from ~/.auto-manual-phase2.env available to this
     # process (and the child processes it spawns, e.g. tools/sync_data.py) without
     # requiring a manual `source`. No-op when the file is absent; never overrides
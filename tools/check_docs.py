@@ -53,7 +53,11 @@ from tools.check_docs_renderer_contracts import (  # noqa: E402
     collect_fcc_renderer_contract_issues as _collect_fcc_renderer_contract_issues_impl,
 )
 from tools.model_languages import resolve_target_languages as _resolve_target_languages_impl  # noqa: E402
-from tools.check_docs_generated import collect_generated_page_issues as _collect_generated_page_issues_impl  # noqa: E402
+from tools.check_docs_generated import (  # noqa: E402
+    collect_csv_page_cache_issues as _collect_csv_page_cache_issues_impl,
+    collect_generated_page_issues as _collect_generated_page_issues_impl,
+)
+from tools.csv_pages.page_cache import unverified_cached_outputs  # noqa: E402
 from tools.check_docs_identity import (  # noqa: E402
     collect_identity_drift_issues as _collect_identity_drift_issues_impl,
     collect_target_identity_issues as _collect_target_identity_issues_impl,
@@ -293,7 +297,7 @@ def collect_bundle_issues(
     model: str | None,
     region: str | None,
 ) -> list[CheckIssue]:
-    return _collect_bundle_issues_impl(
+    issues = _collect_bundle_issues_impl(
         bundle_dir=bundle_dir,
         docs_dir=docs_dir,
         repo_root=ROOT,
@@ -303,6 +307,16 @@ def collect_bundle_issues(
         collect_placeholder_issues=collect_placeholder_issues,
         collect_reference_issues=collect_reference_issues,
     )
+    issues.extend(
+        _collect_csv_page_cache_issues_impl(
+            bundle_dir=bundle_dir,
+            model=model,
+            region=region,
+            issue_cls=CheckIssue,
+            unverified_cached_outputs=unverified_cached_outputs,
+        )
+    )
+    return issues
 
 
 def collect_fcc_renderer_contract_issues(
@@ -6,13 +6,14 @@ from pathlib import Path
 from typing import Any, Callable
 
 from tools.utils.korean_josa import josa_base_key
+from tools.utils.spec_master_index import SpecMasterIndex
 
 SNIPPET_SLOT_RE = re.compile(r"\{\{snippet:([a-zA-Z0-9_.-]+)\}\}")
 
 
 @dataclass(frozen=True)
 class GeneratedPageRuntime:
-    spec_rows: list[dict[str, str]]
+    spec_rows: SpecMasterIndex
     registry_path: Path
     registry_entries: list[Any]
     registry_error: RuntimeError | None
@@ -83,7 +84,7 @@ def _load_generated_runtime(
     load_rst_substitutions: Callable[[Path], dict[str, str]],
 ) -> GeneratedPageRuntime:
     spec_master_csv = resolve_spec_master_csv_path(cfg, data_root=data_root)
-    spec_rows = read_spec_master_rows(spec_master_csv)
+    spec_rows = SpecMasterIndex(read_spec_master_rows(spec_master_csv))
     registry_path = resolve_snippet_registry_path(docs_dir)
     registry_entries: list[Any] = []
     registry_error: RuntimeError | None = None
@@ -838,3 +839,24 @@ def collect_generated_page_issues(
         )
     )
     return issues
+
+
+def collect_csv_page_cache_issues(
+    *,
+    bundle_dir: Path,
+    model: str | None,
+    region: str | None,
+    issue_cls: type[Any],
+    unverified_cached_outputs: Callable[[Path], list[Path]],
+) -> list[Any]:
+    """Reused csv_page outputs are trusted only while they still hash to what their cache key rendered."""
+    return [
+        issue_cls(
+            code="CSV_PAGE_CACHE_MISMATCH",
+            message=f"Reused csv_page output no longer matches its cached render: {path}",
+            model=model,
+            region=region,
+            path=path,
+        )
+        for path in unverified_cached_outputs(bundle_dir / "generated")
+    ]
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Cold-start import budget for lightweight ``build.py`` commands.
+
+Runs each command under ``python -X importtime`` (daemon forwarding off) and
+fails when its module count exceeds the budget or when it pulls in a module
+that only heavy commands should load. Both are deterministic for a given
+interpreter. Import time is only advisory: wall-clock numbers depend on the
+runner, so they are compared against a bare ``python -c pass`` measured in
+the same run and reported as a warning when the ratio regresses. Command
+implementations are bound lazily in build.py (tools/lazy_import.py); this is
+the regression alarm for an eager import creeping back in.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    argv: tuple[str, ...]
+    max_modules: int
+    # Advisory: warn when imports take longer than this many bare interpreter starts.
+    max_time_ratio: float
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    total_ms: float
+    modules: tuple[str, ...]
+    top_level: tuple[tuple[str, float], ...]
+
+
+# Module budgets sit well above the measured cold start (about 130 modules for
+# --help, 160 for the dry run) so a new stdlib dependency does not trip them
+# but an eager heavy import does. Import times measured ~12-17x / ~16-19x a bare
+# interpreter start; the advisory ratios leave room for runner jitter.
+LIGHT_COMMAND_BUDGETS: tuple[ImportBudget, ...] = (
+    ImportBudget(argv=("--help",), max_modules=250, max_time_ratio=30.0),
+    ImportBudget(argv=("message-control-dry-run", "--message", "ping"), max_modules=300, max_time_ratio=35.0),
+)
+
+# Modules that belong to heavy commands (bundle builds, queue processing,
+# rendering). A lightweight command importing any of them means an eager
+# import was reintroduced somewhere on the build.py startup path.
+HEAVY_MODULES: tuple[str, ...] = (
+    "tools.build_docs",
+    "tools.queue_query",
+    "tools.process_build_queue",
+    "tools.manual_index_query",
+    "tools.sync_data",
+    "tools.word_bundle",
+    "bs4",
+    "docutils",
+    "sphinx",
+)
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Parse ``-X importtime`` output; total is the sum of top-level cumulative times."""
+    modules: list[str] = []
+    top_level: list[tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        modules.append(name.strip())
+        if not name.startswith("  ", 1):
+            top_level.append((name.strip(), int(fields[1]) / 1000.0))
+    return ImportProfile(
+        total_ms=sum(ms for _, ms in top_level),
+        modules=tuple(modules),
+        top_level=tuple(top_level),
+    )
+
+
+def _profile(args: list[str], *, repo_root: Path) -> ImportProfile:
+    env = {**os.environ, "AUTO_MANUAL_BUILD_DAEMON": "0"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=repo_root,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def profile_command(argv: tuple[str, ...], *, repo_root: Path = _REPO_ROOT) -> ImportProfile:
+    return _profile([str(repo_root / "build.py"), *argv], repo_root=repo_root)
+
+
+def profile_interpreter(*, repo_root: Path = _REPO_ROOT) -> ImportProfile:
+    """A bare interpreter start on this runner: the yardstick for import times."""
+    return _profile(["-c", "pass"], repo_root=repo_root)
+
+
+def heavy_imports(profile: ImportProfile, heavy_modules: tuple[str, ...] = HEAVY_MODULES) -> list[str]:
+    return sorted(
+        name
+        for name in set(profile.modules)
+        if any(name == heavy or name.startswith(f"{heavy}.") for heavy in heavy_modules)
+    )
+
+
+def check_budget(budget: ImportBudget, profile: ImportProfile) -> list[str]:
+    command = " ".join(budget.argv)
+    problems: list[str] = []
+    if len(profile.modules) > budget.max_modules:
+        problems.append(f"build.py {command}: imported {len(profile.modules)} modules (budget {budget.max_modules})")
+    heavy = heavy_imports(profile)
+    if heavy:
+        problems.append(f"build.py {command}: imported heavy modules {', '.join(heavy)}")
+    return problems
+
+
+def time_ratio(profile: ImportProfile, baseline: ImportProfile) -> float:
+    return profile.total_ms / max(baseline.total_ms, 1.0)
+
+
+def check_time(budget: ImportBudget, profile: ImportProfile, baseline: ImportProfile) -> str | None:
+    """Advisory timing warning, relative to ``baseline`` from the same runner."""
+    ratio = time_ratio(profile, baseline)
+    if ratio <= budget.max_time_ratio:
+        return None
+    return (
+        f"build.py {' '.join(budget.argv)}: imports took {profile.total_ms:.0f}ms, "
+        f"{ratio:.1f}x a bare interpreter start ({baseline.total_ms:.0f}ms; advisory limit {budget.max_time_ratio:.0f}x)"
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Cold-start import budget for lightweight build.py commands.")
+    ap.add_argument("--repo-root", type=Path, default=_REPO_ROOT)
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per command; the fastest one is checked (default: 3)")
+    ap.add_argument("--top", type=int, default=5, help="Slowest top-level imports to list on failure (default: 5)")
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    repeat = max(1, args.repeat)
+    baseline = min(
+        (profile_interpreter(repo_root=args.repo_root) for _ in range(repeat)),
+        key=lambda run: run.total_ms,
+    )
+    failures: list[str] = []
+    for budget in LIGHT_COMMAND_BUDGETS:
+        runs = [profile_command(budget.argv, repo_root=args.repo_root) for _ in range(repeat)]
+        profile = min(runs, key=lambda run: run.total_ms)
+        problems = check_budget(budget, profile)
+        slow = check_time(budget, profile, baseline)
+        status = "FAIL" if problems else ("slow" if slow else "ok")
+        print(
+            f"[import-budget] {status} build.py {' '.join(budget.argv)}: "
+            f"{len(profile.modules)}/{budget.max_modules} modules, "
+            f"{profile.total_ms:.0f}ms ({time_ratio(profile, baseline):.1f}x bare start)"
+        )
+        if slow:
+            print(f"[import-budget] WARNING: {slow}", file=sys.stderr)
+        if problems or slow:
+            failures.extend(problems)
+            for name, ms in sorted(profile.top_level, key=lambda item: -item[1])[: args.top]:
+                print(f"  {ms:8.1f}ms  {name}")
+    for problem in failures:
+        print(f"[import-budget] ERROR: {problem}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,7 +24,9 @@ HOTSPOT_LINE_THRESHOLDS: dict[str, int] = {
     # +11: the publish asset gate needs one injected entrypoint wrapper
     # (import + 7-line resolver + call site). Bundle-path resolution lives in
     # tools/release_asset_lineage.py, so this is the irreducible minimum.
-    "build.py": 761,
+    # +6: translation-memory fuzzy mode (one import + a partial over the
+    # fuzzy payload builder); matching lives in tools/translation_memory_fuzzy.py.
+    "build.py": 767,
     "tools/build_docs.py": 860,
     "tools/process_build_queue.py": 650,
     "tools/validate_spec_master_runtime.py": 880,
@@ -52,7 +54,9 @@ HOTSPOT_LINE_THRESHOLDS: dict[str, int] = {
     # 880 -> 900: the delete-verify block-presence check (apply-parity accuracy
     # fix) is a correctness guard that belongs next to the verify verdicts.
     "tools/cloud_doc_backport_reports.py": 900,
-    "tools/sync_data_runtime.py": 900,
+    # 900 -> 700: snapshot attachment planning and downloads moved to
+    # tools/sync_data_attachments.py; keep the regrowth alarm close.
+    "tools/sync_data_runtime.py": 700,
     "tools/content_lint.py": 800,
     "tools/translation_memory.py": 790,
     "tools/source_record_index.py": 500,
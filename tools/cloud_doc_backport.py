@@ -109,6 +109,7 @@ from tools.cloud_doc_backport_routing import (  # noqa: E402,F401
     _make_delta,
     _semantic_review_flags,
     _without_image_placeholders,
+    diff_block_pairs,
     diff_blocks,
 )
 from tools.cloud_doc_backport_model import (  # noqa: E402,F401
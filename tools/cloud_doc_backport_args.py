@@ -369,6 +369,14 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         "ledger run instead of colliding on one constant id)",
     )
     run_review_branch_parser.add_argument("--out", help="output directory for run-review reports")
+    run_review_branch_parser.add_argument(
+        "--page-workers", type=int, default=1,
+        help="whole-doc runs: diff up to N pages at once, each on a resident worker process (default 1)",
+    )
+    run_review_branch_parser.add_argument(
+        "--page-timeout", type=float, default=None,
+        help="fail a page whose run-review takes longer than this many seconds (the other pages still run)",
+    )
     run_review_branch_parser.add_argument("--lark-cli", default="lark-cli", help="lark-cli binary")
     run_review_branch_parser.add_argument("--identity", default="bot", help="lark-cli identity (user|bot)")
     run_review_branch_parser.add_argument(
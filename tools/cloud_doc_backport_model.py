@@ -4,8 +4,9 @@
 
 The foundation layer (debt-paydown D2-3): the Block model, document fetch/
 normalization, markdown->block parsing, and section selection. Imports only
-stdlib + path_utils, so the routing/apply/CLI layers can import Block & friends
-from here without an import cycle. Re-exported by cloud_doc_backport.
+stdlib, path_utils and the (equally stdlib-only) fetch cache, so the
+routing/apply/CLI layers can import Block & friends from here without an import
+cycle. Re-exported by cloud_doc_backport.
 """
 from __future__ import annotations
 
@@ -19,6 +20,7 @@ from pathlib import Path
 from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.cloud_doc_fetch_cache import doc_ref, doc_revision, open_fetch_cache  # noqa: E402
 from tools.utils.path_utils import get_paths  # noqa: E402
 
 
@@ -127,8 +129,13 @@ def _local_doc_path(doc_url: str) -> Path | None:
         return path
     return None
 
-def fetch_doc_text(doc_url: str, *, lark_cli: str = "lark-cli") -> str:
-    """Fetch a cloud doc, or read a local fixture when doc_url is a file path."""
+def fetch_doc_text(doc_url: str, *, lark_cli: str = "lark-cli", cache_dir: Path | None = None) -> str:
+    """Fetch a cloud doc, or read a local fixture when doc_url is a file path.
+
+    Remote docs go through the revision-keyed fetch cache
+    (``tools.cloud_doc_fetch_cache``): an unchanged doc is served without a
+    fetch, and the command variant that last worked is tried first.
+    """
     doc_url = _unwrap_markdown_link(doc_url)
     local_path = _local_doc_path(doc_url)
     if local_path is not None:
@@ -136,6 +143,13 @@ def fetch_doc_text(doc_url: str, *, lark_cli: str = "lark-cli") -> str:
     if doc_url == "-":
         return _extract_doc_markdown(sys.stdin.read())
 
+    ref = doc_ref(doc_url)
+    cache = open_fetch_cache(cache_dir) if ref else None
+    revision = doc_revision(lark_cli, *ref) if cache is not None and ref else None
+    if cache is not None and ref and revision:
+        cached = cache.load(ref[0], revision)
+        if cached is not None:
+            return cached
     attempts = [
         [
             lark_cli,
@@ -152,8 +166,10 @@ def fetch_doc_text(doc_url: str, *, lark_cli: str = "lark-cli") -> str:
         [lark_cli, "docs", "+fetch", "--doc", doc_url],
         [lark_cli, "docs", "+fetch", doc_url],
     ]
+    learned = cache.learned_variant(lark_cli) if cache is not None else None
     errors: list[str] = []
-    for command in attempts:
+    for variant in sorted(range(len(attempts)), key=lambda index: index != learned):
+        command = attempts[variant]
         try:
             completed = subprocess.run(
                 command,
@@ -167,7 +183,12 @@ def fetch_doc_text(doc_url: str, *, lark_cli: str = "lark-cli") -> str:
             errors.append(f"{shlex.join(command)} -> {exc}")
             continue
         if completed.returncode == 0 and completed.stdout.strip():
-            return _extract_doc_markdown(completed.stdout)
+            text = _extract_doc_markdown(completed.stdout)
+            if cache is not None and ref:
+                cache.remember_variant(lark_cli, variant)
+                if revision:
+                    cache.store(ref[0], revision, variant=variant, text=text)
+            return text
         errors.append(
             f"{shlex.join(command)} -> exit {completed.returncode}: "
             f"{(completed.stderr or completed.stdout).strip()}"
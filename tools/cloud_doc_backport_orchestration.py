@@ -9,7 +9,6 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,6 +25,7 @@ from tools.source_table_sync import (  # noqa: E402
     load_sidecar_index,
     write_change_request_report,
 )
+from tools.backport_page_pool import run_page_subprocess, run_pages  # noqa: E402
 from tools.backport_baseline import baseline_rel_path, load_baseline, store_baseline  # noqa: E402
 from tools.review_branch_resolver import (  # noqa: E402
     doc_token,
@@ -532,15 +532,14 @@ def _run_review_branch(args: argparse.Namespace) -> int:
         print(f"cloud-doc-backport: {exc}", file=sys.stderr)
         return 2
     print(f"BRANCH {git_ref}  WORKTREE {worktree}  PAGES {len(source_rels)}")
-    changed_rels: list[str] = []
-    failed = False
+    page_jobs: list[tuple[str, Path, list[str]]] = []
     for source_rel in source_rels:
         source_abs = Path(worktree) / source_rel
         if not source_abs.is_file():
             continue
         page_out = out_dir / Path(source_rel).stem
-        review_cmd = [
-            sys.executable, str(Path(__file__).resolve()), "run-review",
+        review_argv = [
+            "run-review",
             "--doc-url", str(fixture), "--source-path", str(source_abs),
             "--run-id", f"{run_id}-{Path(source_rel).stem}", "--out", str(page_out), "--lark-cli", args.lark_cli,
             # Internal per-page worker: the source path is DERIVED from the resolved
@@ -551,15 +550,32 @@ def _run_review_branch(args: argparse.Namespace) -> int:
         # F2 (Class D) for the per-page worker too: forward the resolved data-root + lang.
         page_lang = (getattr(args, "lang", None) or _lang_from_doc_name(getattr(args, "doc_name", "") or "")).strip()
         if args.data_root and page_lang:
-            review_cmd += ["--data-root", args.data_root, "--lang", page_lang]
+            review_argv += ["--data-root", args.data_root, "--lang", page_lang]
         # F3 (Class T): forward the auto-resolved (or explicit) family-scope siblings so
         # the per-page worker flags shared-template prose as Class T. Resolved against
         # the worker's cwd (repo root); repeatable.
         for sibling_rel in (getattr(args, "sibling", None) or []):
-            review_cmd += ["--sibling", sibling_rel]
+            review_argv += ["--sibling", sibling_rel]
         if args.write:
-            review_cmd.append("--write")
-        proc = subprocess.run(review_cmd, cwd=str(get_paths().root), capture_output=True, text=True)
+            review_argv.append("--write")
+        page_jobs.append((source_rel, page_out, review_argv))
+    # Whole-doc runs reuse resident workers instead of paying interpreter startup
+    # per page. Each page writes only its own _review file and report dir, so pages
+    # can run side by side; results are consumed in page order either way.
+    page_workers = max(1, int(getattr(args, "page_workers", 1) or 1))
+    page_timeout = getattr(args, "page_timeout", None)
+    page_argvs, root = [argv for _, _, argv in page_jobs], get_paths().root
+    if len(page_argvs) > 1:
+        page_runs = run_pages(page_argvs, workers=page_workers, cwd=root, timeout=page_timeout)
+    else:
+        page_runs = (run_page_subprocess(argv, cwd=root, timeout=page_timeout) for argv in page_argvs)
+    changed_rels: list[str] = []
+    failed = False
+    for (source_rel, page_out, _), proc in zip(page_jobs, page_runs):
+        if proc.timed_out:
+            failed = True
+            print(f"  ERROR {source_rel} (timed out after {page_timeout}s)", file=sys.stderr)
+            continue
         if proc.returncode not in (0, 1):  # run-review returns 1 on a FAIL result
             failed = True
             print(f"  ERROR {source_rel} (rc {proc.returncode})", file=sys.stderr)
@@ -37,6 +37,7 @@ from tools.cloud_doc_backport_util import (  # noqa: E402
 from tools.cloud_doc_backport_routing import (  # noqa: E402
     _PLACEHOLDER_RE,
     _UNIT_VALUE_RE,
+    diff_block_changes,
     diff_blocks,
 )
 from tools.cloud_doc_backport_apply import (  # noqa: E402
@@ -383,7 +384,11 @@ def _rebuild_rediff_gate(
     *, baseline_text: str, edited_text: str, deltas: list[Any], run_id: str
 ) -> dict[str, Any]:
     """F5: re-diff baseline vs the edited source; the only changes must be the
-    intended repo_review_text deltas (no collateral, none missing)."""
+    intended repo_review_text deltas (no collateral, none missing).
+
+    Only the changed block pairs are compared, so the re-diff skips delta
+    routing; its unmatched regions mostly repeat the first pass and come out
+    of the block-diff gap memo."""
 
     def pair(delta: dict[str, Any]) -> tuple[Any, Any]:
         # Headings: compare on TITLE only. The reST source re-diff yields `# title` (level 1)
@@ -402,10 +407,8 @@ def _rebuild_rediff_gate(
         if isinstance(delta, dict) and delta.get("route_class") == "repo_review_text"
     }
     actual = {
-        pair(delta)
-        for delta in diff_blocks(
-            parse_blocks(baseline_text), parse_blocks(edited_text), doc_type="review", run_id=run_id
-        )
+        pair(change)
+        for change in diff_block_changes(parse_blocks(baseline_text), parse_blocks(edited_text))
     }
     unexpected = sorted(f"{old!r}->{new!r}" for old, new in (actual - expected))
     missing = sorted(f"{old!r}->{new!r}" for old, new in (expected - actual))
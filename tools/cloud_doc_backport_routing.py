@@ -8,7 +8,6 @@ cloud_doc_backport.
 """
 from __future__ import annotations
 
-import difflib
 import hashlib
 import json
 import re
@@ -27,6 +26,7 @@ from tools.cloud_doc_backport_model import (  # noqa: E402
 )
 from tools.token_resolution_map import classify_data_origin  # noqa: E402
 from tools.family_scope import classify_family_scope  # noqa: E402
+from tools.utils.block_diff import diff_opcodes  # noqa: E402
 
 
 DELTA_SCHEMA_VERSION = "cloud-doc-backport-delta/v1"
@@ -262,6 +262,52 @@ def _make_delta(
         "context": context,
     }
 
+def _diff_key(block: Block) -> str:
+    if block.kind == "heading":
+        return "heading:" + _section_key(_heading_title(block))
+    return block.normalized
+
+def diff_block_pairs(
+    baseline_blocks: list[Block], fetched_blocks: list[Block]
+) -> list[tuple[str, int | None, int | None]]:
+    """``(change_type, old_index, new_index)`` for every changed block, in diff order.
+
+    Unchanged blocks are anchored by content hash (``tools.utils.block_diff``);
+    a replace run pairs blocks positionally and spills the remainder as
+    deletes / inserts.
+    """
+    opcodes = diff_opcodes(
+        [_diff_key(block) for block in baseline_blocks],
+        [_diff_key(block) for block in fetched_blocks],
+    )
+    pairs: list[tuple[str, int | None, int | None]] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+        pairs.extend(("replace", i1 + offset, j1 + offset) for offset in range(paired))
+        pairs.extend(("delete", old_index, None) for old_index in range(i1 + paired, i2))
+        pairs.extend(("insert", None, new_index) for new_index in range(j1 + paired, j2))
+    return pairs
+
+def diff_block_changes(
+    baseline_blocks: list[Block], fetched_blocks: list[Block]
+) -> list[dict[str, Any]]:
+    """Delta-shaped ``location.kind`` / ``old_normalized`` / ``new_normalized``
+    for every changed block pair, without routing (the F5 re-diff gate)."""
+    changes: list[dict[str, Any]] = []
+    for _, old_index, new_index in diff_block_pairs(baseline_blocks, fetched_blocks):
+        old = baseline_blocks[old_index] if old_index is not None else None
+        new = fetched_blocks[new_index] if new_index is not None else None
+        changes.append(
+            {
+                "location": {"kind": (new or old).kind},
+                "old_normalized": old.normalized if old else None,
+                "new_normalized": new.normalized if new else None,
+            }
+        )
+    return changes
+
 def diff_blocks(
     baseline_blocks: list[Block],
     fetched_blocks: list[Block],
@@ -271,111 +317,19 @@ def diff_blocks(
     value_index: dict[str, Any] | None = None,
     family_index: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    import difflib
-
-    def diff_key(block: Block) -> str:
-        if block.kind == "heading":
-            return "heading:" + _section_key(_heading_title(block))
-        return block.normalized
-
-    baseline_norm = [diff_key(block) for block in baseline_blocks]
-    fetched_norm = [diff_key(block) for block in fetched_blocks]
-    matcher = difflib.SequenceMatcher(None, baseline_norm, fetched_norm, autojunk=False)
-    deltas: list[dict[str, Any]] = []
-
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "equal":
-            continue
-        if tag == "replace":
-            old_range = list(range(i1, i2))
-            new_range = list(range(j1, j2))
-            paired = min(len(old_range), len(new_range))
-            for offset in range(paired):
-                old_index = old_range[offset]
-                new_index = new_range[offset]
-                deltas.append(
-                    _make_delta(
-                        run_id=run_id,
-                        doc_type=doc_type,
-                        change_type="replace",
-                        old=baseline_blocks[old_index],
-                        new=fetched_blocks[new_index],
-                        old_index=old_index,
-                        new_index=new_index,
-                        baseline_blocks=baseline_blocks,
-                        fetched_blocks=fetched_blocks,
-                        value_index=value_index,
-                        family_index=family_index,
-                    )
-                )
-            for old_index in old_range[paired:]:
-                deltas.append(
-                    _make_delta(
-                        run_id=run_id,
-                        doc_type=doc_type,
-                        change_type="delete",
-                        old=baseline_blocks[old_index],
-                        new=None,
-                        old_index=old_index,
-                        new_index=None,
-                        baseline_blocks=baseline_blocks,
-                        fetched_blocks=fetched_blocks,
-                        value_index=value_index,
-                        family_index=family_index,
-                    )
-                )
-            for new_index in new_range[paired:]:
-                deltas.append(
-                    _make_delta(
-                        run_id=run_id,
-                        doc_type=doc_type,
-                        change_type="insert",
-                        old=None,
-                        new=fetched_blocks[new_index],
-                        old_index=None,
-                        new_index=new_index,
-                        baseline_blocks=baseline_blocks,
-                        fetched_blocks=fetched_blocks,
-                        value_index=value_index,
-                        family_index=family_index,
-                    )
-                )
-            continue
-
-        if tag == "delete":
-            for old_index in range(i1, i2):
-                deltas.append(
-                    _make_delta(
-                        run_id=run_id,
-                        doc_type=doc_type,
-                        change_type="delete",
-                        old=baseline_blocks[old_index],
-                        new=None,
-                        old_index=old_index,
-                        new_index=None,
-                        baseline_blocks=baseline_blocks,
-                        fetched_blocks=fetched_blocks,
-                        value_index=value_index,
-                        family_index=family_index,
-                    )
-                )
-            continue
-
-        if tag == "insert":
-            for new_index in range(j1, j2):
-                deltas.append(
-                    _make_delta(
-                        run_id=run_id,
-                        doc_type=doc_type,
-                        change_type="insert",
-                        old=None,
-                        new=fetched_blocks[new_index],
-                        old_index=None,
-                        new_index=new_index,
-                        baseline_blocks=baseline_blocks,
-                        fetched_blocks=fetched_blocks,
-                        value_index=value_index,
-                        family_index=family_index,
-                    )
-                )
-    return deltas
+    return [
+        _make_delta(
+            run_id=run_id,
+            doc_type=doc_type,
+            change_type=change_type,
+            old=baseline_blocks[old_index] if old_index is not None else None,
+            new=fetched_blocks[new_index] if new_index is not None else None,
+            old_index=old_index,
+            new_index=new_index,
+            baseline_blocks=baseline_blocks,
+            fetched_blocks=fetched_blocks,
+            value_index=value_index,
+            family_index=family_index,
+        )
+        for change_type, old_index, new_index in diff_block_pairs(baseline_blocks, fetched_blocks)
+    ]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Revision-keyed cache of fetched Feishu cloud-doc text.
+
+``fetch_doc_text`` probes up to four ``lark-cli docs +fetch`` command shapes
+and used to keep nothing, so every backport run re-downloaded documents
+nobody had touched. This cache keeps each fetched document under its doc
+token and revision (the Drive ``latest_modify_time``, read with one ``drive
+metas batch_query`` call) together with the command variant that produced
+it, and remembers the working variant per lark-cli binary so the next fetch
+of any doc tries it first.
+
+Entries live under ``.tmp/cloud-doc-fetch-cache``; ``AUTO_MANUAL_CLOUD_DOC_CACHE``
+points the cache elsewhere, or turns it off with ``off``. Only the newest
+revision of a doc is kept. An unreadable entry or a failed revision lookup is
+a miss: the cache never fails a fetch.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.utils.path_utils import get_paths  # noqa: E402
+
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_CACHE_DIR = ".tmp/cloud-doc-fetch-cache"
+# Cache location override: unset -> DEFAULT_CACHE_DIR under the repo root; a
+# path -> that directory (tests point it at a tmp dir); "off" -> disabled.
+CLOUD_DOC_CACHE_ENV = "AUTO_MANUAL_CLOUD_DOC_CACHE"
+_VARIANTS_FILE = "variants.json"
+
+_DOC_URL_RE = re.compile(r"/(wiki|docx|docs|file|sheets|base)/([A-Za-z0-9]+)")
+_DRIVE_DOC_TYPES = {
+    "wiki": "wiki",
+    "docx": "docx",
+    "docs": "doc",
+    "file": "file",
+    "sheets": "sheet",
+    "base": "bitable",
+}
+
+
+def doc_ref(doc_url: str) -> tuple[str, str] | None:
+    """``(doc_token, drive_doc_type)`` for a Feishu doc URL, or None."""
+    match = _DOC_URL_RE.search(doc_url)
+    if not match:
+        return None
+    return match.group(2), _DRIVE_DOC_TYPES[match.group(1)]
+
+
+def doc_revision(lark_cli: str, doc_token: str, doc_type: str) -> str | None:
+    """The doc's current ``latest_modify_time``, or None when it cannot be read."""
+    command = [
+        lark_cli,
+        "drive",
+        "metas",
+        "batch_query",
+        "--data",
+        json.dumps(
+            {"request_docs": [{"doc_token": doc_token, "doc_type": doc_type}]},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ),
+    ]
+    try:
+        completed = subprocess.run(
+            command, check=False, capture_output=True, text=True, encoding="utf-8", errors="replace"
+        )
+        payload = json.loads(completed.stdout) if completed.returncode == 0 else None
+    except (OSError, ValueError):
+        return None
+    data = payload.get("data") if isinstance(payload, dict) else None
+    metas = data.get("metas") if isinstance(data, dict) else None
+    if not isinstance(metas, list) or not metas or not isinstance(metas[0], dict):
+        return None
+    revision = str(metas[0].get("latest_modify_time") or "").strip()
+    return revision or None
+
+
+def _read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class CloudDocFetchCache:
+    """Fetched doc text per ``(doc_token, revision)`` plus learned fetch variants."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, doc_token: str) -> Path:
+        return self.cache_dir / f"{doc_token}.json"
+
+    def load(self, doc_token: str, revision: str) -> str | None:
+        entry = _read_json(self._entry_path(doc_token))
+        if not entry or entry.get("schema_version") != CACHE_SCHEMA_VERSION or entry.get("revision") != revision:
+            return None
+        text = entry.get("text")
+        return text if isinstance(text, str) else None
+
+    def store(self, doc_token: str, revision: str, *, variant: int, text: str) -> None:
+        entry = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "doc_token": doc_token,
+            "revision": revision,
+            "variant": variant,
+            "text": text,
+        }
+        try:
+            _write_json(self._entry_path(doc_token), entry)
+        except OSError:
+            pass
+
+    def learned_variant(self, lark_cli: str) -> int | None:
+        variant = (_read_json(self.cache_dir / _VARIANTS_FILE) or {}).get(lark_cli)
+        return variant if isinstance(variant, int) else None
+
+    def remember_variant(self, lark_cli: str, variant: int) -> None:
+        path = self.cache_dir / _VARIANTS_FILE
+        variants = _read_json(path) or {}
+        if variants.get(lark_cli) == variant:
+            return
+        try:
+            _write_json(path, {**variants, lark_cli: variant})
+        except OSError:
+            pass
+
+
+def open_fetch_cache(cache_dir: Path | None = None) -> CloudDocFetchCache | None:
+    """``cache_dir``'s cache, else the one ``AUTO_MANUAL_CLOUD_DOC_CACHE`` selects."""
+    if cache_dir is not None:
+        return CloudDocFetchCache(cache_dir)
+    target = os.environ.get(CLOUD_DOC_CACHE_ENV, "").strip()
+    if target.lower() == "off":
+        return None
+    return CloudDocFetchCache(Path(target) if target else get_paths().root / DEFAULT_CACHE_DIR)
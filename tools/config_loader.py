@@ -1,24 +1,70 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Like git's racy-clean check (see tools/utils/csv_table_cache.py): a file
+# modified this recently may be rewritten within the same mtime tick, so its
+# cached parse is re-verified by digest.
+_RACY_WINDOW_NS = 2_000_000_000
 
-def _load_yaml_mapping(config_path: Path) -> dict[str, Any]:
+
+@dataclass(frozen=True)
+class ConfigFileIdentity:
+    path: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class ConfigCacheStats:
+    hits: int
+    misses: int
+    configs: int
+
+
+@dataclass(frozen=True)
+class _CachedConfig:
+    """A merged config plus the identity/digest of every file in its extends chain."""
+
+    chain: tuple[tuple[ConfigFileIdentity, str], ...]
+    data: dict[str, Any]
+
+
+def _config_file_identity(path: Path) -> ConfigFileIdentity | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return ConfigFileIdentity(path=str(path), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def _content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_yaml_mapping(raw: bytes, config_path: Path) -> dict[str, Any]:
     try:
         import yaml  # type: ignore
     except ImportError as exc:
         raise RuntimeError("PyYAML not installed. Please run: pip install pyyaml") from exc
 
-    with config_path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    data = yaml.safe_load(raw.decode("utf-8")) or {}
 
     if not isinstance(data, dict):
         raise RuntimeError(f"Config root must be a mapping: {config_path}")
     return data
 
 
+def _load_yaml_mapping(config_path: Path) -> dict[str, Any]:
+    return _parse_yaml_mapping(config_path.read_bytes(), config_path)
+
+
 def _resolve_extends_path(config_path: Path, raw_extends: Any) -> Path:
     extends_value = str(raw_extends or "").strip()
     if not extends_value:
@@ -42,24 +88,94 @@ def _merge_config_mappings(base: dict[str, Any], override: dict[str, Any]) -> di
     return merged
 
 
-def _load_config_mapping_with_extends(config_path: Path, *, stack: tuple[Path, ...]) -> dict[str, Any]:
-    resolved_path = config_path.resolve()
-    if resolved_path in stack:
-        cycle = " -> ".join(path.name for path in (*stack, resolved_path))
-        raise RuntimeError(f"Config extends cycle detected: {cycle}")
-
-    data = _load_yaml_mapping(resolved_path)
-    raw_extends = data.get("extends")
-    if raw_extends is None:
-        data.pop("extends", None)
-        return data
-
-    base_path = _resolve_extends_path(resolved_path, raw_extends)
-    if not base_path.exists():
-        raise RuntimeError(f"Extended config not found: {base_path}")
-
-    base_cfg = _load_config_mapping_with_extends(base_path, stack=(*stack, resolved_path))
-    return _merge_config_mappings(base_cfg, data)
+class ConfigCache:
+    """Process-wide cache of merged configs keyed by resolved path.
+
+    An entry stays valid while every file in its extends chain keeps its size
+    and mtime, so a queue pass over hundreds of records parses each distinct
+    config (and each shared base) once. Every load hands out a deep copy;
+    callers may mutate what they get back without corrupting the cache.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _CachedConfig] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def load(self, config_path: Path) -> dict[str, Any]:
+        return copy.deepcopy(self._resolve(config_path, stack=()).data)
+
+    def _is_current(self, entry: _CachedConfig) -> bool:
+        for identity, digest in entry.chain:
+            current = _config_file_identity(Path(identity.path))
+            if current != identity:
+                return False
+            if time.time_ns() - identity.mtime_ns < _RACY_WINDOW_NS:
+                try:
+                    if _content_digest(Path(identity.path).read_bytes()) != digest:
+                        return False
+                except OSError:
+                    return False
+        return True
+
+    def _resolve(self, config_path: Path, *, stack: tuple[Path, ...]) -> _CachedConfig:
+        resolved_path = config_path.resolve()
+        if resolved_path in stack:
+            cycle = " -> ".join(path.name for path in (*stack, resolved_path))
+            raise RuntimeError(f"Config extends cycle detected: {cycle}")
+
+        with self._lock:
+            cached = self._entries.get(resolved_path)
+        if cached is not None and self._is_current(cached):
+            with self._lock:
+                self._hits += 1
+            return cached
+        with self._lock:
+            self._misses += 1
+
+        identity = _config_file_identity(resolved_path)
+        raw = resolved_path.read_bytes()
+        data = _parse_yaml_mapping(raw, resolved_path)
+        chain: tuple[tuple[ConfigFileIdentity, str], ...] = ()
+        if identity is not None:
+            chain = ((identity, _content_digest(raw)),)
+        raw_extends = data.get("extends")
+        if raw_extends is None:
+            data.pop("extends", None)
+        else:
+            base_path = _resolve_extends_path(resolved_path, raw_extends)
+            if not base_path.exists():
+                raise RuntimeError(f"Extended config not found: {base_path}")
+            base = self._resolve(base_path, stack=(*stack, resolved_path))
+            data = _merge_config_mappings(base.data, data)
+            chain += base.chain
+
+        entry = _CachedConfig(chain=chain, data=data)
+        with self._lock:
+            self._entries[resolved_path] = entry
+        return entry
+
+    def stats(self) -> ConfigCacheStats:
+        with self._lock:
+            return ConfigCacheStats(hits=self._hits, misses=self._misses, configs=len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_SHARED_CACHE = ConfigCache()
+
+
+def config_cache_stats() -> ConfigCacheStats:
+    return _SHARED_CACHE.stats()
+
+
+def clear_config_cache() -> None:
+    _SHARED_CACHE.clear()
 
 
 def load_config_mapping(config_path: Path) -> dict[str, Any]:
@@ -67,7 +183,7 @@ def load_config_mapping(config_path: Path) -> dict[str, Any]:
         raise RuntimeError(f"Config not found: {config_path}")
 
     try:
-        return _load_config_mapping_with_extends(config_path, stack=())
+        return _SHARED_CACHE.load(config_path)
     except RuntimeError:
         raise
     except Exception as exc:
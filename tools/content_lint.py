@@ -34,7 +34,6 @@ extension described in the rules doc.
 from __future__ import annotations
 
 import argparse
-import csv
 import hashlib
 import json
 import re
@@ -64,6 +63,7 @@ from tools.content_lint_languages import (  # noqa: E402
     _VALUE,
 )
 from tools.source_record_index import resolve_findings  # noqa: E402
+from tools.utils.csv_table_cache import read_cached_csv_rows  # noqa: E402
 from tools.utils.path_utils import get_paths  # noqa: E402
 
 FINDING_SCHEMA_VERSION = "content-qc-finding/v1"
@@ -77,10 +77,7 @@ _SAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
 
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        return list(csv.DictReader(handle))
+    return read_cached_csv_rows(path)
 
 
 def _t(value: object) -> str:
@@ -22,7 +22,7 @@ from tools.data_snapshot import (
     SPEC_NOTES_FILE,
     SPEC_TITLES_FILE,
 )
-from tools.csv_pages import BuildPaths, BuildSelector, CsvPageBuilder  # noqa: E402
+from tools.csv_pages import DEFAULT_CACHE_DIR, BuildPaths, BuildSelector, CsvPageBuilder, CsvPageCache  # noqa: E402
 
 
 def _display_path(path: Path) -> str:
@@ -40,6 +40,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="skip page ids without registered renderers",
     )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"re-render every page instead of reusing unchanged outputs from {DEFAULT_CACHE_DIR}",
+    )
 
     ap.add_argument("--data-root", default=None, help="Override structured content snapshot root")
     ap.add_argument("--page-registry", default=None)
@@ -118,7 +123,8 @@ def main() -> None:
         pages=args.page,
         langs=args.lang,
     )
-    result = CsvPageBuilder(paths).build(selector, strict_renderer=not args.no_strict_renderer)
+    cache = None if args.no_cache else CsvPageCache(ROOT / DEFAULT_CACHE_DIR)
+    result = CsvPageBuilder(paths, cache=cache).build(selector, strict_renderer=not args.no_strict_renderer)
 
     for out_path in result.written_files:
         print(f"[csv_page_build] Wrote: {out_path}")
@@ -127,7 +133,7 @@ def main() -> None:
 
     print(
         f"[csv_page_build] Done. files={result.write_count}, "
-        f"skipped={len(result.skipped_pages)}"
+        f"cached={len(result.cached_files)}, skipped={len(result.skipped_pages)}"
     )
 
 
@@ -2,10 +2,13 @@
 # -*- coding: utf-8 -*-
 
 from .builder import BuildPaths, BuildResult, BuildSelector, CsvPageBuilder
+from .page_cache import DEFAULT_CACHE_DIR, CsvPageCache
 
 __all__ = [
     "BuildPaths",
     "BuildResult",
     "BuildSelector",
     "CsvPageBuilder",
+    "CsvPageCache",
+    "DEFAULT_CACHE_DIR",
 ]
@@ -3,9 +3,8 @@
 
 from __future__ import annotations
 
-import csv
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
@@ -17,11 +16,14 @@ except ImportError:  # pragma: no cover - direct script execution fallback
 ROOT = bootstrap_repo_root(__file__, parent_count=2)
 
 try:
+    from .page_cache import CsvPageCache, csv_page_cache_record, write_csv_page_cache_manifest
     from .renderers import get_renderer
 except ImportError:  # pragma: no cover - direct script execution fallback
+    from tools.csv_pages.page_cache import CsvPageCache, csv_page_cache_record, write_csv_page_cache_manifest
     from tools.csv_pages.renderers import get_renderer
 
 from tools.utils.spec_master import resolve_product_name_from_spec_master
+from tools.utils.csv_table_cache import read_cached_csv_rows
 from tools.utils.path_utils import Paths
 from tools.data_snapshot import STRUCTURED_DATA_DEFAULT_DIR
 from tools import lang_registry
@@ -30,13 +32,7 @@ from tools import lang_registry
 def _read_csv(path: Path) -> list[dict[str, str]]:
     if not path.exists():
         raise FileNotFoundError(f"Missing CSV: {path}")
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        rows: list[dict[str, str]] = []
-        for lineno, row in enumerate(reader, start=2):
-            row["__line__"] = str(lineno)
-            rows.append(row)
-        return rows
+    return read_cached_csv_rows(path, line_numbers=True)
 
 
 def _parse_langs(value: str) -> list[str]:
@@ -119,6 +115,7 @@ class BuildSelector:
 class BuildResult:
     written_files: list[Path]
     skipped_pages: list[str]
+    cached_files: list[Path] = field(default_factory=list)
 
     @property
     def write_count(self) -> int:
@@ -137,8 +134,9 @@ class PageSpec:
 
 
 class CsvPageBuilder:
-    def __init__(self, paths: BuildPaths):
+    def __init__(self, paths: BuildPaths, *, cache: CsvPageCache | None = None):
         self.paths = paths
+        self.cache = cache
 
     @staticmethod
     def _pick_model_from_vars(vars_map: dict[str, str]) -> str:
@@ -449,6 +447,18 @@ class CsvPageBuilder:
 
         return [b for b in rows if (b.get("page_id") or "").strip() == page_id]
 
+    def _page_input_csvs(self, page_id: str, render_vars: dict[str, str]) -> list[Path]:
+        """Every CSV the page's blocks and renderer read, for the cache key."""
+        if page_id == "spec":
+            inputs = [self.paths.spec_master_csv, self.paths.spec_footnotes_csv, self.paths.spec_notes_csv]
+        else:
+            inputs = [self.paths.page_blocks_dir / f"{page_id}_blocks.csv", self.paths.spec_master_csv]
+        inputs.extend(Path(value) for key, value in render_vars.items() if key.endswith("_csv") and value)
+        localized_copy_csv = (render_vars.get("localized_copy_csv") or "").strip()
+        if page_id == "lcd_icons" and localized_copy_csv:
+            inputs.append(Path(localized_copy_csv).with_name("Status_Words.csv"))
+        return [path for path in inputs if path is not None]
+
     def build(self, selector: BuildSelector, strict_renderer: bool = True) -> BuildResult:
         pages = self._load_pages()
         targets = self._select_targets(selector)
@@ -457,6 +467,8 @@ class CsvPageBuilder:
 
         written: list[Path] = []
         skipped: list[str] = []
+        cached: list[Path] = []
+        cache_records: dict[Path, dict[str, object]] = {}
 
         for page in pages:
             if not page.enabled:
@@ -474,9 +486,12 @@ class CsvPageBuilder:
                 skipped.append(msg)
                 continue
 
-            page_blocks = self._load_page_blocks(page.page_id)
-            if not page_blocks:
-                raise RuntimeError(f"No content blocks for page_id='{page.page_id}'")
+            # Blocks are loaded on the first cache miss; a fully cached page never parses them.
+            page_blocks: list[dict[str, str]] | None = None
+            if self.cache is None:
+                page_blocks = self._load_page_blocks(page.page_id)
+                if not page_blocks:
+                    raise RuntimeError(f"No content blocks for page_id='{page.page_id}'")
 
             for sku_id, sku_vars in targets:
                 model_value = self._pick_model_from_vars(sku_vars) or selected_model
@@ -522,12 +537,38 @@ class CsvPageBuilder:
                         )
                     self._inject_product_name(render_vars, lang=lang)
                     render_sku = (render_vars.get("sku_id") or render_vars.get("sku") or "").strip()
-                    rst = renderer(template, page_blocks, render_sku, lang, render_vars)
                     out_path = out_dir / f"{page.page_id}_{lang}.rst"
+                    cache_key = None
+                    rst = None
+                    if self.cache is not None:
+                        cache_key = self.cache.page_key(
+                            renderer=renderer,
+                            page_id=page.page_id,
+                            lang=lang,
+                            sku=render_sku,
+                            template_text=template,
+                            input_csvs=self._page_input_csvs(page.page_id, render_vars),
+                            render_vars=render_vars,
+                        )
+                        rst = self.cache.load(cache_key)
+                    if rst is None:
+                        if page_blocks is None:
+                            page_blocks = self._load_page_blocks(page.page_id)
+                            if not page_blocks:
+                                raise RuntimeError(f"No content blocks for page_id='{page.page_id}'")
+                        rst = renderer(template, page_blocks, render_sku, lang, render_vars)
+                        if self.cache is not None and cache_key is not None:
+                            self.cache.store(cache_key, rst)
+                            cache_records[out_path] = csv_page_cache_record(key=cache_key, rst=rst, cached=False)
+                    elif cache_key is not None:
+                        cached.append(out_path)
+                        cache_records[out_path] = csv_page_cache_record(key=cache_key, rst=rst, cached=True)
                     out_path.write_text(rst, encoding="utf-8")
                     written.append(out_path)
 
-        return BuildResult(written_files=written, skipped_pages=skipped)
+        if cache_records:
+            write_csv_page_cache_manifest(self.paths.output_dir, cache_records)
+        return BuildResult(written_files=written, skipped_pages=skipped, cached_files=cached)
 
 
 def _main() -> None:
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Rendered csv_page outputs keyed by input fingerprints.
+
+A ``<page>_<lang>.rst`` is a pure function of its template text, the CSVs
+the page reads (page blocks, Spec_Master, the ``*_csv`` render vars), the
+render vars themselves and the renderer code. The cache key hashes all of
+them; the store keeps one rendered file per key under
+``.tmp/csv-page-cache``. Every build writes ``csv_page_cache.json`` next to
+its outputs recording, per output, the key, the output hash and whether it
+was reused, so checks can confirm a reused file is byte-for-byte what was
+rendered for that key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Mapping
+
+CACHE_SCHEMA_VERSION = 1
+DEFAULT_CACHE_DIR = ".tmp/csv-page-cache"
+CACHE_MANIFEST_NAME = "csv_page_cache.json"
+
+
+def _sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _module_closure(roots: Iterable[ModuleType]) -> list[ModuleType]:
+    """``tools.*`` modules reachable from ``roots`` through their globals."""
+    seen: dict[str, ModuleType] = {}
+    pending = list(roots)
+    while pending:
+        module = pending.pop()
+        if module.__name__ in seen:
+            continue
+        seen[module.__name__] = module
+        for value in vars(module).values():
+            name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+            if isinstance(name, str) and name.startswith("tools.") and name not in seen:
+                dependency = sys.modules.get(name)
+                if dependency is not None:
+                    pending.append(dependency)
+    return [seen[name] for name in sorted(seen)]
+
+
+def renderer_code_fingerprint(renderer: Callable[..., str]) -> str:
+    """Hash of the renderer's qualified name and the source of every ``tools`` module it can reach."""
+    digest = hashlib.sha256(f"{renderer.__module__}.{renderer.__qualname__}".encode("utf-8"))
+    root = sys.modules.get(renderer.__module__)
+    for module in _module_closure([root] if root is not None else []):
+        source = getattr(module, "__file__", None)
+        if not source:
+            continue
+        digest.update(f"\0{module.__name__}\0".encode("utf-8"))
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+class CsvPageCache:
+    """Content-addressed store of rendered csv_page RST.
+
+    File and renderer fingerprints are memoized for the life of the instance,
+    so one build hashes each input once however many pages read it.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self._file_hashes: dict[Path, str | None] = {}
+        self._renderer_hashes: dict[Callable[..., str], str] = {}
+
+    def file_sha256(self, path: Path) -> str | None:
+        if path not in self._file_hashes:
+            try:
+                self._file_hashes[path] = _sha256_bytes(path.read_bytes())
+            except OSError:
+                self._file_hashes[path] = None
+        return self._file_hashes[path]
+
+    def page_key(
+        self,
+        *,
+        renderer: Callable[..., str],
+        page_id: str,
+        lang: str,
+        sku: str,
+        template_text: str,
+        input_csvs: Iterable[Path],
+        render_vars: Mapping[str, str],
+    ) -> str:
+        if renderer not in self._renderer_hashes:
+            self._renderer_hashes[renderer] = renderer_code_fingerprint(renderer)
+        payload = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "renderer": self._renderer_hashes[renderer],
+            "page_id": page_id,
+            "lang": lang,
+            "sku": sku,
+            "template": _sha256_bytes(template_text.encode("utf-8")),
+            "inputs": {str(path): self.file_sha256(path) for path in sorted(set(input_csvs))},
+            "vars": dict(sorted(render_vars.items())),
+        }
+        return _sha256_bytes(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.rst"
+
+    def load(self, key: str) -> str | None:
+        try:
+            return self._entry_path(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def store(self, key: str, rst: str) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(rst, encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            # The cache is an optimization; a read-only checkout still renders.
+            pass
+
+
+def csv_page_cache_record(*, key: str, rst: str, cached: bool) -> dict[str, Any]:
+    return {"key": key, "sha256": _sha256_bytes(rst.encode("utf-8")), "cached": cached}
+
+
+def write_csv_page_cache_manifest(output_dir: Path, records: Mapping[Path, dict[str, Any]]) -> Path:
+    """Merge ``records`` (keyed by output path) into ``output_dir``'s manifest."""
+    manifest_path = output_dir / CACHE_MANIFEST_NAME
+    outputs = dict(load_csv_page_cache_manifest(output_dir))
+    outputs.update({path.relative_to(output_dir).as_posix(): record for path, record in records.items()})
+    outputs = {name: record for name, record in sorted(outputs.items()) if (output_dir / name).is_file()}
+    output_dir.mkdir(parents=True, exist_ok=True)
+    payload = {"schema_version": CACHE_SCHEMA_VERSION, "outputs": outputs}
+    manifest_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return manifest_path
+
+
+def load_csv_page_cache_manifest(output_dir: Path) -> dict[str, dict[str, Any]]:
+    try:
+        payload = json.loads((output_dir / CACHE_MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema_version") != CACHE_SCHEMA_VERSION:
+        return {}
+    outputs = payload.get("outputs")
+    return outputs if isinstance(outputs, dict) else {}
+
+
+def unverified_cached_outputs(output_dir: Path) -> list[Path]:
+    """Reused outputs whose bytes no longer match what was rendered for their key."""
+    mismatched: list[Path] = []
+    for name, record in load_csv_page_cache_manifest(output_dir).items():
+        if not isinstance(record, dict) or not record.get("cached"):
+            continue
+        path = output_dir / name
+        try:
+            actual = _sha256_bytes(path.read_bytes())
+        except OSError:
+            actual = None
+        if actual != record.get("sha256"):
+            mismatched.append(path)
+    return mismatched
@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import csv
 import json
 import re
 import unicodedata
@@ -13,6 +12,7 @@ from ..lcd_table_layout import split_lcd_table_rows
 from .. import lang_registry
 from .renderers_common import apply_vars, latex_arg_escape, rst_escape
 from ..localized_copy import LocalizedCopyResolver
+from ..utils.csv_table_cache import read_cached_csv_rows
 from ..utils.spec_master import canonicalize_model_token
 from ..utils.variable_resolver import parse_model_tokens, resolve_variable_value
 
@@ -30,11 +30,7 @@ def _read_csv(path: str) -> list[dict[str, str]]:
     raw = (path or "").strip()
     if not raw:
         return []
-    csv_path = Path(raw)
-    if not csv_path.exists():
-        return []
-    with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
-        return list(csv.DictReader(handle))
+    return read_cached_csv_rows(Path(raw))
 
 
 def _truthy(value: object, *, default: bool = True) -> bool:
@@ -11,6 +11,7 @@ from tools.diff_report_fields_sources import (
     merge_sources,
 )
 from tools.diff_report_git import git_show_text
+from tools.git_object_reader import GitObjectReader
 from tools.diff_report_models import (
     DiffRow,
     FieldDiffRow,
@@ -164,7 +165,18 @@ def collect_field_diff_rows(
     file_rows: list[DiffRow],
     config_path: Path | None = None,
     data_root: str | None = None,
+    reader: GitObjectReader | None = None,
 ) -> list[FieldDiffRow]:
+    if reader is None:
+        # One `git cat-file --batch` process serves every old/new page read.
+        with GitObjectReader(repo_root) as owned_reader:
+            return collect_field_diff_rows(
+                repo_root=repo_root,
+                file_rows=file_rows,
+                config_path=config_path,
+                data_root=data_root,
+                reader=owned_reader,
+            )
     rows: list[FieldDiffRow] = []
     spec_master_csv, spec_titles_csv = resolve_spec_paths(
         repo_root,
@@ -178,8 +190,12 @@ def collect_field_diff_rows(
         if not chosen_path.endswith(".rst"):
             continue
 
-        old_text = git_show_text(repo_root, ref=file_row.from_ref, path_text=file_row.old_path or chosen_path)
-        new_text = git_show_text(repo_root, ref=file_row.to_ref, path_text=file_row.new_path or chosen_path)
+        old_text = git_show_text(
+            repo_root, ref=file_row.from_ref, path_text=file_row.old_path or chosen_path, reader=reader
+        )
+        new_text = git_show_text(
+            repo_root, ref=file_row.to_ref, path_text=file_row.new_path or chosen_path, reader=reader
+        )
         spec_lookup: dict[tuple[str, str], SpecFieldSource] = {}
         lang = derive_lang_from_page_key(file_row.page_key)
         if file_row.page_key.startswith("spec_") and spec_master_csv.exists():
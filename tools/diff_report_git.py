@@ -4,6 +4,7 @@ import subprocess
 from pathlib import Path, PurePosixPath
 
 from tools.diff_report_models import DiffRow
+from tools.git_object_reader import GitObjectReader
 from tools.utils.path_utils import PathSegments
 
 
@@ -173,9 +174,11 @@ def collect_diff_rows(
     return rows
 
 
-def git_show_text(repo_root: Path, *, ref: str, path_text: str) -> str:
+def git_show_text(repo_root: Path, *, ref: str, path_text: str, reader: GitObjectReader | None = None) -> str:
     if not path_text:
         return ""
+    if reader is not None:
+        return reader.read_text(ref, path_text) or ""
     try:
         return run_git(["show", f"{ref}:{path_text}"], cwd=repo_root)
     except subprocess.CalledProcessError:
@@ -387,6 +387,10 @@ def queue_group_force_phase2_refresh(records: list[Any]) -> bool:
     return any(is_force_phase2_refresh_enabled(getattr(record, "force_phase2_refresh_value", None)) for record in records)
 
 
+def queue_group_immediate(records: list[Any]) -> bool:
+    return any(is_immediate_trigger_enabled(getattr(record, "immediate_trigger_value", None)) for record in records)
+
+
 def queue_group_upload_dingtalk(records: list[Any]) -> bool:
     return any(is_upload_dingtalk_enabled(getattr(record, "upload_dingtalk_value", None)) for record in records)
 
@@ -9,11 +9,17 @@ from pathlib import Path
 from typing import Any
 
 from tools.utils.spec_master import (
+    SpecMasterIndex,
     read_spec_master_rows,
     resolve_spec_value_from_rows,
     resolve_template_substitutions_from_rows,
 )
-from tools.word_bundle_common import apply_rst_substitutions, resolve_config_path
+from tools.word_bundle_common import (
+    apply_rst_substitutions,
+    fill_product_name_from_spec_master,
+    resolve_config_path,
+    resolve_spec_master_substitutions,
+)
 
 
 SNIPPET_TOKEN_PREFIX = "{{snippet:"
@@ -584,6 +590,77 @@ def _apply_recipe_postprocess(text: str, recipe: DraftRecipe) -> str:
     return rendered
 
 
+class RenderContext:
+    """Render inputs shared by every page of one (snapshot, model, region) bundle.
+
+    Spec_Master is read and indexed once; page vars and substitutions are
+    memoized per language, recipes and snippet registries per path. Callers
+    get fresh dicts, so per-page edits never leak into the next page.
+    """
+
+    def __init__(
+        self,
+        *,
+        spec_master_csv: Path,
+        model: str | None,
+        region: str | None,
+        base_vars_map: dict[str, str] | None = None,
+        base_substitutions: dict[str, str] | None = None,
+    ) -> None:
+        self.spec_master_csv = spec_master_csv
+        self.model = model
+        self.region = region
+        self.base_vars_map = dict(base_vars_map or {})
+        self.base_substitutions = dict(base_substitutions or {})
+        self._spec_rows: SpecMasterIndex | None = None
+        self._page_vars: dict[str, dict[str, str]] = {}
+        self._page_substitutions: dict[str, dict[str, str]] = {}
+        self._recipes: dict[Path, DraftRecipe] = {}
+        self._registries: dict[Path, list[SnippetEntry]] = {}
+
+    @property
+    def spec_rows(self) -> SpecMasterIndex:
+        if self._spec_rows is None:
+            self._spec_rows = SpecMasterIndex(read_spec_master_rows(self.spec_master_csv))
+        return self._spec_rows
+
+    def page_vars(self, lang: str) -> dict[str, str]:
+        if lang not in self._page_vars:
+            self._page_vars[lang] = fill_product_name_from_spec_master(
+                self.base_vars_map,
+                spec_master_csv=self.spec_master_csv,
+                model=self.model,
+                region=self.region,
+                lang=lang,
+                spec_rows=self.spec_rows,
+            )
+        return dict(self._page_vars[lang])
+
+    def page_substitutions(self, lang: str) -> dict[str, str]:
+        if lang not in self._page_substitutions:
+            self._page_substitutions[lang] = {
+                **self.base_substitutions,
+                **resolve_spec_master_substitutions(
+                    spec_master_csv=self.spec_master_csv,
+                    model=self.model,
+                    region=self.region,
+                    lang=lang,
+                    spec_rows=self.spec_rows,
+                ),
+            }
+        return dict(self._page_substitutions[lang])
+
+    def recipe(self, recipe_path: Path) -> DraftRecipe:
+        if recipe_path not in self._recipes:
+            self._recipes[recipe_path] = load_draft_recipe(recipe_path)
+        return self._recipes[recipe_path]
+
+    def snippet_registry(self, registry_path: Path) -> list[SnippetEntry]:
+        if registry_path not in self._registries:
+            self._registries[registry_path] = load_snippet_registry(registry_path)
+        return self._registries[registry_path]
+
+
 def render_generated_page(
     *,
     docs_dir: Path,
@@ -598,9 +675,11 @@ def render_generated_page(
     lang: str,
     rendered_source_path: Path | None = None,
     draft_placeholders: bool = False,
+    render_context: RenderContext | None = None,
 ) -> GeneratedPageRender:
-    recipe = load_draft_recipe(recipe_path)
-    spec_rows = read_spec_master_rows(spec_master_csv)
+    context = render_context or RenderContext(spec_master_csv=spec_master_csv, model=model, region=region)
+    recipe = context.recipe(recipe_path)
+    spec_rows = context.spec_rows
     substitutions = {
         **base_substitutions,
         **resolve_recipe_substitutions(
@@ -643,7 +722,7 @@ def render_generated_page(
     }
     template_text, used_snippet_ids = resolve_snippet_tokens(
         template_text,
-        registry_entries=load_snippet_registry(registry_path) if bound_slots else [],
+        registry_entries=context.snippet_registry(registry_path) if bound_slots else [],
         registry_path=registry_path,
         docs_dir=docs_dir,
         lang=lang,
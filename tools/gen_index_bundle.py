@@ -7,6 +7,7 @@ import argparse
 import os
 import shutil
 import sys
+import time
 from pathlib import Path
 
 try:
@@ -25,11 +26,13 @@ from tools.config_pages import (
     RstIncludePage,
 )
 from tools.bundle_asset_finalize import finalize_materialized_bundle
+from tools.build_docs_stages import format_stage_timings
 from tools.capability_pages import strip_capability_sections
 from tools.contract_assets import ContractAssetResolver
 from tools.data_snapshot import resolve_data_snapshot_paths
 from tools.draft_engine import (
     GeneratedPageRender,
+    RenderContext,
     render_generated_page,
     resolve_snippet_registry_path,
 )
@@ -44,6 +47,7 @@ from tools.gen_index_bundle_assets import (
 )
 from tools.gen_index_bundle_cli import parse_args as _parse_args_impl
 from tools.gen_index_bundle_entry import run_bundle_entry as _run_bundle_entry_impl
+from tools.gen_index_bundle_incremental import preserve_unchanged_bundle_files, retire_bundle_tree
 from tools.gen_index_bundle_materialize import (
     build_bundle_manifest as _build_bundle_manifest_impl,
     copy_bundle_support_assets as _copy_bundle_support_assets_impl,
@@ -62,6 +66,7 @@ from tools.gen_index_bundle_runtime import (
     build_materialized_bundle_result as _build_materialized_bundle_result_impl,
     materialize_bundle_pages as _materialize_bundle_pages_impl,
     prepare_bundle_workspace as _prepare_bundle_workspace_impl,
+    resolve_bundle_jobs,
     resolve_bundle_materialization_context as _resolve_bundle_materialization_context_impl,
     write_bundle_outputs as _write_bundle_outputs_impl,
 )
@@ -406,6 +411,7 @@ def _materialize_planned_page(
     region: str | None,
     langs: list[str] | tuple[str, ...] = (),
     draft_placeholders: bool = False,
+    render_context: RenderContext | None = None,
 ) -> tuple[str, GeneratedPageRender | None]:
     return _materialize_planned_page_impl(
         planned,
@@ -422,6 +428,7 @@ def _materialize_planned_page(
         region=region,
         langs=langs,
         draft_placeholders=draft_placeholders,
+        render_context=render_context,
         cover_pdf_page_cls=CoverPdfPage,
         pdf_insert_page_cls=PdfInsertPage,
         csv_page_cls=CsvPage,
@@ -468,6 +475,15 @@ def materialize_bundle(
 ) -> MaterializedBundle:
     resolved_docs_dir = docs_dir or paths.docs_dir
     resolved_repo_root = repo_root or paths.root
+    stage_timings: dict[str, float] = {}
+    stage_started = time.monotonic()
+
+    def finish_stage(name: str) -> None:
+        nonlocal stage_started
+        now = time.monotonic()
+        stage_timings[name] = now - stage_started
+        stage_started = now
+
     context = _resolve_bundle_materialization_context_impl(
         cfg,
         model=model,
@@ -498,6 +514,7 @@ def materialize_bundle(
         derive_word_title=derive_word_title,
         bundle_dir_for_target=bundle_dir_for_target,
     )
+    finish_stage("context")
 
     conf_path, conf_base_path = _prepare_bundle_workspace_impl(
         context,
@@ -509,12 +526,15 @@ def materialize_bundle(
         bundle_dir_override=bundle_dir_override,
         csv_page_cls=CsvPage,
         cleanup_legacy_rst_artifacts=cleanup_legacy_rst_artifacts,
-        remove_tree=shutil.rmtree,
+        # Record the outgoing bundle's file states so unchanged files can keep
+        # their mtimes (and Sphinx its doctrees) once the new bundle is final.
+        remove_tree=lambda path: retire_bundle_tree(path, remove_tree=shutil.rmtree),
         load_word_context=load_word_context,
         ensure_csv_page_rsts=ensure_csv_page_rsts,
         copy_bundle_support_assets=_copy_bundle_support_assets,
         write_bundle_conf_files=_write_bundle_conf_files,
     )
+    finish_stage("workspace")
 
     if skeleton_only:
         # Emit only the conf/asset skeleton; the caller overlays the committed
@@ -527,7 +547,16 @@ def materialize_bundle(
             context,
             cfg=cfg,
             materialize_planned_page=_materialize_planned_page,
+            render_context=RenderContext(
+                spec_master_csv=context.spec_master_csv,
+                model=context.target_model,
+                region=context.target_region,
+                base_vars_map=context.base_vars_map,
+                base_substitutions=context.base_substitutions,
+            ),
+            max_workers=resolve_bundle_jobs(cfg.get("build") if isinstance(cfg.get("build"), dict) else {}),
         )
+    finish_stage("pages")
 
     _write_bundle_outputs_impl(
         context,
@@ -566,14 +595,18 @@ def materialize_bundle(
         model=context.target_model,
         region=context.target_region,
     )
-    if not finalize_assets:
-        return bundle
-    return finalize_materialized_bundle(
-        bundle,
-        cfg=cfg,
-        docs_dir=resolved_docs_dir,
-        repo_root=resolved_repo_root,
-    )
+    finish_stage("outputs")
+    if finalize_assets:
+        bundle = finalize_materialized_bundle(
+            bundle,
+            cfg=cfg,
+            docs_dir=resolved_docs_dir,
+            repo_root=resolved_repo_root,
+        )
+        preserve_unchanged_bundle_files(bundle.bundle_dir)
+        finish_stage("finalize")
+    print(f"[bundle] stage timings: {format_stage_timings(stage_timings)}")
+    return bundle
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
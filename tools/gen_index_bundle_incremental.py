@@ -0,0 +1,158 @@
+"""Keep unchanged bundle files stable across re-materialization.
+
+A bundle is still rebuilt from scratch (so stale pages can never survive), but
+the file state of the previous bundle is recorded first. Once the new bundle
+is final, every file whose content is byte-identical gets its previous mtime
+back, so Sphinx's persistent environment and doctrees in the target output
+dirs only re-read the pages that actually changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+BUNDLE_FILE_STATE_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BundleFileState:
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class IncrementalBundleReport:
+    unchanged: int
+    changed: int
+    added: int
+    removed: int
+
+
+def bundle_file_state_path(bundle_dir: Path) -> Path:
+    # Lives beside the bundle so removing the bundle tree keeps it.
+    return bundle_dir.parent / f".{bundle_dir.name}.files.json"
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _iter_bundle_files(bundle_dir: Path) -> list[tuple[str, Path]]:
+    if not bundle_dir.is_dir():
+        return []
+    return sorted(
+        (path.relative_to(bundle_dir).as_posix(), path)
+        for path in bundle_dir.rglob("*")
+        if path.is_file() and not path.is_symlink()
+    )
+
+
+def load_bundle_file_states(bundle_dir: Path) -> dict[str, BundleFileState]:
+    state_path = bundle_file_state_path(bundle_dir)
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema_version") != BUNDLE_FILE_STATE_SCHEMA_VERSION:
+        return {}
+    raw_files = payload.get("files")
+    if not isinstance(raw_files, dict):
+        return {}
+    states: dict[str, BundleFileState] = {}
+    for relative, raw in raw_files.items():
+        try:
+            states[str(relative)] = BundleFileState(
+                size=int(raw["size"]),
+                mtime_ns=int(raw["mtime_ns"]),
+                digest=str(raw["digest"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return states
+
+
+def _write_bundle_file_states(bundle_dir: Path, states: dict[str, BundleFileState]) -> None:
+    state_path = bundle_file_state_path(bundle_dir)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "schema_version": BUNDLE_FILE_STATE_SCHEMA_VERSION,
+        "files": {
+            relative: {"size": state.size, "mtime_ns": state.mtime_ns, "digest": state.digest}
+            for relative, state in sorted(states.items())
+        },
+    }
+    temp_path = state_path.with_name(f"{state_path.name}.tmp")
+    temp_path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+    os.replace(temp_path, state_path)
+
+
+def scan_bundle_file_states(
+    bundle_dir: Path,
+    *,
+    known: dict[str, BundleFileState] | None = None,
+) -> dict[str, BundleFileState]:
+    """Stat every bundle file, hashing only those whose size/mtime moved."""
+    known = known or {}
+    states: dict[str, BundleFileState] = {}
+    for relative, path in _iter_bundle_files(bundle_dir):
+        stat = path.stat()
+        previous = known.get(relative)
+        if previous is not None and previous.size == stat.st_size and previous.mtime_ns == stat.st_mtime_ns:
+            states[relative] = previous
+            continue
+        states[relative] = BundleFileState(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            digest=_file_digest(path),
+        )
+    return states
+
+
+def retire_bundle_tree(bundle_dir: Path, *, remove_tree: Callable[[Path], None]) -> None:
+    """Record the current bundle's file states, then remove the tree."""
+    if not bundle_dir.exists():
+        return
+    states = scan_bundle_file_states(bundle_dir, known=load_bundle_file_states(bundle_dir))
+    _write_bundle_file_states(bundle_dir, states)
+    remove_tree(bundle_dir)
+
+
+def preserve_unchanged_bundle_files(bundle_dir: Path) -> IncrementalBundleReport:
+    """Restore previous mtimes on byte-identical files of a finished bundle.
+
+    Changed and new files keep their fresh mtime; files dropped since the
+    previous materialization are already gone because the tree was rebuilt.
+    """
+    previous = load_bundle_file_states(bundle_dir)
+    current = scan_bundle_file_states(bundle_dir)
+    unchanged = changed = added = 0
+    for relative, state in current.items():
+        before = previous.get(relative)
+        if before is None:
+            added += 1
+            continue
+        if before.size != state.size or before.digest != state.digest:
+            changed += 1
+            continue
+        unchanged += 1
+        if before.mtime_ns != state.mtime_ns:
+            path = bundle_dir / relative
+            os.utime(path, ns=(path.stat().st_atime_ns, before.mtime_ns))
+            current[relative] = before
+    _write_bundle_file_states(bundle_dir, current)
+    return IncrementalBundleReport(
+        unchanged=unchanged,
+        changed=changed,
+        added=added,
+        removed=len(set(previous) - set(current)),
+    )
@@ -79,6 +79,7 @@ def materialize_planned_page(
     region: str | None,
     langs: list[str] | tuple[str, ...] = (),
     draft_placeholders: bool = False,
+    render_context: Any | None = None,
     cover_pdf_page_cls: type[Any],
     pdf_insert_page_cls: type[Any],
     csv_page_cls: type[Any],
@@ -142,23 +143,27 @@ def materialize_planned_page(
         return normalize_rst_empty_line_blocks(rst_text), None
 
     page_lang = planned.lang or primary_lang
-    page_vars = fill_product_name_from_spec_master(
-        base_vars_map,
-        spec_master_csv=spec_master_csv,
-        model=model,
-        region=region,
-        lang=page_lang,
-    )
-    page_vars["lang"] = page_lang
-    page_substitutions = {
-        **base_substitutions,
-        **resolve_spec_master_substitutions(
+    if render_context is not None:
+        page_vars = render_context.page_vars(page_lang)
+        page_substitutions = render_context.page_substitutions(page_lang)
+    else:
+        page_vars = fill_product_name_from_spec_master(
+            base_vars_map,
             spec_master_csv=spec_master_csv,
             model=model,
             region=region,
             lang=page_lang,
-        ),
-    }
+        )
+        page_substitutions = {
+            **base_substitutions,
+            **resolve_spec_master_substitutions(
+                spec_master_csv=spec_master_csv,
+                model=model,
+                region=region,
+                lang=page_lang,
+            ),
+        }
+    page_vars["lang"] = page_lang
 
     if isinstance(page, csv_page_cls):
         if planned.lang is None:
@@ -206,6 +211,7 @@ def materialize_planned_page(
             lang=planned.lang,
             rendered_source_path=generated_source_path,
             draft_placeholders=draft_placeholders,
+            render_context=render_context,
         )
         source_path = generated_render.template_path
         rst_text = generated_render.text
@@ -254,7 +260,9 @@ def materialize_planned_page(
         rst_text, used_include_snippets = resolve_snippet_tokens(
             rst_text,
             registry_entries=(
-                load_snippet_registry(snippet_registry_path)
+                (render_context.snippet_registry if render_context is not None else load_snippet_registry)(
+                    snippet_registry_path
+                )
                 if SNIPPET_TOKEN_PREFIX in rst_text
                 else []
             ),
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
+
+# Set once per page worker process by ``_init_page_worker``.
+_WORKER_RENDER_CONTEXT: Any | None = None
 
 
 @dataclass(frozen=True)
@@ -264,35 +271,115 @@ def prepare_bundle_workspace(
     )
 
 
+def resolve_bundle_jobs(build_cfg: dict) -> int:
+    raw = build_cfg.get("bundle_jobs", 1)
+    try:
+        return max(1, int(raw))
+    except (TypeError, ValueError):
+        raise RuntimeError(f"build.bundle_jobs must be a positive integer, got {raw!r}") from None
+
+
+def _page_kwargs(context: BundleMaterializationContext, planned: Any, *, cfg: dict) -> dict[str, Any]:
+    return {
+        "cfg": cfg,
+        "target_path": context.page_dir / planned.file_name,
+        "bundle_dir": context.bundle_dir,
+        "docs_dir": context.docs_dir,
+        "repo_root": context.repo_root,
+        "spec_master_csv": context.spec_master_csv,
+        "base_substitutions": context.base_substitutions,
+        "base_vars_map": context.base_vars_map,
+        "primary_lang": context.primary_lang,
+        "title": context.title,
+        "model": context.target_model,
+        "region": context.target_region,
+        "langs": list(context.build_langs),
+        "draft_placeholders": context.draft_placeholders,
+    }
+
+
+def _init_page_worker(render_context: Any | None) -> None:
+    global _WORKER_RENDER_CONTEXT
+    _WORKER_RENDER_CONTEXT = render_context
+
+
+def _render_page_in_worker(
+    materialize_planned_page: Callable[..., tuple[str, Any | None]],
+    planned: Any,
+    page_kwargs: dict[str, Any],
+) -> tuple[str, Any | None, str]:
+    # Page logs are replayed by the parent in plan order, not interleaved.
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        rendered, generated_render = materialize_planned_page(
+            planned,
+            render_context=_WORKER_RENDER_CONTEXT,
+            **page_kwargs,
+        )
+    return rendered, generated_render, output.getvalue()
+
+
+def _render_pages_in_parallel(
+    context: BundleMaterializationContext,
+    *,
+    cfg: dict,
+    materialize_planned_page: Callable[..., tuple[str, Any | None]],
+    render_context: Any | None,
+    max_workers: int,
+) -> Iterator[tuple[str, Any | None]]:
+    """Render pages in worker processes; results (and errors) come back in plan order."""
+    pool = ProcessPoolExecutor(
+        max_workers=min(max_workers, len(context.planned_pages)),
+        initializer=_init_page_worker,
+        initargs=(render_context,),
+    )
+    try:
+        futures = [
+            pool.submit(_render_page_in_worker, materialize_planned_page, planned, _page_kwargs(context, planned, cfg=cfg))
+            for planned in context.planned_pages
+        ]
+        for future in futures:
+            rendered, generated_render, output = future.result()
+            if output:
+                sys.stdout.write(output)
+            yield rendered, generated_render
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def materialize_bundle_pages(
     context: BundleMaterializationContext,
     *,
     cfg: dict,
     materialize_planned_page: Callable[..., tuple[str, Any | None]],
+    render_context: Any | None = None,
+    max_workers: int = 1,
 ) -> tuple[list[Path], list[str], list[str]]:
+    """Render and write every planned page.
+
+    With ``max_workers`` > 1 pages render in a process pool, but files,
+    ``recipe_ids`` and ``snippet_ids`` are still produced in plan order, so the
+    bundle (and its manifest) is identical for any worker count.
+    """
     page_paths: list[Path] = []
     recipe_ids: list[str] = []
     snippet_ids: list[str] = []
 
-    for planned in context.planned_pages:
-        target_path = context.page_dir / planned.file_name
-        rendered, generated_render = materialize_planned_page(
-            planned,
+    if max_workers > 1 and len(context.planned_pages) > 1:
+        rendered_pages = _render_pages_in_parallel(
+            context,
             cfg=cfg,
-            target_path=target_path,
-            bundle_dir=context.bundle_dir,
-            docs_dir=context.docs_dir,
-            repo_root=context.repo_root,
-            spec_master_csv=context.spec_master_csv,
-            base_substitutions=context.base_substitutions,
-            base_vars_map=context.base_vars_map,
-            primary_lang=context.primary_lang,
-            title=context.title,
-            model=context.target_model,
-            region=context.target_region,
-            langs=list(context.build_langs),
-            draft_placeholders=context.draft_placeholders,
+            materialize_planned_page=materialize_planned_page,
+            render_context=render_context,
+            max_workers=max_workers,
+        )
+    else:
+        rendered_pages = (
+            materialize_planned_page(planned, render_context=render_context, **_page_kwargs(context, planned, cfg=cfg))
+            for planned in context.planned_pages
         )
+    for planned, (rendered, generated_render) in zip(context.planned_pages, rendered_pages):
+        target_path = context.page_dir / planned.file_name
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text(rendered if rendered.endswith("\n") else f"{rendered}\n", encoding="utf-8")
         page_paths.append(target_path)
@@ -0,0 +1,286 @@
+"""Batched read access to git objects.
+
+Reports that look at many files across two refs (diff_report field diffs,
+revision_ledger merge stamps, the cloud-doc backport reminder) used to spawn
+one ``git show`` / ``git log -1`` process per file. :class:`GitObjectReader`
+instead keeps one ``git cat-file --batch`` process per repository and answers
+``<ref>:<path>`` reads over its pipes, with a bounded in-memory blob cache;
+:func:`last_commits_for_paths` resolves the newest commit of many paths in a
+single ``git log --name-only`` pass.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterable
+
+DEFAULT_MAX_CACHE_BYTES = 32 * 1024 * 1024
+_COMMIT_MARKER = "\x1e"
+_COMMIT_FORMAT = "%x1e%H%x1f%cI%x1f%an%x1f%s"
+# Keeps each `git log` command line well under the Windows length limit.
+_LOG_PATHS_PER_PASS = 200
+
+
+@dataclass(frozen=True)
+class GitObjectReaderStats:
+    reads: int
+    cache_hits: int
+    cached_bytes: int
+
+
+class GitObjectReader:
+    """Reads ``<ref>:<path>`` blobs through one long-running ``git cat-file --batch``.
+
+    Each ref is resolved to its commit on first use and pinned for the reader's
+    lifetime, so one report sees a consistent snapshot even if a fetch moves the
+    ref meanwhile; blobs are cached by (commit, path) up to ``max_cache_bytes``,
+    least recently used first out. The process starts on the first read and
+    stops on :meth:`close` (or leaving the ``with`` block). Missing objects and
+    an unavailable git read as ``None``.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        *,
+        git_bin: str = "git",
+        max_cache_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        self.repo_root = repo_root
+        self.git_bin = git_bin
+        self.max_cache_bytes = max(0, int(max_cache_bytes))
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._unavailable = False
+        self._commits: dict[str, str | None] = {}
+        self._blobs: OrderedDict[tuple[str, str], bytes | None] = OrderedDict()
+        self._cached_bytes = 0
+        self._reads = 0
+        self._cache_hits = 0
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def read_bytes(self, ref: str, path: str) -> bytes | None:
+        path = path.strip().lstrip("/")
+        if not ref or not path:
+            return None
+        with self._lock:
+            self._reads += 1
+            commit = self._resolve_commit(ref)
+            if commit is None:
+                return None
+            key = (commit, path)
+            if key in self._blobs:
+                self._cache_hits += 1
+                self._blobs.move_to_end(key)
+                return self._blobs[key]
+            data = self._request(f"{commit}:{path}")
+            self._remember(key, data)
+            return data
+
+    def read_text(self, ref: str, path: str) -> str | None:
+        data = self.read_bytes(ref, path)
+        return None if data is None else data.decode("utf-8", errors="replace")
+
+    def stats(self) -> GitObjectReaderStats:
+        with self._lock:
+            return GitObjectReaderStats(
+                reads=self._reads,
+                cache_hits=self._cache_hits,
+                cached_bytes=self._cached_bytes,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _resolve_commit(self, ref: str) -> str | None:
+        if ref not in self._commits:
+            header = self._request_header(f"{ref}^{{commit}}")
+            self._commits[ref] = header[0] if header is not None else None
+        return self._commits[ref]
+
+    def _remember(self, key: tuple[str, str], data: bytes | None) -> None:
+        size = len(data or b"")
+        if size > self.max_cache_bytes:
+            return
+        self._blobs[key] = data
+        self._cached_bytes += size
+        while self._cached_bytes > self.max_cache_bytes:
+            _, evicted = self._blobs.popitem(last=False)
+            self._cached_bytes -= len(evicted or b"")
+
+    def _request(self, spec: str) -> bytes | None:
+        header = self._request_header(spec)
+        return header[2] if header is not None and header[1] == "blob" else None
+
+    def _request_header(self, spec: str) -> tuple[str, str, bytes] | None:
+        # `cat-file --batch` reads one object name per line.
+        if "\n" in spec:
+            return None
+        for attempt in range(2):
+            proc = self._ensure_started()
+            if proc is None:
+                return None
+            try:
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(spec.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+                return _read_batch_response(proc.stdout)
+            except (OSError, ValueError):
+                # The process died (or its pipes closed): restart it once, then
+                # give up on this repository (e.g. it is not a git checkout).
+                self._stop()
+                if attempt:
+                    self._unavailable = True
+        return None
+
+    def _ensure_started(self) -> subprocess.Popen[bytes] | None:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        if self._unavailable:
+            return None
+        try:
+            self._proc = subprocess.Popen(
+                [self.git_bin, "-C", str(self.repo_root), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            self._unavailable = True
+            return None
+        return self._proc
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+
+def _read_batch_response(stdout: IO[bytes]) -> tuple[str, str, bytes] | None:
+    line = stdout.readline()
+    if not line:
+        raise ValueError("git cat-file --batch closed its output")
+    fields = line.decode("utf-8", errors="replace").rstrip("\n").split(" ")
+    # `<name> missing` / `<name> ambiguous` carry no body.
+    if len(fields) != 3 or not fields[2].isdigit():
+        return None
+    sha, object_type, size = fields[0], fields[1], int(fields[2])
+    body = stdout.read(size)
+    stdout.read(1)  # trailing newline
+    if len(body) != size:
+        raise ValueError("git cat-file --batch returned a truncated object")
+    return sha, object_type, body
+
+
+@dataclass(frozen=True)
+class PathCommit:
+    sha: str
+    committed_at: str
+    author: str
+    subject: str
+
+
+def last_commits_for_paths(
+    repo_root: Path,
+    paths: Iterable[str],
+    *,
+    git_bin: str = "git",
+    timeout: float = 120.0,
+) -> dict[str, PathCommit]:
+    """Newest commit touching each path, from one ``git log --name-only`` pass.
+
+    Keys are the paths as given. A path is left out when git is unavailable,
+    the path has no history, or only a merge commit touched it (merges list no
+    files); callers fall back to a per-path ``git log -1`` for those.
+    """
+
+    by_relative: dict[str, list[str]] = {}
+    for path in paths:
+        if path:
+            by_relative.setdefault(PurePosixPath(path.replace("\\", "/")).as_posix(), []).append(path)
+    found: dict[str, PathCommit] = {}
+    relative = sorted(by_relative)
+    for start in range(0, len(relative), _LOG_PATHS_PER_PASS):
+        chunk = relative[start : start + _LOG_PATHS_PER_PASS]
+        for rel_path, commit in _log_last_commits(repo_root, chunk, git_bin=git_bin, timeout=timeout).items():
+            for path in by_relative[rel_path]:
+                found[path] = commit
+    return found
+
+
+def _log_last_commits(
+    repo_root: Path,
+    paths: list[str],
+    *,
+    git_bin: str,
+    timeout: float,
+) -> dict[str, PathCommit]:
+    wanted = set(paths)
+    found: dict[str, PathCommit] = {}
+    cmd = [
+        git_bin,
+        "-C",
+        str(repo_root),
+        "-c",
+        "core.quotePath=false",
+        "log",
+        f"--format={_COMMIT_FORMAT}",
+        "--name-only",
+        "--relative",
+        "--",
+        *paths,
+    ]
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except OSError:
+        return {}
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        assert proc.stdout is not None
+        current: PathCommit | None = None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith(_COMMIT_MARKER):
+                parts = line[len(_COMMIT_MARKER) :].split("\x1f")
+                current = PathCommit(*parts) if len(parts) == 4 else None
+            elif current is not None and line in wanted and line not in found:
+                found[line] = current
+                if len(found) == len(wanted):
+                    # Newer commits come first: everything wanted is resolved.
+                    proc.kill()
+                    break
+    finally:
+        timer.cancel()
+        if proc.stdout is not None:
+            proc.stdout.close()
+        proc.wait()
+    return found
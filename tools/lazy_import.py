@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any, Callable
+
+
+class LazyAttr:
+    """Callable stand-in for ``from <module> import <name>``.
+
+    The module is imported on the first call, so an entrypoint can bind every
+    command implementation at module level (keeping names patchable) while a
+    cold start only pays for the command actually dispatched.
+    """
+
+    __slots__ = ("module", "name", "_target")
+
+    def __init__(self, module: str, name: str) -> None:
+        self.module = module
+        self.name = name
+        self._target: Callable[..., Any] | None = None
+
+    def resolve(self) -> Callable[..., Any]:
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self.module), self.name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self.module}.{self.name}>"
+
+
+def lazy_attr(module: str, name: str) -> Any:
+    return LazyAttr(module, name)
+
+
+def resolve_lazy_attrs(module: ModuleType) -> list[str]:
+    """Import every module behind ``module``'s lazy bindings (daemon warm-up)."""
+    resolved: list[str] = []
+    for value in list(vars(module).values()):
+        if isinstance(value, LazyAttr):
+            value.resolve()
+            resolved.append(f"{value.module}.{value.name}")
+    return sorted(resolved)
@@ -38,6 +38,10 @@ from tools.process_build_queue import (  # noqa: E402
     process_build_queue,
     resolve_document_link_binding,
 )
+from tools.queue_bound_binding import document_link_cfg  # noqa: E402
+from tools.queue_bound_runtime import set_worktree_pool_size  # noqa: E402
+from tools.queue_worker_pool import resolve_queue_workers  # noqa: E402
+from tools.queue_worktree_pool import resolve_worktree_pool_size  # noqa: E402
 from tools.phase2_support import (  # noqa: E402
     cli_bin as _cli_bin,
     load_config,
@@ -117,13 +121,16 @@ def event_requests_immediate_build(
 
 
 class BuildQueueWorker:
-    def __new__(cls, *, cfg: dict[str, Any], config_path: Path, data_root: str) -> _BuildQueueWorkerImpl:
+    def __new__(
+        cls, *, cfg: dict[str, Any], config_path: Path, data_root: str, max_workers: int = 1
+    ) -> _BuildQueueWorkerImpl:
         return _BuildQueueWorkerImpl(
             cfg=cfg,
             config_path=config_path,
             data_root=data_root,
             process_build_queue=process_build_queue,
             stderr=sys.stderr,
+            max_workers=max_workers,
         )
 
 
@@ -136,6 +143,7 @@ def listen_build_queue(
     cfg: dict[str, Any],
     config_path: Path,
     data_root: str,
+    queue_workers: int | None = None,
 ) -> int:
     errors = collect_queue_preflight_errors(cfg)
     if errors:
@@ -151,7 +159,10 @@ def listen_build_queue(
         )
 
     ensure_drive_event_subscription(cli_bin=cli_bin, base_token=binding.base_token)
-    worker = BuildQueueWorker(cfg=cfg, config_path=config_path, data_root=data_root)
+    if queue_workers is None:
+        queue_workers = resolve_queue_workers(document_link_cfg(cfg))
+    set_worktree_pool_size(resolve_worktree_pool_size(document_link_cfg(cfg)))
+    worker = BuildQueueWorker(cfg=cfg, config_path=config_path, data_root=data_root, max_workers=queue_workers)
 
     return _listen_for_build_queue_events_impl(
         repo_root=ROOT,
@@ -174,6 +185,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     ap.add_argument("--config", required=True, help="Config YAML path")
     ap.add_argument("--data-root", default=None, help="Override structured content snapshot root")
+    ap.add_argument(
+        "--queue-workers",
+        type=int,
+        default=None,
+        help="Run up to N record groups concurrently across queue passes (default: sync.phase2.document_link.queue_workers or 1)",
+    )
     return ap.parse_args(argv)
 
 
@@ -191,10 +208,13 @@ def main(argv: list[str] | None = None) -> int:
         )
     )
     try:
+        if args.queue_workers is not None and args.queue_workers < 1:
+            raise RuntimeError("--queue-workers must be a positive integer")
         return listen_build_queue(
             cfg=cfg,
             config_path=config_path,
             data_root=resolved_data_root,
+            queue_workers=args.queue_workers,
         )
     except RuntimeError as exc:
         print(f"[build-queue-listener] ERROR: {exc}", file=sys.stderr)
@@ -7,8 +7,19 @@ from collections import deque
 from pathlib import Path
 from typing import Any, Callable
 
+from tools.queue_worker_pool import QueueWorkerPool
+
 
 class BuildQueueWorker:
+    """Runs queue passes for listener triggers.
+
+    With ``max_workers == 1`` one pass runs at a time and triggers arriving
+    meanwhile coalesce into a single re-run. In pool mode a trigger starts a
+    new pass as soon as every earlier pass has dispatched its groups, so a
+    slow publish does not hold back a fresh immediate-build row; all passes
+    share one :class:`QueueWorkerPool` for locks and the worker cap.
+    """
+
     def __init__(
         self,
         *,
@@ -17,6 +28,7 @@ class BuildQueueWorker:
         data_root: str,
         process_build_queue: Callable[..., int],
         stderr: Any,
+        max_workers: int = 1,
     ) -> None:
         self.cfg = cfg
         self.config_path = config_path
@@ -24,16 +36,19 @@ class BuildQueueWorker:
         self._process_build_queue = process_build_queue
         self._stderr = stderr
         self._lock = threading.Lock()
-        self._running = False
+        self._pool = QueueWorkerPool(max_workers) if max_workers > 1 else None
+        self._max_passes = max(1, max_workers)
+        self._passes = 0
         self._pending = False
 
     def trigger(self, *, reason: str) -> None:
         with self._lock:
-            if self._running:
+            can_overlap = self._pool is not None and self._passes < self._max_passes and not self._pool.queued
+            if self._passes and not can_overlap:
                 self._pending = True
                 print(f"[build-queue-listener] Coalesced trigger while build is running: {reason}")
                 return
-            self._running = True
+            self._passes += 1
         print(f"[build-queue-listener] Triggered build queue: {reason}")
         thread = threading.Thread(target=self._run_loop, daemon=True)
         thread.start()
@@ -41,11 +56,15 @@ class BuildQueueWorker:
     def _run_loop(self) -> None:
         while True:
             try:
+                kwargs: dict[str, Any] = {}
+                if self._pool is not None:
+                    kwargs = {"queue_workers": self._pool.max_workers, "worker_pool": self._pool}
                 exit_code = self._process_build_queue(
                     cfg=self.cfg,
                     config_path=self.config_path,
                     data_root=self.data_root,
                     dry_run=False,
+                    **kwargs,
                 )
                 if exit_code:
                     print(f"[build-queue-listener] Queue run finished with exit_code={exit_code}", file=self._stderr)
@@ -56,7 +75,7 @@ class BuildQueueWorker:
                 if self._pending:
                     self._pending = False
                     continue
-                self._running = False
+                self._passes -= 1
                 return
 
 
@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import csv
 import re
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
 from tools import lang_registry
+from tools.utils.csv_table_cache import read_cached_csv_rows
 from tools.utils.spec_master import canonicalize_model_token
 from tools.utils.variable_resolver import parse_model_tokens
 
@@ -160,9 +160,7 @@ def _resolver_from_csv(path_text: str) -> LocalizedCopyResolver:
     path = Path(path_text)
     if not path.exists():
         raise FileNotFoundError(f"localized copy csv not found: {path}")
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        rows = list(csv.DictReader(handle))
-    return LocalizedCopyResolver(rows, source_path=path)
+    return LocalizedCopyResolver(read_cached_csv_rows(path), source_path=path)
 
 
 def apply_localized_copy_tokens(
@@ -155,10 +155,13 @@ from tools.queue_bound_runtime import (  # noqa: E402
     build_py_sync_data_command as _bound_build_py_sync_data_command,
     build_py_target_command as _bound_build_py_target_command,
     prepare_git_ref_worktree as _prepare_git_ref_worktree,
+    release_worktree as _release_worktree,
     remove_worktree as _remove_worktree,
     run_command as _run_command,
     run_git as _run_git,
+    set_worktree_pool_size as _set_worktree_pool_size,
     worktree_dir_for_git_ref as _worktree_dir_for_git_ref,
+    worktree_is_warm as _worktree_is_warm,
 )
 from tools.queue_bound_records import (  # noqa: E402
     group_pending_queue_records,
@@ -167,6 +170,7 @@ from tools.queue_bound_records import (  # noqa: E402
     parse_queue_records,
     queue_group_dingtalk_target_node_url,
     queue_group_force_phase2_refresh,
+    queue_group_immediate,
     queue_group_upload_dingtalk,
     pending_immediate_queue_records,
     pending_queue_records,
@@ -185,6 +189,8 @@ from tools.queue_bound_records import (  # noqa: E402
 )
 from tools.queue_outputs import config_path_in_repo_root as _config_path_in_repo_root_impl  # noqa: E402
 from tools.queue_runtime import command_failure_message as _command_failure_message  # noqa: E402
+from tools.queue_worker_pool import resolve_queue_workers as _resolve_queue_workers  # noqa: E402
+from tools.queue_worktree_pool import resolve_worktree_pool_size as _resolve_worktree_pool_size  # noqa: E402
 
 configure_queue_bound_providers(
     repo_root_provider=lambda: ROOT,
@@ -482,6 +488,8 @@ def process_build_queue(
     doc_phase: str | None = None,
     record_id: str | None = None,
     record_ids: tuple[str, ...] = (),
+    queue_workers: int = 1,
+    worker_pool: Any = None,
 ) -> int:
     return _process_build_queue_service(
         _service_module(),
@@ -494,6 +502,8 @@ def process_build_queue(
         doc_phase=doc_phase,
         record_id=record_id,
         record_ids=record_ids,
+        queue_workers=queue_workers,
+        worker_pool=worker_pool,
     )
 
 
@@ -527,6 +537,12 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="",
         help="Only consume these comma-separated Document_link record_ids (batch worker input)",
     )
+    ap.add_argument(
+        "--queue-workers",
+        type=int,
+        default=None,
+        help="Run up to N independent record groups concurrently (default: sync.phase2.document_link.queue_workers or 1)",
+    )
     return ap.parse_args(argv)
 
 
@@ -538,6 +554,10 @@ def main(argv: list[str] | None = None) -> int:
         load_config=load_config,
         resolve_phase2_export_root=resolve_phase2_export_root,
         process_build_queue=process_build_queue,
+        resolve_queue_workers=lambda cfg: _resolve_queue_workers(_document_link_cfg(cfg)),
+        configure_worktree_pool=lambda cfg: _set_worktree_pool_size(
+            _resolve_worktree_pool_size(_document_link_cfg(cfg))
+        ),
     )
 
 
@@ -14,6 +14,8 @@ def run_main(
     load_config: Callable[[Path], dict[str, Any]],
     resolve_phase2_export_root: Callable[..., Path],
     process_build_queue: Callable[..., int],
+    resolve_queue_workers: Callable[[dict[str, Any]], int] = lambda cfg: 1,
+    configure_worktree_pool: Callable[[dict[str, Any]], None] = lambda cfg: None,
 ) -> int:
     args = parse_args(argv)
     config_path = Path(args.config)
@@ -28,6 +30,12 @@ def run_main(
         )
     )
     try:
+        queue_workers = getattr(args, "queue_workers", None)
+        if queue_workers is None:
+            queue_workers = resolve_queue_workers(cfg)
+        if queue_workers < 1:
+            raise RuntimeError("--queue-workers must be a positive integer")
+        configure_worktree_pool(cfg)
         return process_build_queue(
             cfg=cfg,
             config_path=config_path,
@@ -37,6 +45,7 @@ def run_main(
             doc_phase=args.doc_phase,
             record_id=(args.record_id or "").strip() or None,
             record_ids=tuple(item.strip() for item in str(args.record_ids or "").split(",") if item.strip()),
+            queue_workers=queue_workers,
         )
     except RuntimeError as exc:
         print(f"[build-queue] ERROR: {exc}", file=sys.stderr)
@@ -478,7 +478,7 @@ def build_document_for_task(
         git_ref=git_ref,
         normalize_workflow_action=module.normalize_workflow_action,
         prepare_git_ref_worktree=module._prepare_git_ref_worktree,
-        remove_worktree=module._remove_worktree,
+        release_worktree=module._release_worktree,
         config_path_in_repo_root=module._config_path_in_repo_root,
         run_command=module._run_command,
         build_py_target_command=module._build_py_target_command,
@@ -493,6 +493,7 @@ def build_document_for_task(
         stage_web_publish_assets_to_host_repo=module._stage_web_publish_assets_to_host_repo,
         stage_draft_word_output_to_host_repo=module._stage_draft_word_output_to_host_repo,
         stage_draft_md_output_to_host_repo=module._stage_draft_md_output_to_host_repo,
+        worktree_is_warm=module._worktree_is_warm,
     )
 
 
@@ -668,6 +669,8 @@ def process_build_queue(
     doc_phase: str | None = None,
     record_id: str | None = None,
     record_ids: tuple[str, ...] = (),
+    queue_workers: int = 1,
+    worker_pool: Any = None,
 ) -> int:
     return _process_build_queue_impl(
         cfg=cfg,
@@ -679,6 +682,8 @@ def process_build_queue(
         doc_phase=doc_phase,
         record_id=record_id,
         record_ids=record_ids,
+        queue_workers=queue_workers,
+        worker_pool=worker_pool,
         bootstrap_queue_session=lambda **kwargs: _bootstrap_queue_session(module, **kwargs),
         load_pending_queue_state=_load_pending_queue_state_impl,
         print_no_pending_message=_print_no_pending_message_impl,
@@ -705,6 +710,7 @@ def process_build_queue(
         queue_group_dingtalk_target_node_url=module.queue_group_dingtalk_target_node_url,
         queue_group_operator_union_id=module.queue_group_operator_union_id,
         queue_group_force_phase2_refresh=module.queue_group_force_phase2_refresh,
+        queue_group_immediate=module.queue_group_immediate,
         queue_group_upload_dingtalk=module.queue_group_upload_dingtalk,
         validate_queue_record_group=module.validate_queue_record_group,
         resolve_config_path_for_task=module.resolve_config_path_for_task,
@@ -26,6 +26,7 @@ from tools.document_link_queue import (
     queue_group_build_family,
     queue_group_dingtalk_target_node_url,
     queue_group_force_phase2_refresh,
+    queue_group_immediate,
     queue_group_lang,
     queue_group_operator_union_id,
     queue_group_upload_dingtalk,
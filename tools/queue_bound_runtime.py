@@ -11,6 +11,7 @@ from tools.queue_build_execution import (  # noqa: E402
     build_py_target_command as _build_py_target_command_impl,
 )
 from tools.queue_runtime import (  # noqa: E402
+    _GIT_WORKTREE_LOCK,
     command_failure_message,
     format_command,
     prepare_git_ref_worktree as _prepare_git_ref_worktree_impl,
@@ -19,7 +20,12 @@ from tools.queue_runtime import (  # noqa: E402
     run_git as _run_git_impl,
     slug_ref_token,
     worktree_dir_for_git_ref as _worktree_dir_for_git_ref_impl,
+    worktree_pool_root,
 )
+from tools.queue_worktree_pool import DEFAULT_WORKTREE_POOL_SIZE, QueueWorktreePool  # noqa: E402
+
+_worktree_pool_size = DEFAULT_WORKTREE_POOL_SIZE
+_worktree_pools: dict[Path, QueueWorktreePool] = {}
 
 
 def set_repo_root_provider(provider) -> None:
@@ -31,6 +37,27 @@ def _repo_root() -> Path:
     return Path(_repo_root_provider())
 
 
+def set_worktree_pool_size(size: int) -> None:
+    global _worktree_pool_size
+    _worktree_pool_size = max(0, int(size))
+    for pool in _worktree_pools.values():
+        pool.max_worktrees = _worktree_pool_size
+
+
+def worktree_pool() -> QueueWorktreePool:
+    repo_root = _repo_root()
+    pool = _worktree_pools.get(repo_root)
+    if pool is None:
+        pool = _worktree_pools[repo_root] = QueueWorktreePool(
+            pool_root=worktree_pool_root(repo_root),
+            max_worktrees=_worktree_pool_size,
+            run_git=lambda args: run_git(args),
+            remove_worktree=lambda path: remove_worktree(path),
+            lock=_GIT_WORKTREE_LOCK,
+        )
+    return pool
+
+
 def run_command(
     cmd: list[str],
     *,
@@ -66,9 +93,18 @@ def prepare_git_ref_worktree(git_ref: str, *, prefer_local: bool = True) -> Path
         run_git=run_git,
         worktree_dir_for_git_ref=lambda *, repo_root, git_ref: worktree_dir_for_git_ref(git_ref),
         remove_worktree=lambda *, repo_root, path: remove_worktree(path),
+        worktree_pool=worktree_pool(),
     )
 
 
+def release_worktree(path: Path) -> None:
+    worktree_pool().release(path)
+
+
+def worktree_is_warm(path: Path) -> bool:
+    return worktree_pool().is_warm(path)
+
+
 def build_py_target_command(
     *,
     action: str,
@@ -171,7 +171,7 @@ def build_document_for_task(
     git_ref: str = "",
     normalize_workflow_action: Callable[[str | None], str | None],
     prepare_git_ref_worktree: Callable[..., Path],
-    remove_worktree: Callable[[Path], None],
+    release_worktree: Callable[[Path], None],
     config_path_in_repo_root: Callable[..., Path],
     run_command: Callable[..., None],
     build_py_target_command: Callable[..., list[str]],
@@ -186,6 +186,7 @@ def build_document_for_task(
     stage_web_publish_assets_to_host_repo: Callable[..., tuple[Path, Path]],
     stage_draft_word_output_to_host_repo: Callable[..., Path],
     stage_draft_md_output_to_host_repo: Callable[..., Path],
+    worktree_is_warm: Callable[[Path], bool] = lambda path: False,
 ) -> BuiltDocumentOutputs:
     normalized_doc_phase = normalize_workflow_action(doc_phase)
     effective_repo_root = repo_root
@@ -227,6 +228,10 @@ def build_document_for_task(
             effective_data_root = str(workspace_data_root)
         effective_repo_root = build_workspace
         effective_config_path = config_path_in_repo_root(config_path, repo_root=build_workspace)
+    # A reused pooled worktree keeps docs/_build from its last queue build, so the
+    # preview builds skip --clean and Sphinx rebuilds incrementally. Publish
+    # builds always start clean.
+    incremental = build_workspace is not None and worktree_is_warm(build_workspace)
 
     try:
         if normalized_doc_phase == "draft":
@@ -240,6 +245,7 @@ def build_document_for_task(
                     lang=lang,
                     data_root=effective_data_root,
                     source="review",
+                    no_clean=incremental,
                 ),
                 cwd=effective_repo_root,
             )
@@ -319,7 +325,7 @@ def build_document_for_task(
                 cwd=effective_repo_root,
             )
         elif normalized_doc_phase == "web_publish":
-            for action, no_clean in (("check", False), ("md", True), ("html", True)):
+            for action, no_clean in (("check", incremental), ("md", True), ("html", True)):
                 run_command(
                     build_py_target_command(
                         repo_root=effective_repo_root,
@@ -345,6 +351,7 @@ def build_document_for_task(
                     region=region,
                     lang=lang,
                     data_root=effective_data_root,
+                    no_clean=incremental,
                 ),
                 cwd=effective_repo_root,
             )
@@ -559,5 +566,5 @@ def build_document_for_task(
         for workspace in (review_workspace, build_workspace):
             if workspace is None or workspace in cleaned_paths:
                 continue
-            remove_worktree(workspace)
+            release_worktree(workspace)
             cleaned_paths.add(workspace)
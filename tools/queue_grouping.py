@@ -17,6 +17,7 @@ def group_pending_queue_records(
 ) -> list[list[Any]]:
     grouped: list[list[Any]] = []
     index_by_key: dict[str, int] = {}
+    configs: dict[str, dict[str, Any]] = {}
     for record in records:
         model, region = resolve_target_for_record(record)
         config_path = resolve_config_path_for_task(
@@ -25,7 +26,9 @@ def group_pending_queue_records(
             build_family=record.build_family,
             workflow_action=resolve_queue_workflow_action(record),
         )
-        cfg = config_loader(config_path)
+        cfg = configs.get(str(config_path))
+        if cfg is None:
+            cfg = configs[str(config_path)] = config_loader(config_path)
         workflow_action = resolve_queue_workflow_action(record)
         if queue_by_document_key(cfg):
             key = queue_record_group_key(record)
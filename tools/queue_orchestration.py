@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import threading
 from typing import Any, Callable
 
+from tools.queue_worker_pool import QueueWorkerPool, queue_group_lock_keys, run_queue_groups
+
 
 def sync_phase2_snapshot_once(
     sync_phase2_snapshot_before_queue: Callable[..., None],
@@ -36,6 +39,8 @@ def process_build_queue(
     doc_phase: str | None,
     record_id: str | None,
     record_ids: tuple[str, ...] = (),
+    queue_workers: int = 1,
+    worker_pool: QueueWorkerPool | None = None,
     bootstrap_queue_session: Callable[..., Any],
     load_pending_queue_state: Callable[..., Any],
     print_no_pending_message: Callable[..., None],
@@ -63,6 +68,7 @@ def process_build_queue(
     queue_group_operator_union_id: Callable[..., Any],
     queue_group_force_phase2_refresh: Callable[..., Any],
     queue_group_upload_dingtalk: Callable[..., Any],
+    queue_group_immediate: Callable[..., bool] = lambda group: False,
     validate_queue_record_group: Callable[..., None],
     resolve_config_path_for_task: Callable[..., Any],
     queue_record_key: Callable[..., Any],
@@ -94,6 +100,9 @@ def process_build_queue(
         workflow_action=workflow_action,
         doc_phase=doc_phase,
     )
+    if worker_pool is None and queue_workers > 1:
+        worker_pool = QueueWorkerPool(queue_workers)
+    rows_read_since = worker_pool.mark() if worker_pool is not None else 0
     pending_state = load_pending_queue_state(
         source=session.source,
         binding=session.binding,
@@ -148,17 +157,19 @@ def process_build_queue(
     failures: list[str] = []
     processed = 0
     phase2_sync_memo: set[tuple[str, str]] = set()
+    phase2_sync_lock = threading.Lock()
 
     def sync_phase2_snapshot_for_group(*, config_path: Any, data_root: str | None) -> None:
-        sync_phase2_snapshot_once(
-            sync_phase2_snapshot_before_queue,
-            memo=phase2_sync_memo,
-            config_path=config_path,
-            data_root=data_root,
-        )
+        with phase2_sync_lock:
+            sync_phase2_snapshot_once(
+                sync_phase2_snapshot_before_queue,
+                memo=phase2_sync_memo,
+                config_path=config_path,
+                data_root=data_root,
+            )
 
-    for group in pending_state.pending_groups:
-        result = process_queue_record_group(
+    def run_group(group: list[Any]) -> Any:
+        return process_queue_record_group(
             group=group,
             cfg=cfg,
             config_path=config_path,
@@ -210,6 +221,28 @@ def process_build_queue(
             best_effort_queue_workflow_action=best_effort_queue_workflow_action,
             stderr=stderr,
         )
+
+    if worker_pool is None:
+        results = [run_group(group) for group in pending_state.pending_groups]
+    else:
+        print(
+            f"[build-queue] Running {len(pending_state.pending_groups)} group(s) "
+            f"on up to {worker_pool.max_workers} worker(s)."
+        )
+        results = run_queue_groups(
+            pending_state.pending_groups,
+            pool=worker_pool,
+            run_group=run_group,
+            lock_keys=lambda group: queue_group_lock_keys(group, queue_record_key=queue_record_key),
+            is_immediate=queue_group_immediate,
+            # A phase2 refresh rewrites the snapshot every other build reads.
+            is_exclusive=lambda group: bool(queue_group_force_phase2_refresh(group))
+            or resolve_queue_workflow_action(group[0]) == "web_publish",
+            since=rows_read_since,
+        )
+    for result in results:
+        if result is None:
+            continue
         processed += result.processed_rows
         if result.failure_message:
             failures.append(result.failure_message)
@@ -6,10 +6,20 @@ import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Callable, Mapping
 
+from tools.build_daemon import DaemonResult, build_py_invocation, capture_via_build_daemon
+from tools.queue_worker_pool import current_queue_worker_slot
+from tools.queue_worktree_pool import QueueWorktreePool
+
+# Concurrent queue workers share one repository: fetches and `git worktree`
+# add/remove update the same refs and .git/worktrees entries, so they run one
+# at a time (re-entrant: preparing a worktree removes the stale one first).
+_GIT_WORKTREE_LOCK = threading.RLock()
+
 
 def slug_ref_token(value: str) -> str:
     text = re.sub(r"[^a-z0-9]+", "-", value.strip().lower()).strip("-")
@@ -69,15 +79,23 @@ def run_command(
     command_failure_message: Callable[[list[str], str, str, int], str] = command_failure_message,
 ) -> None:
     print(f"{prefix} {format_command(cmd)}")
-    proc = subprocess.run(
-        cmd,
-        cwd=str(cwd),
-        env={**os.environ, **dict(env)} if env is not None else None,
-        check=False,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
+    merged_env = {**os.environ, **dict(env)} if env is not None else None
+    invocation = build_py_invocation(cmd, cwd=cwd)
+    proc: DaemonResult | subprocess.CompletedProcess[str] | None = None
+    if invocation is not None:
+        # build.py steps run in the resident build daemon when one serves this checkout.
+        repo_root, argv = invocation
+        proc = capture_via_build_daemon(argv, repo_root=repo_root, cwd=cwd, env=merged_env)
+    if proc is None:
+        proc = subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            env=merged_env,
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
     if proc.stdout:
         print(proc.stdout, end="")
     if proc.stderr:
@@ -95,21 +113,29 @@ def run_git(
     run_command(["git", *args], cwd=repo_root)
 
 
+def worktree_pool_root(repo_root: Path) -> Path:
+    return repo_root / ".tmp" / "process-build-queue-worktrees"
+
+
 def worktree_dir_for_git_ref(*, repo_root: Path, git_ref: str) -> Path:
-    return repo_root / ".tmp" / "process-build-queue-worktrees" / slug_ref_token(git_ref)
+    token = slug_ref_token(git_ref)
+    # Each concurrent queue worker (tools/queue_worker_pool.py) gets its own checkouts.
+    slot = current_queue_worker_slot()
+    return worktree_pool_root(repo_root) / (f"{token}@{slot}" if slot else token)
 
 
 def remove_worktree(*, repo_root: Path, path: Path) -> None:
     if not path.exists():
         return
-    proc = subprocess.run(
-        ["git", "worktree", "remove", "--force", str(path)],
-        cwd=str(repo_root),
-        check=False,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
+    with _GIT_WORKTREE_LOCK:
+        proc = subprocess.run(
+            ["git", "worktree", "remove", "--force", str(path)],
+            cwd=str(repo_root),
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
     if proc.returncode != 0 and path.exists():
         shutil.rmtree(path, ignore_errors=True)
 
@@ -136,6 +162,7 @@ def prepare_git_ref_worktree(
     remove_worktree: Callable[..., None],
     git_ref_exists: Callable[..., bool] = git_ref_exists,
     sleep: Callable[[float], None] = time.sleep,
+    worktree_pool: QueueWorktreePool | None = None,
 ) -> Path:
     def _fetch_args(*extra: str) -> list[str]:
         return [
@@ -178,37 +205,40 @@ def prepare_git_ref_worktree(
                 )
                 sleep(delay)
 
-    branch_name = git_ref.strip()
-    if not branch_name:
-        raise RuntimeError("Git_ref is required when preparing a queue build worktree")
-    source_ref = f"origin/{branch_name}"
-    cached_remote_ref = f"refs/remotes/origin/{branch_name}"
-    local_branch_ref = f"refs/heads/{branch_name}"
-    if prefer_local and git_ref_exists(repo_root=repo_root, ref=local_branch_ref):
-        source_ref = branch_name
-        print(
-            f"[build-queue] Using local Git_ref branch {branch_name}",
-            file=sys.stderr,
-        )
-    else:
-        try:
-            _run_git_fetch(_fetch_args("--prune"))
-            _run_git_fetch(_fetch_args(f"refs/heads/{branch_name}:refs/remotes/origin/{branch_name}"))
-        except RuntimeError:
-            if git_ref_exists(repo_root=repo_root, ref=cached_remote_ref):
-                print(
-                    f"[build-queue] WARNING git fetch failed; reusing cached remote ref origin/{branch_name}",
-                    file=sys.stderr,
-                )
-            else:
-                raise
-        if not prefer_local:
+    with _GIT_WORKTREE_LOCK:
+        branch_name = git_ref.strip()
+        if not branch_name:
+            raise RuntimeError("Git_ref is required when preparing a queue build worktree")
+        source_ref = f"origin/{branch_name}"
+        cached_remote_ref = f"refs/remotes/origin/{branch_name}"
+        local_branch_ref = f"refs/heads/{branch_name}"
+        if prefer_local and git_ref_exists(repo_root=repo_root, ref=local_branch_ref):
+            source_ref = branch_name
             print(
-                f"[build-queue] Using remote Git_ref {source_ref}",
+                f"[build-queue] Using local Git_ref branch {branch_name}",
                 file=sys.stderr,
             )
-    worktree = worktree_dir_for_git_ref(repo_root=repo_root, git_ref=branch_name)
-    remove_worktree(repo_root=repo_root, path=worktree)
-    worktree.parent.mkdir(parents=True, exist_ok=True)
-    run_git(["worktree", "add", "--force", "--detach", str(worktree), source_ref])
-    return worktree
+        else:
+            try:
+                _run_git_fetch(_fetch_args("--prune"))
+                _run_git_fetch(_fetch_args(f"refs/heads/{branch_name}:refs/remotes/origin/{branch_name}"))
+            except RuntimeError:
+                if git_ref_exists(repo_root=repo_root, ref=cached_remote_ref):
+                    print(
+                        f"[build-queue] WARNING git fetch failed; reusing cached remote ref origin/{branch_name}",
+                        file=sys.stderr,
+                    )
+                else:
+                    raise
+            if not prefer_local:
+                print(
+                    f"[build-queue] Using remote Git_ref {source_ref}",
+                    file=sys.stderr,
+                )
+        worktree = worktree_dir_for_git_ref(repo_root=repo_root, git_ref=branch_name)
+        if worktree_pool is not None:
+            return worktree_pool.checkout(worktree=worktree, source_ref=source_ref)
+        remove_worktree(repo_root=repo_root, path=worktree)
+        worktree.parent.mkdir(parents=True, exist_ok=True)
+        run_git(["worktree", "add", "--force", "--detach", str(worktree), source_ref])
+        return worktree
@@ -0,0 +1,238 @@
+"""Concurrent scheduling of build-queue record groups.
+
+``process_build_queue`` normally walks its pending groups one at a time. With
+``queue_workers > 1`` the groups run on a small thread pool instead:
+
+* a group holds one lock per document key and one per ``Git_ref`` (or on
+  this checkout when it has no ref, since those builds render in place), so
+  two groups never render the same document or review branch at once;
+* groups that refresh the phase2 snapshot run exclusively, because every
+  other build reads that snapshot;
+* runnable groups alternate between the immediate-build and backlog lanes so
+  neither starves the other;
+* each running group owns a worker slot, and queue worktrees are suffixed
+  with it (tools/queue_runtime.worktree_dir_for_git_ref), so concurrent
+  builds never share the ``main`` build worktree.
+
+One :class:`QueueWorkerPool` can be shared by overlapping queue passes (the
+listener starts a pass per trigger) so the locks and the slot cap hold across
+them. A pass skips groups another pass is running or finished after this pass
+read the table, since its rows are stale; claim verification inside
+``process_queue_record_group`` still arbitrates everything else.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence
+
+MAIN_CHECKOUT_LOCK = "checkout:"
+_WORKER_SLOT = threading.local()
+
+
+def current_queue_worker_slot() -> int:
+    """Slot of the queue group running on this thread (0 outside the pool)."""
+    return int(getattr(_WORKER_SLOT, "slot", 0))
+
+
+def resolve_queue_workers(cfg: dict[str, Any]) -> int:
+    raw = cfg.get("queue_workers", 1) if isinstance(cfg, dict) else 1
+    try:
+        workers = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise RuntimeError(f"document_link.queue_workers must be a positive integer: {raw!r}") from exc
+    return max(1, workers)
+
+
+def queue_group_lock_keys(group: Iterable[Any], *, queue_record_key: Callable[[Any], str]) -> frozenset[str]:
+    keys: set[str] = set()
+    for record in group:
+        keys.add(f"document:{queue_record_key(record)}")
+        git_ref = str(getattr(record, "git_ref", "") or "").strip()
+        if git_ref:
+            keys.add(f"git_ref:{git_ref}")
+        else:
+            keys.add(MAIN_CHECKOUT_LOCK)
+    return frozenset(keys)
+
+
+@dataclass(frozen=True)
+class QueueGroupJob:
+    index: int
+    group: Sequence[Any]
+    record_ids: frozenset[str]
+    lock_keys: frozenset[str]
+    immediate: bool
+    exclusive: bool
+
+
+class QueueWorkerPool:
+    """Lock table, exclusivity flag and worker-slot cap shared by queue passes."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.condition = threading.Condition()
+        self._held: set[str] = set()
+        self._free_slots = list(range(self.max_workers))
+        self._running = 0
+        self._exclusive_running = False
+        self._sequence = 0
+        self._running_records: set[str] = set()
+        self._finished_records: dict[str, int] = {}
+        self._queued = 0
+
+    @property
+    def queued(self) -> int:
+        """Jobs registered by passes but not started yet."""
+        with self.condition:
+            return self._queued
+
+    def mark(self) -> int:
+        """Sequence number to pass as ``since`` for rows read from now on."""
+        with self.condition:
+            return self._sequence
+
+    def is_stale(self, job: QueueGroupJob, since: int) -> bool:
+        return any(
+            record_id in self._running_records or self._finished_records.get(record_id, -1) > since
+            for record_id in job.record_ids
+        )
+
+    def try_start(self, job: QueueGroupJob) -> int | None:
+        """Reserve ``job``'s locks and a slot; caller must hold ``condition``."""
+        if not self._free_slots or self._exclusive_running:
+            return None
+        if job.exclusive and self._running:
+            return None
+        if job.lock_keys & self._held:
+            return None
+        self._held |= job.lock_keys
+        self._running_records |= job.record_ids
+        self._running += 1
+        self._exclusive_running = job.exclusive
+        return self._free_slots.pop(0)
+
+    def finish(self, job: QueueGroupJob, slot: int) -> None:
+        with self.condition:
+            self._sequence += 1
+            for record_id in job.record_ids:
+                self._finished_records[record_id] = self._sequence
+            self._running_records -= job.record_ids
+            self._held -= job.lock_keys
+            self._running -= 1
+            if job.exclusive:
+                self._exclusive_running = False
+            self._free_slots.append(slot)
+            self._free_slots.sort()
+            self.condition.notify_all()
+
+
+class _FairQueue:
+    """Pending jobs in two lanes; each start hands the next turn to the other lane."""
+
+    def __init__(self, jobs: Iterable[QueueGroupJob]) -> None:
+        self.immediate: deque[QueueGroupJob] = deque()
+        self.backlog: deque[QueueGroupJob] = deque()
+        for job in jobs:
+            (self.immediate if job.immediate else self.backlog).append(job)
+        self._immediate_turn = True
+
+    def __len__(self) -> int:
+        return len(self.immediate) + len(self.backlog)
+
+    def drop_stale(self, pool: QueueWorkerPool, since: int) -> None:
+        for lane in (self.immediate, self.backlog):
+            for job in [job for job in lane if pool.is_stale(job, since)]:
+                lane.remove(job)
+                pool._queued -= 1
+
+    def start_next(self, pool: QueueWorkerPool) -> tuple[QueueGroupJob, int] | None:
+        lanes = (self.immediate, self.backlog) if self._immediate_turn else (self.backlog, self.immediate)
+        for lane in lanes:
+            for job in lane:
+                slot = pool.try_start(job)
+                if slot is not None:
+                    lane.remove(job)
+                    pool._queued -= 1
+                    self._immediate_turn = lane is self.backlog
+                    return job, slot
+        return None
+
+
+def run_queue_groups(
+    groups: Sequence[Sequence[Any]],
+    *,
+    pool: QueueWorkerPool,
+    run_group: Callable[[Sequence[Any]], Any],
+    lock_keys: Callable[[Sequence[Any]], frozenset[str]],
+    is_immediate: Callable[[Sequence[Any]], bool],
+    is_exclusive: Callable[[Sequence[Any]], bool],
+    since: int | None = None,
+) -> list[Any]:
+    """Run ``groups`` on up to ``pool.max_workers`` threads; results keep group order.
+
+    ``since`` is :meth:`QueueWorkerPool.mark` taken before the groups' rows
+    were read; stale groups are skipped and their result is ``None``. The
+    first exception raised by a group is re-raised once every started group
+    has finished; groups not yet started are then skipped.
+    """
+
+    if since is None:
+        since = pool.mark()
+    pending = _FairQueue(
+        QueueGroupJob(
+            index=index,
+            group=group,
+            record_ids=frozenset(str(getattr(record, "record_id", "")) for record in group),
+            lock_keys=lock_keys(group),
+            immediate=is_immediate(group),
+            exclusive=is_exclusive(group),
+        )
+        for index, group in enumerate(groups)
+    )
+    results: list[Any] = [None] * len(groups)
+    errors: list[tuple[int, BaseException]] = []
+    with pool.condition:
+        pool._queued += len(pending)
+
+    def worker() -> None:
+        while True:
+            with pool.condition:
+                started = None
+                while not errors:
+                    pending.drop_stale(pool, since)
+                    if not len(pending):
+                        break
+                    started = pending.start_next(pool)
+                    if started is not None:
+                        break
+                    pool.condition.wait()
+                if started is None:
+                    return
+            job, slot = started
+            _WORKER_SLOT.slot = slot
+            try:
+                results[job.index] = run_group(job.group)
+            except BaseException as exc:  # noqa: BLE001 - re-raised by the caller thread
+                with pool.condition:
+                    errors.append((job.index, exc))
+            finally:
+                _WORKER_SLOT.slot = 0
+                pool.finish(job, slot)
+
+    threads = [
+        threading.Thread(target=worker, name=f"build-queue-worker-{index}", daemon=True)
+        for index in range(min(pool.max_workers, len(groups)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with pool.condition:
+        pool._queued -= len(pending)
+        pool.condition.notify_all()
+    if errors:
+        raise min(errors, key=lambda item: item[0])[1]
+    return results
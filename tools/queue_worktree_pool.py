@@ -0,0 +1,139 @@
+"""Reusable queue build worktrees, kept per Git_ref.
+
+A queue build of a ``Git_ref`` used to add a fresh worktree and remove it
+afterwards, paying a full checkout every time. The pool keeps the worktree
+instead: the next build of the same ref (and worker slot, see
+tools/queue_worker_pool.py) fast-forwards it with ``git reset --hard`` to the
+freshly fetched ref and ``git clean`` everything except ``docs/_build``, so the
+incremental Sphinx state of that branch survives between queue runs.
+
+Idle worktrees beyond ``max_worktrees`` are evicted least recently used first;
+worktrees in use are never evicted. Last-use times live in an index file next
+to the worktrees so the LRU order survives across queue processes. With
+``max_worktrees == 0`` released worktrees are removed right away (the old
+behaviour).
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_WORKTREE_POOL_SIZE = 4
+POOL_INDEX_NAME = ".pool-index.json"
+# Kept across reuse: `git clean -x` would otherwise drop the ignored build tree.
+PRESERVED_BUILD_DIR = "/docs/_build/"
+
+
+def resolve_worktree_pool_size(cfg: dict[str, Any]) -> int:
+    raw = cfg.get("worktree_pool_size") if isinstance(cfg, dict) else None
+    if raw is None:
+        raw = DEFAULT_WORKTREE_POOL_SIZE
+    try:
+        size = int(raw)
+    except (TypeError, ValueError) as exc:
+        raise RuntimeError(f"document_link.worktree_pool_size must be a non-negative integer: {raw!r}") from exc
+    return max(0, size)
+
+
+def is_git_worktree(path: Path) -> bool:
+    # A linked worktree has a `.git` file pointing at .git/worktrees/<name>.
+    return (path / ".git").is_file()
+
+
+class QueueWorktreePool:
+    def __init__(
+        self,
+        *,
+        pool_root: Path,
+        max_worktrees: int,
+        run_git: Callable[[list[str]], None],
+        remove_worktree: Callable[[Path], None],
+        lock: Any | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.pool_root = pool_root
+        self.max_worktrees = max(0, int(max_worktrees))
+        self._run_git = run_git
+        self._remove_worktree = remove_worktree
+        # Share the caller's git lock: checkouts already run under it, and
+        # eviction must not interleave with a checkout of the same worktree.
+        self._lock = lock if lock is not None else threading.RLock()
+        self._clock = clock
+        self._in_use: set[Path] = set()
+        self._warm: set[Path] = set()
+
+    def checkout(self, *, worktree: Path, source_ref: str) -> Path:
+        """Point ``worktree`` at ``source_ref``, reusing it when it is already a worktree."""
+        with self._lock:
+            self._in_use.add(worktree)
+            self._warm.discard(worktree)
+            if self.max_worktrees and is_git_worktree(worktree):
+                try:
+                    self._run_git(["-C", str(worktree), "reset", "--hard", "--quiet", source_ref])
+                    self._run_git(["-C", str(worktree), "clean", "-ffdxq", "-e", PRESERVED_BUILD_DIR])
+                except RuntimeError as exc:
+                    print(
+                        f"[build-queue] WARNING reusing worktree {worktree.name} failed; recreating it ({exc})",
+                        file=sys.stderr,
+                    )
+                else:
+                    self._warm.add(worktree)
+                    print(f"[build-queue] Reusing worktree {worktree.name} at {source_ref}", file=sys.stderr)
+                    return worktree
+            self._remove_worktree(worktree)
+            worktree.parent.mkdir(parents=True, exist_ok=True)
+            self._run_git(["worktree", "add", "--force", "--detach", str(worktree), source_ref])
+            return worktree
+
+    def is_warm(self, worktree: Path) -> bool:
+        """Whether ``worktree`` was reused, so its ``docs/_build`` holds earlier build state."""
+        with self._lock:
+            return worktree in self._warm
+
+    def release(self, worktree: Path) -> None:
+        with self._lock:
+            self._in_use.discard(worktree)
+            self._warm.discard(worktree)
+            if not self.max_worktrees:
+                self._remove_worktree(worktree)
+                return
+            index = self._read_index()
+            if worktree.exists():
+                index[worktree.name] = self._clock()
+            for victim in self._eviction_candidates(index):
+                print(f"[build-queue] Evicting idle worktree {victim.name}", file=sys.stderr)
+                self._remove_worktree(victim)
+                index.pop(victim.name, None)
+            self._write_index(index)
+
+    def _eviction_candidates(self, index: dict[str, float]) -> list[Path]:
+        pooled = [path for path in self.pool_root.iterdir() if path.is_dir()] if self.pool_root.is_dir() else []
+        excess = len(pooled) - self.max_worktrees
+        if excess <= 0:
+            return []
+        idle = sorted(
+            (path for path in pooled if path not in self._in_use),
+            key=lambda path: (index.get(path.name, 0.0), path.name),
+        )
+        return idle[:excess]
+
+    def _read_index(self) -> dict[str, float]:
+        try:
+            payload = json.loads((self.pool_root / POOL_INDEX_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        return {str(name): float(used) for name, used in payload.items() if isinstance(used, (int, float))}
+
+    def _write_index(self, index: dict[str, float]) -> None:
+        self.pool_root.mkdir(parents=True, exist_ok=True)
+        path = self.pool_root / POOL_INDEX_NAME
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
@@ -15,7 +15,9 @@ MVP scope (ingest only):
   ``cloud_doc_backport_reports.build_report``) and turn each delta into one ledger
   row.
 - Append rows to ``reports/revision_ledger/ledger.jsonl`` (JSON Lines), de-duped
-  by ``row_key`` so re-ingesting the same report is a no-op (idempotent).
+  by ``row_key`` so re-ingesting the same report is a no-op (idempotent). The
+  indexed store next to it (``tools/revision_ledger_store.py``) answers the
+  de-dup and pending-row lookups without re-parsing the JSONL.
 - Leave the human-verdict fields (``final_status`` / ``final_text`` / merge
   metadata) as ``pending``. A later ``reconcile`` step fills them in from the
   merged ``docs/_review`` text; see ``code-as-doc`` follow-up.
@@ -27,7 +29,6 @@ backport behaviour.
 from __future__ import annotations
 
 import argparse
-import difflib
 import json
 import re
 import subprocess
@@ -37,6 +38,9 @@ from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from tools.cloud_doc_backport_model import _normalize_inline, parse_blocks  # noqa: E402
+from tools.git_object_reader import last_commits_for_paths  # noqa: E402
+from tools.revision_ledger_store import RevisionLedgerStore, ledger_line  # noqa: E402
+from tools.utils.fuzzy_match import partial_ratio  # noqa: E402
 from tools.utils.path_utils import PathSegments, get_paths, revision_ledger_of  # noqa: E402
 
 LEDGER_SCHEMA_VERSION = 1
@@ -199,7 +203,8 @@ def load_ledger(ledger_path: Path) -> list[dict[str, Any]]:
 
 
 def existing_row_keys(ledger_path: Path) -> set[str]:
-    return {row.get("row_key") for row in load_ledger(ledger_path) if row.get("row_key")}
+    with RevisionLedgerStore(ledger_path) as store:
+        return {row["row_key"] for _, row in store.entries() if row.get("row_key")}
 
 
 def ingest_report(
@@ -213,22 +218,18 @@ def ingest_report(
     merges).
     """
     deltas = report.get("deltas") or []
-    seen_keys = existing_row_keys(ledger_path)
+    candidates = [delta_to_row(report, delta, default_lang=default_lang) for delta in deltas]
     new_rows: list[dict[str, Any]] = []
     skipped = 0
-    for delta in deltas:
-        row = delta_to_row(report, delta, default_lang=default_lang)
-        if row["row_key"] in seen_keys:
-            skipped += 1
-            continue
-        seen_keys.add(row["row_key"])
-        new_rows.append(row)
-
-    if new_rows:
-        ledger_path.parent.mkdir(parents=True, exist_ok=True)
-        with ledger_path.open("a", encoding="utf-8") as handle:
-            for row in new_rows:
-                handle.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+    with RevisionLedgerStore(ledger_path) as store:
+        seen_keys = store.existing_row_keys(row["row_key"] for row in candidates)
+        for row in candidates:
+            if row["row_key"] in seen_keys:
+                skipped += 1
+                continue
+            seen_keys.add(row["row_key"])
+            new_rows.append(row)
+        store.append(new_rows)
 
     return {
         "ledger": str(ledger_path),
@@ -254,7 +255,7 @@ def write_ledger(rows: list[dict[str, Any]], ledger_path: Path) -> None:
     ledger_path.parent.mkdir(parents=True, exist_ok=True)
     with ledger_path.open("w", encoding="utf-8") as handle:
         for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+            handle.write(ledger_line(row) + "\n")
 
 
 def _source_haystack(root: Path, source_path: str | None) -> str | None:
@@ -273,32 +274,6 @@ def _source_haystack(root: Path, source_path: str | None) -> str | None:
     return " ".join(block.normalized for block in blocks)
 
 
-def _partial_ratio(needle: str, hay: str) -> float:
-    """Best similarity of ``needle`` against any needle-sized window of ``hay``.
-
-    Sliding-window best-alignment ratio (the classic partial-ratio shape):
-    anchor candidate windows at each matching block, then score the window with
-    a plain ``SequenceMatcher`` ratio. Returns 0.0..1.0.
-    """
-    if not needle or not hay:
-        return 0.0
-    if len(needle) > len(hay):
-        needle, hay = hay, needle
-    anchor = difflib.SequenceMatcher(None, needle, hay, autojunk=False)
-    best = 0.0
-    for block in anchor.get_matching_blocks():
-        start = max(block.b - block.a, 0)
-        window = hay[start : start + len(needle)]
-        if not window:
-            continue
-        ratio = difflib.SequenceMatcher(None, needle, window, autojunk=False).ratio()
-        if ratio > best:
-            best = ratio
-        if best >= 0.995:
-            break
-    return best
-
-
 def _fuzzy_present(needle: str, haystack: str, threshold: float) -> bool:
     """True when ``needle`` (near-)appears in ``haystack``.
 
@@ -311,7 +286,7 @@ def _fuzzy_present(needle: str, haystack: str, threshold: float) -> bool:
         return True
     if len(needle) < MIN_FUZZY_LENGTH:
         return False
-    return _partial_ratio(needle, haystack) >= threshold
+    return partial_ratio(needle, haystack, min_ratio=threshold) >= threshold
 
 
 def classify_verdict(
@@ -347,10 +322,12 @@ def classify_verdict(
     if machine and machine in haystack:
         return REJECTED_STATUS
     reviewer_ratio = (
-        _partial_ratio(reviewer, haystack) if len(reviewer) >= MIN_FUZZY_LENGTH else 0.0
+        partial_ratio(reviewer, haystack, min_ratio=threshold)
+        if len(reviewer) >= MIN_FUZZY_LENGTH
+        else 0.0
     )
     machine_ratio = (
-        _partial_ratio(machine, haystack)
+        partial_ratio(machine, haystack, min_ratio=threshold)
         if machine and len(machine) >= MIN_FUZZY_LENGTH
         else 0.0
     )
@@ -404,7 +381,23 @@ def _git_merge_meta(root: Path, source_path: str | None) -> dict[str, Any]:
     parts = line.split("\x1f")
     if len(parts) != 4:
         return {}
-    sha, committed_at, author, subject = parts
+    return _merge_meta_from_commit(*parts)
+
+
+def _git_merge_meta_batch(root: Path, source_paths: set[str]) -> dict[str, dict[str, Any]]:
+    """``_git_merge_meta`` for many paths from one ``git log --name-only`` pass.
+
+    Paths the batch pass cannot resolve are left out; the caller falls back to
+    ``_git_merge_meta`` for them.
+    """
+    commits = last_commits_for_paths(root, sorted(source_paths))
+    return {
+        path: _merge_meta_from_commit(commit.sha, commit.committed_at, commit.author, commit.subject)
+        for path, commit in commits.items()
+    }
+
+
+def _merge_meta_from_commit(sha: str, committed_at: str, author: str, subject: str) -> dict[str, Any]:
     pr_match = re.search(r"\(#(\d+)\)", subject)
     return {
         "merged_commit": sha,
@@ -485,6 +478,20 @@ def reconcile_rows(
     skip_row_keys = skip_row_keys or set()
     haystacks: dict[str, str | None] = {}
     git_meta: dict[str, dict[str, Any]] = {}
+    if auto_merge_meta:
+        git_meta.update(
+            _git_merge_meta_batch(
+                root,
+                {
+                    row["source_path"]
+                    for row in rows
+                    if row.get("route_class") == ROUTE_REVIEW
+                    and row.get("source_path")
+                    and (force or row.get("final_status") == PENDING_STATUS)
+                    and row.get("row_key") not in skip_row_keys
+                },
+            )
+        )
     counts: dict[str, int] = {}
     reconciled = 0
     for row in rows:
@@ -535,26 +542,28 @@ def reconcile(
     auto_merge_meta: bool = False,
     skip_row_keys: set[str] | None = None,
 ) -> dict[str, Any]:
-    """Load a ledger, reconcile pending rows, write back.
+    """Load a ledger's pending rows (all rows with ``force``), reconcile, write back.
 
     ``apply_report`` is an optional source_table_sync apply report used to resolve
     ``source_table_suggestion`` (online-table) rows. ``auto_merge_meta`` resolves
     merge metadata from git per source file (explicit ``merge_meta`` wins).
     ``skip_row_keys`` rows are left pending (see ``reconcile_rows``).
     """
-    rows = load_ledger(ledger_path)
     apply_index = index_apply_report(apply_report)
-    summary = reconcile_rows(
-        rows,
-        root=root,
-        merge_meta=merge_meta,
-        apply_index=apply_index,
-        force=force,
-        auto_merge_meta=auto_merge_meta,
-        skip_row_keys=skip_row_keys,
-    )
-    if summary["rows_reconciled"]:
-        write_ledger(rows, ledger_path)
+    with RevisionLedgerStore(ledger_path) as store:
+        entries = store.entries(final_status=None if force else PENDING_STATUS)
+        before = [ledger_line(row) for _, row in entries]
+        summary = reconcile_rows(
+            [row for _, row in entries],
+            root=root,
+            merge_meta=merge_meta,
+            apply_index=apply_index,
+            force=force,
+            auto_merge_meta=auto_merge_meta,
+            skip_row_keys=skip_row_keys,
+        )
+        if summary["rows_reconciled"]:
+            store.update([entry for entry, line in zip(entries, before) if ledger_line(entry[1]) != line])
     summary["ledger"] = str(ledger_path)
     return summary
 
@@ -0,0 +1,218 @@
+"""Indexed SQLite store behind the JSONL revision ledger.
+
+``ledger.jsonl`` stays the ledger's import/export format (flow_dashboard and
+humans read it, it diffs well), but ingest and reconcile no longer re-parse
+it: they go through ``ledger.sqlite3`` next to it, which holds every row
+indexed by ``row_key``, page (``source_path``), block hash (``delta_hash``),
+``git_ref`` and verdict.
+
+- Ingest looks up only the incoming row keys and appends the new rows to both
+  files, so its I/O is proportional to the report, not the ledger.
+- Reconcile reads only the pending rows (or all with ``force``) and rewrites the
+  JSONL export from the store's stored lines when verdicts change.
+
+The store records the JSONL file's size and mtime after each of its own writes.
+When the JSONL changed underneath it (hand edit, checkout, a crash between the
+two writes, or no store yet) the store re-imports the whole file once.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable
+
+STORE_SCHEMA_VERSION = 1
+STORE_SUFFIX = ".sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    row_key TEXT UNIQUE,
+    source_path TEXT,
+    delta_hash TEXT,
+    git_ref TEXT,
+    final_status TEXT,
+    line TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rows_source_path ON rows(source_path);
+CREATE INDEX IF NOT EXISTS rows_delta_hash ON rows(delta_hash);
+CREATE INDEX IF NOT EXISTS rows_git_ref ON rows(git_ref);
+CREATE INDEX IF NOT EXISTS rows_final_status ON rows(final_status);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+# SQLite's default bound-parameter limit is 999 on older builds.
+_QUERY_CHUNK = 500
+
+
+def ledger_line(row: dict[str, Any]) -> str:
+    """The JSONL serialization of one ledger row (without the newline)."""
+    return json.dumps(row, ensure_ascii=False, sort_keys=True)
+
+
+def store_path_for(ledger_path: Path) -> Path:
+    return ledger_path.with_suffix(STORE_SUFFIX)
+
+
+def _jsonl_identity(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except OSError:
+        return "absent"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _columns(row: dict[str, Any], line: str) -> tuple[Any, ...]:
+    return (
+        row.get("row_key"),
+        row.get("source_path"),
+        row.get("delta_hash"),
+        row.get("git_ref"),
+        row.get("final_status"),
+        line,
+    )
+
+
+class RevisionLedgerStore:
+    def __init__(self, ledger_path: Path, *, store_path: Path | None = None) -> None:
+        self.ledger_path = ledger_path
+        self.store_path = store_path or store_path_for(ledger_path)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.store_path))
+        self.reimported = False
+        try:
+            self._conn.executescript(_SCHEMA)
+            if self._meta("schema_version") != str(STORE_SCHEMA_VERSION):
+                self._reimport()
+            else:
+                self.sync()
+        except BaseException:
+            self._conn.close()
+            raise
+
+    def __enter__(self) -> RevisionLedgerStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def sync(self) -> None:
+        """Re-import the JSONL when it changed since this store last wrote it."""
+        if self._meta("jsonl_identity") != _jsonl_identity(self.ledger_path):
+            self._reimport()
+
+    def existing_row_keys(self, row_keys: Iterable[str]) -> set[str]:
+        keys = sorted({key for key in row_keys if key})
+        found: set[str] = set()
+        for start in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[start : start + _QUERY_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                key for (key,) in self._conn.execute(f"SELECT row_key FROM rows WHERE row_key IN ({placeholders})", chunk)
+            )
+        return found
+
+    def get(self, row_key: str) -> dict[str, Any] | None:
+        rows = self._select("WHERE row_key = ?", (row_key,))
+        return rows[0][1] if rows else None
+
+    def rows_for_page(self, source_path: str) -> list[dict[str, Any]]:
+        return [row for _, row in self._select("WHERE source_path = ?", (source_path,))]
+
+    def rows_for_block(self, delta_hash: str) -> list[dict[str, Any]]:
+        return [row for _, row in self._select("WHERE delta_hash = ?", (delta_hash,))]
+
+    def rows_for_git_ref(self, git_ref: str) -> list[dict[str, Any]]:
+        return [row for _, row in self._select("WHERE git_ref = ?", (git_ref,))]
+
+    def entries(self, *, final_status: str | None = None) -> list[tuple[int, dict[str, Any]]]:
+        """``(seq, row)`` pairs in ledger order, optionally only one verdict."""
+        if final_status is None:
+            return self._select("", ())
+        return self._select("WHERE final_status = ?", (final_status,))
+
+    def count(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0])
+
+    def append(self, rows: list[dict[str, Any]]) -> None:
+        """Append rows to the JSONL and the store (callers de-duplicate first)."""
+        if not rows:
+            return
+        lines = [ledger_line(row) for row in rows]
+        payload = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        expected_size = self._jsonl_size() + len(payload)
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.ledger_path.open("ab") as handle:
+            handle.write(payload)
+        if self._jsonl_size() != expected_size:
+            # Someone else appended too: take the file as the source of truth.
+            self._reimport()
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rows (row_key, source_path, delta_hash, git_ref, final_status, line) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [_columns(row, line) for row, line in zip(rows, lines)],
+            )
+            self._set_meta("jsonl_identity", _jsonl_identity(self.ledger_path))
+
+    def update(self, entries: list[tuple[int, dict[str, Any]]]) -> None:
+        """Replace rows in place and rewrite the JSONL export in ledger order."""
+        if not entries:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE rows SET row_key = ?, source_path = ?, delta_hash = ?, git_ref = ?, final_status = ?, "
+                "line = ? WHERE seq = ?",
+                [(*_columns(row, ledger_line(row)), seq) for seq, row in entries],
+            )
+            self._export()
+            self._set_meta("jsonl_identity", _jsonl_identity(self.ledger_path))
+
+    def _export(self) -> None:
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.ledger_path.with_name(f"{self.ledger_path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8", newline="\n") as handle:
+            for (line,) in self._conn.execute("SELECT line FROM rows ORDER BY seq"):
+                handle.write(f"{line}\n")
+        tmp_path.replace(self.ledger_path)
+
+    def _reimport(self) -> None:
+        records: list[tuple[Any, ...]] = []
+        if self.ledger_path.exists():
+            for raw in self.ledger_path.read_text(encoding="utf-8").splitlines():
+                line = raw.strip()
+                if line:
+                    records.append(_columns(json.loads(line), line))
+        with self._conn:
+            self._conn.execute("DELETE FROM rows")
+            # Duplicate row keys (hand-merged files) keep their last occurrence.
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rows (row_key, source_path, delta_hash, git_ref, final_status, line) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                records,
+            )
+            self._set_meta("schema_version", str(STORE_SCHEMA_VERSION))
+            self._set_meta("jsonl_identity", _jsonl_identity(self.ledger_path))
+        self.reimported = True
+
+    def _select(self, where: str, params: tuple[Any, ...]) -> list[tuple[int, dict[str, Any]]]:
+        cursor = self._conn.execute(f"SELECT seq, line FROM rows {where} ORDER BY seq", params)
+        return [(int(seq), json.loads(line)) for seq, line in cursor]
+
+    def _jsonl_size(self) -> int:
+        try:
+            return self.ledger_path.stat().st_size
+        except OSError:
+            return 0
+
+    def _meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compiled RST templates for ``{{ var }}``, ``|SUBSTITUTION|`` and ``{{ copy:key }}``.
+
+A template is tokenized once (cached by its text) into literal, var,
+placeholder and copy-token segments and then rendered in a single pass.
+The historical renderer ran ``apply_vars``, then one ``str.replace`` per
+substitution key in mapping order, then a copy-token scan; its output is the
+contract. The few inputs where that sequence is order-sensitive (a value
+that itself contains ``|`` or braces, placeholders sharing a pipe, a var
+expanding next to pipes or braces, a placeholder inside a ``{{ copy: }}``
+token, keys that are not plain names) are
+detected up front and rendered the historical way.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Mapping
+
+from tools.csv_pages.renderers_common import VAR_PATTERN, apply_vars
+from tools.localized_copy import COPY_TOKEN_RE, LocalizedCopyResolver
+from tools.utils.korean_josa import JOSA_PAIRS, josa_base_key, select_josa, with_josa_substitutions
+
+PLACEHOLDER_RE = re.compile(r"\|([^\s|{}](?:[^|\n{}]*[^\s|{}])?)\|")
+_OVERLAPPING_PLACEHOLDER_RE = re.compile(f"(?={PLACEHOLDER_RE.pattern})")
+_TOKEN_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})"
+        for name, pattern in (("var", VAR_PATTERN), ("copy", COPY_TOKEN_RE), ("sub", PLACEHOLDER_RE))
+    )
+)
+_BRACE_SPAN_RE = re.compile(r"\{\{[^{}]*\}\}")
+_UNSAFE_VALUE_CHARS = frozenset("|{}")
+_KO_LANGS = {"ko", "ko-kr"}
+
+
+@dataclass(frozen=True)
+class _Var:
+    name: str
+    source: str
+
+
+@dataclass(frozen=True)
+class _Copy:
+    key: str
+
+
+@dataclass(frozen=True)
+class _Placeholder:
+    name: str
+    source: str
+
+
+@dataclass(frozen=True)
+class CompiledRstTemplate:
+    segments: tuple[str | _Var | _Copy | _Placeholder, ...]
+    placeholder_names: frozenset[str]
+    # Candidates the left-to-right scan skipped because they share a pipe
+    # with a neighbour; per-key replacement could still hit them.
+    shadowed_names: frozenset[str]
+    # A var sits on a line with pipes or braces, so its value could join
+    # surrounding text into a new placeholder or copy token.
+    var_sensitive: bool
+    # A placeholder sits inside ``{{ ... }}``; the copy-token scan runs after
+    # substitution, so the substituted text may form (or be) a copy token.
+    copy_sensitive: bool
+    has_vars: bool
+
+
+@dataclass(frozen=True)
+class RenderedRst:
+    text: str
+    unresolved: tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def compile_rst_template(text: str) -> CompiledRstTemplate:
+    segments: list[str | _Var | _Copy | _Placeholder] = []
+    names: set[str] = set()
+    sub_starts: set[int] = set()
+    cursor = 0
+    for match in _TOKEN_RE.finditer(text):
+        if match.start() > cursor:
+            segments.append(text[cursor : match.start()])
+        if match.group("var") is not None:
+            segments.append(_Var(match.group(2), match.group(0)))
+        elif match.group("copy") is not None:
+            segments.append(_Copy(match.group(4)))
+        else:
+            segments.append(_Placeholder(match.group(6), match.group(0)))
+            names.add(match.group(6))
+            sub_starts.add(match.start())
+        cursor = match.end()
+    if cursor < len(text):
+        segments.append(text[cursor:])
+    shadowed = {
+        match.group(1)
+        for match in _OVERLAPPING_PLACEHOLDER_RE.finditer(text)
+        if match.start() not in sub_starts
+    }
+    var_sensitive = any(
+        _UNSAFE_VALUE_CHARS.intersection(VAR_PATTERN.sub("", line))
+        for line in text.split("\n")
+        if VAR_PATTERN.search(line)
+    )
+    return CompiledRstTemplate(
+        segments=tuple(segments),
+        placeholder_names=frozenset(names),
+        shadowed_names=frozenset(shadowed),
+        var_sensitive=var_sensitive,
+        copy_sensitive=any(PLACEHOLDER_RE.search(span.group(0)) for span in _BRACE_SPAN_RE.finditer(text)),
+        has_vars=any(isinstance(segment, _Var) for segment in segments),
+    )
+
+
+@lru_cache(maxsize=64)
+def _keys_are_names(keys: frozenset[str]) -> bool:
+    return all(PLACEHOLDER_RE.fullmatch(f"|{key}|") for key in keys)
+
+
+def _josa_lookup(substitutions: Mapping[str, str]) -> Callable[[str], str | None]:
+    """Resolve ``name`` the way ``with_josa_substitutions`` would, without building it."""
+
+    def lookup(name: str) -> str | None:
+        if name in substitutions:
+            return substitutions[name]
+        base = josa_base_key(name)
+        if base is None or base not in substitutions:
+            return None
+        value = (substitutions[base] or "").strip()
+        if not value:
+            return None
+        pair = name[len(base) + len("_JOSA_") :]
+        if pair not in JOSA_PAIRS:
+            return None
+        particle = select_josa(value, pair)
+        return None if particle is None else f"{value}{particle}"
+
+    return lookup
+
+
+def _copy_target(vars_map: Mapping[str, str]) -> tuple[str, str]:
+    localized_copy_csv = (vars_map.get("localized_copy_csv") or "").strip()
+    lang = (vars_map.get("lang") or vars_map.get("language") or "").strip()
+    if not localized_copy_csv:
+        raise RuntimeError("RST uses {{ copy:<key> }} but localized_copy_csv is not configured")
+    if not lang:
+        raise RuntimeError("RST uses {{ copy:<key> }} but render lang is not configured")
+    return localized_copy_csv, lang
+
+
+def _apply_copy_tokens(text: str, vars_map: Mapping[str, str], *, model: str | None, region: str | None) -> str:
+    localized_copy_csv, lang = _copy_target(vars_map)
+    try:
+        resolver = LocalizedCopyResolver.from_csv(localized_copy_csv)
+        return resolver.apply(text, lang=lang, model=model, region=region)
+    except (FileNotFoundError, KeyError) as exc:
+        raise RuntimeError(str(exc)) from exc
+
+
+def _render_sequential(
+    text: str,
+    substitutions: Mapping[str, str],
+    vars_map: dict[str, str],
+    *,
+    ko: bool,
+    model: str | None,
+    region: str | None,
+) -> str:
+    """The historical per-key renderer, for order-sensitive inputs."""
+    out = apply_vars(text, vars_map)
+    effective = with_josa_substitutions(substitutions) if ko else substitutions
+    for key, value in effective.items():
+        out = out.replace(f"|{key}|", value)
+    if COPY_TOKEN_RE.search(out):
+        out = _apply_copy_tokens(out, vars_map, model=model, region=region)
+    return out
+
+
+def render_rst_template(
+    text: str,
+    substitutions: Mapping[str, str],
+    vars_map: dict[str, str],
+    *,
+    model: str | None = None,
+    region: str | None = None,
+) -> RenderedRst:
+    """Render ``text`` and report the placeholders no substitution resolved."""
+    lang = (vars_map.get("lang") or vars_map.get("language") or "").strip().lower()
+    ko = lang in _KO_LANGS
+    compiled = compile_rst_template(text)
+    source = text
+    if compiled.has_vars and (
+        compiled.var_sensitive
+        or any(
+            _UNSAFE_VALUE_CHARS.intersection(vars_map[segment.name])
+            for segment in compiled.segments
+            if isinstance(segment, _Var) and segment.name in vars_map
+        )
+    ):
+        text = apply_vars(text, vars_map)
+        compiled = compile_rst_template(text)
+        vars_map_for_segments: Mapping[str, str] = {}
+    else:
+        vars_map_for_segments = vars_map
+    lookup = _josa_lookup(substitutions) if ko else substitutions.get
+    values = {name: lookup(name) for name in compiled.placeholder_names}
+    unresolved = tuple(sorted(name for name, value in values.items() if value is None))
+    if (
+        compiled.copy_sensitive
+        or any(lookup(name) is not None for name in compiled.shadowed_names)
+        or any(value is not None and _UNSAFE_VALUE_CHARS.intersection(value) for value in values.values())
+        or not _keys_are_names(frozenset(substitutions))
+    ):
+        return RenderedRst(
+            _render_sequential(source, substitutions, vars_map, ko=ko, model=model, region=region),
+            unresolved,
+        )
+
+    resolver: LocalizedCopyResolver | None = None
+    copy_lang = ""
+    parts: list[str] = []
+    for segment in compiled.segments:
+        if isinstance(segment, str):
+            parts.append(segment)
+        elif isinstance(segment, _Placeholder):
+            value = values[segment.name]
+            parts.append(segment.source if value is None else value)
+        elif isinstance(segment, _Var):
+            parts.append(vars_map_for_segments.get(segment.name, segment.source))
+        else:
+            if resolver is None:
+                localized_copy_csv, copy_lang = _copy_target(vars_map)
+                try:
+                    resolver = LocalizedCopyResolver.from_csv(localized_copy_csv)
+                except FileNotFoundError as exc:
+                    raise RuntimeError(str(exc)) from exc
+            try:
+                parts.append(resolver.resolve(segment.key, lang=copy_lang, model=model, region=region))
+            except KeyError as exc:
+                raise RuntimeError(str(exc)) from exc
+    return RenderedRst("".join(parts), unresolved)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import csv
 import json
 import re
 from pathlib import Path
@@ -28,6 +27,7 @@ from tools.source_intake_model import (
 from tools.source_record_index import load_index, resolve_by_table
 from tools.spec_master_sources import model_region_from_document_key
 from tools.source_table_sync import CHANGE_REQUEST_SCHEMA_VERSION
+from tools.utils.csv_table_cache import read_cached_csv_rows
 
 
 _HEADER_CLEAN_RE = re.compile(r"[^a-z0-9]+")
@@ -387,10 +387,7 @@ def extract_candidates_from_text(
 
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        return list(csv.DictReader(handle))
+    return read_cached_csv_rows(path)
 
 
 def _source_rows_for_target(data_root: Path, target_table: str) -> list[dict[str, str]]:
@@ -10,9 +10,11 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
 try:
     from tools.script_bootstrap import bootstrap_repo_root
@@ -23,11 +25,14 @@ ROOT = bootstrap_repo_root(__file__, parent_count=1)
 
 from tools.config_loader import load_config_mapping
 from tools.sync_data_config import (  # noqa: E402
+    attachment_store_root as _attachment_store_root_impl,
     cli_bin as _cli_bin_impl,
     cli_command_exists as _cli_command_exists_impl,
     cli_command_parts as _cli_command_parts_impl,
     collect_sync_preflight_errors as _collect_sync_preflight_errors_impl,
     env_value as _env_value_impl,
+    delta_sync_enabled as _delta_sync_enabled_impl,
+    fetch_jobs as _fetch_jobs_impl,
     phase2_identity as _phase2_identity_impl,
     phase2_tables_cfg as _phase2_tables_cfg_impl,
     provider_name as _provider_name_impl,
@@ -38,12 +43,21 @@ from tools.sync_data_config import (  # noqa: E402
     table_cfg as _table_cfg_impl,
     table_env_names as _table_env_names_impl,
 )
+from tools.schema_drift import inspect_phase2_schema  # noqa: E402
 from tools.sync_data_cli import build_sync_run_output_lines  # noqa: E402
 from tools.data_snapshot import (  # noqa: E402
     resolve_data_snapshot_paths,
     resolve_phase2_export_root,
     resolve_phase2_manifest_path,
 )
+from tools.sync_data_fetch import (  # noqa: E402
+    LarkRateLimitError,
+    RecordPage,
+    call_with_rate_limit_backoff,
+    collect_record_pages,
+    is_rate_limit_message,
+    resolve_fetch_jobs,
+)
 from tools.sync_data_entry import parse_args as _parse_args_impl, run_main as _run_main_impl  # noqa: E402
 from tools.sync_data_models import (  # noqa: E402
     ROW_KEY_MAPPING_FIELDNAMES,
@@ -97,6 +111,18 @@ def _cli_bin(cfg: dict[str, Any]) -> str:
     return _cli_bin_impl(cfg)
 
 
+def _fetch_jobs(cfg: dict[str, Any]) -> int:
+    return _fetch_jobs_impl(cfg)
+
+
+def _delta_sync_enabled(cfg: dict[str, Any]) -> bool:
+    return _delta_sync_enabled_impl(cfg)
+
+
+def _attachment_store_root(cfg: dict[str, Any]) -> Path:
+    return _attachment_store_root_impl(cfg, repo_root=ROOT)
+
+
 def _phase2_identity() -> str:
     return _phase2_identity_impl(os.environ, supported_identities=SUPPORTED_IDENTITIES)
 
@@ -205,30 +231,52 @@ def _is_unknown_format_flag_error(exc: RuntimeError) -> bool:
 
 
 class LarkCliSource:
-    def __init__(self, *, cli_bin: str, identity: str = "user"):
+    def __init__(self, *, cli_bin: str, identity: str = "user", fetch_jobs: int = 1):
         self.cli_bin = cli_bin
         self.identity = identity
+        # Bounds concurrent lark-cli processes across every thread using this
+        # source (parallel tables and their parallel offset pages alike).
+        self.fetch_jobs = max(1, int(fetch_jobs))
+        self._cli_slots = threading.BoundedSemaphore(self.fetch_jobs)
+        self._sleep: Callable[[float], None] = time.sleep
         self._field_name_cache: dict[tuple[str, str], dict[str, str]] = {}
 
     def _run_base_command(
         self,
         *,
         args: list[str],
+    ) -> dict[str, Any]:
+        return self._run_json_command(args=["base", *args])
+
+    def _run_json_command(
+        self,
+        *,
+        args: list[str],
+    ) -> dict[str, Any]:
+        return call_with_rate_limit_backoff(
+            lambda: self._run_json_command_once(args=args),
+            sleep=self._sleep,
+        )
+
+    def _run_json_command_once(
+        self,
+        *,
+        args: list[str],
     ) -> dict[str, Any]:
         cmd = [
             *_resolved_cli_command_parts(self.cli_bin),
-            "base",
             *args,
         ]
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=str(ROOT),
-                check=True,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-            )
+            with self._cli_slots:
+                proc = subprocess.run(
+                    cmd,
+                    cwd=str(ROOT),
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                )
         except subprocess.CalledProcessError as exc:
             details = []
             if exc.stdout:
@@ -236,12 +284,14 @@ class LarkCliSource:
             if exc.stderr:
                 details.append(f"stderr={exc.stderr.strip()}")
             suffix = "; " + "; ".join(details) if details else ""
-            raise RuntimeError(f"Lark CLI base command failed with exit code {exc.returncode}{suffix}") from exc
+            error_cls = LarkRateLimitError if is_rate_limit_message(suffix) else RuntimeError
+            raise error_cls(f"Lark CLI {args[0]} command failed with exit code {exc.returncode}{suffix}") from exc
         payload = _parse_json_payload(proc.stdout)
         code = payload.get("code")
         if code not in (None, 0):
             message = str(payload.get("msg") or payload.get("message") or "Lark CLI API request failed")
-            raise RuntimeError(f"Lark CLI API request failed: {message}")
+            error_cls = LarkRateLimitError if is_rate_limit_message(f"{code} {message}") else RuntimeError
+            raise error_cls(f"Lark CLI API request failed: {message}")
         return payload
 
     def _field_name_map(self, *, base_token: str, table_id: str) -> dict[str, str]:
@@ -374,6 +424,59 @@ class LarkCliSource:
             include_record_ids=True,
         )
 
+    def list_record_versions(
+        self,
+        *,
+        base_token: str,
+        table_id: str,
+        view_id: str | None,
+    ) -> dict[str, int]:
+        """Return ``record_id -> last_modified_time`` (ms) for every record in the view."""
+        body: dict[str, Any] = {"field_names": [], "automatic_fields": True}
+        if view_id:
+            body["view_id"] = view_id
+        versions: dict[str, int] = {}
+        page_token = ""
+        while True:
+            params: dict[str, Any] = {"page_size": 500}
+            if page_token:
+                params["page_token"] = page_token
+            payload = self._run_json_command(
+                args=[
+                    "api",
+                    "POST",
+                    f"/open-apis/bitable/v1/apps/{base_token}/tables/{table_id}/records/search",
+                    "--params",
+                    json.dumps(params, separators=(",", ":")),
+                    "--data",
+                    json.dumps(body, ensure_ascii=False, separators=(",", ":")),
+                    "--as",
+                    self.identity,
+                ]
+            )
+            data = payload.get("data")
+            if not isinstance(data, dict):
+                raise RuntimeError("Lark CLI record search response is missing data payload")
+            items = data.get("items") or []
+            if not isinstance(items, list):
+                raise RuntimeError("Lark CLI record search response has invalid items payload")
+            for item in items:
+                record_id = str(item.get("record_id") or "").strip() if isinstance(item, dict) else ""
+                if not record_id:
+                    raise RuntimeError("Lark CLI record search response contains a record without record_id")
+                try:
+                    versions[record_id] = int(item.get("last_modified_time") or 0)
+                except (TypeError, ValueError):
+                    raise RuntimeError(
+                        f"Lark CLI record search response has invalid last_modified_time for {record_id}"
+                    ) from None
+            page_token = str(data.get("page_token") or "")
+            if not data.get("has_more"):
+                break
+            if not page_token:
+                raise RuntimeError("Lark CLI record search response signaled pagination without page_token")
+        return versions
+
     def download_drive_file(
         self,
         *,
@@ -400,14 +503,15 @@ class LarkCliSource:
         ]
         if output_path.exists() and not overwrite:
             return
-        subprocess.run(
-            cmd,
-            cwd=str(output_path.parent),
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-        )
+        with self._cli_slots:
+            subprocess.run(
+                cmd,
+                cwd=str(output_path.parent),
+                check=True,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+            )
 
     def _fetch_records(
         self,
@@ -417,11 +521,10 @@ class LarkCliSource:
         view_id: str | None,
         include_record_ids: bool,
     ) -> list[dict[str, Any]]:
-        records: list[dict[str, Any]] = []
-        offset = 0
         limit = 200
         field_name_map = self._field_name_map(base_token=base_token, table_id=table_id)
-        while True:
+
+        def fetch_page(offset: int) -> RecordPage:
             payload = self._run_record_list(
                 base_token=base_token,
                 table_id=table_id,
@@ -429,53 +532,69 @@ class LarkCliSource:
                 offset=offset,
                 limit=limit,
             )
-            data = payload.get("data")
-            if not isinstance(data, dict):
-                raise RuntimeError("Lark CLI API response is missing data payload")
-            field_ids = data.get("field_id_list", [])
-            if not isinstance(field_ids, list) or not all(isinstance(field_id, str) for field_id in field_ids):
-                raise RuntimeError("Lark CLI record list response has invalid field id list")
-            display_field_names = data.get("fields", [])
-            if not isinstance(display_field_names, list) or not all(
-                isinstance(name, str) for name in display_field_names
-            ):
-                raise RuntimeError("Lark CLI record list response has invalid field list")
-            if len(field_ids) != len(display_field_names):
-                raise RuntimeError("Lark CLI record list response field metadata is misaligned")
-            field_names = [
-                field_name_map.get(field_id, display_name)
-                for field_id, display_name in zip(field_ids, display_field_names)
-            ]
-            rows = data.get("data", [])
-            if not isinstance(rows, list):
-                raise RuntimeError("Lark CLI API response has invalid record list")
-            record_ids = data.get("record_id_list", [])
-            if record_ids not in (None, []):
-                if not isinstance(record_ids, list) or not all(isinstance(record_id, str) for record_id in record_ids):
-                    raise RuntimeError("Lark CLI record list response has invalid record id list")
-                if len(record_ids) != len(rows):
-                    raise RuntimeError("Lark CLI record list response record ids are misaligned")
-            for row in rows:
-                if not isinstance(row, list):
-                    raise RuntimeError("Lark CLI record list response contains a non-list row")
-                row_index = len(records) - offset
-                fields = {
-                    field_name: row[index] if index < len(row) else None
-                    for index, field_name in enumerate(field_names)
-                }
-                record: dict[str, Any] = {"fields": fields}
-                if include_record_ids:
-                    if not isinstance(record_ids, list) or row_index >= len(record_ids):
-                        raise RuntimeError("Lark CLI record list response is missing record ids")
-                    record["record_id"] = record_ids[row_index]
-                records.append(record)
-            has_more = bool(data.get("has_more"))
-            if not has_more:
-                break
-            if not rows:
-                raise RuntimeError("Lark CLI record list response signaled pagination without rows")
-            offset += len(rows)
-        return records
+            return self._parse_record_page(
+                payload,
+                field_name_map=field_name_map,
+                include_record_ids=include_record_ids,
+            )
+
+        return collect_record_pages(
+            fetch_page,
+            first_page=fetch_page(0),
+            limit=limit,
+            max_workers=self.fetch_jobs,
+        )
+
+    @staticmethod
+    def _parse_record_page(
+        payload: dict[str, Any],
+        *,
+        field_name_map: dict[str, str],
+        include_record_ids: bool,
+    ) -> RecordPage:
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            raise RuntimeError("Lark CLI API response is missing data payload")
+        field_ids = data.get("field_id_list", [])
+        if not isinstance(field_ids, list) or not all(isinstance(field_id, str) for field_id in field_ids):
+            raise RuntimeError("Lark CLI record list response has invalid field id list")
+        display_field_names = data.get("fields", [])
+        if not isinstance(display_field_names, list) or not all(
+            isinstance(name, str) for name in display_field_names
+        ):
+            raise RuntimeError("Lark CLI record list response has invalid field list")
+        if len(field_ids) != len(display_field_names):
+            raise RuntimeError("Lark CLI record list response field metadata is misaligned")
+        field_names = [
+            field_name_map.get(field_id, display_name)
+            for field_id, display_name in zip(field_ids, display_field_names)
+        ]
+        rows = data.get("data", [])
+        if not isinstance(rows, list):
+            raise RuntimeError("Lark CLI API response has invalid record list")
+        record_ids = data.get("record_id_list", [])
+        if record_ids not in (None, []):
+            if not isinstance(record_ids, list) or not all(isinstance(record_id, str) for record_id in record_ids):
+                raise RuntimeError("Lark CLI record list response has invalid record id list")
+            if len(record_ids) != len(rows):
+                raise RuntimeError("Lark CLI record list response record ids are misaligned")
+        records: list[dict[str, Any]] = []
+        for row_index, row in enumerate(rows):
+            if not isinstance(row, list):
+                raise RuntimeError("Lark CLI record list response contains a non-list row")
+            fields = {
+                field_name: row[index] if index < len(row) else None
+                for index, field_name in enumerate(field_names)
+            }
+            record: dict[str, Any] = {"fields": fields}
+            if include_record_ids:
+                if not isinstance(record_ids, list) or row_index >= len(record_ids):
+                    raise RuntimeError("Lark CLI record list response is missing record ids")
+                record["record_id"] = record_ids[row_index]
+            records.append(record)
+        raw_total = data.get("total")
+        total = raw_total if isinstance(raw_total, int) and not isinstance(raw_total, bool) else None
+        return RecordPage(records=records, has_more=bool(data.get("has_more")), total=total)
 
     def upsert_record(
         self,
@@ -619,6 +738,7 @@ def sync_phase2_snapshot(
     dry_run: bool = False,
     source: RecordSource | None = None,
     built_at: datetime | None = None,
+    full_sync: bool = False,
 ) -> SyncRunResult:
     return _sync_phase2_snapshot_impl(
         cfg=cfg,
@@ -628,6 +748,7 @@ def sync_phase2_snapshot(
         dry_run=dry_run,
         source=source,
         built_at=built_at,
+        full_sync=full_sync,
         deps=SyncRuntimeDeps(
             repo_root=ROOT,
             table_order=TABLE_ORDER,
@@ -641,7 +762,15 @@ def sync_phase2_snapshot(
             resolve_phase2_manifest_path=resolve_phase2_manifest_path,
             phase2_base_token=_phase2_base_token,
             phase2_identity=_phase2_identity,
-            source_factory=lambda *, cli_bin, identity: LarkCliSource(cli_bin=cli_bin, identity=identity),
+            fetch_jobs=_fetch_jobs,
+            delta_sync_enabled=_delta_sync_enabled,
+            attachment_store_root=_attachment_store_root,
+            inspect_phase2_schema=inspect_phase2_schema,
+            source_factory=lambda *, cli_bin, identity: LarkCliSource(
+                cli_bin=cli_bin,
+                identity=identity,
+                fetch_jobs=_fetch_jobs(cfg),
+            ),
             resolve_table_binding=resolve_table_binding,
             normalize_records=normalize_records,
             csv_text=_csv_text,
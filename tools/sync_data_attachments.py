@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Attachment download scheduling for phase2 sync.
+
+Feishu drive ``file_token`` values identify immutable uploads, so a shared
+store keyed by token lets every data root (and every row that reuses the same
+icon) materialize an attachment that was downloaded once. Downloads still
+land on the row's own target path first; the store keeps a private copy.
+
+The snapshot side (which lcd_icons / symbols_blocks cells carry attachments,
+where each one lands, and what path the CSV cell records afterwards) is
+planned here too, so sync_data_runtime only hands over normalized rows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from tools.sync_data_fetch import run_ordered
+
+DEFAULT_ATTACHMENT_STORE = ".tmp/sync-attachments"
+
+STATUS_PRESENT = "present"
+STATUS_REUSED = "reused"
+STATUS_DOWNLOADED = "downloaded"
+STATUS_FAILED = "failed"
+STATUS_UNAVAILABLE = "unavailable"
+
+
+@dataclass(frozen=True)
+class AttachmentJob:
+    file_token: str
+    target_path: Path
+
+
+@dataclass(frozen=True)
+class AttachmentOutcome:
+    status: str
+    error: str | None = None
+
+    @property
+    def materialized(self) -> bool:
+        return self.status in {STATUS_PRESENT, STATUS_REUSED, STATUS_DOWNLOADED}
+
+
+@dataclass
+class AttachmentStats:
+    downloaded: int = 0
+    reused: int = 0
+    present: int = 0
+    failed: int = 0
+    bytes_downloaded: int = 0
+    bytes_reused: int = 0
+
+    def as_manifest_entry(self) -> dict[str, int]:
+        return {
+            "downloaded": self.downloaded,
+            "reused": self.reused,
+            "present": self.present,
+            "failed": self.failed,
+            "bytes_downloaded": self.bytes_downloaded,
+            "bytes_reused": self.bytes_reused,
+        }
+
+
+class AttachmentStore:
+    """Content-addressed attachment copies, one file per drive ``file_token``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path_for(self, file_token: str) -> Path:
+        token = re.sub(r"[^A-Za-z0-9._-]+", "_", file_token.strip()).strip("._-") or "file"
+        return self.root / token[:2] / token
+
+    def contains(self, file_token: str) -> bool:
+        path = self.path_for(file_token)
+        return path.is_file() and path.stat().st_size > 0
+
+    def adopt(self, file_token: str, source_path: Path) -> None:
+        _atomic_copy(source_path, self.path_for(file_token))
+
+    def materialize(self, file_token: str, target_path: Path) -> int:
+        stored = self.path_for(file_token)
+        _atomic_copy(stored, target_path)
+        return stored.stat().st_size
+
+
+def _atomic_copy(source: Path, target: Path) -> None:
+    # Copies, not hard links: a later overwrite download must not rewrite the store.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_name)
+        os.replace(temp_name, target)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _run_token_jobs(
+    jobs: list[tuple[int, AttachmentJob]],
+    *,
+    store: AttachmentStore,
+    download: Callable[[str, Path], None] | None,
+) -> list[tuple[int, AttachmentOutcome, int]]:
+    """Resolve every job sharing one token; the token is downloaded at most once."""
+    results: list[tuple[int, AttachmentOutcome, int]] = []
+    download_error: str | None = None
+    for position, job in jobs:
+        if job.target_path.exists():
+            if not store.contains(job.file_token):
+                store.adopt(job.file_token, job.target_path)
+            results.append((position, AttachmentOutcome(STATUS_PRESENT), 0))
+            continue
+        if store.contains(job.file_token):
+            size = store.materialize(job.file_token, job.target_path)
+            results.append((position, AttachmentOutcome(STATUS_REUSED), size))
+            continue
+        if download is None:
+            results.append((position, AttachmentOutcome(STATUS_UNAVAILABLE), 0))
+            continue
+        if download_error is not None:
+            results.append((position, AttachmentOutcome(STATUS_FAILED, download_error), 0))
+            continue
+        try:
+            download(job.file_token, job.target_path)
+        except Exception as exc:
+            download_error = str(exc)
+            results.append((position, AttachmentOutcome(STATUS_FAILED, download_error), 0))
+            continue
+        if not job.target_path.is_file():
+            download_error = f"download produced no file at {job.target_path}"
+            results.append((position, AttachmentOutcome(STATUS_FAILED, download_error), 0))
+            continue
+        store.adopt(job.file_token, job.target_path)
+        results.append((position, AttachmentOutcome(STATUS_DOWNLOADED), job.target_path.stat().st_size))
+    return results
+
+
+def download_attachments(
+    jobs: Sequence[AttachmentJob],
+    *,
+    store: AttachmentStore,
+    download: Callable[[str, Path], None] | None,
+    max_workers: int,
+    stats: AttachmentStats,
+) -> list[AttachmentOutcome]:
+    """Materialize ``jobs`` through the store; outcomes keep job order.
+
+    Distinct tokens run concurrently; jobs that share a token run in one
+    worker so the token is fetched once and copied for the rest.
+    """
+    by_token: dict[str, list[tuple[int, AttachmentJob]]] = {}
+    for position, job in enumerate(jobs):
+        by_token.setdefault(job.file_token, []).append((position, job))
+    grouped = run_ordered(
+        [
+            lambda token_jobs=token_jobs: _run_token_jobs(token_jobs, store=store, download=download)
+            for token_jobs in by_token.values()
+        ],
+        max_workers=max_workers,
+    )
+    outcomes: list[AttachmentOutcome | None] = [None] * len(jobs)
+    for token_results in grouped:
+        for position, outcome, size in token_results:
+            outcomes[position] = outcome
+            if outcome.status == STATUS_DOWNLOADED:
+                stats.downloaded += 1
+                stats.bytes_downloaded += size
+            elif outcome.status == STATUS_REUSED:
+                stats.reused += 1
+                stats.bytes_reused += size
+            elif outcome.status == STATUS_PRESENT:
+                stats.present += 1
+            elif outcome.status == STATUS_FAILED:
+                stats.failed += 1
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def _display_path(path: Path, *, repo_root: Path) -> str:
+    return path.relative_to(repo_root).as_posix() if path.is_relative_to(repo_root) else path.as_posix()
+
+
+def _safe_filename_part(value: str, *, fallback: str) -> str:
+    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", (value or "").strip())
+    cleaned = cleaned.strip("._-")
+    return cleaned or fallback
+
+
+def _attachment_items_from_cell(value: str) -> list[dict[str, Any]]:
+    raw = (value or "").strip()
+    if not raw:
+        return []
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
+        return []
+    items = payload if isinstance(payload, list) else [payload]
+    return [item for item in items if isinstance(item, dict)]
+
+
+def _extension_from_attachment(item: dict[str, Any]) -> str:
+    name = str(item.get("name") or item.get("file_name") or "").strip()
+    suffix = Path(name).suffix.lower()
+    if suffix:
+        return suffix
+    mime_type = str(item.get("mime_type") or item.get("type") or "").strip().lower()
+    return {
+        "image/jpeg": ".jpg",
+        "image/jpg": ".jpg",
+        "image/png": ".png",
+        "image/svg+xml": ".svg",
+        "image/webp": ".webp",
+        "image/gif": ".gif",
+    }.get(mime_type, ".png")
+
+
+def _attachment_file_token(item: dict[str, Any]) -> str:
+    return str(item.get("file_token") or item.get("token") or "").strip()
+
+
+def _cached_attachment_path(target_path: Path, file_token: str) -> Path | None:
+    if target_path.exists():
+        return target_path
+
+    token_part = _safe_filename_part(file_token, fallback="file")
+    token_suffix = f"_{token_part}"
+    if not target_path.stem.endswith(token_suffix):
+        return None
+
+    prefix = target_path.stem[: -len(token_suffix)]
+    if not prefix:
+        return None
+
+    candidates = sorted(
+        candidate
+        for candidate in target_path.parent.glob(f"{prefix}_*")
+        if candidate.is_file() and candidate != target_path
+    )
+    return candidates[0] if candidates else None
+
+
+def _logical_attachment_path(path: Path) -> str:
+    # CSV cells carry the LOGICAL attachment location, not the physical export
+    # root: snapshots are materialized under arbitrary roots (the queue workers
+    # use .tmp/review-start/phase2), and a physical path baked into the snapshot
+    # is unresolvable for downstream consumers built from a different tree. The
+    # asset pipeline's contract is data/phase2/_attachments/<category>/<name>;
+    # bundle staging resolves that against whichever data root is active.
+    return f"data/phase2/_attachments/{path.parent.name}/{path.name}"
+
+
+@dataclass(frozen=True)
+class _PlannedAttachment:
+    label: str
+    row: dict[str, str]
+    columns: tuple[str, ...]
+    file_token: str
+    target_path: Path
+    missing_downloader_message: str
+
+
+def _attachment_display_path(
+    planned: _PlannedAttachment,
+    outcome: AttachmentOutcome | None,
+    *,
+    store: AttachmentStore,
+    repo_root: Path,
+) -> str:
+    target_path = planned.target_path
+    file_token = planned.file_token
+    if outcome is None:
+        # Dry run: report where the attachment would be materialized.
+        if target_path.exists() or store.contains(file_token):
+            return _logical_attachment_path(target_path)
+        return _logical_attachment_path(_cached_attachment_path(target_path, file_token) or target_path)
+
+    if outcome.materialized:
+        return _logical_attachment_path(target_path)
+
+    cached_path = _cached_attachment_path(target_path, file_token)
+    if outcome.status == STATUS_UNAVAILABLE:
+        if cached_path is not None:
+            return _logical_attachment_path(cached_path)
+        raise RuntimeError(planned.missing_downloader_message)
+
+    target_display_path = _display_path(target_path, repo_root=repo_root)
+    if cached_path is not None:
+        cached_display_path = _display_path(cached_path, repo_root=repo_root)
+        print(
+            f"[sync-data] WARNING: Failed to download {planned.label} attachment "
+            f"{file_token} to {target_display_path}: {outcome.error}. "
+            f"Using cached attachment {cached_display_path}.",
+            file=sys.stderr,
+        )
+        return _logical_attachment_path(cached_path)
+
+    print(
+        f"[sync-data] WARNING: Failed to download {planned.label} attachment "
+        f"{file_token} to {target_display_path}: {outcome.error}. "
+        "Clearing optional image reference for this row.",
+        file=sys.stderr,
+    )
+    return ""
+
+
+def _drive_file_downloader(source: Any) -> Callable[[str, Path], None] | None:
+    download_drive_file = getattr(source, "download_drive_file", None)
+    if not callable(download_drive_file):
+        return None
+
+    def download(file_token: str, output_path: Path) -> None:
+        download_drive_file(file_token=file_token, output_path=output_path, overwrite=False)
+
+    return download
+
+
+def _materialize_planned_attachments(
+    planned: list[_PlannedAttachment],
+    *,
+    store: AttachmentStore,
+    repo_root: Path,
+    source: Any,
+    dry_run: bool,
+    max_workers: int,
+) -> AttachmentStats:
+    stats = AttachmentStats()
+    outcomes: list[AttachmentOutcome | None]
+    if dry_run:
+        outcomes = [None] * len(planned)
+    else:
+        outcomes = list(
+            download_attachments(
+                [AttachmentJob(file_token=item.file_token, target_path=item.target_path) for item in planned],
+                store=store,
+                download=_drive_file_downloader(source),
+                max_workers=max_workers,
+                stats=stats,
+            )
+        )
+    for item, outcome in zip(planned, outcomes):
+        display_path = _attachment_display_path(item, outcome, store=store, repo_root=repo_root)
+        for column in item.columns:
+            item.row[column] = display_path
+    return stats
+
+
+def _lcd_icon_attachment_path(
+    row: dict[str, str],
+    item: dict[str, Any],
+    *,
+    export_root: Path,
+) -> Path | None:
+    file_token = _attachment_file_token(item)
+    if not file_token:
+        return None
+    no_part = _safe_filename_part(row.get("No.") or row.get("No") or "", fallback="row")
+    name_part = _safe_filename_part(row.get("icon_en") or "", fallback="icon")
+    token_part = _safe_filename_part(file_token, fallback="file")
+    return export_root / "_attachments" / "lcd_icons" / f"{no_part}_{name_part}_{token_part}{_extension_from_attachment(item)}"
+
+
+def _symbols_attachment_path(
+    row: dict[str, str],
+    item: dict[str, Any],
+    *,
+    export_root: Path,
+) -> Path | None:
+    file_token = _attachment_file_token(item)
+    if not file_token:
+        return None
+    order_part = _safe_filename_part(row.get("order") or "", fallback="row")
+    key_part = _safe_filename_part(row.get("symbol_key") or "", fallback="symbol")
+    token_part = _safe_filename_part(file_token, fallback="file")
+    return export_root / "_attachments" / "symbols" / f"{order_part}_{key_part}_{token_part}{_extension_from_attachment(item)}"
+
+
+def _lcd_icon_attachment_plans(rows: list[dict[str, str]], *, export_root: Path) -> list[_PlannedAttachment]:
+    planned: list[_PlannedAttachment] = []
+    for row in rows:
+        items = _attachment_items_from_cell(row.get("figure", ""))
+        if not items:
+            continue
+        target_path = _lcd_icon_attachment_path(row, items[0], export_root=export_root)
+        if target_path is None:
+            continue
+        planned.append(
+            _PlannedAttachment(
+                label="lcd_icons figure",
+                row=row,
+                columns=("figure",),
+                file_token=_attachment_file_token(items[0]),
+                target_path=target_path,
+                missing_downloader_message=(
+                    "lcd_icons figure attachments require the sync source to support drive file downloads"
+                ),
+            )
+        )
+    return planned
+
+
+def _symbols_attachment_plans(rows: list[dict[str, str]], *, export_root: Path) -> list[_PlannedAttachment]:
+    planned: list[_PlannedAttachment] = []
+    for row in rows:
+        items = _attachment_items_from_cell(row.get("Figure") or row.get("figure") or "")
+        if not items:
+            continue
+        target_path = _symbols_attachment_path(row, items[0], export_root=export_root)
+        if target_path is None:
+            continue
+        planned.append(
+            _PlannedAttachment(
+                label="symbols_blocks Figure",
+                row=row,
+                columns=("Figure", "image_path"),
+                file_token=_attachment_file_token(items[0]),
+                target_path=target_path,
+                missing_downloader_message=(
+                    "symbols_blocks Figure attachments require the sync source to support drive file downloads"
+                ),
+            )
+        )
+    return planned
+
+
+def materialize_snapshot_attachments(
+    rows_by_table: dict[str, list[dict[str, str]]],
+    *,
+    export_root: Path,
+    store_root: Path,
+    repo_root: Path,
+    source: Any,
+    dry_run: bool,
+    max_workers: int,
+) -> AttachmentStats | None:
+    """Download lcd_icons / symbols_blocks attachments and rewrite their cells.
+
+    Returns the run's stats, or None when no synced row carries an attachment.
+    """
+    plans: list[_PlannedAttachment] = []
+    if "lcd_icons" in rows_by_table:
+        plans.extend(_lcd_icon_attachment_plans(rows_by_table["lcd_icons"], export_root=export_root))
+    if "symbols_blocks" in rows_by_table:
+        plans.extend(_symbols_attachment_plans(rows_by_table["symbols_blocks"], export_root=export_root))
+    if not plans:
+        return None
+    return _materialize_planned_attachments(
+        plans,
+        store=AttachmentStore(store_root),
+        repo_root=repo_root,
+        source=source,
+        dry_run=dry_run,
+        max_workers=max_workers,
+    )
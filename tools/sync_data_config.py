@@ -12,6 +12,8 @@ from tools.spec_master_sources import (
     source_view_env_names_from_cfg,
     spec_master_sources_cfg,
 )
+from tools.sync_data_attachments import DEFAULT_ATTACHMENT_STORE
+from tools.sync_data_fetch import resolve_fetch_jobs
 
 
 def sync_phase2_cfg(cfg: dict[str, Any]) -> dict[str, Any]:
@@ -34,6 +36,20 @@ def provider_name(cfg: dict[str, Any], *, supported_providers: set[str]) -> str:
     return "lark_cli"
 
 
+def fetch_jobs(cfg: dict[str, Any]) -> int:
+    return resolve_fetch_jobs(sync_phase2_cfg(cfg).get("fetch_jobs"))
+
+
+def delta_sync_enabled(cfg: dict[str, Any]) -> bool:
+    return sync_phase2_cfg(cfg).get("delta_sync") is True
+
+
+def attachment_store_root(cfg: dict[str, Any], *, repo_root: Path) -> Path:
+    raw = str(sync_phase2_cfg(cfg).get("attachment_store") or DEFAULT_ATTACHMENT_STORE).strip()
+    path = Path(raw).expanduser()
+    return path if path.is_absolute() else repo_root / path
+
+
 def cli_bin(cfg: dict[str, Any]) -> str:
     raw = str(sync_phase2_cfg(cfg).get("cli_bin", "lark-cli")).strip()
     return raw or "lark-cli"
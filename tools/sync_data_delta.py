@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Delta fetching for phase2 sync: reuse cached raw records for unchanged tables.
+
+Per fetch request the store keeps the last raw record set (with record ids),
+each record's modification time and the table's high-water mark. A delta
+fetch lists ``record_id -> last_modified_time`` (cheap: no field payloads),
+then:
+
+- nothing modified since the high-water mark and no deletions: cached records;
+- only deletions: cached records minus the deleted ids;
+- any modified or new record: the table is fetched in full.
+
+Changed records are not fetched by id: the Open API's record search formats
+cell values differently from ``+record-list``, so merging them would break
+byte-identical CSVs. The saving is the unchanged tables a sync skips.
+
+Formula and lookup fields can change (when a referenced record or table
+changes) without bumping the record's ``last_modified_time``; such a table is
+served from the cache until one of its own records changes or ``sync-data
+--full`` runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from tools.sync_data_fetch import RecordFetchRequest
+
+DELTA_STATE_DIRNAME = ".sync_delta"
+DELTA_STATE_SCHEMA_VERSION = 1
+
+OUTCOME_FULL = "full"
+OUTCOME_CACHED = "cached"
+
+
+@dataclass(frozen=True)
+class DeltaTableState:
+    high_water_mark_ms: int
+    versions: dict[str, int]
+    field_names: tuple[str, ...] | None
+    records: list[dict[str, Any]]
+
+
+@dataclass
+class DeltaFetchReport:
+    outcomes: dict[str, str] = field(default_factory=dict)
+    changed_records: dict[str, int] = field(default_factory=dict)
+    deleted_records: dict[str, int] = field(default_factory=dict)
+
+    def as_manifest_entry(self, *, full_refresh_reason: str | None) -> dict[str, Any]:
+        entry: dict[str, Any] = {
+            "tables": {
+                key: {
+                    "outcome": outcome,
+                    "changed_records": self.changed_records.get(key, 0),
+                    "deleted_records": self.deleted_records.get(key, 0),
+                }
+                for key, outcome in sorted(self.outcomes.items())
+            }
+        }
+        if full_refresh_reason:
+            entry["full_refresh_reason"] = full_refresh_reason
+        return entry
+
+
+def delta_state_dir(manifest_path: Path) -> Path:
+    return manifest_path.parent / DELTA_STATE_DIRNAME
+
+
+def request_key(request: RecordFetchRequest) -> str:
+    return f"{request.table_id}@{request.view_id}" if request.view_id else request.table_id
+
+
+class DeltaRecordStore:
+    """One JSON state file per fetch request; writes are atomic and optional."""
+
+    def __init__(self, state_dir: Path, *, writable: bool = True) -> None:
+        self.state_dir = state_dir
+        self.writable = writable
+
+    def _path(self, request: RecordFetchRequest) -> Path:
+        digest = hashlib.sha256(
+            f"{request.base_token}\0{request.table_id}\0{request.view_id or ''}".encode("utf-8")
+        ).hexdigest()[:16]
+        return self.state_dir / f"{request.table_id}-{digest}.json"
+
+    def load(self, request: RecordFetchRequest) -> DeltaTableState | None:
+        try:
+            payload = json.loads(self._path(request).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("schema_version") != DELTA_STATE_SCHEMA_VERSION:
+            return None
+        try:
+            versions = {str(key): int(value) for key, value in payload["versions"].items()}
+            records = [record for record in payload["records"] if isinstance(record, dict)]
+            raw_field_names = payload.get("field_names")
+            field_names = tuple(str(name) for name in raw_field_names) if isinstance(raw_field_names, list) else None
+            state = DeltaTableState(
+                high_water_mark_ms=int(payload["high_water_mark_ms"]),
+                versions=versions,
+                field_names=field_names,
+                records=records,
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        # A cache whose records and versions disagree cannot be reused safely.
+        if [record.get("record_id") for record in state.records] != list(state.versions):
+            return None
+        return state
+
+    def save(self, request: RecordFetchRequest, state: DeltaTableState) -> None:
+        if not self.writable:
+            return
+        path = self._path(request)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "schema_version": DELTA_STATE_SCHEMA_VERSION,
+            "table_id": request.table_id,
+            "view_id": request.view_id,
+            "high_water_mark_ms": state.high_water_mark_ms,
+            "field_names": list(state.field_names) if state.field_names is not None else None,
+            "versions": state.versions,
+            "records": state.records,
+        }
+        temp_path = path.with_name(f"{path.name}.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+def source_supports_delta(source: Any) -> bool:
+    return callable(getattr(source, "list_record_versions", None)) and callable(
+        getattr(source, "fetch_records_with_ids", None)
+    )
+
+
+def _source_field_names(source: Any, request: RecordFetchRequest) -> tuple[str, ...] | None:
+    field_names = getattr(source, "field_names", None)
+    if not callable(field_names):
+        return None
+    return tuple(sorted(field_names(base_token=request.base_token, table_id=request.table_id)))
+
+
+def _strip_record_ids(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [{key: value for key, value in record.items() if key != "record_id"} for record in records]
+
+
+def _state_for(records: list[dict[str, Any]], versions: dict[str, int], field_names: tuple[str, ...] | None) -> DeltaTableState | None:
+    ordered_ids = [str(record.get("record_id") or "") for record in records]
+    if not all(ordered_ids) or set(ordered_ids) != set(versions) or len(ordered_ids) != len(versions):
+        # Rows changed between the version listing and the fetch; do not cache.
+        return None
+    return DeltaTableState(
+        high_water_mark_ms=max(versions.values(), default=0),
+        versions={record_id: versions[record_id] for record_id in ordered_ids},
+        field_names=field_names,
+        records=records,
+    )
+
+
+def fetch_records_delta(
+    source: Any,
+    request: RecordFetchRequest,
+    *,
+    store: DeltaRecordStore,
+    full_refresh: bool,
+    report: DeltaFetchReport,
+) -> list[dict[str, Any]]:
+    """Fetch one request through the delta cache; same records as a full fetch."""
+    key = request_key(request)
+    field_names = _source_field_names(source, request)
+    versions: dict[str, int] = source.list_record_versions(
+        base_token=request.base_token,
+        table_id=request.table_id,
+        view_id=request.view_id,
+    )
+    cached = None if full_refresh else store.load(request)
+    if cached is not None and cached.field_names != field_names:
+        cached = None
+
+    records: list[dict[str, Any]] | None = None
+    outcome = OUTCOME_FULL
+    changed_count = 0
+    deleted_count = 0
+    if cached is not None:
+        changed_ids = [
+            record_id
+            for record_id, modified in versions.items()
+            if modified > cached.high_water_mark_ms or cached.versions.get(record_id) != modified
+        ]
+        deleted_ids = set(cached.versions) - set(versions)
+        changed_count, deleted_count = len(changed_ids), len(deleted_ids)
+        if not changed_ids:
+            records = [record for record in cached.records if record["record_id"] not in deleted_ids]
+            outcome = OUTCOME_CACHED
+
+    if records is None:
+        records = source.fetch_records_with_ids(
+            base_token=request.base_token,
+            table_id=request.table_id,
+            view_id=request.view_id,
+        )
+        outcome = OUTCOME_FULL
+    state = _state_for(records, versions, field_names)
+    if state is not None:
+        store.save(request, state)
+    report.outcomes[key] = outcome
+    report.changed_records[key] = changed_count
+    report.deleted_records[key] = deleted_count
+    return records if request.with_ids else _strip_record_ids(records)
+
+
+@dataclass(frozen=True)
+class DeltaSyncSession:
+    """One sync run's delta fetcher plus what it reports to the manifest."""
+
+    fetch: Callable[[RecordFetchRequest], list[dict[str, Any]]]
+    report: DeltaFetchReport
+    full_refresh_reason: str | None = None
+
+    def manifest_entry(self) -> dict[str, Any]:
+        return self.report.as_manifest_entry(full_refresh_reason=self.full_refresh_reason)
+
+
+def full_refresh_reason_for(
+    *,
+    full_sync: bool,
+    export_root: Path,
+    manifest_path: Path,
+    inspect_phase2_schema: Callable[..., list[Any]],
+) -> str | None:
+    """Why cached raw records cannot be trusted this run, or None when they can."""
+    if full_sync:
+        return "full sync requested"
+    # Cached raw records are only trusted against a healthy snapshot; any
+    # drift (or no readable previous manifest) re-fetches every table.
+    try:
+        drift_issues = inspect_phase2_schema(phase2_root=export_root, manifest_path=manifest_path)
+    except RuntimeError as exc:
+        return f"previous snapshot unreadable: {exc}"
+    if drift_issues:
+        return f"schema drift ({len(drift_issues)} issue(s)): {drift_issues[0].message}"
+    return None
+
+
+def open_delta_sync(
+    source: Any,
+    *,
+    export_root: Path,
+    manifest_path: Path,
+    full_sync: bool,
+    dry_run: bool,
+    inspect_phase2_schema: Callable[..., list[Any]],
+) -> DeltaSyncSession | None:
+    """A delta fetcher for ``source``, or None when it cannot list record versions."""
+    if not source_supports_delta(source):
+        return None
+    reason = full_refresh_reason_for(
+        full_sync=full_sync,
+        export_root=export_root,
+        manifest_path=manifest_path,
+        inspect_phase2_schema=inspect_phase2_schema,
+    )
+    report = DeltaFetchReport()
+    store = DeltaRecordStore(delta_state_dir(manifest_path), writable=not dry_run)
+
+    def fetch(request: RecordFetchRequest) -> list[dict[str, Any]]:
+        return fetch_records_delta(source, request, store=store, full_refresh=reason is not None, report=report)
+
+    return DeltaSyncSession(fetch=fetch, report=report, full_refresh_reason=reason)
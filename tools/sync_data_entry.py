@@ -19,6 +19,11 @@ def parse_args(argv: list[str] | None = None, *, table_choices: list[str]) -> ar
         help="Logical table id to sync; defaults to all content tables",
     )
     ap.add_argument("--dry-run", action="store_true", help="Validate and compare without writing CSV files")
+    ap.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the delta-sync cache and fetch every table in full (only matters with sync.phase2.delta_sync)",
+    )
     return ap.parse_args(argv)
 
 
@@ -44,6 +49,7 @@ def run_main(
             data_root=args.data_root,
             table_names=args.table,
             dry_run=args.dry_run,
+            full_sync=args.full,
         )
     except (RuntimeError, subprocess.CalledProcessError) as exc:
         print(f"[sync-data] ERROR: {exc}", file=sys.stderr)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable, Mapping, Sequence, TypeVar
+
+from tools.spec_master_sources import source_table_bindings_from_cfg
+
+DEFAULT_FETCH_JOBS = 4
+RATE_LIMIT_MAX_ATTEMPTS = 6
+RATE_LIMIT_BASE_DELAY_SECONDS = 1.0
+RATE_LIMIT_MAX_DELAY_SECONDS = 30.0
+# Feishu/Lark "request trigger frequency limit" (app level) and Bitable
+# "TooManyRequest"; matched textually too because lark-cli may only echo them.
+RATE_LIMIT_API_CODES = frozenset({99991400, 1254290})
+_RATE_LIMIT_MARKERS = ("frequency limit", "too many request", "toomanyrequest", "rate limit", "http 429", "status 429")
+
+T = TypeVar("T")
+
+
+class LarkRateLimitError(RuntimeError):
+    """A Lark CLI call was throttled and may be retried after a back-off."""
+
+
+def is_rate_limit_message(message: str) -> bool:
+    lowered = (message or "").lower()
+    return any(marker in lowered for marker in _RATE_LIMIT_MARKERS) or any(
+        str(code) in lowered for code in RATE_LIMIT_API_CODES
+    )
+
+
+def rate_limit_delay(attempt: int, *, jitter: Callable[[], float] = random.random) -> float:
+    """Exponential back-off with up to 50% jitter so parallel callers spread out."""
+    base = min(RATE_LIMIT_MAX_DELAY_SECONDS, RATE_LIMIT_BASE_DELAY_SECONDS * (2**attempt))
+    return base * (1.0 + 0.5 * jitter())
+
+
+def call_with_rate_limit_backoff(
+    call: Callable[[], T],
+    *,
+    max_attempts: int = RATE_LIMIT_MAX_ATTEMPTS,
+    sleep: Callable[[float], None] = time.sleep,
+    jitter: Callable[[], float] = random.random,
+) -> T:
+    for attempt in range(max_attempts):
+        try:
+            return call()
+        except LarkRateLimitError:
+            if attempt + 1 >= max_attempts:
+                raise
+            sleep(rate_limit_delay(attempt, jitter=jitter))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def resolve_fetch_jobs(raw: Any) -> int:
+    if raw is None:
+        return DEFAULT_FETCH_JOBS
+    if isinstance(raw, bool):
+        raise RuntimeError(f"sync.phase2.fetch_jobs must be a positive integer, got {raw!r}")
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise RuntimeError(f"sync.phase2.fetch_jobs must be a positive integer, got {raw!r}") from None
+    if value < 1:
+        raise RuntimeError(f"sync.phase2.fetch_jobs must be a positive integer, got {raw!r}")
+    return value
+
+
+def run_ordered(calls: Sequence[Callable[[], T]], *, max_workers: int) -> list[T]:
+    """Run independent calls on a thread pool; results (and the first error) keep call order."""
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls)), thread_name_prefix="sync-fetch") as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+@dataclass(frozen=True)
+class RecordFetchRequest:
+    base_token: str
+    table_id: str
+    view_id: str | None
+    with_ids: bool = False
+
+
+def fetch_record_requests(
+    source: Any,
+    requests: Sequence[RecordFetchRequest],
+    *,
+    max_workers: int,
+    fetch: Callable[[RecordFetchRequest], list[dict[str, Any]]] | None = None,
+) -> dict[RecordFetchRequest, list[dict[str, Any]]]:
+    """Fetch each distinct table request once, concurrently when ``max_workers`` > 1.
+
+    ``source`` only needs ``fetch_records`` (and ``fetch_records_with_ids`` for
+    requests that ask for record ids), so fakes of the runtime record-source
+    protocol work unchanged. ``fetch`` replaces the direct source call (delta sync).
+    """
+    unique = list(dict.fromkeys(requests))
+
+    def bind(request: RecordFetchRequest) -> Callable[[], list[dict[str, Any]]]:
+        if fetch is not None:
+            return lambda: fetch(request)
+        fetch_fn = source.fetch_records_with_ids if request.with_ids else source.fetch_records
+        return lambda: fetch_fn(
+            base_token=request.base_token,
+            table_id=request.table_id,
+            view_id=request.view_id,
+        )
+
+    records = run_ordered([bind(request) for request in unique], max_workers=max_workers)
+    return dict(zip(unique, records))
+
+
+@dataclass(frozen=True)
+class TableFetchPlan:
+    """Every record request a phase2 sync needs, grouped by logical table."""
+
+    bindings_by_table: dict[str, Any]
+    requests_by_table: dict[str, tuple[RecordFetchRequest, ...]]
+    # (rows, placeholders) source table ids when spec_master syncs from them.
+    spec_master_source_table_ids: tuple[str, str] | None = None
+    translation_memory_binding: Any | None = None
+    translation_memory_request: RecordFetchRequest | None = None
+
+    @property
+    def requests(self) -> list[RecordFetchRequest]:
+        planned = [request for requests in self.requests_by_table.values() for request in requests]
+        if self.translation_memory_request is not None:
+            planned.append(self.translation_memory_request)
+        return planned
+
+    def table_records(
+        self,
+        logical_name: str,
+        fetched: Mapping[RecordFetchRequest, list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        return [record for request in self.requests_by_table[logical_name] for record in fetched[request]]
+
+
+def plan_table_fetches(
+    cfg: dict[str, Any],
+    selected_tables: Sequence[str],
+    *,
+    table_schemas: Mapping[str, Any],
+    phase2_base_token: Callable[..., str],
+    resolve_table_binding: Callable[..., Any],
+    source_supports_ids: bool,
+    with_ids_tables: frozenset[str],
+    translation_memory_binding: Any | None = None,
+) -> TableFetchPlan:
+    """Plan every table fetch up front so independent tables are pulled together.
+
+    spec_master either syncs from its configured rows/placeholders source
+    tables (two requests) or from its own binding; manual_copy_source also
+    needs the translation memory table.
+    """
+    bindings_by_table: dict[str, Any] = {}
+    requests_by_table: dict[str, tuple[RecordFetchRequest, ...]] = {}
+    spec_master_source_table_ids: tuple[str, str] | None = None
+    for logical_name in selected_tables:
+        if logical_name == "spec_master":
+            rows_table_id, rows_view_id, placeholders_table_id, placeholders_view_id = (
+                source_table_bindings_from_cfg(cfg)
+            )
+            if rows_table_id and placeholders_table_id:
+                base_token = phase2_base_token(cfg)
+                # Fetch with record ids when the source supports it, so the
+                # source_record_index sidecar can map Spec_Master rows to record
+                # ids (F6). CSV output is unchanged because normalization
+                # consumes fields.
+                requests_by_table[logical_name] = tuple(
+                    RecordFetchRequest(
+                        base_token=base_token,
+                        table_id=table_id,
+                        view_id=view_id,
+                        with_ids=source_supports_ids,
+                    )
+                    for table_id, view_id in (
+                        (rows_table_id, rows_view_id),
+                        (placeholders_table_id, placeholders_view_id),
+                    )
+                )
+                bindings_by_table[logical_name] = SimpleNamespace(
+                    logical_name=logical_name,
+                    schema=table_schemas[logical_name],
+                    base_token=base_token,
+                    table_id="",
+                    view_id=None,
+                )
+                spec_master_source_table_ids = (rows_table_id, placeholders_table_id)
+                continue
+
+        binding = resolve_table_binding(cfg, logical_name)
+        bindings_by_table[logical_name] = binding
+        # Fetch with record ids only for tables that need them (footnotes ref
+        # mapping + the source_record_index sidecar's indexed tables, F1). CSV
+        # output is unchanged because normalization only consumes record fields.
+        requests_by_table[logical_name] = (
+            RecordFetchRequest(
+                base_token=binding.base_token,
+                table_id=binding.table_id,
+                view_id=binding.view_id,
+                with_ids=source_supports_ids and logical_name in with_ids_tables,
+            ),
+        )
+
+    tm_binding: Any | None = None
+    tm_request: RecordFetchRequest | None = None
+    if "manual_copy_source" in requests_by_table:
+        tm_binding = translation_memory_binding or resolve_table_binding(cfg, "translation_memory")
+        tm_request = RecordFetchRequest(
+            base_token=tm_binding.base_token,
+            table_id=tm_binding.table_id,
+            view_id=tm_binding.view_id,
+        )
+    return TableFetchPlan(
+        bindings_by_table=bindings_by_table,
+        requests_by_table=requests_by_table,
+        spec_master_source_table_ids=spec_master_source_table_ids,
+        translation_memory_binding=tm_binding,
+        translation_memory_request=tm_request,
+    )
+
+
+@dataclass(frozen=True)
+class RecordPage:
+    records: list[dict[str, Any]]
+    has_more: bool
+    total: int | None
+
+
+def collect_record_pages(
+    fetch_page: Callable[[int], RecordPage],
+    *,
+    first_page: RecordPage,
+    limit: int,
+    max_workers: int,
+) -> list[dict[str, Any]]:
+    """Collect every record after ``first_page`` in offset order.
+
+    When the first page is full and reports ``total``, the remaining offsets are
+    independent and fetched concurrently; anything that does not line up (a
+    short middle page, rows appended meanwhile) falls back to sequential
+    paging from the last consistent offset, so the result never depends on
+    completion order.
+    """
+    if first_page.has_more and not first_page.records:
+        raise RuntimeError("Lark CLI record list response signaled pagination without rows")
+    records = list(first_page.records)
+    has_more = first_page.has_more
+    total = first_page.total
+    if (
+        has_more
+        and max_workers > 1
+        and total is not None
+        and len(first_page.records) == limit
+        and total > limit
+    ):
+        offsets = list(range(limit, total, limit))
+        pages = run_ordered([lambda offset=offset: fetch_page(offset) for offset in offsets], max_workers=max_workers)
+        for page in pages:
+            records.extend(page.records)
+            has_more = page.has_more
+            if len(page.records) != limit and page is not pages[-1]:
+                # The table shrank mid-fetch: redo the tail sequentially.
+                records = records[: len(first_page.records)]
+                has_more = True
+                break
+    while has_more:
+        page = fetch_page(len(records))
+        if not page.records:
+            if page.has_more:
+                raise RuntimeError("Lark CLI record list response signaled pagination without rows")
+            break
+        records.extend(page.records)
+        has_more = page.has_more
+    return records
@@ -6,21 +6,20 @@ from __future__ import annotations
 import csv
 import io
 import json
-import re
-import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from types import SimpleNamespace
 from typing import Any, Callable, ContextManager, Mapping, Protocol
 
+from tools.sync_data_attachments import materialize_snapshot_attachments
+from tools.sync_data_delta import open_delta_sync
 from tools.sync_data_derived import collect_derived_snapshot_writes
+from tools.sync_data_fetch import fetch_record_requests, plan_table_fetches
 
 from tools.spec_master_sources import (
     collect_footnote_record_id_refs,
     normalize_footnote_ref_value,
     normalize_spec_master_source_rows,
-    source_table_bindings_from_cfg,
 )
 from tools.manual_copy_source import (
     LOCALIZED_COPY_COLUMNS,
@@ -86,17 +85,6 @@ class _RecordSourceWithIdsLike(_RecordSourceLike, Protocol):
         ...
 
 
-class _DriveFileDownloaderLike(_RecordSourceLike, Protocol):
-    def download_drive_file(
-        self,
-        *,
-        file_token: str,
-        output_path: Path,
-        overwrite: bool = False,
-    ) -> None:
-        ...
-
-
 class _TableSyncResultLike(Protocol):
     logical_name: str
     file_name: str
@@ -121,6 +109,10 @@ class SyncRuntimeDeps:
     resolve_phase2_manifest_path: Callable[..., Path]
     phase2_base_token: Callable[..., str]
     phase2_identity: Callable[..., str]
+    fetch_jobs: Callable[..., int]
+    delta_sync_enabled: Callable[..., bool]
+    attachment_store_root: Callable[..., Path]
+    inspect_phase2_schema: Callable[..., list[Any]]
     source_factory: Callable[..., _RecordSourceLike]
     resolve_table_binding: Callable[..., _BindingLike]
     normalize_records: Callable[..., list[dict[str, str]]]
@@ -178,6 +170,8 @@ def manifest_payload(
     dry_run: bool,
     repo_root: Path,
     warnings: tuple[dict[str, Any], ...] = (),
+    delta_sync: dict[str, Any] | None = None,
+    attachments: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     def _result_entry(result: _TableSyncResultLike) -> dict[str, Any]:
         return {
@@ -204,6 +198,10 @@ def manifest_payload(
     }
     if warnings:
         payload["warnings"] = list(warnings)
+    if delta_sync is not None:
+        payload["delta_sync"] = delta_sync
+    if attachments is not None:
+        payload["attachments"] = attachments
     return payload
 
 
@@ -250,219 +248,6 @@ def _csv_data_row_count(csv_text: str) -> int:
     return max(len(rows) - 1, 0) if rows else 0
 
 
-def _drive_file_downloader(source: _RecordSourceLike) -> _DriveFileDownloaderLike | None:
-    download_drive_file = getattr(source, "download_drive_file", None)
-    if not callable(download_drive_file):
-        return None
-    return source  # type: ignore[return-value]
-
-
-def _safe_filename_part(value: str, *, fallback: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "_", (value or "").strip())
-    cleaned = cleaned.strip("._-")
-    return cleaned or fallback
-
-
-def _attachment_items_from_cell(value: str) -> list[dict[str, Any]]:
-    raw = (value or "").strip()
-    if not raw:
-        return []
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
-        return []
-    items = payload if isinstance(payload, list) else [payload]
-    return [item for item in items if isinstance(item, dict)]
-
-
-def _extension_from_attachment(item: dict[str, Any]) -> str:
-    name = str(item.get("name") or item.get("file_name") or "").strip()
-    suffix = Path(name).suffix.lower()
-    if suffix:
-        return suffix
-    mime_type = str(item.get("mime_type") or item.get("type") or "").strip().lower()
-    return {
-        "image/jpeg": ".jpg",
-        "image/jpg": ".jpg",
-        "image/png": ".png",
-        "image/svg+xml": ".svg",
-        "image/webp": ".webp",
-        "image/gif": ".gif",
-    }.get(mime_type, ".png")
-
-
-def _attachment_file_token(item: dict[str, Any]) -> str:
-    return str(item.get("file_token") or item.get("token") or "").strip()
-
-
-def _cached_attachment_path(target_path: Path, file_token: str) -> Path | None:
-    if target_path.exists():
-        return target_path
-
-    token_part = _safe_filename_part(file_token, fallback="file")
-    token_suffix = f"_{token_part}"
-    if not target_path.stem.endswith(token_suffix):
-        return None
-
-    prefix = target_path.stem[: -len(token_suffix)]
-    if not prefix:
-        return None
-
-    candidates = sorted(
-        candidate
-        for candidate in target_path.parent.glob(f"{prefix}_*")
-        if candidate.is_file() and candidate != target_path
-    )
-    return candidates[0] if candidates else None
-
-
-def _logical_attachment_path(path: Path) -> str:
-    # CSV cells carry the LOGICAL attachment location, not the physical export
-    # root: snapshots are materialized under arbitrary roots (the queue workers
-    # use .tmp/review-start/phase2), and a physical path baked into the snapshot
-    # is unresolvable for downstream consumers built from a different tree. The
-    # asset pipeline's contract is data/phase2/_attachments/<category>/<name>;
-    # bundle staging resolves that against whichever data root is active.
-    return f"data/phase2/_attachments/{path.parent.name}/{path.name}"
-
-
-def _materialized_attachment_display_path(
-    *,
-    label: str,
-    item: dict[str, Any],
-    target_path: Path,
-    repo_root: Path,
-    source: _RecordSourceLike,
-    dry_run: bool,
-    missing_downloader_message: str,
-) -> str:
-    file_token = _attachment_file_token(item)
-    cached_path = _cached_attachment_path(target_path, file_token)
-    if dry_run:
-        return _logical_attachment_path(cached_path or target_path)
-
-    if cached_path == target_path:
-        return _logical_attachment_path(target_path)
-
-    downloader = _drive_file_downloader(source)
-    if downloader is None:
-        if cached_path is not None:
-            return _logical_attachment_path(cached_path)
-        raise RuntimeError(missing_downloader_message)
-
-    try:
-        downloader.download_drive_file(
-            file_token=file_token,
-            output_path=target_path,
-            overwrite=False,
-        )
-    except Exception as exc:
-        target_display_path = _display_path(target_path, repo_root=repo_root)
-        if cached_path is not None:
-            cached_display_path = _display_path(cached_path, repo_root=repo_root)
-            print(
-                f"[sync-data] WARNING: Failed to download {label} attachment "
-                f"{file_token} to {target_display_path}: {exc}. "
-                f"Using cached attachment {cached_display_path}.",
-                file=sys.stderr,
-            )
-            return _logical_attachment_path(cached_path)
-
-        print(
-            f"[sync-data] WARNING: Failed to download {label} attachment "
-            f"{file_token} to {target_display_path}: {exc}. "
-            "Clearing optional image reference for this row.",
-            file=sys.stderr,
-        )
-        return ""
-
-    return _logical_attachment_path(target_path)
-
-
-def _lcd_icon_attachment_path(
-    row: dict[str, str],
-    item: dict[str, Any],
-    *,
-    export_root: Path,
-) -> Path | None:
-    file_token = _attachment_file_token(item)
-    if not file_token:
-        return None
-    no_part = _safe_filename_part(row.get("No.") or row.get("No") or "", fallback="row")
-    name_part = _safe_filename_part(row.get("icon_en") or "", fallback="icon")
-    token_part = _safe_filename_part(file_token, fallback="file")
-    return export_root / "_attachments" / "lcd_icons" / f"{no_part}_{name_part}_{token_part}{_extension_from_attachment(item)}"
-
-
-def _symbols_attachment_path(
-    row: dict[str, str],
-    item: dict[str, Any],
-    *,
-    export_root: Path,
-) -> Path | None:
-    file_token = _attachment_file_token(item)
-    if not file_token:
-        return None
-    order_part = _safe_filename_part(row.get("order") or "", fallback="row")
-    key_part = _safe_filename_part(row.get("symbol_key") or "", fallback="symbol")
-    token_part = _safe_filename_part(file_token, fallback="file")
-    return export_root / "_attachments" / "symbols" / f"{order_part}_{key_part}_{token_part}{_extension_from_attachment(item)}"
-
-
-def _materialize_lcd_icon_attachments(
-    rows: list[dict[str, str]],
-    *,
-    export_root: Path,
-    repo_root: Path,
-    source: _RecordSourceLike,
-    dry_run: bool,
-) -> None:
-    for row in rows:
-        items = _attachment_items_from_cell(row.get("figure", ""))
-        if not items:
-            continue
-        target_path = _lcd_icon_attachment_path(row, items[0], export_root=export_root)
-        if target_path is None:
-            continue
-        row["figure"] = _materialized_attachment_display_path(
-            label="lcd_icons figure",
-            item=items[0],
-            target_path=target_path,
-            repo_root=repo_root,
-            source=source,
-            dry_run=dry_run,
-            missing_downloader_message="lcd_icons figure attachments require the sync source to support drive file downloads",
-        )
-
-
-def _materialize_symbols_attachments(
-    rows: list[dict[str, str]],
-    *,
-    export_root: Path,
-    repo_root: Path,
-    source: _RecordSourceLike,
-    dry_run: bool,
-) -> None:
-    for row in rows:
-        items = _attachment_items_from_cell(row.get("Figure") or row.get("figure") or "")
-        if not items:
-            continue
-        target_path = _symbols_attachment_path(row, items[0], export_root=export_root)
-        if target_path is None:
-            continue
-        display_path = _materialized_attachment_display_path(
-            label="symbols_blocks Figure",
-            item=items[0],
-            target_path=target_path,
-            repo_root=repo_root,
-            source=source,
-            dry_run=dry_run,
-            missing_downloader_message="symbols_blocks Figure attachments require the sync source to support drive file downloads",
-        )
-        row["Figure"] = display_path
-        row["image_path"] = display_path
-
-
 def sync_phase2_snapshot(
     *,
     cfg: dict[str, Any],
@@ -472,6 +257,7 @@ def sync_phase2_snapshot(
     dry_run: bool = False,
     source: _RecordSourceLike | None = None,
     built_at: datetime | None = None,
+    full_sync: bool = False,
     deps: SyncRuntimeDeps,
 ) -> Any:
     del config_path
@@ -504,67 +290,60 @@ def sync_phase2_snapshot(
     derived_results: list[Any] = []
     warnings: list[dict[str, Any]] = []
     written_files: list[tuple[Path, str]] = []
-    bindings_by_table: dict[str, _BindingLike] = {}
     raw_records_by_table: dict[str, list[dict[str, Any]]] = {}
     normalized_rows_by_table: dict[str, list[dict[str, str]]] = {}
 
-    for logical_name in selected_tables:
-        source_with_ids = _record_source_with_ids(resolved_source)
-        (
-            spec_rows_source_table_id,
-            spec_rows_source_view_id,
-            placeholders_source_table_id,
-            placeholders_source_view_id,
-        ) = (
-            source_table_bindings_from_cfg(cfg)
-            if logical_name == "spec_master"
-            else ("", None, "", None)
+    # Plan every table fetch first so independent tables (and the two
+    # spec_master source tables) are pulled concurrently; rows are assembled
+    # afterwards in plan order, so CSV output never depends on timing.
+    fetch_plan = plan_table_fetches(
+        cfg,
+        selected_tables,
+        table_schemas=deps.table_schemas,
+        phase2_base_token=deps.phase2_base_token,
+        resolve_table_binding=deps.resolve_table_binding,
+        source_supports_ids=_record_source_with_ids(resolved_source) is not None,
+        with_ids_tables=_WITH_ID_LOGICAL_TABLES,
+        translation_memory_binding=translation_memory_binding,
+    )
+    bindings_by_table = fetch_plan.bindings_by_table
+    delta_sync = (
+        open_delta_sync(
+            resolved_source,
+            export_root=export_root,
+            manifest_path=manifest_path,
+            full_sync=full_sync,
+            dry_run=dry_run,
+            inspect_phase2_schema=deps.inspect_phase2_schema,
         )
-        if logical_name == "spec_master" and spec_rows_source_table_id and placeholders_source_table_id:
-            base_token = deps.phase2_base_token(cfg)
+        if deps.delta_sync_enabled(cfg)
+        else None
+    )
+    fetched_records = fetch_record_requests(
+        resolved_source,
+        fetch_plan.requests,
+        max_workers=deps.fetch_jobs(cfg),
+        fetch=delta_sync.fetch if delta_sync is not None else None,
+    )
+
+    for logical_name in selected_tables:
+        binding = bindings_by_table[logical_name]
+        raw_records = fetch_plan.table_records(logical_name, fetched_records)
+        raw_records_by_table[logical_name] = raw_records
+        if logical_name == "spec_master" and fetch_plan.spec_master_source_table_ids is not None:
             append_missing_columns_warning_for_sources(
                 warnings,
                 logical_name=logical_name,
                 schema=deps.table_schemas[logical_name],
                 source=resolved_source,
-                base_token=base_token,
-                table_ids=(spec_rows_source_table_id, placeholders_source_table_id),
-            )
-            # Fetch with record ids when the source supports it, so the
-            # source_record_index sidecar can map Spec_Master rows to record ids
-            # (F6). CSV output is unchanged because normalization consumes fields.
-            spec_fetch = (
-                source_with_ids.fetch_records_with_ids
-                if source_with_ids is not None
-                else resolved_source.fetch_records
-            )
-            raw_records = [
-                *spec_fetch(
-                    base_token=base_token,
-                    table_id=spec_rows_source_table_id,
-                    view_id=spec_rows_source_view_id,
-                ),
-                *spec_fetch(
-                    base_token=base_token,
-                    table_id=placeholders_source_table_id,
-                    view_id=placeholders_source_view_id,
-                ),
-            ]
-            bindings_by_table[logical_name] = SimpleNamespace(
-                logical_name=logical_name,
-                schema=deps.table_schemas[logical_name],
-                base_token=base_token,
-                table_id="",
-                view_id=None,
+                base_token=binding.base_token,
+                table_ids=fetch_plan.spec_master_source_table_ids,
             )
-            raw_records_by_table[logical_name] = raw_records
             normalized_rows = deps.normalize_records(deps.table_schemas[logical_name], raw_records)
             normalize_spec_master_source_rows(normalized_rows)
             normalized_rows_by_table[logical_name] = normalized_rows
             continue
 
-        binding = deps.resolve_table_binding(cfg, logical_name)
-        bindings_by_table[logical_name] = binding
         append_missing_columns_warning(
             warnings,
             logical_name=logical_name,
@@ -573,22 +352,6 @@ def sync_phase2_snapshot(
             base_token=binding.base_token,
             table_id=binding.table_id,
         )
-        # Fetch with record ids only for tables that need them (footnotes ref
-        # mapping + the source_record_index sidecar's indexed tables, F1). CSV
-        # output is unchanged because normalization only consumes record fields.
-        if logical_name in _WITH_ID_LOGICAL_TABLES and source_with_ids is not None:
-            raw_records = source_with_ids.fetch_records_with_ids(
-                base_token=binding.base_token,
-                table_id=binding.table_id,
-                view_id=binding.view_id,
-            )
-        else:
-            raw_records = resolved_source.fetch_records(
-                base_token=binding.base_token,
-                table_id=binding.table_id,
-                view_id=binding.view_id,
-            )
-        raw_records_by_table[logical_name] = raw_records
         normalized_rows = deps.normalize_records(binding.schema, raw_records)
         normalized_rows_by_table[logical_name] = normalized_rows
 
@@ -624,27 +387,19 @@ def sync_phase2_snapshot(
                 + ", ".join(unresolved_record_refs[:10])
             )
 
-    if "lcd_icons" in normalized_rows_by_table:
-        _materialize_lcd_icon_attachments(
-            normalized_rows_by_table["lcd_icons"],
-            export_root=export_root,
-            repo_root=deps.repo_root,
-            source=resolved_source,
-            dry_run=dry_run,
-        )
-
-    if "symbols_blocks" in normalized_rows_by_table:
-        _materialize_symbols_attachments(
-            normalized_rows_by_table["symbols_blocks"],
-            export_root=export_root,
-            repo_root=deps.repo_root,
-            source=resolved_source,
-            dry_run=dry_run,
-        )
+    attachment_stats = materialize_snapshot_attachments(
+        normalized_rows_by_table,
+        export_root=export_root,
+        store_root=deps.attachment_store_root(cfg),
+        repo_root=deps.repo_root,
+        source=resolved_source,
+        dry_run=dry_run,
+        max_workers=deps.fetch_jobs(cfg),
+    )
 
     translation_memory_rows: list[dict[str, str]] | None = None
-    if "manual_copy_source" in normalized_rows_by_table:
-        tm_binding = translation_memory_binding or deps.resolve_table_binding(cfg, "translation_memory")
+    tm_binding = fetch_plan.translation_memory_binding
+    if tm_binding is not None and fetch_plan.translation_memory_request is not None:
         append_missing_columns_warning(
             warnings,
             logical_name="translation_memory",
@@ -653,14 +408,9 @@ def sync_phase2_snapshot(
             base_token=tm_binding.base_token,
             table_id=tm_binding.table_id,
         )
-        tm_raw_records = resolved_source.fetch_records(
-            base_token=tm_binding.base_token,
-            table_id=tm_binding.table_id,
-            view_id=tm_binding.view_id,
-        )
         translation_memory_rows = deps.normalize_records(
             deps.table_schemas["translation_memory"],
-            tm_raw_records,
+            fetched_records[fetch_plan.translation_memory_request],
         )
 
     for logical_name in selected_tables:
@@ -867,6 +617,8 @@ def sync_phase2_snapshot(
         dry_run=dry_run,
         repo_root=deps.repo_root,
         warnings=tuple(warnings),
+        delta_sync=delta_sync.manifest_entry() if delta_sync is not None else None,
+        attachments=attachment_stats.as_manifest_entry() if attachment_stats is not None and not dry_run else None,
     )
 
     if not dry_run:
@@ -14,11 +14,12 @@ and CI-friendly.
 
 from __future__ import annotations
 
-import csv
 import re
 from pathlib import Path
 from typing import Any
 
+from tools.utils.csv_table_cache import read_cached_csv_rows
+
 SPEC_MASTER_FILE = "Spec_Master.csv"
 LOCALIZED_COPY_FILE = "Localized_Copy.csv"
 SPEC_MASTER_TABLE = "Spec_Master"
@@ -35,10 +36,7 @@ def _normalize(text: str | None) -> str:
 
 
 def _read_csv(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-    with path.open(newline="", encoding="utf-8-sig") as handle:
-        return list(csv.DictReader(handle))
+    return read_cached_csv_rows(path)
 
 
 def _page_tokens(value: str | None) -> set[str]:
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-import csv
 import json
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from tools.build_paths import load_config
-from tools.data_snapshot import resolve_data_snapshot_paths, resolve_phase2_export_root
+from tools.data_snapshot import (
+    resolve_data_snapshot_paths,
+    resolve_phase2_export_root,
+    resolve_phase2_manifest_path,
+)
+from tools.utils.csv_table_cache import read_cached_csv_rows
 from tools.utils.spec_master_row_helpers import multi_value_tokens
 
+if TYPE_CHECKING:
+    from tools.translation_memory_index import TranslationMemoryIndex
+
 LANGUAGE_ALIASES = {
     "cn": "zh",
     "de": "de",
@@ -137,7 +144,9 @@ def build_translation_memory_payload(
     row_key: str | None = None,
     limit: int = 10,
 ) -> dict[str, Any]:
-    entries, snapshot_root = collect_translation_memory_entries(
+    from tools.translation_memory_index import load_translation_memory_index
+
+    index, snapshot_root = load_translation_memory_index(
         config_path=config_path,
         repo_root=repo_root,
         data_root=data_root,
@@ -145,7 +154,7 @@ def build_translation_memory_payload(
         region=region,
     )
     matched = query_translation_memory_entries(
-        entries,
+        index,
         query_text=query_text,
         preferred_lang=preferred_lang,
         tables=tables,
@@ -192,6 +201,86 @@ def render_translation_memory_payload(payload: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@dataclass(frozen=True)
+class TranslationMemorySegment:
+    """Entries read from one snapshot table; ``paths`` are every file it reads."""
+
+    name: str
+    paths: tuple[Path, ...]
+    collect: Callable[[], list[TranslationMemoryEntry]]
+
+
+def translation_memory_segments(
+    *,
+    config_path: Path,
+    repo_root: Path,
+    data_root: str | Path | None = None,
+    model: str | None = None,
+    region: str | None = None,
+) -> tuple[list[TranslationMemorySegment], Path, Path]:
+    """Return the TM segments plus the phase2 root and its snapshot manifest path."""
+    cfg = load_config(config_path)
+    dimensions: dict[str, Any] = {"repo_root": repo_root, "data_root": data_root, "model": model, "region": region}
+    snapshot_paths = resolve_data_snapshot_paths(cfg, **dimensions)
+    phase2_root = resolve_phase2_export_root(cfg, **dimensions)
+    manifest_path = resolve_phase2_manifest_path(cfg, **dimensions)
+    row_key_mapping_csv = snapshot_paths.row_key_mapping_csv
+    symbols_csv = phase2_root / "symbols_blocks.csv"
+    segments = [
+        TranslationMemorySegment(
+            "spec-master",
+            (snapshot_paths.spec_master_csv, row_key_mapping_csv),
+            lambda: _iter_spec_master_entries(
+                snapshot_paths.spec_master_csv,
+                model=model,
+                region=region,
+                row_key_aliases=_load_row_key_aliases(row_key_mapping_csv),
+            ),
+        ),
+        TranslationMemorySegment(
+            "spec-titles",
+            (snapshot_paths.spec_titles_csv,),
+            lambda: _iter_spec_title_entries(snapshot_paths.spec_titles_csv),
+        ),
+        TranslationMemorySegment(
+            "spec-notes",
+            (snapshot_paths.spec_notes_csv,),
+            lambda: _iter_note_like_entries(
+                snapshot_paths.spec_notes_csv, table="spec-notes", id_field="Note_id", model=model, region=region
+            ),
+        ),
+        TranslationMemorySegment(
+            "spec-footnotes",
+            (snapshot_paths.spec_footnotes_csv,),
+            lambda: _iter_note_like_entries(
+                snapshot_paths.spec_footnotes_csv,
+                table="spec-footnotes",
+                id_field="Footnote_id",
+                model=model,
+                region=region,
+            ),
+        ),
+        TranslationMemorySegment(
+            "symbols-blocks",
+            (symbols_csv,),
+            lambda: _iter_symbol_entries(symbols_csv, model=model, region=region),
+        ),
+    ]
+    return segments, phase2_root, manifest_path
+
+
+def sorted_translation_memory_entries(
+    entries: list[TranslationMemoryEntry],
+    *,
+    phase2_root: Path,
+) -> list[TranslationMemoryEntry]:
+    if not entries:
+        raise RuntimeError(
+            f"No translation-memory entries were found under {phase2_root}. Run sync-data first or check the snapshot root."
+        )
+    return sorted(entries, key=_default_sort_key)
+
+
 def collect_translation_memory_entries(
     *,
     config_path: Path,
@@ -200,53 +289,19 @@ def collect_translation_memory_entries(
     model: str | None = None,
     region: str | None = None,
 ) -> tuple[list[TranslationMemoryEntry], Path]:
-    cfg = load_config(config_path)
-    snapshot_paths = resolve_data_snapshot_paths(
-        cfg,
-        repo_root=repo_root,
-        data_root=data_root,
-        model=model,
-        region=region,
-    )
-    phase2_root = resolve_phase2_export_root(
-        cfg,
+    segments, phase2_root, _ = translation_memory_segments(
+        config_path=config_path,
         repo_root=repo_root,
         data_root=data_root,
         model=model,
         region=region,
     )
-    row_key_aliases = _load_row_key_aliases(snapshot_paths.row_key_mapping_csv)
-    entries: list[TranslationMemoryEntry] = []
-    entries.extend(
-        _iter_spec_master_entries(
-            snapshot_paths.spec_master_csv,
-            model=model,
-            region=region,
-            row_key_aliases=row_key_aliases,
-        )
-    )
-    entries.extend(_iter_spec_title_entries(snapshot_paths.spec_titles_csv))
-    entries.extend(_iter_note_like_entries(snapshot_paths.spec_notes_csv, table="spec-notes", id_field="Note_id", model=model, region=region))
-    entries.extend(
-        _iter_note_like_entries(
-            snapshot_paths.spec_footnotes_csv,
-            table="spec-footnotes",
-            id_field="Footnote_id",
-            model=model,
-            region=region,
-        )
-    )
-    entries.extend(_iter_symbol_entries(phase2_root / "symbols_blocks.csv", model=model, region=region))
-    if not entries:
-        raise RuntimeError(
-            f"No translation-memory entries were found under {phase2_root}. Run sync-data first or check the snapshot root."
-        )
-    entries.sort(key=_default_sort_key)
-    return entries, phase2_root
+    entries = [entry for segment in segments for entry in segment.collect()]
+    return sorted_translation_memory_entries(entries, phase2_root=phase2_root), phase2_root
 
 
 def query_translation_memory_entries(
-    entries: list[TranslationMemoryEntry],
+    entries: list[TranslationMemoryEntry] | TranslationMemoryIndex,
     *,
     query_text: str | None = None,
     preferred_lang: str | None = None,
@@ -258,71 +313,21 @@ def query_translation_memory_entries(
     row_key: str | None = None,
     limit: int = 10,
 ) -> list[TranslationMemoryEntry]:
-    normalized_query = _normalize_text(query_text)
-    preferred_lang_code = normalize_language(preferred_lang)
-    source_lang_code = normalize_language(source_lang)
-    target_lang_code = normalize_language(target_lang)
-    table_filters = normalize_tables(tables)
-    page_filter = _normalize_text(page)
-    section_filter = _normalize_text(section)
-    row_key_filter = _normalize_text(row_key)
-    query_tokens = _tokenize(query_text)
-    ranked: list[tuple[int, int, TranslationMemoryEntry]] = []
-
-    for index, entry in enumerate(entries):
-        if table_filters and entry.table not in table_filters:
-            continue
-        if page_filter and _normalize_text(entry.page) != page_filter:
-            continue
-        if section_filter and _normalize_text(entry.section) != section_filter:
-            continue
-        if row_key_filter and _normalize_text(entry.row_key) != row_key_filter:
-            continue
-        if source_lang_code and not entry.translations.get(source_lang_code):
-            continue
-        if target_lang_code and not entry.translations.get(target_lang_code):
-            continue
+    """Rank entries for a query; pass a reused index when issuing many queries."""
+    from tools.translation_memory_index import TranslationMemoryIndex
 
-        score = 0
-        searchable_values = _entry_searchable_values(entry)
-        search_blob = " ".join(searchable_values)
-        source_blob = _normalize_text(entry.translations.get(source_lang_code)) if source_lang_code else ""
-        target_blob = _normalize_text(entry.translations.get(target_lang_code)) if target_lang_code else ""
-        source_token_hits = 0
-
-        if normalized_query:
-            if source_blob and normalized_query == source_blob:
-                score += 180
-            elif normalized_query == _normalize_text(entry.source_text):
-                score += 120
-            if normalized_query == _normalize_text(entry.row_key):
-                score += 110
-            if any(normalized_query == _normalize_text(value) for value in entry.translations.values()):
-                score += 110
-            if source_blob and normalized_query in source_blob:
-                score += 60
-            if normalized_query in search_blob:
-                score += 40
-            if source_blob:
-                source_token_hits = sum(1 for token in query_tokens if token in source_blob)
-                score += source_token_hits * 12
-            token_hits = sum(1 for token in query_tokens if token in search_blob)
-            if token_hits == 0:
-                continue
-            score += token_hits * 8
-            if query_tokens and token_hits == len(query_tokens):
-                score += 24
-        if preferred_lang_code and entry.translations.get(preferred_lang_code):
-            score += 12
-        if target_lang_code and target_blob:
-            score += 12
-        if source_lang_code and source_token_hits:
-            score += 10
-        ranked.append((score, index, entry))
-
-    ranked.sort(key=lambda item: (-item[0], item[1]))
-    capped_limit = max(limit, 1)
-    return [entry for _, _, entry in ranked[:capped_limit]]
+    index = entries if isinstance(entries, TranslationMemoryIndex) else TranslationMemoryIndex(entries)
+    return index.query(
+        query_text=query_text,
+        preferred_lang=preferred_lang,
+        source_lang=source_lang,
+        target_lang=target_lang,
+        tables=tables,
+        page=page,
+        section=section,
+        row_key=row_key,
+        limit=limit,
+    )
 
 
 def _iter_spec_master_entries(
@@ -599,10 +604,7 @@ def _load_row_key_aliases(path: Path) -> dict[str, list[str]]:
 
 
 def _read_csv_rows(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        return list(csv.DictReader(handle))
+    return read_cached_csv_rows(path)
 
 
 def _dimension_matches(row_value: str, target: str | None) -> bool:
@@ -679,6 +681,8 @@ def _render_entry(entry: dict[str, Any], *, index: int, preferred_lang: str | No
     heading = f"## {index}. {entry.get('table')} / {entry.get('entry_type')}"
     lines = ["", heading]
     lines.append(f"- source: `{entry.get('source_text')}` (`{entry.get('source_lang')}`)")
+    if entry.get("match_percent") is not None:
+        lines.append(f"- fuzzy match: `{entry['match_percent']}%` on `{entry.get('matched_text')}`")
     translations = entry.get("translations") or {}
     ordered_languages: list[str] = []
     if preferred_lang and preferred_lang in translations:
@@ -0,0 +1,173 @@
+"""Fuzzy (edit-distance) translation-memory matches with CAT-style percentages.
+
+Each source language gets a character n-gram index over the normalized source
+texts; a segment is only verified against the shortlisted entries with a
+bounded Levenshtein distance (see ``tools.utils.fuzzy_match``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+from tools.translation_memory import (
+    TranslationMemoryEntry,
+    _clean,
+    _display_path,
+    _normalize_text,
+    normalize_language,
+    normalize_tables,
+    split_translation_units,
+)
+from tools.translation_memory_index import load_translation_memory_index
+from tools.utils.fuzzy_match import NGramIndex, normalize_fuzzy_text
+
+DEFAULT_FUZZY_MIN_SIMILARITY = 75
+
+
+@dataclass(frozen=True)
+class FuzzyTranslationMatch:
+    entry: TranslationMemoryEntry
+    similarity: int
+    matched_text: str
+    # The entry's position in the TM's default order (ties, de-duplication).
+    position: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**self.entry.to_dict(), "match_percent": self.similarity, "matched_text": self.matched_text}
+
+
+class FuzzyTranslationMemory:
+    def __init__(self, entries: Sequence[TranslationMemoryEntry]) -> None:
+        self.entries = list(entries)
+        self._indexes: dict[str, NGramIndex] = {}
+
+    def _source_text(self, entry: TranslationMemoryEntry, source_lang: str | None) -> str:
+        return entry.translations.get(source_lang, "") if source_lang else entry.source_text
+
+    def _index_for(self, source_lang: str | None) -> NGramIndex:
+        key = source_lang or ""
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = NGramIndex(
+                (position, self._source_text(entry, source_lang)) for position, entry in enumerate(self.entries)
+            )
+        return index
+
+    def match(
+        self,
+        segment: str,
+        *,
+        source_lang: str | None = None,
+        target_lang: str | None = None,
+        tables: list[str] | tuple[str, ...] = (),
+        page: str | None = None,
+        section: str | None = None,
+        row_key: str | None = None,
+        min_similarity: int = DEFAULT_FUZZY_MIN_SIMILARITY,
+        limit: int = 5,
+    ) -> list[FuzzyTranslationMatch]:
+        """Entries whose source text scores ``min_similarity``+ against ``segment``.
+
+        Best match first; equal scores keep the TM's default entry order.
+        """
+        source_lang_code = normalize_language(source_lang)
+        target_lang_code = normalize_language(target_lang)
+        table_filters = normalize_tables(tables)
+        filters = {"page": _normalize_text(page), "section": _normalize_text(section), "row_key": _normalize_text(row_key)}
+        threshold = min(max(int(min_similarity), 1), 100)
+        found: list[tuple[int, int, int, TranslationMemoryEntry]] = []
+        for candidate in self._index_for(source_lang_code).search(segment, min_similarity=threshold):
+            position = int(candidate.key)  # type: ignore[call-overload]
+            entry = self.entries[position]
+            if table_filters and entry.table not in table_filters:
+                continue
+            if target_lang_code and not entry.translations.get(target_lang_code):
+                continue
+            if any(value and _normalize_text(getattr(entry, name)) != value for name, value in filters.items()):
+                continue
+            found.append((candidate.similarity, candidate.distance, position, entry))
+        found.sort(key=lambda item: (-item[0], item[1], item[2]))
+        return [
+            FuzzyTranslationMatch(
+                entry=entry,
+                similarity=similarity,
+                matched_text=self._source_text(entry, source_lang_code),
+                position=position,
+            )
+            for similarity, _, position, entry in found[: max(limit, 1)]
+        ]
+
+    def match_batch(self, segments: Sequence[str], **kwargs: Any) -> list[list[FuzzyTranslationMatch]]:
+        """``match`` for each segment; repeated segments are scored once."""
+        memo: dict[str, list[FuzzyTranslationMatch]] = {}
+        results: list[list[FuzzyTranslationMatch]] = []
+        for segment in segments:
+            key = normalize_fuzzy_text(segment)
+            if key not in memo:
+                memo[key] = self.match(segment, **kwargs)
+            results.append(memo[key])
+        return results
+
+
+def build_fuzzy_translation_memory_payload(
+    *,
+    config_path: Path,
+    repo_root: Path,
+    data_root: str | Path | None = None,
+    model: str | None = None,
+    region: str | None = None,
+    query_text: str | None = None,
+    preferred_lang: str | None = None,
+    source_lang: str | None = None,
+    tables: list[str] | tuple[str, ...] = (),
+    page: str | None = None,
+    section: str | None = None,
+    row_key: str | None = None,
+    limit: int = 10,
+    min_similarity: int = DEFAULT_FUZZY_MIN_SIMILARITY,
+) -> dict[str, Any]:
+    index, snapshot_root = load_translation_memory_index(
+        config_path=config_path,
+        repo_root=repo_root,
+        data_root=data_root,
+        model=model,
+        region=region,
+    )
+    units = split_translation_units(query_text)
+    unit_results = FuzzyTranslationMemory(index.entries).match_batch(
+        units,
+        source_lang=source_lang,
+        target_lang=preferred_lang,
+        tables=tables,
+        page=page,
+        section=section,
+        row_key=row_key,
+        min_similarity=min_similarity,
+        limit=limit,
+    )
+    unique: dict[int, FuzzyTranslationMatch] = {}
+    for matches in unit_results:
+        for match in matches:
+            known = unique.get(match.position)
+            if known is None or match.similarity > known.similarity:
+                unique[match.position] = match
+    # Across units the best match percentage wins; ties keep the TM's order.
+    ranked = sorted(unique.values(), key=lambda match: (-match.similarity, match.position))
+    return {
+        "query_text": _clean(query_text),
+        "mode": "fuzzy",
+        "min_similarity": min_similarity,
+        "source_lang": normalize_language(source_lang),
+        "preferred_lang": normalize_language(preferred_lang),
+        "snapshot_root": _display_path(snapshot_root, repo_root=repo_root),
+        "query_units": units,
+        "unit_matches": [
+            {"source_unit": unit, "match_count": len(matches), "entries": [match.to_dict() for match in matches]}
+            for unit, matches in zip(units, unit_results)
+        ],
+        "match_count": sum(len(matches) for matches in unit_results),
+        "unique_entry_count": len(unique),
+        "entries": [match.to_dict() for match in ranked[: max(limit, 1)]],
+    }
@@ -0,0 +1,382 @@
+"""Inverted index over translation-memory entries.
+
+Ranking matches the original linear scan: a query token scores against an
+entry when it is a *substring* of the entry's search blob. Every substring
+hit of a token lies inside one maximal ``TOKEN_RE`` run of the blob, so the
+index keeps blob runs (terms) -> posting lists and resolves a query token to
+all terms containing it. Only those candidate entries are scored.
+
+The persisted form lives under ``.tmp/translation-memory-index``, keyed by
+snapshot root and model/region. When the snapshot manifest or a table file
+changes, only the tables whose content hash changed are re-read.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from tools.translation_memory import (
+    TOKEN_RE,
+    TranslationMemoryEntry,
+    _entry_searchable_values,
+    _normalize_text,
+    _tokenize,
+    normalize_language,
+    normalize_tables,
+    sorted_translation_memory_entries,
+    translation_memory_segments,
+)
+
+INDEX_SCHEMA_VERSION = 1
+DEFAULT_INDEX_DIR = ".tmp/translation-memory-index"
+_TERM_GRAM = 3
+
+
+@dataclass(frozen=True, slots=True)
+class _EntryFeatures:
+    search_blob: str
+    source_text: str
+    row_key: str
+    page: str
+    section: str
+    translations: dict[str, str]
+
+
+def _entry_features(entry: TranslationMemoryEntry) -> _EntryFeatures:
+    return _EntryFeatures(
+        search_blob=" ".join(_entry_searchable_values(entry)),
+        source_text=_normalize_text(entry.source_text),
+        row_key=_normalize_text(entry.row_key),
+        page=_normalize_text(entry.page),
+        section=_normalize_text(entry.section),
+        translations={lang: _normalize_text(value) for lang, value in entry.translations.items()},
+    )
+
+
+def _build_postings(texts: Iterable[tuple[int, str]]) -> dict[str, list[int]]:
+    postings: dict[str, list[int]] = defaultdict(list)
+    for entry_id, text in texts:
+        for term in dict.fromkeys(TOKEN_RE.findall(text)):
+            postings[term].append(entry_id)
+    return dict(postings)
+
+
+class _TermPostings:
+    """Term -> entry ids, queried by substring of a term."""
+
+    def __init__(self, postings: dict[str, list[int]]) -> None:
+        self.postings = postings
+        self._grams: dict[str, set[str]] | None = None
+        self._cache: dict[str, frozenset[int]] = {}
+
+    def _candidate_terms(self, token: str) -> Iterable[str]:
+        if len(token) < _TERM_GRAM:
+            return self.postings
+        if self._grams is None:
+            grams: dict[str, set[str]] = defaultdict(set)
+            for term in self.postings:
+                for start in range(len(term) - _TERM_GRAM + 1):
+                    grams[term[start : start + _TERM_GRAM]].add(term)
+            self._grams = dict(grams)
+        term_sets = sorted(
+            (self._grams.get(token[start : start + _TERM_GRAM], set()) for start in range(len(token) - _TERM_GRAM + 1)),
+            key=len,
+        )
+        return set.intersection(*term_sets)
+
+    def ids_containing(self, token: str) -> frozenset[int]:
+        cached = self._cache.get(token)
+        if cached is None:
+            ids: set[int] = set()
+            for term in self._candidate_terms(token):
+                if token in term:
+                    ids.update(self.postings[term])
+            cached = self._cache[token] = frozenset(ids)
+        return cached
+
+
+class TranslationMemoryIndex:
+    def __init__(
+        self,
+        entries: list[TranslationMemoryEntry],
+        *,
+        postings: dict[str, Any] | None = None,
+        rebuilt_segments: tuple[str, ...] = (),
+    ) -> None:
+        self.entries = list(entries)
+        self.rebuilt_segments = rebuilt_segments
+        self._features = [_entry_features(entry) for entry in self.entries]
+        if postings is None:
+            postings = {
+                "terms": _build_postings((entry_id, features.search_blob) for entry_id, features in enumerate(self._features)),
+                "languages": {},
+            }
+            texts_by_lang: dict[str, list[tuple[int, str]]] = defaultdict(list)
+            for entry_id, features in enumerate(self._features):
+                for lang, text in features.translations.items():
+                    if text:
+                        texts_by_lang[lang].append((entry_id, text))
+            postings["languages"] = {lang: _build_postings(texts) for lang, texts in texts_by_lang.items()}
+        self._postings_payload = postings
+        self._terms = _TermPostings(postings["terms"])
+        self._lang_terms = {lang: _TermPostings(terms) for lang, terms in postings["languages"].items()}
+        self._exact_translations: dict[str, set[int]] = defaultdict(set)
+        for entry_id, features in enumerate(self._features):
+            for text in features.translations.values():
+                if text:
+                    self._exact_translations[text].add(entry_id)
+
+    def postings_payload(self) -> dict[str, Any]:
+        return self._postings_payload
+
+    def query(
+        self,
+        *,
+        query_text: str | None = None,
+        preferred_lang: str | None = None,
+        source_lang: str | None = None,
+        target_lang: str | None = None,
+        tables: list[str] | tuple[str, ...] = (),
+        page: str | None = None,
+        section: str | None = None,
+        row_key: str | None = None,
+        limit: int = 10,
+    ) -> list[TranslationMemoryEntry]:
+        normalized_query = _normalize_text(query_text)
+        preferred_lang_code = normalize_language(preferred_lang)
+        source_lang_code = normalize_language(source_lang)
+        target_lang_code = normalize_language(target_lang)
+        table_filters = normalize_tables(tables)
+        page_filter = _normalize_text(page)
+        section_filter = _normalize_text(section)
+        row_key_filter = _normalize_text(row_key)
+        query_tokens = _tokenize(query_text)
+
+        token_ids: dict[str, frozenset[int]] = {}
+        source_token_ids: dict[str, frozenset[int]] = {}
+        candidates: Iterable[int]
+        if normalized_query:
+            token_ids = {token: self._terms.ids_containing(token) for token in dict.fromkeys(query_tokens)}
+            source_terms = self._lang_terms.get(source_lang_code or "")
+            source_token_ids = {
+                token: source_terms.ids_containing(token) if source_terms is not None else frozenset()
+                for token in token_ids
+            }
+            candidates = sorted(set().union(*token_ids.values()))
+        else:
+            candidates = range(len(self.entries))
+        exact_translation_ids = self._exact_translations.get(normalized_query, set())
+
+        ranked: list[tuple[int, int, TranslationMemoryEntry]] = []
+        for index in candidates:
+            entry = self.entries[index]
+            features = self._features[index]
+            if table_filters and entry.table not in table_filters:
+                continue
+            if page_filter and features.page != page_filter:
+                continue
+            if section_filter and features.section != section_filter:
+                continue
+            if row_key_filter and features.row_key != row_key_filter:
+                continue
+            if source_lang_code and not entry.translations.get(source_lang_code):
+                continue
+            if target_lang_code and not entry.translations.get(target_lang_code):
+                continue
+
+            score = 0
+            source_blob = features.translations.get(source_lang_code, "") if source_lang_code else ""
+            target_blob = features.translations.get(target_lang_code, "") if target_lang_code else ""
+            source_token_hits = 0
+
+            if normalized_query:
+                if source_blob and normalized_query == source_blob:
+                    score += 180
+                elif normalized_query == features.source_text:
+                    score += 120
+                if normalized_query == features.row_key:
+                    score += 110
+                if index in exact_translation_ids:
+                    score += 110
+                if source_blob and normalized_query in source_blob:
+                    score += 60
+                if normalized_query in features.search_blob:
+                    score += 40
+                if source_blob:
+                    source_token_hits = sum(1 for token in query_tokens if index in source_token_ids[token])
+                    score += source_token_hits * 12
+                token_hits = sum(1 for token in query_tokens if index in token_ids[token])
+                if token_hits == 0:
+                    continue
+                score += token_hits * 8
+                if query_tokens and token_hits == len(query_tokens):
+                    score += 24
+            if preferred_lang_code and entry.translations.get(preferred_lang_code):
+                score += 12
+            if target_lang_code and target_blob:
+                score += 12
+            if source_lang_code and source_token_hits:
+                score += 10
+            ranked.append((score, index, entry))
+
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        capped_limit = max(limit, 1)
+        return [entry for _, _, entry in ranked[:capped_limit]]
+
+
+def translation_memory_index_path(
+    *,
+    repo_root: Path,
+    phase2_root: Path,
+    model: str | None,
+    region: str | None,
+) -> Path:
+    key = hashlib.sha256(f"{phase2_root.resolve()}\0{model or ''}\0{region or ''}".encode("utf-8")).hexdigest()[:16]
+    return repo_root / DEFAULT_INDEX_DIR / f"{key}.json"
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_fingerprint(path: Path, previous: Any) -> dict[str, Any] | None:
+    """Size/mtime/sha256 of ``path``; the hash is reused while size and mtime hold."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if (
+        isinstance(previous, dict)
+        and previous.get("size") == stat.st_size
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+        and isinstance(previous.get("sha256"), str)
+    ):
+        return previous
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": _sha256_file(path)}
+
+
+def _same_content(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return left is right
+    return isinstance(left, dict) and isinstance(right, dict) and left.get("sha256") == right.get("sha256")
+
+
+def _load_cache(path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("schema_version") != INDEX_SCHEMA_VERSION:
+        return {}
+    return payload
+
+
+def _write_cache(path: Path, payload: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, path)
+    except OSError:
+        # The index is an optimization; a read-only checkout still answers queries.
+        pass
+
+
+def _entry_record(entry: TranslationMemoryEntry) -> dict[str, Any]:
+    return dataclasses.asdict(entry)
+
+
+def _entry_from_record(record: dict[str, Any]) -> TranslationMemoryEntry:
+    return TranslationMemoryEntry(**record)
+
+
+def load_translation_memory_index(
+    *,
+    config_path: Path,
+    repo_root: Path,
+    data_root: str | Path | None = None,
+    model: str | None = None,
+    region: str | None = None,
+) -> tuple[TranslationMemoryIndex, Path]:
+    """Return the snapshot's TM index, re-reading only the tables that changed."""
+    segments, phase2_root, manifest_path = translation_memory_segments(
+        config_path=config_path,
+        repo_root=repo_root,
+        data_root=data_root,
+        model=model,
+        region=region,
+    )
+    cache_path = translation_memory_index_path(
+        repo_root=repo_root,
+        phase2_root=phase2_root,
+        model=model,
+        region=region,
+    )
+    cached = _load_cache(cache_path)
+    cached_segments = cached.get("segments") if isinstance(cached.get("segments"), dict) else {}
+    # A new manifest means a new sync; segments are then re-validated by
+    # content hash so an unchanged table keeps its cached entries.
+    manifest = _file_fingerprint(manifest_path, cached.get("manifest"))
+    fingerprints_changed = manifest != cached.get("manifest")
+
+    entries: list[TranslationMemoryEntry] = []
+    segment_payloads: dict[str, Any] = {}
+    rebuilt: list[str] = []
+    for segment in segments:
+        previous = cached_segments.get(segment.name)
+        previous = previous if isinstance(previous, dict) else {}
+        previous_files = previous.get("files") if isinstance(previous.get("files"), list) else []
+        files = [
+            _file_fingerprint(path, previous_files[position] if position < len(previous_files) else None)
+            for position, path in enumerate(segment.paths)
+        ]
+        fingerprints_changed = fingerprints_changed or files != previous_files
+        reusable = (
+            len(previous_files) == len(files)
+            and all(_same_content(new, old) for new, old in zip(files, previous_files))
+            and isinstance(previous.get("entries"), list)
+        )
+        segment_entries: list[TranslationMemoryEntry] | None = None
+        records: list[dict[str, Any]] = []
+        if reusable:
+            records = previous["entries"]
+            try:
+                segment_entries = [_entry_from_record(record) for record in records]
+            except TypeError:
+                segment_entries = None
+        if segment_entries is None:
+            segment_entries = segment.collect()
+            records = [_entry_record(entry) for entry in segment_entries]
+            rebuilt.append(segment.name)
+        entries.extend(segment_entries)
+        segment_payloads[segment.name] = {"files": files, "entries": records}
+
+    entries = sorted_translation_memory_entries(entries, phase2_root=phase2_root)
+    cached_postings = cached.get("postings")
+    if not rebuilt and isinstance(cached_postings, dict) and cached.get("entry_count") == len(entries):
+        index = TranslationMemoryIndex(entries, postings=cached_postings)
+    else:
+        index = TranslationMemoryIndex(entries, rebuilt_segments=tuple(rebuilt))
+    if rebuilt or fingerprints_changed:
+        _write_cache(
+            cache_path,
+            {
+                "schema_version": INDEX_SCHEMA_VERSION,
+                "manifest": manifest,
+                "segments": segment_payloads,
+                "entry_count": len(entries),
+                "postings": index.postings_payload(),
+            },
+        )
+    return index, phase2_root
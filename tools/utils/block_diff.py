@@ -0,0 +1,147 @@
+"""Hash-anchored sequence diff for block lists.
+
+:func:`diff_opcodes` returns ``difflib.SequenceMatcher.get_opcodes()``-shaped
+tuples for two sequences of block keys. Each key is reduced to a content
+digest first; the common prefix and suffix are trimmed, and keys that occur
+exactly once on both sides are anchored in order (the longest increasing run
+of their positions, as in patience diff). Only the unmatched regions between
+anchors reach ``difflib``, so an edit to one paragraph of a long manual costs
+a diff of that paragraph's neighbourhood rather than of the whole document.
+
+Gap alignments are memoized by the digests of the two spans, so a second diff
+that shares regions with an earlier one (the backport's rebuild+rediff gate
+re-diffs the same baseline against the applied source) reuses them.
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Sequence
+
+Opcode = tuple[str, int, int, int, int]
+
+DEFAULT_MAX_GAPS = 512
+
+_gap_cache: OrderedDict[tuple[bytes, bytes], tuple[Opcode, ...]] = OrderedDict()
+_gap_cache_lock = threading.Lock()
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def _span_digest(digests: Sequence[bytes]) -> bytes:
+    return hashlib.blake2b(b"".join(digests), digest_size=16).digest()
+
+
+def clear_block_diff_cache() -> None:
+    with _gap_cache_lock:
+        _gap_cache.clear()
+
+
+def _gap_opcodes(a: Sequence[bytes], b: Sequence[bytes]) -> tuple[Opcode, ...]:
+    key = (_span_digest(a), _span_digest(b))
+    with _gap_cache_lock:
+        cached = _gap_cache.get(key)
+        if cached is not None:
+            _gap_cache.move_to_end(key)
+            return cached
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    opcodes = tuple(matcher.get_opcodes())
+    with _gap_cache_lock:
+        _gap_cache[key] = opcodes
+        while len(_gap_cache) > DEFAULT_MAX_GAPS:
+            _gap_cache.popitem(last=False)
+    return opcodes
+
+
+def _unique_anchors(
+    a: Sequence[bytes], alo: int, ahi: int, b: Sequence[bytes], blo: int, bhi: int
+) -> list[tuple[int, int]]:
+    """``(i, j)`` pairs of keys unique on both sides, longest in-order run."""
+    seen_a: dict[bytes, int | None] = {}
+    for index in range(alo, ahi):
+        seen_a[a[index]] = None if a[index] in seen_a else index
+    seen_b: dict[bytes, int | None] = {}
+    for index in range(blo, bhi):
+        seen_b[b[index]] = None if b[index] in seen_b else index
+    pairs = [
+        (i, j)
+        for key, i in seen_a.items()
+        if i is not None and (j := seen_b.get(key)) is not None
+    ]
+    pairs.sort()
+    # Patience sort over the b positions: tails[k] is the pair index ending
+    # the best run of length k + 1, back[p] links each pair to its predecessor.
+    tails: list[int] = []
+    tail_js: list[int] = []
+    back: list[int] = [-1] * len(pairs)
+    for position, (_, j) in enumerate(pairs):
+        slot = bisect.bisect_left(tail_js, j)
+        back[position] = tails[slot - 1] if slot else -1
+        if slot == len(tails):
+            tails.append(position)
+            tail_js.append(j)
+        else:
+            tails[slot] = position
+            tail_js[slot] = j
+    run: list[tuple[int, int]] = []
+    position = tails[-1] if tails else -1
+    while position >= 0:
+        run.append(pairs[position])
+        position = back[position]
+    run.reverse()
+    return run
+
+
+def _align(
+    a: Sequence[bytes], alo: int, ahi: int, b: Sequence[bytes], blo: int, bhi: int, out: list[Opcode]
+) -> None:
+    start_a, start_b = alo, blo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo, blo = alo + 1, blo + 1
+    if alo > start_a:
+        out.append(("equal", start_a, alo, start_b, blo))
+    end_a, end_b = ahi, bhi
+    while ahi > alo and bhi > blo and a[ahi - 1] == b[bhi - 1]:
+        ahi, bhi = ahi - 1, bhi - 1
+    if alo < ahi or blo < bhi:
+        anchors = _unique_anchors(a, alo, ahi, b, blo, bhi) if alo < ahi and blo < bhi else []
+        if anchors:
+            for i, j in anchors:
+                _align(a, alo, i, b, blo, j, out)
+                out.append(("equal", i, i + 1, j, j + 1))
+                alo, blo = i + 1, j + 1
+            _align(a, alo, ahi, b, blo, bhi, out)
+        else:
+            for tag, i1, i2, j1, j2 in _gap_opcodes(a[alo:ahi], b[blo:bhi]):
+                out.append((tag, alo + i1, alo + i2, blo + j1, blo + j2))
+    if ahi < end_a:
+        out.append(("equal", ahi, end_a, bhi, end_b))
+
+
+def _merge(opcodes: list[Opcode]) -> list[Opcode]:
+    merged: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if i1 == i2 and j1 == j2:
+            continue
+        if merged and (merged[-1][0] == "equal") == (tag == "equal"):
+            previous = merged.pop()
+            i1, j1 = previous[1], previous[3]
+            if tag != "equal":
+                tag = "replace" if i1 < i2 and j1 < j2 else ("delete" if i1 < i2 else "insert")
+        merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
+def diff_opcodes(a: Sequence[str], b: Sequence[str]) -> list[Opcode]:
+    """``get_opcodes()``-shaped diff of ``a`` -> ``b``, anchored on unique keys."""
+    digests_a = [_digest(key) for key in a]
+    digests_b = [_digest(key) for key in b]
+    out: list[Opcode] = []
+    _align(digests_a, 0, len(digests_a), digests_b, 0, len(digests_b), out)
+    return _merge(out)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import csv
+from dataclasses import dataclass
+import hashlib
+import io
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+
+DEFAULT_MAX_TABLES = 64
+# Like git's racy-clean check: a file modified this recently may be rewritten
+# again within the same mtime tick, so its cached parse is re-verified by digest.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class CsvTableIdentity:
+    path: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class CsvTable:
+    """One parsed CSV snapshot table; rows are never handed out directly."""
+
+    identity: CsvTableIdentity
+    digest: str
+    fieldnames: tuple[str, ...]
+    rows: tuple[dict[Any, Any], ...]
+
+
+@dataclass(frozen=True)
+class CsvTableCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    tables: int
+
+
+def csv_table_identity(path: Path) -> CsvTableIdentity | None:
+    try:
+        resolved = path.resolve()
+        stat = resolved.stat()
+    except OSError:
+        return None
+    if not resolved.is_file():
+        return None
+    return CsvTableIdentity(path=str(resolved), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def _content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_csv_table(data: bytes, identity: CsvTableIdentity) -> CsvTable:
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig"), newline=""))
+    rows = tuple(reader)
+    return CsvTable(
+        identity=identity,
+        digest=_content_digest(data),
+        fieldnames=tuple(reader.fieldnames or ()),
+        rows=rows,
+    )
+
+
+def _is_racy(identity: CsvTableIdentity) -> bool:
+    return time.time_ns() - identity.mtime_ns < _RACY_WINDOW_NS
+
+
+class CsvTableCache:
+    """Process-wide LRU of parsed CSV tables keyed by path, size and mtime.
+
+    A snapshot table is parsed once per content identity; every read returns
+    fresh row dicts, so callers may mutate what they get back without
+    corrupting the cached table.
+    """
+
+    def __init__(self, max_tables: int = DEFAULT_MAX_TABLES) -> None:
+        self.max_tables = max(1, int(max_tables))
+        self._tables: OrderedDict[str, CsvTable] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def table(self, path: Path) -> CsvTable | None:
+        identity = csv_table_identity(path)
+        if identity is None:
+            return None
+        with self._lock:
+            cached = self._tables.get(identity.path)
+        data: bytes | None = None
+        if cached is not None and cached.identity == identity and _is_racy(identity):
+            data = Path(identity.path).read_bytes()
+            if _content_digest(data) != cached.digest:
+                cached = None
+        with self._lock:
+            if cached is not None and cached.identity == identity:
+                self._tables.move_to_end(identity.path)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        table = _parse_csv_table(data if data is not None else Path(identity.path).read_bytes(), identity)
+        with self._lock:
+            self._tables[identity.path] = table
+            self._tables.move_to_end(identity.path)
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+                self._evictions += 1
+        return table
+
+    def read_rows(self, path: Path, *, line_numbers: bool = False) -> list[dict[Any, Any]] | None:
+        table = self.table(path)
+        if table is None:
+            return None
+        if not line_numbers:
+            return [dict(row) for row in table.rows]
+        rows: list[dict[Any, Any]] = []
+        for line, row in enumerate(table.rows, start=2):
+            copied = dict(row)
+            copied["__line__"] = str(line)
+            rows.append(copied)
+        return rows
+
+    def stats(self) -> CsvTableCacheStats:
+        with self._lock:
+            return CsvTableCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                tables=len(self._tables),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_SHARED_CACHE = CsvTableCache()
+
+
+def shared_csv_table_cache() -> CsvTableCache:
+    return _SHARED_CACHE
+
+
+def read_cached_csv_rows(path: Path | str, *, line_numbers: bool = False) -> list[dict[str, str]]:
+    """Read a CSV through the shared cache; a missing file reads as no rows."""
+    rows = _SHARED_CACHE.read_rows(Path(path), line_numbers=line_numbers)
+    return rows if rows is not None else []
+
+
+def csv_table_cache_stats() -> CsvTableCacheStats:
+    return _SHARED_CACHE.stats()
+
+
+def clear_csv_table_cache() -> None:
+    _SHARED_CACHE.clear()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Character n-gram shortlisting plus bounded edit distance.
+
+Similarity is CAT-style: ``floor(100 * (longest - distance) / longest)`` on
+normalized text, so 100 means identical. A shortlist never drops a string
+that could reach the threshold while sharing an n-gram with the query: an
+edit touches at most ``n`` n-grams of a padded string, so a match within
+``k`` edits keeps at least ``len(grams) - k * n`` of them (q-gram lemma).
+Only the rarest ``k * n + 1`` query grams need probing to find every such
+string (prefix filter); the lemma and the character-bag distance (a lower
+bound on edit distance) then prune before the distance check.
+
+:func:`partial_ratio` applies the same idea to "does this text appear, nearly,
+somewhere in that page": hay gram hits vote for alignment diagonals, and only
+windows with enough votes on a narrow diagonal band get a character-bag bound
+and then a bounded edit distance. A needle with no verified window scores 0.0
+without touching ``difflib``; the rest get the historical anchored score
+(:func:`anchored_partial_ratio`), so threshold decisions are unchanged.
+"""
+
+from __future__ import annotations
+
+import difflib
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Hashable, Iterable, Iterator
+
+NGRAM_SIZE = 3
+
+
+def normalize_fuzzy_text(raw: str | None) -> str:
+    return " ".join((raw or "").lower().split())
+
+
+def char_ngrams(text: str, *, size: int = NGRAM_SIZE) -> set[str]:
+    padded = "\0" * (size - 1) + text + "\0" * (size - 1)
+    return {padded[start : start + size] for start in range(len(padded) - size + 1)}
+
+
+def max_edit_distance(length_a: int, length_b: int, min_similarity: int) -> int:
+    """Largest distance that still scores ``min_similarity`` percent."""
+    longest = max(length_a, length_b)
+    return (longest * (100 - min_similarity)) // 100
+
+
+def similarity_percent(length_a: int, length_b: int, distance: int) -> int:
+    longest = max(length_a, length_b)
+    if longest == 0:
+        return 100
+    return (100 * (longest - distance)) // longest
+
+
+def bag_distance(a: Counter[str], b: Counter[str]) -> int:
+    """Lower bound on the edit distance of the strings with character counts ``a`` and ``b``."""
+    return max(sum((a - b).values()), sum((b - a).values()))
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int | None:
+    """Levenshtein distance, or ``None`` once it must exceed ``max_distance``.
+
+    Only the diagonal band of width ``2 * max_distance + 1`` is evaluated and
+    the scan stops as soon as a whole row is over the bound.
+    """
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    length_a, length_b = len(a), len(b)
+    if length_b - length_a > max_distance:
+        return None
+    over = max_distance + 1
+    previous = [column if column <= max_distance else over for column in range(length_b + 1)]
+    for row in range(1, length_a + 1):
+        current = [over] * (length_b + 1)
+        current[0] = row if row <= max_distance else over
+        row_min = current[0]
+        char_a = a[row - 1]
+        for column in range(max(1, row - max_distance), min(length_b, row + max_distance) + 1):
+            value = previous[column - 1] + (char_a != b[column - 1])
+            if previous[column] + 1 < value:
+                value = previous[column] + 1
+            if current[column - 1] + 1 < value:
+                value = current[column - 1] + 1
+            if value > over:
+                value = over
+            current[column] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+    distance = previous[length_b]
+    return distance if distance <= max_distance else None
+
+
+@dataclass(frozen=True)
+class FuzzyCandidate:
+    key: Hashable
+    text: str
+    distance: int
+    similarity: int
+
+
+class NGramIndex:
+    """Normalized texts keyed by caller ids, searchable by similarity.
+
+    Keys with the same normalized text share one posting entry, so a TM that
+    repeats a label across models verifies it once per query.
+    """
+
+    def __init__(self, items: Iterable[tuple[Hashable, str]], *, size: int = NGRAM_SIZE) -> None:
+        self.size = size
+        self.texts: dict[Hashable, str] = {}
+        self._text_ids: dict[str, int] = {}
+        self._distinct: list[str] = []
+        self._grams: list[frozenset[str]] = []
+        self._bags: list[Counter[str]] = []
+        self._keys: list[list[Hashable]] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for key, raw in items:
+            text = normalize_fuzzy_text(raw)
+            if not text:
+                continue
+            self.texts[key] = text
+            text_id = self._text_ids.get(text)
+            if text_id is None:
+                text_id = self._text_ids[text] = len(self._distinct)
+                grams = frozenset(char_ngrams(text, size=size))
+                self._distinct.append(text)
+                self._grams.append(grams)
+                self._bags.append(Counter(text))
+                self._keys.append([])
+                for gram in grams:
+                    self._postings[gram].append(text_id)
+            self._keys[text_id].append(key)
+
+    def _shortlist(self, grams: set[str], *, length: int, min_similarity: int) -> set[int]:
+        longest = length * 100 // max(min_similarity, 1)
+        required = len(grams) - max_edit_distance(length, longest, min_similarity) * self.size
+        probes = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        if required > 0:
+            probes = probes[: len(grams) - required + 1]
+        shortlist: set[int] = set()
+        for gram in probes:
+            shortlist.update(self._postings.get(gram, ()))
+        return shortlist
+
+    def search(self, query: str, *, min_similarity: int) -> list[FuzzyCandidate]:
+        """Every indexed text scoring at least ``min_similarity``, best first."""
+        text = normalize_fuzzy_text(query)
+        if not text:
+            return []
+        grams = char_ngrams(text, size=self.size)
+        bag = Counter(text)
+        found: list[FuzzyCandidate] = []
+        for text_id in sorted(self._shortlist(grams, length=len(text), min_similarity=min_similarity)):
+            candidate = self._distinct[text_id]
+            bound = max_edit_distance(len(text), len(candidate), min_similarity)
+            if abs(len(text) - len(candidate)) > bound:
+                continue
+            if len(grams & self._grams[text_id]) < len(grams) - bound * self.size:
+                continue
+            if bag_distance(bag, self._bags[text_id]) > bound:
+                continue
+            distance = bounded_levenshtein(text, candidate, bound)
+            if distance is None:
+                continue
+            similarity = similarity_percent(len(text), len(candidate), distance)
+            found.extend(
+                FuzzyCandidate(key=key, text=candidate, distance=distance, similarity=similarity)
+                for key in self._keys[text_id]
+            )
+        found.sort(key=lambda item: (-item.similarity, item.distance))
+        return found
+
+
+@lru_cache(maxsize=8)
+def _gram_positions(text: str, size: int) -> dict[str, list[int]]:
+    positions: dict[str, list[int]] = defaultdict(list)
+    for start in range(len(text) - size + 1):
+        positions[text[start : start + size]].append(start)
+    return positions
+
+
+def _window_starts(needle: str, hay: str, min_ratio: float, size: int) -> Iterator[int]:
+    """Starts of the ``hay`` windows that could score ``min_ratio`` against ``needle``.
+
+    A window of length ``L`` scoring ``r`` shares a common subsequence of at
+    least ``r * (len(needle) + L) / 2`` characters with the needle, which
+    bounds the needle characters left out (``max_deleted``) and the window
+    characters skipped (``max_inserted``). Every needle gram that survives the
+    alignment reappears in the window on a diagonal (hay position minus needle
+    position) within ``[start - max_deleted, start + max_inserted]``, and at
+    most ``size`` grams die per deletion and ``size - 1`` per insertion. Windows
+    near the end of ``hay`` are cut short, as in the anchored search, so the
+    bounds are taken over every usable window length.
+    """
+    length, hay_length = len(needle), len(hay)
+    shortest = max(1, math.ceil(min_ratio * length / (2 - min_ratio) - 1e-9))
+    if shortest > length:
+        return
+    max_deleted = max_inserted = 0
+    required = length
+    for window_length in range(shortest, length + 1):
+        common = math.ceil(min_ratio * (length + window_length) / 2 - 1e-9)
+        deleted, inserted = length - common, window_length - common
+        max_deleted, max_inserted = max(max_deleted, deleted), max(max_inserted, inserted)
+        required = min(required, (length - size + 1) - size * deleted - (size - 1) * inserted)
+    last_start = hay_length - shortest
+    if required <= 0:
+        yield from range(last_start + 1)
+        return
+    positions = _gram_positions(hay, size)
+    events: list[tuple[int, int, int]] = []
+    for offset in range(length - size + 1):
+        for position in positions.get(needle[offset : offset + size], ()):
+            diagonal = position - offset
+            events.append((diagonal - max_inserted, 1, offset))
+            events.append((diagonal + max_deleted + 1, -1, offset))
+    if len({offset for _, _, offset in events}) < required:
+        return
+    events.sort()
+    votes: Counter[int] = Counter()
+    voters = 0
+    for index, (start, step, offset) in enumerate(events):
+        if step > 0:
+            voters += votes[offset] == 0
+            votes[offset] += 1
+        else:
+            votes[offset] -= 1
+            voters -= votes[offset] == 0
+        following = events[index + 1][0] if index + 1 < len(events) else start
+        if voters >= required and following > start:
+            yield from range(max(start, 0), min(following - 1, last_start) + 1)
+
+
+def anchored_partial_ratio(needle: str, hay: str) -> float:
+    """Best ``difflib`` ratio of ``needle`` against a needle-sized window of ``hay``.
+
+    The revision ledger's historical matcher: candidate windows are anchored at
+    each matching block of one ``SequenceMatcher`` over the whole hay, then
+    scored with a plain ratio. Returns 0.0..1.0.
+    """
+    if not needle or not hay:
+        return 0.0
+    if len(needle) > len(hay):
+        needle, hay = hay, needle
+    anchor = difflib.SequenceMatcher(None, needle, hay, autojunk=False)
+    best = 0.0
+    for block in anchor.get_matching_blocks():
+        start = max(block.b - block.a, 0)
+        window = hay[start : start + len(needle)]
+        if not window:
+            continue
+        ratio = difflib.SequenceMatcher(None, needle, window, autojunk=False).ratio()
+        if ratio > best:
+            best = ratio
+        if best >= 0.995:
+            break
+    return best
+
+
+def partial_ratio(needle: str, hay: str, *, min_ratio: float, size: int = NGRAM_SIZE) -> float:
+    """:func:`anchored_partial_ratio`, or 0.0 when it cannot reach ``min_ratio``.
+
+    A window's ``difflib`` ratio ``2M / T`` never exceeds ``1 - d / T`` for its
+    edit distance ``d`` to the needle: ``M`` is at most the longest common
+    subsequence ``L``, and deleting and inserting everything outside it is a
+    ``T - 2L`` step edit script. A window whose distance exceeds
+    ``(1 - min_ratio) * T`` therefore cannot reach the threshold, and the
+    anchored scan only runs once some window survives.
+    """
+    if not needle or not hay:
+        return 0.0
+    short, long = (hay, needle) if len(needle) > len(hay) else (needle, hay)
+    length, wanted = len(short), Counter(short)
+    window: Counter[str] = Counter()
+    shared, previous = 0, -2
+    for start in _window_starts(short, long, min_ratio, size):
+        if start == previous + 1:
+            dropped = long[previous]
+            shared -= window[dropped] <= wanted[dropped]
+            window[dropped] -= 1
+            if start + length <= len(long):
+                added = long[start + length - 1]
+                window[added] += 1
+                shared += window[added] <= wanted[added]
+        else:
+            window = Counter(long[start : start + length])
+            shared = sum((window & wanted).values())
+        previous = start
+        total = length + min(length, len(long) - start)
+        if 2.0 * shared / total < min_ratio:
+            continue
+        max_distance = math.floor((1.0 - min_ratio) * total + 1e-9)
+        if bounded_levenshtein(short, long[start : start + length], max_distance) is None:
+            continue
+        score = anchored_partial_ratio(needle, hay)
+        return score if score >= min_ratio else 0.0
+    return 0.0
@@ -9,6 +9,10 @@ from tools.utils.spec_master_auditing import (
     normalize_spec_master_csv,
     normalize_spec_master_rows,
 )
+from tools.utils.spec_master_index import (
+    SpecMasterIndex,
+    ensure_spec_master_index,
+)
 from tools.utils.spec_master_lookup import (
     collect_matching_spec_rows,
     collect_spec_value_matches_from_rows,
@@ -67,6 +71,7 @@ __all__ = [
     'SpecMasterAppliedRepair',
     'SpecMasterAuditIssue',
     'SpecMasterAuditResult',
+    'SpecMasterIndex',
     'SpecMasterNormalizationResult',
     'SpecMasterRepairResult',
     'SpecMasterSectionOrderConflict',
@@ -84,6 +89,7 @@ __all__ = [
     'collect_referenced_footnote_ids_by_page',
     'collect_referenced_matching_footnote_rows',
     'collect_spec_value_matches_from_rows',
+    'ensure_spec_master_index',
     'iter_footnote_ref_ids',
     'is_page_value_row',
     'model_value_matches_target',
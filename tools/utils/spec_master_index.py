@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import overload
+
+from tools.utils.spec_master_row_helpers import (
+    _first_non_empty,
+    _is_truthy,
+    _legacy_page_value_binding,
+    _normalize_page_filters,
+    _page_value_signature,
+    _pick_row_key,
+    _pick_row_model,
+    _pick_row_region,
+    _row_line_num,
+    _row_page_value_binding,
+    _score_row,
+    model_value_matches_target,
+    normalize_page_tokens,
+    region_value_matches_target,
+)
+from tools.utils.spec_master_shared import PageValueBinding
+
+
+PageFilter = str | list[str] | tuple[str, ...] | set[str] | None
+_QueryKey = tuple[
+    str | None,
+    str | None,
+    str,
+    str,
+    frozenset[str] | None,
+    str | None,
+    str | None,
+    str | None,
+    str | None,
+    str | None,
+]
+
+
+@dataclass(frozen=True)
+class _IndexedRow:
+    position: int
+    line_num: int
+    row: dict[str, str]
+    row_key: str
+    binding: PageValueBinding | None
+    page_tokens: frozenset[str]
+    model: str
+    region: str
+    line_order: str
+
+
+@dataclass
+class _RowBucket:
+    rows: list[_IndexedRow] = field(default_factory=list)
+    any_page_rows: list[_IndexedRow] = field(default_factory=list)
+    rows_by_page: dict[str, list[_IndexedRow]] = field(default_factory=dict)
+
+    def add(self, entry: _IndexedRow) -> None:
+        self.rows.append(entry)
+        if not entry.page_tokens:
+            self.any_page_rows.append(entry)
+            return
+        for token in entry.page_tokens:
+            self.rows_by_page.setdefault(token, []).append(entry)
+
+    def candidates(self, page_filters: frozenset[str] | None) -> list[_IndexedRow]:
+        if not page_filters:
+            return self.rows
+        selected = {entry.position: entry for entry in self.any_page_rows}
+        for token in page_filters:
+            for entry in self.rows_by_page.get(token, ()):
+                selected[entry.position] = entry
+        return [selected[position] for position in sorted(selected)]
+
+
+_EMPTY_BUCKET = _RowBucket()
+
+
+def _binding_signature(binding: PageValueBinding) -> tuple[str, str, str, str, str]:
+    return _page_value_signature(
+        row_key=binding.row_key,
+        usage_type=binding.usage_type,
+        placement_key=binding.placement_key,
+        value_role=binding.value_role,
+        variant_key=binding.variant_key,
+    )
+
+
+def _optional_token(value: str | int | None) -> str | None:
+    return None if value is None else str(value)
+
+
+class SpecMasterIndex(Sequence[dict[str, str]]):
+    """Pre-normalized, bucketed view over one Spec_Master row snapshot.
+
+    Rows are normalized once (enabled/latest flags, row key, page tokens,
+    page-value binding) and bucketed by row key, page-value signature and
+    page token. Ranked queries return the same rows in the same order as a
+    linear ``_iter_ranked_rows`` scan and are memoized per query, so an index
+    must not outlive edits to the row dicts it was built from.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, str]]) -> None:
+        self._rows: tuple[dict[str, str], ...] = tuple(rows)
+        self._all = _RowBucket()
+        self._by_row_key: dict[str, _RowBucket] = {}
+        self._by_signature: dict[tuple[str, str, str, str, str], _RowBucket] = {}
+        self._target_match_cache: dict[tuple[str, str, str | None, str | None], bool] = {}
+        self._query_cache: dict[_QueryKey, tuple[dict[str, str], ...]] = {}
+        for position, row in enumerate(self._rows):
+            if not _is_truthy(_first_non_empty(row, ["enabled", "Enabled"])):
+                continue
+            if not _is_truthy(_first_non_empty(row, ["Is_Latest", "is_latest"])):
+                continue
+            binding = _row_page_value_binding(row)
+            entry = _IndexedRow(
+                position=position,
+                line_num=_row_line_num(row, position),
+                row=row,
+                row_key=_pick_row_key(row),
+                binding=binding,
+                page_tokens=frozenset(normalize_page_tokens(_first_non_empty(row, ["Page", "page"]))),
+                model=_pick_row_model(row),
+                region=_pick_row_region(row),
+                line_order=_first_non_empty(row, ["Line_order", "line_order"]),
+            )
+            self._all.add(entry)
+            self._by_row_key.setdefault(entry.row_key, _RowBucket()).add(entry)
+            if binding is not None:
+                self._by_signature.setdefault(_binding_signature(binding), _RowBucket()).add(entry)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[dict[str, str]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, str] | Sequence[dict[str, str]]:
+        return self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        return iter(self._rows)
+
+    @property
+    def rows(self) -> tuple[dict[str, str], ...]:
+        return self._rows
+
+    def _bucket_for_row_key(self, row_key: str | None) -> _RowBucket:
+        target_key = (row_key or "").strip().lower()
+        if not target_key:
+            return self._all
+        legacy_binding = _legacy_page_value_binding(target_key)
+        if legacy_binding is not None:
+            return self._by_signature.get(_binding_signature(legacy_binding), _EMPTY_BUCKET)
+        return self._by_row_key.get(target_key, _EMPTY_BUCKET)
+
+    def _matches_target(self, entry: _IndexedRow, *, model: str | None, region: str | None) -> bool:
+        cache_key = (entry.model, entry.region, model, region)
+        cached = self._target_match_cache.get(cache_key)
+        if cached is None:
+            target_region = (region or "").strip()
+            cached = model_value_matches_target(
+                entry.model,
+                target_model=model,
+                target_region=target_region,
+                row_region=entry.region,
+            ) and region_value_matches_target(entry.region, target_region)
+            self._target_match_cache[cache_key] = cached
+        return cached
+
+    def ranked_rows(
+        self,
+        *,
+        model: str | None,
+        region: str | None,
+        lang: str,
+        row_key: str | None = None,
+        pages: PageFilter = None,
+        line_order: str | int | None = None,
+        usage_type: str | None = None,
+        placement_key: str | None = None,
+        value_role: str | None = None,
+        variant_key: str | None = None,
+    ) -> tuple[dict[str, str], ...]:
+        target_model = (model or "").strip() or None
+        target_region = (region or "").strip() or None
+        normalized_pages = _normalize_page_filters(pages)
+        page_filters = frozenset(normalized_pages) if normalized_pages else None
+        query_key: _QueryKey = (
+            target_model,
+            target_region,
+            lang,
+            (row_key or "").strip().lower(),
+            page_filters,
+            _optional_token(line_order),
+            usage_type,
+            placement_key,
+            value_role,
+            variant_key,
+        )
+        cached = self._query_cache.get(query_key)
+        if cached is not None:
+            return cached
+
+        wanted_line_order = str(line_order).strip() if line_order is not None else ""
+        needs_binding = bool(usage_type or placement_key or value_role or variant_key)
+        candidates: list[tuple[int, int, int, dict[str, str]]] = []
+        for entry in self._bucket_for_row_key(row_key).candidates(page_filters):
+            if not self._matches_target(entry, model=target_model, region=target_region):
+                continue
+            if wanted_line_order and entry.line_order != wanted_line_order:
+                continue
+            if needs_binding:
+                binding = entry.binding
+                if binding is None:
+                    continue
+                if usage_type and binding.usage_type != usage_type.strip().lower():
+                    continue
+                if placement_key and binding.placement_key != placement_key.strip().lower():
+                    continue
+                if value_role and binding.value_role != value_role.strip().lower():
+                    continue
+                if variant_key and binding.variant_key != variant_key.strip().lower():
+                    continue
+            score = _score_row(entry.row, model=target_model, region=target_region, lang=lang)
+            candidates.append((score, entry.line_num, entry.position, entry.row))
+
+        candidates.sort(key=lambda item: (-item[0], item[1], item[2]))
+        ranked = tuple(item[3] for item in candidates)
+        self._query_cache[query_key] = ranked
+        return ranked
+
+
+def ensure_spec_master_index(rows: Iterable[dict[str, str]]) -> SpecMasterIndex:
+    if isinstance(rows, SpecMasterIndex):
+        return rows
+    return SpecMasterIndex(rows)
@@ -4,8 +4,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 
+from tools.utils.spec_master_index import (
+    PageFilter,
+    SpecMasterIndex,
+    ensure_spec_master_index,
+)
 from tools.utils.spec_master_shared import (
     ProductNameMatch,
     SpecValueMatch,
@@ -25,6 +31,51 @@ from tools.utils.spec_master_row_helpers import (
 )
 
 
+SpecRows = Sequence[dict[str, str]] | SpecMasterIndex
+
+
+def _ranked_rows(
+    rows: SpecRows,
+    *,
+    model: str | None,
+    region: str | None,
+    lang: str,
+    row_key: str | None = None,
+    pages: PageFilter = None,
+    line_order: str | int | None = None,
+    usage_type: str | None = None,
+    placement_key: str | None = None,
+    value_role: str | None = None,
+    variant_key: str | None = None,
+) -> Sequence[dict[str, str]]:
+    if isinstance(rows, SpecMasterIndex):
+        return rows.ranked_rows(
+            model=model,
+            region=region,
+            lang=lang,
+            row_key=row_key,
+            pages=pages,
+            line_order=line_order,
+            usage_type=usage_type,
+            placement_key=placement_key,
+            value_role=value_role,
+            variant_key=variant_key,
+        )
+    return _iter_ranked_rows(
+        list(rows),
+        model=model,
+        region=region,
+        lang=lang,
+        row_key=row_key,
+        pages=pages,
+        line_order=line_order,
+        usage_type=usage_type,
+        placement_key=placement_key,
+        value_role=value_role,
+        variant_key=variant_key,
+    )
+
+
 def _pick_lang_specific_value(row: dict[str, str], base: str, lang: str) -> str:
     normalized_lang = (lang or "").strip()
     if not normalized_lang:
@@ -81,20 +132,20 @@ def _preferred_page_value_text(row: dict[str, str], *, lang: str) -> str:
     return _pick_lang_value(row, "Value", lang)
 
 def resolve_spec_value_from_rows(
-    rows: list[dict[str, str]],
+    rows: SpecRows,
     *,
     model: str | None,
     region: str | None,
     lang: str,
     row_key: str,
-    pages: str | list[str] | tuple[str, ...] | set[str] | None = ("spec", "specifications"),
+    pages: PageFilter = ("spec", "specifications"),
     line_order: str | int | None = None,
     usage_type: str | None = None,
     placement_key: str | None = None,
     value_role: str | None = None,
     variant_key: str | None = None,
 ) -> SpecValueMatch | None:
-    for row in _iter_ranked_rows(
+    for row in _ranked_rows(
         rows,
         model=model,
         region=region,
@@ -118,13 +169,13 @@ def resolve_spec_value_from_rows(
 
 
 def collect_matching_spec_rows(
-    rows: list[dict[str, str]],
+    rows: SpecRows,
     *,
     model: str | None,
     region: str | None,
     lang: str,
     row_key: str,
-    pages: str | list[str] | tuple[str, ...] | set[str] | None = ("spec", "specifications"),
+    pages: PageFilter = ("spec", "specifications"),
     line_order: str | int | None = None,
     usage_type: str | None = None,
     placement_key: str | None = None,
@@ -132,7 +183,7 @@ def collect_matching_spec_rows(
     variant_key: str | None = None,
 ) -> tuple[dict[str, str], ...]:
     return tuple(
-        _iter_ranked_rows(
+        _ranked_rows(
             rows,
             model=model,
             region=region,
@@ -149,13 +200,13 @@ def collect_matching_spec_rows(
 
 
 def collect_spec_value_matches_from_rows(
-    rows: list[dict[str, str]],
+    rows: SpecRows,
     *,
     model: str | None,
     region: str | None,
     lang: str,
     row_key: str,
-    pages: str | list[str] | tuple[str, ...] | set[str] | None = ("spec", "specifications"),
+    pages: PageFilter = ("spec", "specifications"),
     line_order: str | int | None = None,
     usage_type: str | None = None,
     placement_key: str | None = None,
@@ -245,16 +296,17 @@ def _with_derived_substitutions(substitutions: dict[str, str]) -> dict[str, str]
 
 
 def resolve_template_substitutions_from_rows(
-    rows: list[dict[str, str]],
+    rows: SpecRows,
     *,
     model: str | None,
     region: str | None,
     lang: str,
 ) -> dict[str, str]:
+    index = ensure_spec_master_index(rows)
     substitutions: dict[str, str] = {}
 
     product_match = resolve_spec_value_from_rows(
-        rows,
+        index,
         model=model,
         region=region,
         lang=lang,
@@ -268,7 +320,7 @@ def resolve_template_substitutions_from_rows(
             substitutions["PRODUCT_SHORT_NAME"] = short_name
 
     model_match = resolve_spec_value_from_rows(
-        rows,
+        index,
         model=model,
         region=region,
         lang=lang,
@@ -278,8 +330,8 @@ def resolve_template_substitutions_from_rows(
     if model_match:
         substitutions["MODEL_NO"] = model_match.value
 
-    for row in _iter_ranked_rows(
-        rows,
+    for row in _ranked_rows(
+        index,
         model=model,
         region=region,
         lang=lang,
@@ -299,8 +351,8 @@ def resolve_template_substitutions_from_rows(
         substitutions.setdefault(placeholder, value)
 
     for row_key, (placeholder_base, pages) in _DERIVED_MULTILINE_PLACEHOLDERS.items():
-        for row in _iter_ranked_rows(
-            rows,
+        for row in _ranked_rows(
+            index,
             model=model,
             region=region,
             lang=lang,
@@ -322,7 +374,7 @@ def resolve_template_substitutions_from_rows(
 
 
 def resolve_product_name_from_rows(
-    rows: list[dict[str, str]],
+    rows: SpecRows,
     *,
     model: str | None,
     region: str | None,
@@ -6,10 +6,10 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
 from collections import Counter
-import csv
 from pathlib import Path
 import re
 
+from tools.utils.csv_table_cache import read_cached_csv_rows
 from tools.utils.spec_master_shared import (
     PageValueBinding,
     _LEGACY_PAGE_VALUE_BINDINGS,
@@ -23,14 +23,7 @@ from tools.utils.spec_master_shared import (
 )
 
 def _read_csv_rows(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        rows: list[dict[str, str]] = []
-        for line, row in enumerate(csv.DictReader(f), start=2):
-            row["__line__"] = str(line)
-            rows.append(row)
-        return rows
+    return read_cached_csv_rows(path, line_numbers=True)
 
 
 def _first_non_empty(row: dict[str, str], keys: list[str]) -> str:
@@ -170,6 +170,14 @@ def validate(cfg: dict, strict_files: bool) -> list[Issue]:
     if default_region is not None and (not isinstance(default_region, str) or not default_region.strip()):
         issues.append(Issue("ERROR", "build.default_region must be a non-empty string when provided"))
 
+    format_jobs = build.get("format_jobs")
+    if format_jobs is not None and (isinstance(format_jobs, bool) or not isinstance(format_jobs, int) or format_jobs < 1):
+        issues.append(Issue("ERROR", "build.format_jobs must be a positive integer when provided"))
+
+    bundle_jobs = build.get("bundle_jobs")
+    if bundle_jobs is not None and (isinstance(bundle_jobs, bool) or not isinstance(bundle_jobs, int) or bundle_jobs < 1):
+        issues.append(Issue("ERROR", "build.bundle_jobs must be a positive integer when provided"))
+
     raw_targets = build.get("targets")
     if raw_targets is not None:
         if not isinstance(raw_targets, list) or not raw_targets:
@@ -285,11 +293,19 @@ def validate(cfg: dict, strict_files: bool) -> list[Issue]:
         if value is not None and (not isinstance(value, str) or not value.strip()):
             issues.append(Issue("ERROR", f"sync.phase2.{key} must be a non-empty string when provided"))
 
-    for key in ("export_root", "manifest_path"):
+    for key in ("export_root", "manifest_path", "attachment_store"):
         value = phase2.get(key)
         if value is not None and (not isinstance(value, str) or not value.strip()):
             issues.append(Issue("ERROR", f"sync.phase2.{key} must be a non-empty string when provided"))
 
+    fetch_jobs = phase2.get("fetch_jobs")
+    if fetch_jobs is not None and (isinstance(fetch_jobs, bool) or not isinstance(fetch_jobs, int) or fetch_jobs < 1):
+        issues.append(Issue("ERROR", "sync.phase2.fetch_jobs must be a positive integer when provided"))
+
+    delta_sync = phase2.get("delta_sync")
+    if delta_sync is not None and not isinstance(delta_sync, bool):
+        issues.append(Issue("ERROR", "sync.phase2.delta_sync must be a boolean when provided"))
+
     spec_master_sources = phase2.get("spec_master_sources")
     if spec_master_sources is not None:
         if not isinstance(spec_master_sources, dict):
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from tools.data_snapshot import resolve_data_snapshot_paths
 from tools.utils.spec_master import (
+    SpecMasterIndex,
     canonicalize_model_token,
     collect_matching_footnote_rows,
     collect_matching_spec_rows,
@@ -846,11 +847,12 @@ def collect_spec_master_validation_issues(
         region=region,
     )
 
+    spec_index = SpecMasterIndex(rows)
     for target in targets:
         issues.extend(
             _collect_target_issues(
                 cfg=cfg,
-                rows=rows,
+                rows=spec_index,
                 footnote_rows=footnote_rows,
                 note_rows=note_rows,
                 langs=langs,
@@ -7,16 +7,18 @@ import glob
 from pathlib import Path
 
 from tools.config_pages import CsvPage
-from tools.utils.korean_josa import with_josa_substitutions
 from tools.data_snapshot import resolve_data_snapshot_paths
 from tools.language_aliases import language_key, normalize_language
-from tools.localized_copy import COPY_TOKEN_RE, apply_localized_copy_tokens
 from tools.page_manifest import resolve_config_pages_or_raise
 from tools.csv_pages.builder import BuildPaths, BuildSelector, CsvPageBuilder
-from tools.csv_pages.renderers import apply_vars
+from tools.csv_pages.page_cache import DEFAULT_CACHE_DIR, CsvPageCache
+from tools.rst_template import render_rst_template
 from tools.utils.path_utils import get_paths
 from tools.utils.spec_master import (
+    SpecMasterIndex,
+    resolve_product_name_from_rows,
     resolve_product_name_from_spec_master,
+    resolve_template_substitutions_from_rows,
     resolve_template_substitutions_from_spec_master,
 )
 from tools.utils.targets import (
@@ -114,34 +116,16 @@ def apply_rst_substitutions(
     substitutions: dict[str, str],
     vars_map: dict[str, str],
 ) -> str:
-    out = apply_vars(text, vars_map)
-    lang = (vars_map.get("lang") or vars_map.get("language") or "").strip().lower()
     # ko templates name a particle pair (|PRODUCT_NAME_JOSA_EUN|) instead of
-    # printing the ambiguous 은(는) form; resolve those companions here too so the
-    # Word path matches the Sphinx path.
-    effective = (
-        with_josa_substitutions(substitutions) if lang in {"ko", "ko-kr"} else substitutions
-    )
-    for key, value in effective.items():
-        out = out.replace(f"|{key}|", value)
-    if COPY_TOKEN_RE.search(out):
-        localized_copy_csv = (vars_map.get("localized_copy_csv") or "").strip()
-        lang = (vars_map.get("lang") or vars_map.get("language") or "").strip()
-        if not localized_copy_csv:
-            raise RuntimeError("RST uses {{ copy:<key> }} but localized_copy_csv is not configured")
-        if not lang:
-            raise RuntimeError("RST uses {{ copy:<key> }} but render lang is not configured")
-        try:
-            out = apply_localized_copy_tokens(
-                out,
-                localized_copy_csv=localized_copy_csv,
-                lang=lang,
-                model=_pick_model_from_vars(vars_map) or None,
-                region=_pick_region_from_vars(vars_map) or None,
-            )
-        except (FileNotFoundError, KeyError) as exc:
-            raise RuntimeError(str(exc)) from exc
-    return out
+    # printing the ambiguous 은(는) form; the renderer resolves those companions
+    # too so the Word path matches the Sphinx path.
+    return render_rst_template(
+        text,
+        substitutions,
+        vars_map,
+        model=_pick_model_from_vars(vars_map) or None,
+        region=_pick_region_from_vars(vars_map) or None,
+    ).text
 
 
 def resolve_reference_doc(reference_value: str | None, *, root: Path | None = None) -> Path | None:
@@ -219,7 +203,7 @@ def load_word_context(
         spec_titles_csv=snapshot_paths.spec_titles_csv,
         localized_copy_csv=snapshot_paths.localized_copy_csv,
     )
-    return CsvPageBuilder(build_paths)
+    return CsvPageBuilder(build_paths, cache=CsvPageCache(paths.root / DEFAULT_CACHE_DIR))
 
 
 def ensure_csv_page_rsts(
@@ -310,19 +294,28 @@ def fill_product_name_from_spec_master(
     model: str | None,
     region: str | None,
     lang: str,
+    spec_rows: SpecMasterIndex | None = None,
 ) -> dict[str, str]:
+    """``spec_rows`` is ``spec_master_csv`` already indexed, to skip re-reading it."""
     out = dict(vars_map)
     target_model = (model or _pick_model_from_vars(out)).strip()
     target_region = (region or _pick_region_from_vars(out)).strip() or None
     if not target_model:
         return out
 
-    match = resolve_product_name_from_spec_master(
-        spec_master_csv,
-        model=target_model,
-        region=target_region,
-        lang=lang,
-    )
+    if spec_rows is None:
+        match = resolve_product_name_from_spec_master(
+            spec_master_csv,
+            model=target_model,
+            region=target_region,
+            lang=lang,
+        )
+    else:
+        match = (
+            resolve_product_name_from_rows(spec_rows, model=target_model, region=target_region, lang=lang)
+            if len(spec_rows)
+            else None
+        )
     if not match:
         return out
 
@@ -340,9 +333,14 @@ def resolve_spec_master_substitutions(
     model: str | None,
     region: str | None,
     lang: str,
+    spec_rows: SpecMasterIndex | None = None,
 ) -> dict[str, str]:
     if not (model or "").strip():
         return {}
+    if spec_rows is not None:
+        if not len(spec_rows):
+            return {}
+        return resolve_template_substitutions_from_rows(spec_rows, model=model, region=region, lang=lang)
     return resolve_template_substitutions_from_spec_master(
         spec_master_csv,
         model=model,